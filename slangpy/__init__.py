@@ -52,14 +52,24 @@ from . import builtin as internal_marshalls
 from .torchintegration import TorchModule
 
 # Debug options for call data gen
-from .core.calldata import set_dump_generated_shaders, set_dump_slang_intermediates
+from .core.calldata import (
+    set_dump_generated_shaders,
+    set_dump_slang_intermediates,
+    set_kernel_cache_path,
+)
 
 # Core slangpy interface
 from .core.function import Function
 from .core.struct import Struct
 from .core.module import Module
+from .core.callgraph import CallGraph
+from .core.callfuture import CallFuture
+from .core.profiler import CallProfiler
 from .core.instance import InstanceList, InstanceBuffer
 
+# Scan, compaction and sort primitives over buffers
+from .core import algorithms
+
 # Py torch integration
 from .torchintegration import *
 
@@ -7,7 +7,7 @@ from slangpy.core.enums import PrimType
 from slangpy.core.native import AccessType, CallContext, NativeMarshall
 
 import slangpy.reflection as kfr
-from slangpy import Buffer, BufferUsage
+from slangpy import BufferView
 from slangpy.bindings import (
     PYTHON_TYPES,
     Marshall,
@@ -175,14 +175,7 @@ class DiffPairMarshall(Marshall):
             if prim_access in [AccessType.write, AccessType.readwrite]:
                 assert prim_type is not None
                 npdata = slang_value_to_numpy(prim_type, prim_data).view(dtype=np.uint8)
-                res[prim_name] = {
-                    "value": context.device.create_buffer(
-                        element_count=1,
-                        struct_size=npdata.size,
-                        data=npdata,
-                        usage=BufferUsage.shader_resource | BufferUsage.unordered_access,
-                    )
-                }
+                res[prim_name] = {"value": context.allocate_readback(npdata.tobytes(), npdata.size)}
             elif prim_access == AccessType.read:
                 res[prim_name] = {"value": prim_data}
 
@@ -201,9 +194,11 @@ class DiffPairMarshall(Marshall):
             prim_access = access[prim.value]
             prim_type = self.get_type(prim)
             if prim_access in [AccessType.write, AccessType.readwrite]:
-                assert isinstance(result[prim_name]["value"], Buffer)
+                view = result[prim_name]["value"]
+                assert isinstance(view, BufferView)
                 assert prim_type is not None
-                val = numpy_to_slang_value(prim_type, result[prim_name]["value"].to_numpy())
+                npdata = np.frombuffer(context.read_readback(view), dtype=np.uint8)
+                val = numpy_to_slang_value(prim_type, npdata)
                 data.set(prim, val)
 
     def create_output(self, context: CallContext, binding: BoundVariableRuntime) -> Any:
@@ -8,7 +8,7 @@ from slangpy import BufferCursor
 from slangpy.core.native import AccessType, CallContext
 
 import slangpy.reflection as kfr
-from slangpy import Buffer, BufferUsage
+from slangpy import BufferView
 from slangpy.bindings import (
     PYTHON_TYPES,
     Marshall,
@@ -54,6 +54,7 @@ def numpy_to_slang_matrix_remove_padding(
     aligned_row_num = (
         slang_type.buffer_layout.stride // slang_type.rows
     ) // slang_type.scalar_type.buffer_layout.stride
+    np_data = np_data[: slang_type.rows * aligned_row_num]
     if aligned_row_num == slang_type.cols:
         return python_type(np_data)
     else:
@@ -90,7 +91,7 @@ def numpy_to_slang_value(slang_type: kfr.SlangType, value: npt.NDArray[Any]) ->
     elif isinstance(slang_type, kfr.VectorType):
         # convert to one of the SGL vector types (can be constructed from sequence)
         np_data = value.view(dtype=kfr.SCALAR_TYPE_TO_NUMPY_TYPE[slang_type.slang_scalar_type])
-        return python_type(*np_data)
+        return python_type(*np_data[: slang_type.num_elements])
     elif isinstance(slang_type, kfr.MatrixType):
         # convert to one of the SGL matrix types (can be constructed from numpy array)
         return numpy_to_slang_matrix_remove_padding(slang_type, value, python_type)
@@ -159,30 +160,22 @@ class ValueRefMarshall(Marshall):
         if access[0] == AccessType.read:
             return {"value": data.value}
         else:
+            # Writable values are packed into the call's shared readback buffer, so all
+            # value refs of a call are uploaded and read back with a single copy.
             if isinstance(binding.vector_type, kfr.StructType):
-                buffer = context.device.create_buffer(
-                    element_count=1,
-                    struct_size=binding.vector_type.buffer_layout.stride,
-                    usage=BufferUsage.shader_resource | BufferUsage.unordered_access,
-                )
-                cursor = BufferCursor(binding.vector_type.buffer_layout.reflection, buffer, False)
+                layout = binding.vector_type.buffer_layout
+                cursor = BufferCursor(layout.reflection, 1)
                 cursor[0].write(data.value)
-                cursor.apply()
-                return {"value": buffer}
+                npdata = cursor.to_numpy()
+                stride = layout.stride
             else:
                 if isinstance(self.value_type, kfr.SlangType):
                     npdata = slang_value_to_numpy(self.value_type, data.value)
                 else:
                     npdata = self.value_type.to_numpy(data.value)
                 npdata = npdata.view(dtype=np.uint8)
-                return {
-                    "value": context.device.create_buffer(
-                        element_count=1,
-                        struct_size=npdata.size,
-                        data=npdata,
-                        usage=BufferUsage.shader_resource | BufferUsage.unordered_access,
-                    )
-                }
+                stride = npdata.size
+            return {"value": context.allocate_readback(npdata.tobytes(), stride)}
 
     # Value ref just passes its value for raw dispatch
     def create_dispatchdata(self, data: Any) -> Any:
@@ -198,12 +191,13 @@ class ValueRefMarshall(Marshall):
     ) -> None:
         access = binding.access
         if access[0] in [AccessType.write, AccessType.readwrite]:
-            assert isinstance(result["value"], Buffer)
+            assert isinstance(result["value"], BufferView)
+            npdata = np.frombuffer(bytearray(context.read_readback(result["value"])), np.uint8)
             if isinstance(binding.vector_type, kfr.StructType):
-                cursor = BufferCursor(binding.vector_type.buffer_layout.reflection, result["value"])
+                cursor = BufferCursor(binding.vector_type.buffer_layout.reflection, 1)
+                cursor.copy_from_numpy(npdata)
                 data.value = cursor[0].read()
             else:
-                npdata = result["value"].to_numpy()
                 if isinstance(self.value_type, kfr.SlangType):
                     data.value = numpy_to_slang_value(self.value_type, npdata)
                 else:
@@ -0,0 +1,555 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Parallel primitives over 1D NDBuffers and Tensors: prefix scans, stream compaction, radix sort
+and unique. All work runs on the device through slangpy kernels, so data never round-trips
+through host memory, except for the element count of compacted results.
+
+Scans and sorts launch one workgroup of `GROUP_SIZE` threads per block of `BLOCK_SIZE`
+consecutive elements. A workgroup walks its block in chunks of `GROUP_SIZE` elements, one per
+thread, so neighbouring threads read neighbouring elements, and combines the chunk in
+groupshared memory before carrying its total on to the next chunk. Results are deterministic,
+and sorts are stable as every block keeps its own digit histogram. Multi-dimensional inputs are
+accepted if contiguous, and are treated as flattened in row-major order.
+"""
+from typing import Optional, Union
+
+from slangpy import Device
+from slangpy.core.bufferkernels import (
+    GROUP_SIZE,
+    TBuffer,
+    buffer_type,
+    container,
+    dispatch_groups,
+    empty_buffer,
+    get_kernel_module,
+)
+from slangpy.core.module import Module
+from slangpy.core.native import NativeNDBuffer, NativeTensor
+from slangpy.experimental.gridarg import grid
+from slangpy.types.buffer import NDBuffer, get_lookup_module
+
+#: Number of consecutive elements processed by each workgroup.
+BLOCK_SIZE = 8 * GROUP_SIZE
+
+#: Number of key bits sorted by each radix sort pass.
+RADIX_BITS = 4
+
+#: Element types supported by scan.
+SCAN_TYPES = ("int", "uint", "int64_t", "uint64_t", "float", "double")
+
+#: Key types supported by radix_sort and unique, mapped to an expression converting `key`
+#: to a uint with the same ordering.
+SORT_KEY_TYPES = {
+    "uint": "key",
+    "int": "asuint(key) ^ 0x80000000u",
+    "float": "asuint(key) ^ ((asuint(key) >> 31) != 0 ? 0xffffffffu : 0x80000000u)",
+}
+
+SCAN_SOURCE = """
+static const int BLOCK_SIZE = {B};
+
+groupshared {T} g_scan[GROUP_SIZE];
+
+// Inclusive and exclusive scans of one value per thread of a workgroup, also returning the
+// total of the group to every thread.
+void group_scan(int tid, {T} value, out {T} inclusive, out {T} exclusive, out {T} total)
+{{
+    g_scan[tid] = value;
+    GroupMemoryBarrierWithGroupSync();
+    for (int s = 1; s < GROUP_SIZE; s <<= 1) {{
+        {T} other = {T}(0);
+        if (tid >= s)
+            other = g_scan[tid - s];
+        GroupMemoryBarrierWithGroupSync();
+        g_scan[tid] += other;
+        GroupMemoryBarrierWithGroupSync();
+    }}
+    inclusive = g_scan[tid];
+    exclusive = {T}(0);
+    if (tid > 0)
+        exclusive = g_scan[tid - 1];
+    total = g_scan[GROUP_SIZE - 1];
+    // Keep the next scan from overwriting values before every thread has read them.
+    GroupMemoryBarrierWithGroupSync();
+}}
+
+// Each workgroup sums a block of BLOCK_SIZE elements into entry `block` of `sums`.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void scan_block_sum(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 1> src,
+    uniform RW{C}<{T}, 1> sums,
+    uniform int groups_x
+)
+{{
+    int block = group_index(group_id, groups_x);
+    int begin = block * BLOCK_SIZE;
+    if (begin >= int(src.shape[0]))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[0]));
+    int tid = int(thread_id.x);
+
+    {T} acc = {T}(0);
+    int idx[1];
+    for (idx[0] = begin + tid; idx[0] < end; idx[0] += GROUP_SIZE)
+        acc += src.get(idx);
+    {T} inclusive, exclusive, total;
+    group_scan(tid, acc, inclusive, exclusive, total);
+
+    if (tid == 0) {{
+        int dst_idx[1] = {{ block }};
+        sums.set(dst_idx, total);
+    }}
+}}
+
+// Each workgroup scans a block of BLOCK_SIZE elements, starting from the block's entry in
+// `offsets`.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void scan_block(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 1> src,
+    uniform {C}<{T}, 1> offsets,
+    uniform RW{C}<{T}, 1> dst,
+    uniform int exclusive,
+    uniform int groups_x
+)
+{{
+    int block = group_index(group_id, groups_x);
+    int begin = block * BLOCK_SIZE;
+    if (begin >= int(src.shape[0]))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[0]));
+    int tid = int(thread_id.x);
+
+    int offset_idx[1] = {{ block }};
+    {T} carry = offsets.get(offset_idx);
+    for (int chunk = begin; chunk < end; chunk += GROUP_SIZE) {{
+        int idx[1] = {{ chunk + tid }};
+        bool valid = idx[0] < end;
+        {T} value = {T}(0);
+        if (valid)
+            value = src.get(idx);
+        {T} inclusive_sum, exclusive_sum, total;
+        group_scan(tid, value, inclusive_sum, exclusive_sum, total);
+        if (valid)
+            dst.set(idx, carry + (exclusive != 0 ? exclusive_sum : inclusive_sum));
+        carry += total;
+    }}
+}}
+"""
+
+COMPACT_SOURCE = """
+uint compact_flag({M} mask)
+{{
+    return mask != {M}(0) ? 1 : 0;
+}}
+
+void compact_scatter({T} value, uint flag, uint position, RW{C}<{T}, 1> dst)
+{{
+    if (flag != 0) {{
+        int idx[1] = {{ int(position) - 1 }};
+        dst.set(idx, value);
+    }}
+}}
+"""
+
+SORT_SOURCE = """
+static const int RADIX_SIZE = 1 << {BITS};
+static const uint RADIX_MASK = RADIX_SIZE - 1;
+static const int BLOCK_SIZE = {B};
+static const int MASK_WORDS = GROUP_SIZE / 32;
+
+// Next output position of each digit in a workgroup's block.
+groupshared uint g_digit_offset[RADIX_SIZE];
+// Bit per thread of a chunk holding each digit, MASK_WORDS words per digit.
+groupshared uint g_digit_mask[RADIX_SIZE * MASK_WORDS];
+
+uint radix_key({K} key)
+{{
+    return {KEY};
+}}
+
+uint radix_digit({K} key, int shift)
+{{
+    return (radix_key(key) >> shift) & RADIX_MASK;
+}}
+
+// Output position of the key held by each thread of a chunk of GROUP_SIZE consecutive keys.
+// A key is placed after the keys with the same digit held by lower threads, which keeps the sort
+// stable, then each digit's offset is advanced past the chunk. Threads past the end of the keys
+// pass `valid` false.
+uint radix_position(int tid, bool valid, uint digit)
+{{
+    int word = tid / 32;
+    uint bit = 1u << uint(tid % 32);
+    int masks = int(digit) * MASK_WORDS;
+    for (int i = tid; i < RADIX_SIZE * MASK_WORDS; i += GROUP_SIZE)
+        g_digit_mask[i] = 0;
+    GroupMemoryBarrierWithGroupSync();
+    if (valid)
+        InterlockedOr(g_digit_mask[masks + word], bit);
+    GroupMemoryBarrierWithGroupSync();
+
+    uint position = 0;
+    if (valid) {{
+        position = g_digit_offset[digit] + countbits(g_digit_mask[masks + word] & (bit - 1));
+        for (int w = 0; w < word; w++)
+            position += countbits(g_digit_mask[masks + w]);
+    }}
+    GroupMemoryBarrierWithGroupSync();
+
+    if (tid < RADIX_SIZE) {{
+        uint chunk_count = 0;
+        for (int w = 0; w < MASK_WORDS; w++)
+            chunk_count += countbits(g_digit_mask[tid * MASK_WORDS + w]);
+        g_digit_offset[tid] += chunk_count;
+    }}
+    GroupMemoryBarrierWithGroupSync();
+    return position;
+}}
+
+// Load the output position of each digit of a workgroup's block from `offsets`.
+void radix_load_offsets(int tid, int block, NDBuffer<uint, 2> offsets)
+{{
+    if (tid < RADIX_SIZE) {{
+        int h[2] = {{ tid, block }};
+        g_digit_offset[tid] = offsets.get(h);
+    }}
+    GroupMemoryBarrierWithGroupSync();
+}}
+
+// Each workgroup counts the digits of a block of BLOCK_SIZE keys into column `block` of `hist`.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void radix_count(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{K}, 1> keys,
+    uniform RWNDBuffer<uint, 2> hist,
+    uniform int shift,
+    uniform int groups_x
+)
+{{
+    int block = group_index(group_id, groups_x);
+    int begin = block * BLOCK_SIZE;
+    if (begin >= int(keys.shape[0]))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(keys.shape[0]));
+    int tid = int(thread_id.x);
+
+    if (tid < RADIX_SIZE)
+        g_digit_offset[tid] = 0;
+    GroupMemoryBarrierWithGroupSync();
+    int idx[1];
+    for (idx[0] = begin + tid; idx[0] < end; idx[0] += GROUP_SIZE)
+        InterlockedAdd(g_digit_offset[radix_digit(keys.get(idx), shift)], 1u);
+    GroupMemoryBarrierWithGroupSync();
+
+    if (tid < RADIX_SIZE) {{
+        int h[2] = {{ tid, block }};
+        hist.set(h, g_digit_offset[tid]);
+    }}
+}}
+
+// Each workgroup scatters a block of BLOCK_SIZE keys to their sorted positions, starting from
+// column `block` of `offsets`.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void radix_scatter_keys(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{K}, 1> keys,
+    uniform NDBuffer<uint, 2> offsets,
+    uniform RW{C}<{K}, 1> dst_keys,
+    uniform int shift,
+    uniform int groups_x
+)
+{{
+    int block = group_index(group_id, groups_x);
+    int begin = block * BLOCK_SIZE;
+    if (begin >= int(keys.shape[0]))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(keys.shape[0]));
+    int tid = int(thread_id.x);
+
+    radix_load_offsets(tid, block, offsets);
+    for (int chunk = begin; chunk < end; chunk += GROUP_SIZE) {{
+        int idx[1] = {{ chunk + tid }};
+        bool valid = idx[0] < end;
+        {K} key = {K}(0);
+        uint digit = 0;
+        if (valid) {{
+            key = keys.get(idx);
+            digit = radix_digit(key, shift);
+        }}
+        int dst[1] = {{ int(radix_position(tid, valid, digit)) }};
+        if (valid)
+            dst_keys.set(dst, key);
+    }}
+}}
+
+// As radix_scatter_keys, also moving each key's value.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void radix_scatter(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{K}, 1> keys,
+    uniform {VC}<{V}, 1> values,
+    uniform NDBuffer<uint, 2> offsets,
+    uniform RW{C}<{K}, 1> dst_keys,
+    uniform RW{VC}<{V}, 1> dst_values,
+    uniform int shift,
+    uniform int groups_x
+)
+{{
+    int block = group_index(group_id, groups_x);
+    int begin = block * BLOCK_SIZE;
+    if (begin >= int(keys.shape[0]))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(keys.shape[0]));
+    int tid = int(thread_id.x);
+
+    radix_load_offsets(tid, block, offsets);
+    for (int chunk = begin; chunk < end; chunk += GROUP_SIZE) {{
+        int idx[1] = {{ chunk + tid }};
+        bool valid = idx[0] < end;
+        {K} key = {K}(0);
+        uint digit = 0;
+        if (valid) {{
+            key = keys.get(idx);
+            digit = radix_digit(key, shift);
+        }}
+        int dst[1] = {{ int(radix_position(tid, valid, digit)) }};
+        if (valid) {{
+            dst_keys.set(dst, key);
+            dst_values.set(dst, values.get(idx));
+        }}
+    }}
+}}
+
+uint unique_flag(int i, {C}<{K}, 1> sorted)
+{{
+    if (i == 0)
+        return 1;
+    int idx[1] = {{ i }};
+    int prev[1] = {{ i - 1 }};
+    return sorted.get(idx) != sorted.get(prev) ? 1 : 0;
+}}
+"""
+
+
+def _flatten(buffer: TBuffer, name: str, types: tuple[str, ...]) -> TBuffer:
+    """
+    Check `buffer` holds one of `types` and return it as a 1D view.
+    """
+    if not isinstance(buffer, (NativeNDBuffer, NativeTensor)):
+        raise ValueError(f"{name} must be an NDBuffer or Tensor, got {type(buffer).__name__}")
+    type_name = buffer.dtype.full_name
+    if type_name not in types:
+        raise ValueError(
+            f"{name} must have one of the element types {', '.join(types)}, got '{type_name}'"
+        )
+    if isinstance(buffer, NativeTensor) and type_name not in ("float", "double"):
+        raise ValueError(f"Tensor {name} must have a floating point element type")
+    shape = buffer.shape
+    if len(shape) == 1:
+        return buffer
+    if buffer.strides != shape.calc_contiguous_strides():
+        raise ValueError(f"{name} must be contiguous to be flattened")
+    return buffer.view((buffer.element_count,))
+
+
+def _get_scan_module(device: Device, type_name: str, container_name: str) -> Module:
+    return get_kernel_module(
+        device, "scan", SCAN_SOURCE, T=type_name, C=container_name, B=BLOCK_SIZE
+    )
+
+
+def _scan(module: Module, src: TBuffer, dst: TBuffer, exclusive: bool):
+    device = src.device
+    kind = buffer_type(src)
+    count = src.shape[0]
+    blocks = (count + BLOCK_SIZE - 1) // BLOCK_SIZE
+    if blocks == 1:
+        offsets = kind.zeros(device, (1,), src.dtype)
+    else:
+        # Scan the sums of each block to find the value each block starts from.
+        sums = kind.empty(device, (blocks,), src.dtype)
+        dispatch_groups(module.scan_block_sum, blocks, src=src, sums=sums)
+        offsets = kind.empty(device, (blocks,), src.dtype)
+        _scan(module, sums, offsets, True)
+    dispatch_groups(
+        module.scan_block, blocks, src=src, offsets=offsets, dst=dst, exclusive=int(exclusive)
+    )
+
+
+def scan(src: TBuffer, exclusive: bool = True) -> TBuffer:
+    """
+    Returns the prefix sum of `src` as a new buffer of the same kind. Each element of an
+    exclusive scan is the sum of all elements before it, and of an inclusive scan also
+    includes the element itself.
+    """
+    src = _flatten(src, "src", SCAN_TYPES)
+    type_name = src.dtype.full_name
+    if src.element_count == 0:
+        return empty_buffer(buffer_type(src), src.device, src.dtype)
+    module = _get_scan_module(src.device, type_name, container(src))
+    dst = buffer_type(src).empty(src.device, (src.element_count,), src.dtype)
+    _scan(module, src, dst, exclusive)
+    return dst
+
+
+def compact(src: TBuffer, mask: TBuffer) -> TBuffer:
+    """
+    Returns the elements of `src` for which `mask` is non-zero as a new buffer of the same
+    kind, keeping their order. The result is empty if no elements are selected. `mask` must
+    have the same number of elements as `src`, and may have any scalar element type.
+
+    The number of selected elements is read back from the device to size the result.
+    """
+    src = _flatten(src, "src", SCAN_TYPES + ("half",) + tuple(SORT_KEY_TYPES))
+    mask = _flatten(mask, "mask", SCAN_TYPES + ("bool", "half"))
+    if mask.element_count != src.element_count:
+        raise ValueError(
+            f"mask has {mask.element_count} elements, expected {src.element_count} to match src"
+        )
+    device = src.device
+    if src.element_count == 0:
+        return empty_buffer(buffer_type(src), device, src.dtype)
+    module = get_kernel_module(
+        device,
+        "compact",
+        COMPACT_SOURCE,
+        T=src.dtype.full_name,
+        C=container(src),
+        M=mask.dtype.full_name,
+    )
+    flags = NDBuffer.empty(device, (src.element_count,), "uint")
+    module.compact_flag(mask, _result=flags)
+
+    # An inclusive scan gives each selected element its position plus one, and the
+    # total number of selected elements in the last entry.
+    scan_module = _get_scan_module(device, "uint", "NDBuffer")
+    positions = NDBuffer.empty(device, (src.element_count,), "uint")
+    _scan(scan_module, flags, positions, False)
+    count = int(positions.view((1,), (1,), src.element_count - 1).to_numpy()[0])
+    if count == 0:
+        return empty_buffer(buffer_type(src), device, src.dtype)
+
+    dst = buffer_type(src).empty(device, (count,), src.dtype)
+    module.compact_scatter(src, flags, positions, dst)
+    return dst
+
+
+def radix_sort(
+    keys: TBuffer, values: Optional[TBuffer] = None
+) -> Union[TBuffer, tuple[TBuffer, TBuffer]]:
+    """
+    Stable sort of `keys` in ascending order, returning a new buffer of the same kind. If
+    `values` is given, it is reordered along with the keys and a tuple of the sorted keys and
+    values is returned. Values may have any element type defined by slang or slangpy.
+
+    Keys are sorted `RADIX_BITS` bits per pass, from the least significant bits up.
+    """
+    keys = _flatten(keys, "keys", tuple(SORT_KEY_TYPES))
+    device = keys.device
+    key_type = keys.dtype.full_name
+    args: dict[str, object] = {
+        "K": key_type,
+        "KEY": SORT_KEY_TYPES[key_type],
+        "C": container(keys),
+        "BITS": RADIX_BITS,
+        "B": BLOCK_SIZE,
+        "V": "uint",
+        "VC": "NDBuffer",
+    }
+    if values is not None:
+        if not isinstance(values, (NativeNDBuffer, NativeTensor)):
+            raise ValueError(f"values must be an NDBuffer or Tensor, got {type(values).__name__}")
+        value_type = values.dtype.full_name
+        if get_lookup_module(device).find_type_by_name(value_type) is None:
+            raise ValueError(f"values element type '{value_type}' is not a builtin type")
+        if len(values.shape) != 1:
+            raise ValueError("values must be 1D")
+        if values.element_count != keys.element_count:
+            raise ValueError(
+                f"values has {values.element_count} elements, expected {keys.element_count}"
+            )
+        args["V"] = value_type
+        args["VC"] = container(values)
+    if keys.element_count == 0:
+        empty_keys = empty_buffer(buffer_type(keys), device, keys.dtype)
+        if values is None:
+            return empty_keys
+        return empty_keys, empty_buffer(buffer_type(values), device, values.dtype)
+
+    module = get_kernel_module(device, "sort", SORT_SOURCE, **args)
+    scan_module = _get_scan_module(device, "uint", "NDBuffer")
+
+    count = keys.element_count
+    blocks = (count + BLOCK_SIZE - 1) // BLOCK_SIZE
+    buckets = 1 << RADIX_BITS
+    hist = NDBuffer.empty(device, (buckets, blocks), "uint")
+    offsets = NDBuffer.empty(device, (buckets, blocks), "uint")
+    src_keys = keys
+    src_values = values
+    for shift in range(0, 32, RADIX_BITS):
+        # Elements with a given digit are written after all elements with smaller digits,
+        # and after elements with the same digit in earlier blocks.
+        block_args = {"keys": src_keys, "shift": shift}
+        dispatch_groups(module.radix_count, blocks, hist=hist, **block_args)
+        _scan(scan_module, hist.view((buckets * blocks,)), offsets.view((buckets * blocks,)), True)
+        dst_keys = buffer_type(keys).empty(device, (count,), keys.dtype)
+        if src_values is None:
+            dispatch_groups(
+                module.radix_scatter_keys, blocks, offsets=offsets, dst_keys=dst_keys, **block_args
+            )
+        else:
+            dst_values = buffer_type(src_values).empty(device, (count,), src_values.dtype)
+            dispatch_groups(
+                module.radix_scatter,
+                blocks,
+                values=src_values,
+                offsets=offsets,
+                dst_keys=dst_keys,
+                dst_values=dst_values,
+                **block_args,
+            )
+            src_values = dst_values
+        src_keys = dst_keys
+
+    if src_values is None:
+        return src_keys
+    return src_keys, src_values
+
+
+def unique(src: TBuffer) -> TBuffer:
+    """
+    Returns the sorted unique elements of `src` as a new buffer of the same kind.
+    """
+    sorted_keys = radix_sort(src)
+    assert not isinstance(sorted_keys, tuple)
+    if sorted_keys.element_count == 0:
+        return sorted_keys
+    key_type = sorted_keys.dtype.full_name
+    module = get_kernel_module(
+        src.device,
+        "sort",
+        SORT_SOURCE,
+        K=key_type,
+        KEY=SORT_KEY_TYPES[key_type],
+        C=container(sorted_keys),
+        BITS=RADIX_BITS,
+        B=BLOCK_SIZE,
+        V="uint",
+        VC="NDBuffer",
+    )
+    count = sorted_keys.element_count
+    flags = NDBuffer.empty(src.device, (count,), "uint")
+    module.unique_flag(grid((count,)), sorted_keys, _result=flags)
+    return compact(sorted_keys, flags)
@@ -0,0 +1,96 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Helpers shared by the reductions and algorithms that run over NDBuffers and Tensors: a per-device
+cache of the modules generated for each element type, and launching their compute kernels.
+
+Kernels are compute entry points with `GROUP_SIZE` threads per workgroup. Workgroups are laid out
+along x, wrapping into y past `MAX_GROUPS_X` groups, and kernels find their flattened index with
+`group_index`, which is defined by `KERNEL_PRELUDE`.
+"""
+import re
+from typing import TYPE_CHECKING, Any, Union
+
+from slangpy import Device, uint3
+from slangpy.core.module import Module
+from slangpy.core.native import NativeTensor
+from slangpy.types.buffer import NDBuffer
+from slangpy.types.tensor import Tensor
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+#: Number of threads in each workgroup.
+GROUP_SIZE = 256
+
+#: Maximum number of workgroups dispatched along x, beyond which groups wrap into y.
+MAX_GROUPS_X = 32768
+
+#: Code added to the start of every generated module.
+KERNEL_PRELUDE = f"""
+import "slangpy";
+
+static const int GROUP_SIZE = {GROUP_SIZE};
+
+// Index of a workgroup in a grid of groups wrapped into y past `groups_x` groups.
+int group_index(uint3 group_id, int groups_x)
+{{
+    return int(group_id.y) * groups_x + int(group_id.x);
+}}
+"""
+
+TBuffer = Union[NDBuffer, Tensor]
+
+global_kernel_modules: dict[Device, dict[str, Module]] = {}
+
+
+def _on_device_close(device: Device):
+    del global_kernel_modules[device]
+
+
+def get_kernel_module(device: Device, name: str, source: str, **args: object) -> Module:
+    """
+    Get the module generated from `source` with `args` substituted, loading it on first use.
+    """
+    if device not in global_kernel_modules:
+        global_kernel_modules[device] = {}
+        device.register_device_close_callback(_on_device_close)
+    modules = global_kernel_modules[device]
+    key = "_".join([name] + [f"{k}{v}" for k, v in sorted(args.items())])
+    if key not in modules:
+        module_name = "slangpy_" + re.sub(r"\W", "_", key)
+        modules[key] = Module.load_from_source(
+            device, module_name, KERNEL_PRELUDE + source.format(**args)
+        )
+    return modules[key]
+
+
+def dispatch_groups(func: "FunctionNode", groups: int, **kwargs: Any):
+    """
+    Dispatch `groups` workgroups of a kernel, passing the number of groups along x to the
+    kernel as `groups_x`.
+    """
+    groups_x = min(groups, MAX_GROUPS_X)
+    thread_count = uint3(groups_x * GROUP_SIZE, (groups + groups_x - 1) // groups_x, 1)
+    func.dispatch(thread_count, groups_x=groups_x, **kwargs)
+
+
+def container(buffer: TBuffer) -> str:
+    """
+    Name of the slang type that reads elements of `buffer`, ``Tensor`` or ``NDBuffer``.
+    """
+    return "Tensor" if isinstance(buffer, NativeTensor) else "NDBuffer"
+
+
+def buffer_type(buffer: TBuffer) -> type:
+    """
+    Type of buffer to create for results of the same kind as `buffer`.
+    """
+    return Tensor if isinstance(buffer, NativeTensor) else NDBuffer
+
+
+def empty_buffer(kind: type, device: Device, dtype: Any) -> TBuffer:
+    """
+    Returns a buffer of type `kind` with no elements. Device buffers can't be empty, so this is
+    a view of a single element buffer.
+    """
+    return kind.empty(device, (1,), dtype).view((0,))
@@ -2,14 +2,21 @@
 import hashlib
 import os
 import re
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from os import PathLike
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from slangpy.core.callsignature import *
+from slangpy.core.kernelcache import DEFAULT_MAX_SIZE, PersistentKernelCache
 from slangpy.core.logging import bound_call_table, bound_exception_info, mismatch_info
-from slangpy.core.native import CallMode, NativeCallData
+from slangpy.core.manifest import ManifestMismatch, apply_manifest, serialize_bindings
+from slangpy.core.native import CallMode, NativeCallData, SignatureBuilder
+from slangpy.core.profiler import PhaseTimer
 
-from slangpy import SlangCompileError, SlangLinkOptions
+from slangpy import SlangCompileError, SlangLinkOptions, SlangModule, SlangSession
 from slangpy.bindings import (
     BindContext,
     BoundCallRuntime,
@@ -20,12 +27,17 @@ from slangpy.bindings.boundvariable import BoundCall, BoundVariable
 from slangpy.reflection import SlangFunction
 
 if TYPE_CHECKING:
-    from slangpy.core.function import FunctionNode
+    from slangpy.core.function import FunctionNode, FunctionBuildInfo
 
 SLANG_PATH = Path(__file__).parent.parent / "slang"
 
 _DUMP_GENERATED_SHADERS = False
 _DUMP_SLANG_INTERMEDIATES = False
+_PERSISTENT_KERNEL_CACHE: Optional[PersistentKernelCache] = None
+_SESSION_LOCKS: "weakref.WeakKeyDictionary[SlangSession, threading.RLock]" = (
+    weakref.WeakKeyDictionary()
+)
+_SESSION_LOCKS_LOCK = threading.Lock()
 
 
 def set_dump_generated_shaders(value: bool):
@@ -44,6 +56,42 @@ def set_dump_slang_intermediates(value: bool):
     _DUMP_SLANG_INTERMEDIATES = value
 
 
+def set_kernel_cache_path(
+    path: Optional[Union[str, PathLike[str]]], max_size: int = DEFAULT_MAX_SIZE
+):
+    """
+    Specify a directory in which to persist compiled kernels between processes, or None
+    to disable the persistent kernel cache. Once the cache exceeds max_size bytes, least
+    recently used kernels are evicted.
+    """
+    global _PERSISTENT_KERNEL_CACHE
+    if path is None:
+        _PERSISTENT_KERNEL_CACHE = None
+    else:
+        _PERSISTENT_KERNEL_CACHE = PersistentKernelCache(path, max_size)
+
+
+def get_kernel_cache() -> Optional[PersistentKernelCache]:
+    """
+    Get the persistent kernel cache, or None if it is disabled.
+    """
+    return _PERSISTENT_KERNEL_CACHE
+
+
+def session_lock(session: SlangSession) -> threading.RLock:
+    """
+    Get the lock that serializes loading and linking kernels in a session between call data
+    builds on different threads. Slang sessions are not thread safe, and linking releases the
+    GIL so that other threads can generate code meanwhile.
+    """
+    with _SESSION_LOCKS_LOCK:
+        lock = _SESSION_LOCKS.get(session)
+        if lock is None:
+            lock = threading.RLock()
+            _SESSION_LOCKS[session] = lock
+        return lock
+
+
 def unpack_arg(arg: Any) -> Any:
     if hasattr(arg, "get_this"):
         arg = arg.get_this()
@@ -74,6 +122,7 @@ class CallData(NativeCallData):
         **kwargs: Any,
     ) -> None:
         super().__init__()
+        start_time = time.perf_counter()
 
         try:
 
@@ -95,6 +144,7 @@ class CallData(NativeCallData):
             else:
                 self.logger = build_info.module.logger
             self.debug_name = f"{build_info.module.name}::{function.name}"
+            phases = PhaseTimer(build_info.module.profiler, self.debug_name)
 
             self.log_debug(f"Generating kernel for {func.name}")
             self.log_debug(f"  Module: {build_info.module.name}")
@@ -115,6 +165,27 @@ class CallData(NativeCallData):
                 build_info.options,
             )
 
+            # If a persistent kernel cache is enabled, attempt to restore the resolved bindings
+            # and kernel for this call signature from a previous process, skipping generation.
+            kernel_cache = _PERSISTENT_KERNEL_CACHE
+            manifest_key = ""
+            if kernel_cache is not None:
+                manifest_key = self._manifest_key(kernel_cache, func, build_info, args, kwargs)
+                bindings = self._restore_from_manifest(
+                    kernel_cache,
+                    manifest_key,
+                    context,
+                    build_info,
+                    unpacked_args,
+                    unpacked_kwargs,
+                )
+                phases.mark("restore")
+                if bindings is not None:
+                    self.debug_only_bindings = bindings
+                    self.runtime = BoundCallRuntime(bindings)
+                    build_info.module.record_build(func.name, time.perf_counter() - start_time)
+                    return
+
             # Build the unbound signature from inputs
             bindings = BoundCall(context, *unpacked_args, **unpacked_kwargs)
 
@@ -130,6 +201,7 @@ class CallData(NativeCallData):
                     f"Function signature mismatch: {slang_function.reason}\n\n"
                     f"{mismatch_info(bindings, build_info.function)}\n"
                 )
+            phases.mark("specialize")
 
             # Check for differentiability error
             if not slang_function.differentiable and self.call_mode != CallMode.prim:
@@ -139,6 +211,7 @@ class CallData(NativeCallData):
                 )
 
             # Inject a dummy node into the Python signature if we need a result back
+            generated_result = False
             if (
                 self.call_mode == CallMode.prim
                 and not "_result" in kwargs
@@ -147,6 +220,7 @@ class CallData(NativeCallData):
             ):
                 rvalnode = BoundVariable(context, None, None, "_result")
                 bindings.kwargs["_result"] = rvalnode
+                generated_result = True
 
             # Create bound variable information now that we have concrete data for path sides
             bindings = bind(context, bindings, slang_function)
@@ -176,6 +250,7 @@ class CallData(NativeCallData):
 
             # Calculate differentiability of all variables.
             calculate_differentiability(context, bindings)
+            phases.mark("bind")
 
             # Generate code.
             codegen = CodeGen()
@@ -227,37 +302,59 @@ class CallData(NativeCallData):
                 "[CallData]\n" + str(build_info.type_conformances) + code[len(codegen.header) :]
             )
             hash = hashlib.sha256(code_minus_header.encode()).hexdigest()
-
-            # Check if we've already built this module.
-            if hash in build_info.module.kernel_cache:
-                # Get kernel from cache if we have
-                self.kernel = build_info.module.kernel_cache[hash]
-                self.device = build_info.module.device
-                self.log_debug(f"  Found cached kernel with hash {hash}")
-
-            else:
-                # Build new module and link it with the one that contains the function being called.
-                self.log_debug(f"  Building new kernel with hash {hash}")
-                session = build_info.module.session
-                device = session.device
-                module = session.load_module_from_source(hash, code)
-                ep = module.entry_point(f"compute_main", type_conformances)
-                opts = SlangLinkOptions()
-                opts.dump_intermediates = _DUMP_SLANG_INTERMEDIATES
-                opts.dump_intermediates_prefix = sanitized
-                program = session.link_program(
-                    [module, build_info.module.device_module] + build_info.module.link,
-                    [ep],
-                    opts,
+            phases.mark("codegen")
+
+            session = build_info.module.session
+            opts = self._link_options(sanitized)
+            cache_key = ""
+            if kernel_cache is not None:
+                cache_key = kernel_cache.key(hash, session, opts)
+
+            with session_lock(session):
+                # Check if we've already built this module.
+                kernel = build_info.module.kernel_cache.get(hash)
+                if kernel is not None:
+                    # Get kernel from cache if we have
+                    self.kernel = kernel
+                    self.device = build_info.module.device
+                    self.log_debug(f"  Found cached kernel with hash {hash}")
+
+                else:
+                    # Attempt to load a previously compiled module from the persistent cache,
+                    # and otherwise build a new one from the generated code.
+                    module = None
+                    if kernel_cache is not None:
+                        module = kernel_cache.load(session, cache_key)
+                        if module is not None:
+                            self.log_debug(
+                                f"  Loaded kernel with hash {hash} from persistent cache"
+                            )
+                    if module is None:
+                        self.log_debug(f"  Building new kernel with hash {hash}")
+                        module = session.load_module_from_source(hash, code)
+                        if kernel_cache is not None:
+                            kernel_cache.store(cache_key, module)
+
+                    self._link_kernel(build_info, hash, module, opts)
+                    self.log_debug(f"  Build succesful")
+            phases.mark("compile")
+
+            # Record the resolved bindings so later processes can skip generation.
+            if kernel_cache is not None:
+                manifest = serialize_bindings(
+                    bindings,
+                    self.call_dimensionality,
+                    self.call_mode,
+                    hash,
+                    cache_key,
+                    generated_result,
                 )
-                self.kernel = device.create_compute_kernel(program)
-                build_info.module.kernel_cache[hash] = self.kernel
-                self.device = device
-                self.log_debug(f"  Build succesful")
+                kernel_cache.store_manifest(manifest_key, manifest)
 
             # Store the bindings and runtime for later use.
             self.debug_only_bindings = bindings
             self.runtime = BoundCallRuntime(bindings)
+            build_info.module.record_build(func.name, time.perf_counter() - start_time)
 
         except BoundVariableException as e:
             if bindings is not None:
@@ -314,3 +411,88 @@ class CallData(NativeCallData):
                 ) from e
             else:
                 raise
+
+    def _link_options(self, prefix: str) -> SlangLinkOptions:
+        opts = SlangLinkOptions()
+        opts.dump_intermediates = _DUMP_SLANG_INTERMEDIATES
+        opts.dump_intermediates_prefix = prefix
+        return opts
+
+    def _link_kernel(
+        self,
+        build_info: "FunctionBuildInfo",
+        hash: str,
+        module: SlangModule,
+        opts: SlangLinkOptions,
+    ):
+        # Link the module with the one that contains the function being called.
+        session = build_info.module.session
+        device = session.device
+        ep = module.entry_point(f"compute_main", build_info.type_conformances)
+        program = session.link_program(
+            [module, build_info.module.device_module] + build_info.module.link,
+            [ep],
+            opts,
+        )
+        self.kernel = device.create_compute_kernel(program)
+        build_info.module.kernel_cache[hash] = self.kernel
+        self.device = device
+
+    def _manifest_key(
+        self,
+        kernel_cache: PersistentKernelCache,
+        func: "FunctionNode",
+        build_info: "FunctionBuildInfo",
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+    ) -> str:
+        # Use the same signature as the in-memory call data cache, qualified by module.
+        builder = SignatureBuilder()
+        func.read_signature(builder)
+        build_info.module.call_data_cache.get_args_signature(builder, *args, **kwargs)
+        signature = f"[Manifest]\n{build_info.module.name}\n{builder.str}"
+        signature_hash = hashlib.sha256(signature.encode()).hexdigest()
+        return kernel_cache.key(signature_hash, build_info.module.session)
+
+    def _restore_from_manifest(
+        self,
+        kernel_cache: PersistentKernelCache,
+        manifest_key: str,
+        context: BindContext,
+        build_info: "FunctionBuildInfo",
+        unpacked_args: tuple[Any, ...],
+        unpacked_kwargs: dict[str, Any],
+    ) -> Optional[BoundCall]:
+        manifest = kernel_cache.load_manifest(manifest_key)
+        if manifest is None:
+            return None
+
+        try:
+            # Build the unbound signature from inputs, then apply the resolved binding
+            # information recorded by the process that generated the kernel.
+            bindings = BoundCall(context, *unpacked_args, **unpacked_kwargs)
+            if manifest["generated_result"] and not "_result" in unpacked_kwargs:
+                bindings.kwargs["_result"] = BoundVariable(context, None, None, "_result")
+            apply_manifest(context, bindings, manifest)
+            self.call_dimensionality = manifest["call_dimensionality"]
+            context.call_dimensionality = self.call_dimensionality
+            create_return_value_binding(context, bindings, build_info.return_type)
+
+            hash = manifest["kernel_hash"]
+            session = build_info.module.session
+            with session_lock(session):
+                kernel = build_info.module.kernel_cache.get(hash)
+                if kernel is not None:
+                    self.kernel = kernel
+                    self.device = build_info.module.device
+                else:
+                    module = kernel_cache.load(session, manifest["kernel_key"])
+                    if module is None:
+                        return None
+                    self._link_kernel(build_info, hash, module, self._link_options(""))
+        except (ManifestMismatch, BoundVariableException, KeyError, TypeError, ValueError) as e:
+            self.log_debug(f"  Ignoring persistent manifest: {e}")
+            return None
+
+        self.log_debug(f"  Restored kernel with hash {hash} from persistent manifest")
+        return bindings
@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any, Generator, Optional
+
+from slangpy.core.native import NativeCallFuture
+
+from slangpy import Fence
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+# Interval between checks of the fence when waiting with a timeout.
+_POLL_INTERVAL = 0.0005
+
+
+class CallFuture:
+    """
+    Result of a function call that has been submitted to the device without waiting for
+    it to finish, as returned by `Function.call_async`.
+
+    Completion is tracked with a fence that the device signals once the call has finished
+    executing, so the host is free to do other work in the meantime. Results are read back
+    the first time `result` is called. The future can also be awaited from asyncio, in which
+    case the wait for the device happens on a worker thread so the event loop keeps running.
+    """
+
+    def __init__(self, func: "FunctionNode", native: NativeCallFuture):
+        super().__init__()
+        self._func = func
+        self._native = native
+
+    @property
+    def fence(self) -> Fence:
+        """
+        Fence that is signaled when the call has finished executing. Can be used to make
+        other submissions wait for the call.
+        """
+        return self._native.fence
+
+    @property
+    def fence_value(self) -> int:
+        """
+        Value the fence is signaled with when the call has finished executing.
+        """
+        return self._native.fence_value
+
+    def done(self) -> bool:
+        """
+        Check if the call has finished executing on the device.
+        """
+        return self._native.done()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the call has finished executing on the device, or until `timeout`
+        seconds have passed. Returns True if the call has finished.
+        """
+        if timeout is None:
+            self._native.wait()
+            return True
+        deadline = time.perf_counter() + timeout
+        while not self._native.done():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            time.sleep(min(remaining, _POLL_INTERVAL))
+        return True
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """
+        Wait for the call to finish, then read back and return its result. Raises
+        TimeoutError if the call does not finish within `timeout` seconds.
+        """
+        if not self.wait(timeout):
+            raise TimeoutError(f"Call to {self._func.name} did not finish within {timeout}s")
+        try:
+            return self._native.result()
+        except ValueError as e:
+            self._func._raise_call_error(e)
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        if not self._native.done():
+            loop = asyncio.get_running_loop()
+            yield from loop.run_in_executor(None, self._native.wait).__await__()
+        return self.result()
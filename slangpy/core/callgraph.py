@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import TYPE_CHECKING, Any, Optional
+
+from slangpy.core.native import NativeCallGraph, NativeCallGraphNode
+
+from slangpy import CommandEncoder
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+
+class CallGraph(NativeCallGraph):
+    """
+    A sequence of function calls that is recorded once and then replayed repeatedly.
+
+    Recording a call resolves its call data, calculates its call shape, allocates its
+    return value and writes its arguments to a persistent shader object. Replaying the
+    graph just binds those shader objects and dispatches, skipping signature hashing
+    and argument processing entirely.
+
+    As with CUDA graphs, arguments are captured at record time. Buffers and textures
+    are bound by reference, so changes to their contents are seen on replay, but host
+    values (scalars, vectors, numpy arrays etc) are baked in. To change them, or to bind
+    different resources, use `rebind` to re-record an individual call. Results are
+    written to the same return value on every replay.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._functions: list["FunctionNode"] = []
+
+    def append(self, func: "FunctionNode", *args: Any, **kwargs: Any) -> int:
+        """
+        Record a call to a function with the given arguments, and return its index.
+        """
+        func = self._resolve_function(func, kwargs)
+        node = self._record(func, args, kwargs)
+        self._functions.append(func)
+        return self.add_node(node)
+
+    def rebind(self, index: int, *args: Any, **kwargs: Any):
+        """
+        Re-record the call at a given index with new arguments. Only this call has its
+        arguments re-processed, so this is cheap relative to re-recording the graph.
+        """
+        func = self._resolve_function(self._functions[index], kwargs)
+        self.set_node(index, self._record(func, args, kwargs))
+
+    def replay(self, command_encoder: Optional[CommandEncoder] = None) -> Optional[list[Any]]:
+        """
+        Dispatch all recorded calls. If a command encoder is provided the dispatches are
+        appended to it and None is returned. Otherwise they are submitted immediately, and
+        a list containing the result of each call is returned.
+        """
+        return super().replay(command_encoder)
+
+    def clear(self):
+        """
+        Remove all recorded calls.
+        """
+        super().clear()
+        self._functions = []
+
+    def _resolve_function(self, func: "FunctionNode", kwargs: dict[str, Any]) -> "FunctionNode":
+        # Handle result type override (e.g. for numpy) as in FunctionNode.call
+        resval = kwargs.get("_result", None)
+        if isinstance(resval, (type, str)):
+            del kwargs["_result"]
+            return func.return_type(resval)
+        return func
+
+    def _record(
+        self, func: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> NativeCallGraphNode:
+        try:
+            return func._native_record(func.module.call_data_cache, *args, **kwargs)
+        except ValueError as e:
+            func._raise_call_error(e)
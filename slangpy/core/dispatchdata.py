@@ -171,9 +171,10 @@ void {reflection.name}_entrypoint({params}) {{
             hash = hashlib.sha256(code_minus_header.encode()).hexdigest()
 
             # Check if we've already built this module.
-            if hash in build_info.module.kernel_cache:
+            kernel = build_info.module.kernel_cache.get(hash)
+            if kernel is not None:
                 # Get kernel from cache if we have
-                self.kernel = build_info.module.kernel_cache[hash]
+                self.kernel = kernel
                 self.device = build_info.module.device
             else:
                 # Load the module
@@ -1,5 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol, Union, cast
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    NoReturn,
+    Optional,
+    Protocol,
+    Sequence,
+    Union,
+    cast,
+)
 
 from slangpy.core.native import (
     CallMode,
@@ -15,7 +26,10 @@ from slangpy.bindings.typeregistry import PYTHON_SIGNATURES
 
 if TYPE_CHECKING:
     from slangpy.core.calldata import CallData
+    from slangpy.core.callfuture import CallFuture
     from slangpy.core.module import Module
+    from slangpy.core.reduce import ReducedFunction
+    from slangpy.core.stream import StreamedFunction
     from slangpy.core.struct import Struct
 
 ENABLE_CALLDATA_CACHE = True
@@ -175,6 +189,27 @@ class FunctionNode(NativeFunctionNode):
         """
         return FunctionNodeThreadGroupSize(self, thread_group_size)
 
+    def stream(self, chunk: int, axis: int = 0, depth: int = 2) -> "StreamedFunction":
+        """
+        Return a callable that calls this function in chunks of `chunk` elements along call
+        dimension `axis`, overlapping upload of each chunk with execution of the previous
+        ones. Useful when host arrays are too large to upload to the device at once. Results
+        are assembled into a numpy array. See `StreamedFunction` for details.
+        """
+        from slangpy.core.stream import StreamedFunction
+
+        return StreamedFunction(self, chunk, axis, depth)
+
+    def reduce(self, op: str, axis: Union[None, int, Sequence[int]] = None) -> "ReducedFunction":
+        """
+        Return a callable that calls this function and reduces its result on the device with
+        `op` (one of sum, min, max, mean or argmax) over the dimensions in `axis`, or all
+        dimensions if None. See `slangpy.core.reduce.reduce` for details.
+        """
+        from slangpy.core.reduce import ReducedFunction
+
+        return ReducedFunction(self, op, axis)
+
     def as_func(self) -> "FunctionNode":
         """
         Typing helper to cast the function to a function (i.e. a no-op)
@@ -196,6 +231,17 @@ class FunctionNode(NativeFunctionNode):
             self._native_build_call_data(self.module.call_data_cache, *args, **kwargs),
         )
 
+    def precompile_async(self, *args: Any, **kwargs: Any) -> "Future[CallData]":
+        """
+        Generate and compile the kernel for a call with the given example arguments on a
+        background thread, returning a future for the resulting call data. A later call
+        with matching argument types will wait for the compile rather than starting
+        a duplicate one.
+        """
+        from slangpy.core.precompile import precompile_async
+
+        return precompile_async(self, args, kwargs)
+
     def call(self, *args: Any, **kwargs: Any) -> Any:
         """
         Call the function with a given set of arguments. This will generate and compile
@@ -212,33 +258,84 @@ class FunctionNode(NativeFunctionNode):
             try:
                 return self._native_call(self.module.call_data_cache, *args, **kwargs)
             except ValueError as e:
-                # If runtime returned useful information, reformat it and raise a new exception
-                # Otherwise just throw the original.
-                if (
-                    len(e.args) != 1
-                    or not isinstance(e.args[0], dict)
-                    or not "message" in e.args[0]
-                    or not "source" in e.args[0]
-                    or not "context" in e.args[0]
-                ):
-                    raise
-                from slangpy.bindings.boundvariableruntime import (
-                    BoundCallRuntime,
-                    BoundVariableRuntime,
-                )
-                from slangpy.core.native import NativeCallData
-                from slangpy.core.logging import bound_runtime_call_table
-
-                msg: str = e.args[0]["message"]
-                source: BoundVariableRuntime = e.args[0]["source"]
-                context: NativeCallData = e.args[0]["context"]
-                runtime = cast(BoundCallRuntime, context.runtime)
-                msg += (
-                    "\n\n"
-                    + bound_runtime_call_table(runtime, source)
-                    + "\n\nFor help and support: https://khr.io/slangdiscord"
-                )
-                raise ValueError(msg) from e
+                self._raise_call_error(e)
+
+    def call_async(self, *args: Any, **kwargs: Any) -> "CallFuture":
+        """
+        Call the function with a given set of arguments, without waiting for it to finish.
+        The dispatch is submitted immediately, and a future is returned that can be waited
+        on or awaited from asyncio to read back the results, allowing the host to prepare
+        further work while the device executes the call.
+        """
+        from slangpy.core.callfuture import CallFuture
+
+        resval = kwargs.get("_result", None)
+        if isinstance(resval, (type, str)):
+            del kwargs["_result"]
+            return self.return_type(resval).call_async(*args, **kwargs)
+        try:
+            native = self._native_call_async(self.module.call_data_cache, *args, **kwargs)
+        except ValueError as e:
+            self._raise_call_error(e)
+        return CallFuture(self, native)
+
+    def call_batch(
+        self,
+        args: Sequence[tuple[Any, ...]],
+        kwargs: Optional[Sequence[dict[str, Any]]] = None,
+    ) -> list[Any]:
+        """
+        Call the function once for each set of arguments, returning a list of results.
+        All dispatches are recorded to a single command encoder that is submitted once,
+        and call data is only looked up again when the argument signature changes, which
+        substantially reduces overhead when making many small calls.
+
+        `args` is a list of positional argument tuples, and `kwargs` an optional list
+        of keyword argument dictionaries of the same length.
+        """
+        if kwargs is None:
+            kwargs = [{}] * len(args)
+        elif len(kwargs) != len(args):
+            raise ValueError(
+                f"Expected {len(args)} keyword argument dictionaries, got {len(kwargs)}"
+            )
+        calls = [(tuple(a), dict(k)) for a, k in zip(args, kwargs)]
+        for _, k in calls:
+            if isinstance(k.get("_result", None), (type, str)):
+                raise ValueError("Result type overrides are not supported by call_batch")
+        try:
+            return self._native_call_batch(self.module.call_data_cache, calls)
+        except ValueError as e:
+            self._raise_call_error(e)
+
+    def _raise_call_error(self, e: ValueError) -> NoReturn:
+        # If runtime returned useful information, reformat it and raise a new exception
+        # Otherwise just throw the original.
+        if (
+            len(e.args) != 1
+            or not isinstance(e.args[0], dict)
+            or not "message" in e.args[0]
+            or not "source" in e.args[0]
+            or not "context" in e.args[0]
+        ):
+            raise e
+        from slangpy.bindings.boundvariableruntime import (
+            BoundCallRuntime,
+            BoundVariableRuntime,
+        )
+        from slangpy.core.native import NativeCallData
+        from slangpy.core.logging import bound_runtime_call_table
+
+        msg: str = e.args[0]["message"]
+        source: BoundVariableRuntime = e.args[0]["source"]
+        context: NativeCallData = e.args[0]["context"]
+        runtime = cast(BoundCallRuntime, context.runtime)
+        msg += (
+            "\n\n"
+            + bound_runtime_call_table(runtime, source)
+            + "\n\nFor help and support: https://khr.io/slangdiscord"
+        )
+        raise ValueError(msg) from e
 
     def append_to(self, command_buffer: CommandEncoder, *args: Any, **kwargs: Any):
         """
@@ -282,8 +379,8 @@ class FunctionNode(NativeFunctionNode):
             self.module.call_data_cache.get_args_signature(builder, self, **kwargs)
             sig = builder.str
 
-            if sig in self.module.dispatch_data_cache:
-                dispatch_data = self.module.dispatch_data_cache[sig]
+            dispatch_data = self.module.dispatch_data_cache.get(sig)
+            if dispatch_data is not None:
                 if dispatch_data.device != self.module.device:
                     raise NameError("Cached CallData is linked to wrong device")
             else:
@@ -330,7 +427,12 @@ class FunctionNode(NativeFunctionNode):
 
     def generate_call_data(self, args: Any, kwargs: Any):
         from .calldata import CallData
+        from .precompile import wait_for_precompile
 
+        # Avoid building a duplicate if the same call is already being precompiled.
+        call_data = wait_for_precompile(self, args, kwargs)
+        if call_data is not None:
+            return call_data
         return CallData(self, *args, **kwargs)
 
 
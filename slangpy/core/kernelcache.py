@@ -0,0 +1,215 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import hashlib
+import json
+import os
+import weakref
+from os import PathLike
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import slangpy
+from slangpy import SlangLinkOptions, SlangModule, SlangSession
+
+#: Default maximum size of the persistent kernel cache in bytes (1GB).
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+_KERNEL_EXTENSION = ".slang-module"
+_MANIFEST_EXTENSION = ".json"
+
+
+def _session_fingerprint(session: SlangSession) -> str:
+    """
+    Build a string that identifies everything about a session and its device
+    that affects the kernels it generates.
+    """
+    device = session.device
+    opts = session.desc.compiler_options
+    lines = [
+        str(slangpy.SGL_VERSION),
+        str(slangpy.SGL_GIT_VERSION),
+        str(device.info.type),
+        str(device.info.api_name),
+        str(device.info.adapter_name),
+        str(opts.defines),
+        str(opts.shader_model),
+        str(opts.matrix_layout),
+        str(opts.optimization),
+        str(opts.debug_info),
+        str(opts.downstream_args),
+    ]
+    return "\n".join(lines)
+
+
+class PersistentKernelCache:
+    """
+    Content addressed on-disk cache of serialized kernel modules, used to avoid
+    recompiling generated kernels when a new process starts.
+
+    Entries are keyed by the hash of the generated kernel code combined with the
+    device type, compiler version and link options. The cache is size bounded, and
+    evicts least recently used entries (as tracked by file modification time) once
+    the total size exceeds `max_size`.
+
+    The cache also stores small JSON manifests that map call signatures to the resolved
+    bindings and kernel they were compiled to (see `slangpy.core.manifest`).
+
+    Note that this caches the compiled slang module only. To also skip the downstream
+    compile (e.g. DXC/SPIR-V generation), enable the device's own shader cache via
+    `shader_cache_path` when creating it.
+    """
+
+    def __init__(self, path: Union[str, PathLike[str]], max_size: int = DEFAULT_MAX_SIZE):
+        self.path = Path(path).absolute()
+        self.max_size = max_size
+        self.path.mkdir(parents=True, exist_ok=True)
+        # Sessions are held weakly, so entries go away with their sessions.
+        self._fingerprints: "weakref.WeakKeyDictionary[SlangSession, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._size = sum(size for _, size, _ in self._scan())
+
+    @property
+    def size(self) -> int:
+        """
+        Total size in bytes of all entries in the cache.
+        """
+        return self._size
+
+    def key(
+        self,
+        code_hash: str,
+        session: SlangSession,
+        link_options: Optional[SlangLinkOptions] = None,
+    ) -> str:
+        """
+        Calculate the cache key for a kernel with the given code hash, compiled
+        by a given session with the provided link options.
+        """
+        fingerprint = self._fingerprints.get(session)
+        if fingerprint is None:
+            fingerprint = _session_fingerprint(session)
+            self._fingerprints[session] = fingerprint
+        lines = [code_hash, fingerprint]
+        if link_options is not None:
+            lines.append(str(link_options.dump_intermediates))
+            lines.append(str(link_options.dump_intermediates_prefix))
+        return hashlib.sha256("\n".join(lines).encode()).hexdigest()
+
+    def load(self, session: SlangSession, key: str) -> Optional[SlangModule]:
+        """
+        Load a kernel module from the cache, returning None if it is missing or out of date.
+        """
+        fn = self._entry_path(key, _KERNEL_EXTENSION)
+        ir = self._read(fn)
+        if ir is None:
+            return None
+
+        module = session.load_module_from_ir(key, ir)
+        if module is None:
+            # Serialized module is stale with respect to its dependencies.
+            if self._remove(fn):
+                self._size -= len(ir)
+            return None
+
+        return module
+
+    def store(self, key: str, module: SlangModule) -> None:
+        """
+        Store a kernel module in the cache, evicting old entries if the cache is full.
+        """
+        self._write(self._entry_path(key, _KERNEL_EXTENSION), module.serialize())
+
+    def load_manifest(self, key: str) -> Optional[dict[str, Any]]:
+        """
+        Load a call manifest from the cache, returning None if it is missing or invalid.
+        """
+        data = self._read(self._entry_path(key, _MANIFEST_EXTENSION))
+        if data is None:
+            return None
+        try:
+            return json.loads(data)
+        except ValueError:
+            return None
+
+    def store_manifest(self, key: str, manifest: dict[str, Any]) -> None:
+        """
+        Store a call manifest in the cache.
+        """
+        data = json.dumps(manifest, separators=(",", ":")).encode()
+        self._write(self._entry_path(key, _MANIFEST_EXTENSION), data)
+
+    def evict(self, target_size: Optional[int] = None) -> None:
+        """
+        Evict least recently used entries until the cache is no larger than
+        `target_size` (defaults to `max_size`).
+        """
+        if target_size is None:
+            target_size = self.max_size
+        entries = sorted(self._scan(), key=lambda x: x[2])
+        size = sum(size for _, size, _ in entries)
+        for fn, entry_size, _ in entries:
+            if size <= target_size:
+                break
+            if self._remove(fn):
+                size -= entry_size
+        self._size = size
+
+    def clear(self) -> None:
+        """
+        Remove all entries from the cache.
+        """
+        self.evict(0)
+
+    def _entry_path(self, key: str, extension: str) -> Path:
+        return self.path / key[:2] / (key + extension)
+
+    def _read(self, fn: Path) -> Optional[bytes]:
+        try:
+            with open(fn, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        # Touch entry so it is treated as most recently used.
+        try:
+            os.utime(fn)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, fn: Path, data: bytes):
+        if len(data) > self.max_size:
+            return
+
+        # Write to a temporary file and rename, so concurrent processes never
+        # observe partially written entries.
+        fn.parent.mkdir(parents=True, exist_ok=True)
+        tmp = fn.with_suffix(f"{fn.suffix}-{os.getpid()}")
+        try:
+            prev_size = fn.stat().st_size if fn.exists() else 0
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, fn)
+        except OSError:
+            self._remove(tmp)
+            return
+        self._size += len(data) - prev_size
+
+        if self._size > self.max_size:
+            self.evict()
+
+    def _scan(self):
+        for extension in (_KERNEL_EXTENSION, _MANIFEST_EXTENSION):
+            for fn in self.path.glob(f"*/*{extension}"):
+                try:
+                    st = fn.stat()
+                except OSError:
+                    continue
+                yield (fn, st.st_size, st.st_mtime)
+
+    def _remove(self, fn: Path) -> bool:
+        try:
+            os.remove(fn)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from collections import OrderedDict
+from typing import Generic, Iterator, Optional, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """
+    Dictionary-like cache that evicts least recently used entries once it holds more
+    than `capacity` entries, and tracks hit/miss/eviction statistics. A capacity of
+    0 means the cache is unbounded.
+    """
+
+    def __init__(self, capacity: int = 0):
+        super().__init__()
+        self._entries: OrderedDict[K, V] = OrderedDict()
+        self._capacity = capacity
+        #: Number of lookups that found an entry.
+        self.hits = 0
+        #: Number of lookups that failed to find an entry.
+        self.misses = 0
+        #: Number of entries evicted due to exceeding capacity.
+        self.evictions = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        Maximum number of entries, or 0 if unbounded.
+        """
+        return self._capacity
+
+    @capacity.setter
+    def capacity(self, value: int):
+        self._capacity = value
+        self._evict()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of entries in the cache.
+        """
+        return len(self._entries)
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """
+        Look up an entry, marking it as most recently used.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def clear(self):
+        """
+        Remove all entries from the cache.
+        """
+        self._entries.clear()
+
+    def reset_stats(self):
+        """
+        Reset hit/miss/eviction counters.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _evict(self):
+        if self._capacity > 0:
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def __getitem__(self, key: K) -> V:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: K, value: V):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def __delitem__(self, key: K):
+        del self._entries[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from typing import Any, Optional
+
+from slangpy.core.native import AccessType, CallMode, Shape
+
+from slangpy.bindings.boundvariable import BoundCall, BoundVariable
+from slangpy.bindings.marshall import BindContext
+
+#: Version of the manifest format. Bump whenever the serialized layout changes.
+MANIFEST_VERSION = 1
+
+
+class ManifestMismatch(Exception):
+    """
+    Raised when a manifest can not be applied to the arguments of a call, in which
+    case the full kernel generation pipeline should be run instead.
+    """
+
+    def __init__(self, message: str):
+        super().__init__(message)
+        self.message = message
+
+
+def _serialize_variable(variable: BoundVariable) -> dict[str, Any]:
+    res: dict[str, Any] = {
+        "name": variable.name,
+        "variable_name": variable.variable_name,
+        "param_index": variable.param_index,
+        "access": [variable.access[0].name, variable.access[1].name],
+        "differentiable": variable.differentiable,
+        "call_dimensionality": variable.call_dimensionality,
+        "vector_mapping": list(variable.vector_mapping.as_tuple()),
+        "vector_type": (
+            variable.vector_type.full_name if variable.vector_type is not None else None
+        ),
+    }
+    if variable.children is not None:
+        res["children"] = {
+            name: _serialize_variable(child) for name, child in variable.children.items()
+        }
+    return res
+
+
+def serialize_bindings(
+    bindings: BoundCall,
+    call_dimensionality: int,
+    call_mode: CallMode,
+    kernel_hash: str,
+    kernel_key: str,
+    generated_result: bool,
+) -> dict[str, Any]:
+    """
+    Serialize the fully resolved bindings of a call, along with the identity of
+    the kernel it was compiled to, so the call can later be restored without
+    running the kernel generation pipeline.
+    """
+    return {
+        "version": MANIFEST_VERSION,
+        "kernel_hash": kernel_hash,
+        "kernel_key": kernel_key,
+        "call_mode": call_mode.name,
+        "call_dimensionality": call_dimensionality,
+        "generated_result": generated_result,
+        "args": [_serialize_variable(x) for x in bindings.args],
+        "kwargs": {name: _serialize_variable(x) for name, x in bindings.kwargs.items()},
+    }
+
+
+def _apply_variable(context: BindContext, variable: BoundVariable, data: dict[str, Any]):
+    variable.name = data["name"]
+    variable.variable_name = data["variable_name"]
+    variable.param_index = data["param_index"]
+    variable.access = (AccessType[data["access"][0]], AccessType[data["access"][1]])
+    variable.differentiable = data["differentiable"]
+    variable.call_dimensionality = data["call_dimensionality"]
+    variable.vector_mapping = Shape(*data["vector_mapping"])
+
+    vector_type_name: Optional[str] = data["vector_type"]
+    if vector_type_name is not None:
+        vector_type = context.layout.find_type_by_name(vector_type_name)
+        if vector_type is None:
+            raise ManifestMismatch(f"Could not find vector type '{vector_type_name}'")
+        variable.vector_type = vector_type
+
+    children: Optional[dict[str, Any]] = data.get("children")
+    if (children is None) != (variable.children is None):
+        raise ManifestMismatch(f"Structure of argument '{variable.debug_name}' has changed")
+    if children is not None:
+        assert variable.children is not None
+        if children.keys() != variable.children.keys():
+            raise ManifestMismatch(f"Fields of argument '{variable.debug_name}' have changed")
+        for name, child in variable.children.items():
+            _apply_variable(context, child, children[name])
+
+
+def apply_manifest(context: BindContext, bindings: BoundCall, data: dict[str, Any]):
+    """
+    Apply a manifest created by serialize_bindings to a newly constructed (unbound)
+    set of bindings, restoring all information calculated during kernel generation.
+    """
+    if data.get("version") != MANIFEST_VERSION:
+        raise ManifestMismatch("Manifest version mismatch")
+    if data["call_mode"] != context.call_mode.name:
+        raise ManifestMismatch("Call mode mismatch")
+
+    if len(data["args"]) != len(bindings.args):
+        raise ManifestMismatch("Positional argument count mismatch")
+    if data["kwargs"].keys() != bindings.kwargs.keys():
+        raise ManifestMismatch("Keyword arguments mismatch")
+
+    for variable, var_data in zip(bindings.args, data["args"]):
+        _apply_variable(context, variable, var_data)
+    for name, variable in bindings.kwargs.items():
+        _apply_variable(context, variable, data["kwargs"][name])
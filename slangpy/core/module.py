@@ -1,7 +1,11 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
-from typing import TYPE_CHECKING, Any, Optional, Union
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Union
 
-from slangpy.core.function import Function
+from slangpy.core.function import Function, FunctionNode
+from slangpy.core.lrucache import LRUCache
+from slangpy.core.profiler import CallProfiler
 from slangpy.core.struct import Struct
 
 from slangpy import ComputeKernel, SlangModule, Device, Logger
@@ -12,6 +16,7 @@ from slangpy.bindings.typeregistry import PYTHON_SIGNATURES
 import weakref
 
 if TYPE_CHECKING:
+    from slangpy.core.calldata import CallData
     from slangpy.core.dispatchdata import DispatchData
 
 LOADED_MODULES = weakref.WeakValueDictionary()
@@ -19,9 +24,10 @@ LOADED_MODULES = weakref.WeakValueDictionary()
 
 def _check_for_hot_reload(event_info: Any = None):
     global LOADED_MODULES
+    changed_files = event_info.changed_files if event_info is not None else None
     for module in LOADED_MODULES.values():
         if module is not None:
-            module.on_hot_reload()
+            module.on_hot_reload(changed_files)
 
 
 def _register_hot_reload_hook(device: Device):
@@ -69,8 +75,10 @@ class Module:
         self.layout = SlangProgramLayout(combined_program.layout)
 
         self.call_data_cache = CallDataCache()
-        self.dispatch_data_cache: dict[str, "DispatchData"] = {}
-        self.kernel_cache: dict[str, ComputeKernel] = {}
+        self.pending_call_data: dict[str, "Future[CallData]"] = {}
+        self.dispatch_data_cache: LRUCache[str, "DispatchData"] = LRUCache()
+        self.kernel_cache: LRUCache[str, ComputeKernel] = LRUCache()
+        self.build_stats: dict[str, dict[str, Any]] = {}
         self.link = [x.module if isinstance(x, Module) else x for x in link]
         self.logger: Optional[Logger] = None
 
@@ -204,19 +212,134 @@ class Module:
             return None
         return child.as_func()
 
-    def on_hot_reload(self):
+    def warmup(
+        self, calls: Iterable[tuple[Union[str, FunctionNode], tuple[Any, ...], dict[str, Any]]]
+    ) -> list["Future[CallData]"]:
         """
-        Called by device when the module is hot reloaded.
+        Precompile kernels for a set of expected calls on background threads. Each call is
+        a tuple of (function or function name, example args, example kwargs). Returns
+        a future per call, which can be waited on with `concurrent.futures.wait`.
+        """
+        futures = []
+        for func, args, kwargs in calls:
+            if isinstance(func, str):
+                func = self.require_function(func)
+            futures.append(func.precompile_async(*args, **kwargs))
+        return futures
+
+    def set_cache_capacity(
+        self,
+        call_data: Optional[int] = None,
+        kernels: Optional[int] = None,
+        dispatch_data: Optional[int] = None,
+    ):
+        """
+        Set the maximum number of entries in the module's call data, kernel and dispatch
+        data caches. Least recently used entries are evicted once a cache is full. A
+        capacity of 0 means unbounded, and None leaves the capacity unchanged.
+        """
+        if call_data is not None:
+            self.call_data_cache.capacity = call_data
+        if kernels is not None:
+            self.kernel_cache.capacity = kernels
+        if dispatch_data is not None:
+            self.dispatch_data_cache.capacity = dispatch_data
+
+    def cache_stats(self) -> dict[str, Any]:
+        """
+        Get statistics for the module's caches (entry counts, capacity, hits, misses and
+        evictions), along with the number of kernels generated and cumulative time spent
+        generating them for each function.
+        """
+
+        def stats(cache: Union[CallDataCache, LRUCache[Any, Any]]):
+            return {
+                "entries": cache.size,
+                "capacity": cache.capacity,
+                "hits": cache.hits,
+                "misses": cache.misses,
+                "evictions": cache.evictions,
+            }
+
+        return {
+            "call_data": stats(self.call_data_cache),
+            "kernels": stats(self.kernel_cache),
+            "dispatch_data": stats(self.dispatch_data_cache),
+            "build": {name: dict(x) for name, x in self.build_stats.items()},
+        }
+
+    def record_build(self, name: str, seconds: float):
+        """
+        Record time spent generating call data for a function, reported by cache_stats.
+        """
+        stats = self.build_stats.get(name)
+        if stats is None:
+            stats = {"count": 0, "seconds": 0.0}
+            self.build_stats[name] = stats
+        stats["count"] += 1
+        stats["seconds"] += seconds
+
+    @property
+    def profiler(self) -> Optional[CallProfiler]:
+        """
+        The profiler recording timings of calls to functions in this module, if enabled.
+        """
+        return self.call_data_cache.profiler
+
+    def enable_profiling(
+        self, capacity: int = CallProfiler.DEFAULT_CAPACITY, gpu_timing: bool = False
+    ) -> CallProfiler:
+        """
+        Start recording the time spent in each phase of calls to functions in this module,
+        keeping up to `capacity` events. If `gpu_timing` is set, device execution time is
+        also measured with timestamp queries, which requires waiting for each call to finish.
+        Returns the profiler, which can be used to summarize or export the recorded events.
+        """
+        profiler = CallProfiler(capacity)
+        profiler.gpu_timing = gpu_timing
+        self.call_data_cache.profiler = profiler
+        return profiler
+
+    def disable_profiling(self):
+        """
+        Stop recording call timings.
+        """
+        self.call_data_cache.profiler = None
+
+    def depends_on(self, files: Iterable[Union[str, Path]]) -> bool:
+        """
+        Check if the module, or any module linked to it, was built from any of the files.
+        """
+        paths = {Path(f) for f in files}
+        for module in [self.device_module] + self.link:
+            if any(dep in paths for dep in module.dependency_files):
+                return True
+        return False
+
+    def on_hot_reload(self, changed_files: Optional[Iterable[Union[str, Path]]] = None):
+        """
+        Called by device when the module is hot reloaded. If `changed_files` is given, cached
+        kernels and call data are only dropped if the module depends on one of the files.
         """
         # Relink combined program
         module_list = [self.slangpy_device_module, self.device_module]
         combined_program = self.device_module.session.link_program(module_list, [])
         self.layout.on_hot_reload(combined_program.layout)
 
+        # Kernels of modules that don't depend on the changed files are still valid, as
+        # their programs aren't relinked, so they're kept to avoid recompiling them.
+        if changed_files and not self.depends_on(changed_files):
+            return
+
         # Clear all caches
+        call_data_capacity = self.call_data_cache.capacity
+        profiler = self.call_data_cache.profiler
         self.call_data_cache = CallDataCache()
-        self.dispatch_data_cache = {}
-        self.kernel_cache = {}
+        self.call_data_cache.capacity = call_data_capacity
+        self.call_data_cache.profiler = profiler
+        self.pending_call_data = {}
+        self.dispatch_data_cache.clear()
+        self.kernel_cache.clear()
         self._attr_cache = {}
 
     def __getattr__(self, name: str):
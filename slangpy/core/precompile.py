@@ -0,0 +1,112 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional
+
+from slangpy.core.native import NativeCallDataCache, NativeCallRuntimeOptions, SignatureBuilder
+
+if TYPE_CHECKING:
+    from slangpy.core.calldata import CallData
+    from slangpy.core.function import FunctionNode
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        _EXECUTOR = ThreadPoolExecutor(
+            max_workers=os.cpu_count(), thread_name_prefix="slangpy-compile"
+        )
+    return _EXECUTOR
+
+
+def _call_signature(func: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    # Must match the signature calculated by NativeFunctionNode when calling.
+    builder = SignatureBuilder()
+    func.read_signature(builder)
+    func.module.call_data_cache.get_args_signature(builder, *args, **kwargs)
+    return builder.str
+
+
+def _build(
+    func: "FunctionNode",
+    cache: NativeCallDataCache,
+    pending: dict[str, "Future[CallData]"],
+    signature: str,
+    future: "Future[CallData]",
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+):
+    from slangpy.core.calldata import CallData
+
+    try:
+        call_data = CallData(func, *args, **kwargs)
+        cache.add_call_data(signature, call_data)
+        future.set_result(call_data)
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _LOCK:
+            pending.pop(signature, None)
+
+
+def precompile_async(
+    func: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> "Future[CallData]":
+    """
+    Generate and compile the kernel for a call to a function with the given example
+    arguments on a background thread, and return a future for the resulting call data.
+    Linking releases the GIL, so kernels for different signatures are generated while others
+    link. If the kernel is already compiled or being compiled, no new work is started.
+    """
+    options = NativeCallRuntimeOptions()
+    func.gather_runtime_options(options)
+    if options.this is not None:
+        args = (options.this,) + args
+
+    module = func.module
+    signature = _call_signature(func, args, kwargs)
+    cache = module.call_data_cache
+    pending = module.pending_call_data
+
+    with _LOCK:
+        # Peek rather than find, so probing doesn't count towards the cache statistics.
+        call_data = cache.peek_call_data(signature)
+        if call_data is not None:
+            future: "Future[CallData]" = Future()
+            future.set_result(call_data)
+            return future
+
+        future = pending.get(signature)
+        if future is not None:
+            return future
+
+        future = Future()
+        pending[signature] = future
+        _get_executor().submit(_build, func, cache, pending, signature, future, args, kwargs)
+        return future
+
+
+def wait_for_precompile(
+    func: "FunctionNode", args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> Optional["CallData"]:
+    """
+    If a call with matching signature is currently being compiled in the background, wait
+    for it to complete and return its call data. Returns None if there is no matching
+    compile in flight, or if it failed.
+    """
+    pending = func.module.pending_call_data
+    if len(pending) == 0:
+        return None
+    with _LOCK:
+        future = pending.get(_call_signature(func, args, kwargs))
+    if future is None:
+        return None
+    try:
+        return future.result()
+    except Exception:
+        # Let the caller regenerate the call data, so the error is reported in context.
+        return None
@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import json
+from os import PathLike
+from typing import Any, Optional, Union
+
+from slangpy.core.native import CallProfileEvent, NativeCallProfiler
+
+
+class CallProfiler(NativeCallProfiler):
+    """
+    Records how long each phase of a call takes into a ring buffer, which can be
+    summarized or exported as a Chrome trace (viewable in chrome://tracing or Perfetto).
+
+    Phases recorded for every call are:
+
+    - ``signature``: hashing the arguments to build the call signature.
+    - ``lookup``: finding call data for the signature.
+    - ``prepare``: unpacking arguments, calculating call shape and allocating results.
+    - ``dispatch``: recording the kernel dispatch, which includes ``write``.
+    - ``write``: writing arguments to shader cursors.
+    - ``submit``: submitting the command buffer.
+    - ``readback``: waiting for the device and reading back results.
+
+    When call data is generated, ``build`` is recorded along with its sub-phases
+    (``restore``, ``specialize``, ``bind``, ``codegen`` and ``compile``). If `gpu_timing`
+    is enabled and supported by the device, ``execute`` records how long the device spent
+    executing each call, placed on the timeline at the point the call was submitted.
+    """
+
+    def __init__(self, capacity: int = NativeCallProfiler.DEFAULT_CAPACITY):
+        super().__init__(capacity)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """
+        Aggregate recorded events by phase, returning the number of events along with
+        the total and mean duration in milliseconds of each phase.
+        """
+        res: dict[str, dict[str, float]] = {}
+        for event in self.events():
+            duration = (event.end - event.start) * 1e-6
+            stats = res.setdefault(event.phase, {"count": 0, "total_ms": 0.0, "mean_ms": 0.0})
+            stats["count"] += 1
+            stats["total_ms"] += duration
+        for stats in res.values():
+            stats["mean_ms"] = stats["total_ms"] / stats["count"]
+        return res
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Convert recorded events to the Chrome trace event format. Host events are
+        grouped by thread, and device events are shown as a separate process.
+        """
+        trace: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": 0, "args": {"name": "Host"}},
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": "Device"}},
+        ]
+        for event in self.events():
+            trace.append(_chrome_trace_event(event))
+        return {"traceEvents": trace, "displayTimeUnit": "ns"}
+
+    def export_chrome_trace(self, path: Union[str, PathLike[str]]):
+        """
+        Write recorded events to a Chrome trace JSON file.
+        """
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+
+def _chrome_trace_event(event: CallProfileEvent) -> dict[str, Any]:
+    return {
+        "name": event.phase,
+        "cat": "gpu" if event.gpu else "cpu",
+        "ph": "X",
+        "ts": event.start * 1e-3,
+        "dur": (event.end - event.start) * 1e-3,
+        "pid": 1 if event.gpu else 0,
+        "tid": 0 if event.gpu else event.thread_id,
+        "args": {"function": event.name},
+    }
+
+
+class PhaseTimer:
+    """
+    Records a sequence of consecutive phases of work to a profiler. Each call to `mark`
+    records the time since the previous mark (or construction). Does nothing if no
+    profiler is provided.
+    """
+
+    def __init__(self, profiler: Optional[NativeCallProfiler], name: str):
+        super().__init__()
+        self.profiler = profiler
+        self.name = name
+        self.start = NativeCallProfiler.now() if profiler is not None else 0
+
+    def mark(self, phase: str):
+        if self.profiler is not None:
+            end = NativeCallProfiler.now()
+            self.profiler.record(self.name, phase, self.start, end)
+            self.start = end
@@ -0,0 +1,485 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Reductions (sum, min, max, mean and argmax) over NDBuffers and Tensors that run on the device.
+
+An input is first viewed as a 2D [M, N] buffer, with the M kept elements as rows and the N
+reduced elements as columns. Each pass launches one workgroup of `GROUP_SIZE` threads per
+block of `REDUCE_BLOCK_SIZE` columns of a row. Neighbouring threads read neighbouring columns,
+and the workgroup combines its per-thread results with a tree reduction in groupshared memory,
+writing one partial result per block. Passes repeat over the partial results, shrinking N by
+`REDUCE_BLOCK_SIZE` each time, until a single column remains. Results never leave the device
+and are deterministic, as every pass combines values in a fixed order.
+"""
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
+
+from slangpy import Device
+from slangpy.core.bufferkernels import (
+    GROUP_SIZE,
+    TBuffer,
+    buffer_type,
+    container,
+    dispatch_groups,
+    get_kernel_module,
+)
+from slangpy.core.module import Module
+from slangpy.core.native import NativeNDBuffer, NativeTensor
+from slangpy.types.buffer import NDBuffer
+
+if TYPE_CHECKING:
+    from slangpy.core.function import FunctionNode
+
+#: Number of columns reduced by each workgroup in a pass.
+REDUCE_BLOCK_SIZE = 8 * GROUP_SIZE
+
+#: Supported reduction operations.
+REDUCE_OPS = ("sum", "min", "max", "mean", "argmax")
+
+#: Supported element types, mapped to the type used to accumulate sums.
+ACCUMULATOR_TYPES = {
+    "int": "int",
+    "uint": "uint",
+    "int64_t": "int64_t",
+    "uint64_t": "uint64_t",
+    "half": "float",
+    "float": "float",
+    "double": "double",
+}
+
+FLOAT_TYPES = ("half", "float", "double")
+
+REDUCE_SOURCE = """
+static const int BLOCK_SIZE = {B};
+
+groupshared {A} g_sum[GROUP_SIZE];
+groupshared {T} g_value[GROUP_SIZE];
+groupshared int g_index[GROUP_SIZE];
+
+{T} reduce_copy({T} value)
+{{
+    return value;
+}}
+
+// Find the row and the first column of the block reduced by a workgroup. Returns false for the
+// groups past the last block, which pad the dispatch grid.
+bool reduce_block(uint3 group_id, int groups_x, int blocks, int rows, out int row, out int begin)
+{{
+    int group = group_index(group_id, groups_x);
+    row = group / blocks;
+    begin = (group % blocks) * BLOCK_SIZE;
+    return row < rows;
+}}
+
+// Tree reductions of one value per thread of a workgroup, in a fixed order. The result is
+// returned to thread 0.
+{A} tree_sum(int tid, {A} value)
+{{
+    g_sum[tid] = value;
+    GroupMemoryBarrierWithGroupSync();
+    for (int s = GROUP_SIZE / 2; s > 0; s >>= 1) {{
+        if (tid < s)
+            g_sum[tid] += g_sum[tid + s];
+        GroupMemoryBarrierWithGroupSync();
+    }}
+    return g_sum[0];
+}}
+
+{T} tree_min(int tid, {T} value)
+{{
+    g_value[tid] = value;
+    GroupMemoryBarrierWithGroupSync();
+    for (int s = GROUP_SIZE / 2; s > 0; s >>= 1) {{
+        if (tid < s)
+            g_value[tid] = min(g_value[tid], g_value[tid + s]);
+        GroupMemoryBarrierWithGroupSync();
+    }}
+    return g_value[0];
+}}
+
+{T} tree_max(int tid, {T} value)
+{{
+    g_value[tid] = value;
+    GroupMemoryBarrierWithGroupSync();
+    for (int s = GROUP_SIZE / 2; s > 0; s >>= 1) {{
+        if (tid < s)
+            g_value[tid] = max(g_value[tid], g_value[tid + s]);
+        GroupMemoryBarrierWithGroupSync();
+    }}
+    return g_value[0];
+}}
+
+// Ties resolve to the lowest index, as in numpy.
+void tree_argmax(int tid, inout {T} value, inout int index)
+{{
+    g_value[tid] = value;
+    g_index[tid] = index;
+    GroupMemoryBarrierWithGroupSync();
+    for (int s = GROUP_SIZE / 2; s > 0; s >>= 1) {{
+        if (tid < s) {{
+            {T} v = g_value[tid + s];
+            int i = g_index[tid + s];
+            if (v > g_value[tid] || (v == g_value[tid] && i < g_index[tid])) {{
+                g_value[tid] = v;
+                g_index[tid] = i;
+            }}
+        }}
+        GroupMemoryBarrierWithGroupSync();
+    }}
+    value = g_value[0];
+    index = g_index[0];
+}}
+
+// Each workgroup reduces a block of BLOCK_SIZE columns of a row into column `begin / BLOCK_SIZE`
+// of `dst`. Neighbouring threads read neighbouring columns, and threads past the end of a
+// short block start from its first element, which leaves min, max and argmax unchanged.
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_sum(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 2> src,
+    uniform RW{C}<{T}, 2> dst,
+    uniform int groups_x,
+    uniform int blocks,
+    uniform {A} scale
+)
+{{
+    int row, begin;
+    if (!reduce_block(group_id, groups_x, blocks, int(src.shape[0]), row, begin))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[1]));
+    int tid = int(thread_id.x);
+
+    {A} acc = {A}(0);
+    int idx[2] = {{ row, begin }};
+    for (idx[1] = begin + tid; idx[1] < end; idx[1] += GROUP_SIZE)
+        acc += {A}(src.get(idx));
+    acc = tree_sum(tid, acc);
+
+    if (tid == 0) {{
+        int dst_idx[2] = {{ row, begin / BLOCK_SIZE }};
+        dst.set(dst_idx, {T}(acc * scale));
+    }}
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_min(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 2> src,
+    uniform RW{C}<{T}, 2> dst,
+    uniform int groups_x,
+    uniform int blocks
+)
+{{
+    int row, begin;
+    if (!reduce_block(group_id, groups_x, blocks, int(src.shape[0]), row, begin))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[1]));
+    int tid = int(thread_id.x);
+
+    int idx[2] = {{ row, begin }};
+    {T} res = src.get(idx);
+    for (idx[1] = begin + tid; idx[1] < end; idx[1] += GROUP_SIZE)
+        res = min(res, src.get(idx));
+    res = tree_min(tid, res);
+
+    if (tid == 0) {{
+        int dst_idx[2] = {{ row, begin / BLOCK_SIZE }};
+        dst.set(dst_idx, res);
+    }}
+}}
+
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_max(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 2> src,
+    uniform RW{C}<{T}, 2> dst,
+    uniform int groups_x,
+    uniform int blocks
+)
+{{
+    int row, begin;
+    if (!reduce_block(group_id, groups_x, blocks, int(src.shape[0]), row, begin))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[1]));
+    int tid = int(thread_id.x);
+
+    int idx[2] = {{ row, begin }};
+    {T} res = src.get(idx);
+    for (idx[1] = begin + tid; idx[1] < end; idx[1] += GROUP_SIZE)
+        res = max(res, src.get(idx));
+    res = tree_max(tid, res);
+
+    if (tid == 0) {{
+        int dst_idx[2] = {{ row, begin / BLOCK_SIZE }};
+        dst.set(dst_idx, res);
+    }}
+}}
+
+// First argmax pass, where the index of a value is its column.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_argmax_first(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 2> src,
+    uniform RW{C}<{T}, 2> dst,
+    uniform RWNDBuffer<int, 2> dst_index,
+    uniform int groups_x,
+    uniform int blocks
+)
+{{
+    int row, begin;
+    if (!reduce_block(group_id, groups_x, blocks, int(src.shape[0]), row, begin))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[1]));
+    int tid = int(thread_id.x);
+
+    // Columns are visited in increasing order, so keeping the first largest value keeps the
+    // lowest index.
+    int idx[2] = {{ row, begin }};
+    {T} value = src.get(idx);
+    int index = begin;
+    for (idx[1] = begin + tid; idx[1] < end; idx[1] += GROUP_SIZE) {{
+        {T} v = src.get(idx);
+        if (v > value) {{
+            value = v;
+            index = idx[1];
+        }}
+    }}
+    tree_argmax(tid, value, index);
+
+    if (tid == 0) {{
+        int dst_idx[2] = {{ row, begin / BLOCK_SIZE }};
+        dst.set(dst_idx, value);
+        dst_index.set(dst_idx, index);
+    }}
+}}
+
+// Later argmax passes, reading the index of each value from the previous pass.
+[shader("compute")]
+[numthreads(GROUP_SIZE, 1, 1)]
+void reduce_argmax(
+    uint3 thread_id: SV_GroupThreadID,
+    uint3 group_id: SV_GroupID,
+    uniform {C}<{T}, 2> src,
+    uniform NDBuffer<int, 2> src_index,
+    uniform RW{C}<{T}, 2> dst,
+    uniform RWNDBuffer<int, 2> dst_index,
+    uniform int groups_x,
+    uniform int blocks
+)
+{{
+    int row, begin;
+    if (!reduce_block(group_id, groups_x, blocks, int(src.shape[0]), row, begin))
+        return;
+    int end = min(begin + BLOCK_SIZE, int(src.shape[1]));
+    int tid = int(thread_id.x);
+
+    int idx[2] = {{ row, begin }};
+    {T} value = src.get(idx);
+    int index = src_index.get(idx);
+    for (idx[1] = begin + tid; idx[1] < end; idx[1] += GROUP_SIZE) {{
+        {T} v = src.get(idx);
+        if (v > value) {{
+            value = v;
+            index = src_index.get(idx);
+        }}
+    }}
+    tree_argmax(tid, value, index);
+
+    if (tid == 0) {{
+        int dst_idx[2] = {{ row, begin / BLOCK_SIZE }};
+        dst.set(dst_idx, value);
+        dst_index.set(dst_idx, index);
+    }}
+}}
+"""
+
+
+def get_reduce_module(device: Device, type_name: str, container_name: str) -> Module:
+    """
+    Get the module containing reduction kernels for elements of type `type_name`
+    read from `container_name` (``NDBuffer`` or ``Tensor``), loading it on first use.
+    """
+    return get_kernel_module(
+        device,
+        "reduce",
+        REDUCE_SOURCE,
+        T=type_name,
+        A=ACCUMULATOR_TYPES[type_name],
+        C=container_name,
+        B=REDUCE_BLOCK_SIZE,
+    )
+
+
+def _normalize_axis(axis: Union[None, int, Sequence[int]], dims: int) -> list[int]:
+    if axis is None:
+        return list(range(dims))
+    axes = [axis] if isinstance(axis, int) else list(axis)
+    res: list[int] = []
+    for a in axes:
+        if a < -dims or a >= dims:
+            raise ValueError(f"Axis {a} is out of range for {dims} dimensions")
+        a = a % dims
+        if a in res:
+            raise ValueError(f"Axis {a} is repeated")
+        res.append(a)
+    return sorted(res)
+
+
+def _collapse(shape: list[int], strides: list[int]) -> Optional[tuple[int, int]]:
+    """
+    Collapse dimensions into one, returning its size and stride, or None if the elements
+    can't be addressed with a single stride.
+    """
+    dims = [(s, st) for s, st in zip(shape, strides) if s != 1]
+    size = 1
+    for s, _ in dims:
+        size *= s
+    if len(dims) == 0:
+        return size, 0
+    for (_, outer), (inner_size, inner) in zip(dims[:-1], dims[1:]):
+        if outer != inner * inner_size:
+            return None
+    return size, dims[-1][1]
+
+
+def reduce(src: TBuffer, op: str, axis: Union[None, int, Sequence[int]] = None) -> TBuffer:
+    """
+    Reduce `src` with `op` over the dimensions in `axis` (all dimensions if None), returning a
+    new buffer of the same kind holding the result, shaped like `src` without the reduced
+    dimensions, or (1,) if all dimensions are reduced. Results of argmax are indices into the
+    flattened reduced dimensions, returned as an NDBuffer of ints.
+    """
+    if op not in REDUCE_OPS:
+        raise ValueError(f"Unsupported reduction '{op}', expected one of {', '.join(REDUCE_OPS)}")
+    if not isinstance(src, (NativeNDBuffer, NativeTensor)):
+        raise ValueError(f"Reductions require an NDBuffer or Tensor, got {type(src).__name__}")
+
+    type_name = src.dtype.full_name
+    if type_name not in ACCUMULATOR_TYPES:
+        raise ValueError(
+            f"Reductions require a scalar element type "
+            f"({', '.join(ACCUMULATOR_TYPES)}), got '{type_name}'"
+        )
+    if op == "mean" and type_name not in FLOAT_TYPES:
+        raise ValueError(f"mean requires a floating point element type, got '{type_name}'")
+    if isinstance(src, NativeTensor) and type_name not in FLOAT_TYPES:
+        raise ValueError(
+            f"Tensor reductions require a floating point element type, got '{type_name}'"
+        )
+
+    kind = buffer_type(src)
+    device = src.device
+    module = get_reduce_module(device, type_name, container(src))
+
+    # Permute the view so kept dimensions come first, followed by reduced dimensions.
+    shape = list(src.shape.as_tuple())
+    strides = list(src.strides.as_tuple())
+    reduced = _normalize_axis(axis, len(shape))
+    kept = [i for i in range(len(shape)) if i not in reduced]
+    order = kept + reduced
+    shape = [shape[i] for i in order]
+    strides = [strides[i] for i in order]
+    out_shape = tuple(shape[: len(kept)]) if len(kept) > 0 else (1,)
+
+    rows = _collapse(shape[: len(kept)], strides[: len(kept)])
+    cols = _collapse(shape[len(kept) :], strides[len(kept) :])
+    if rows is None or cols is None:
+        # Copy into a contiguous buffer so both groups of dimensions can be collapsed.
+        permuted = src.view(tuple(shape), tuple(strides))
+        src = kind.empty(device, shape, src.dtype)
+        module.reduce_copy(permuted, _result=src)
+        strides = list(src.strides.as_tuple())
+        rows = _collapse(shape[: len(kept)], strides[: len(kept)])
+        cols = _collapse(shape[len(kept) :], strides[len(kept) :])
+        assert rows is not None and cols is not None
+    (m, row_stride), (n, col_stride) = rows, cols
+
+    if n == 0:
+        if op != "sum":
+            raise ValueError(f"Cannot compute {op} over an empty dimension")
+        return kind.zeros(device, out_shape, src.dtype)
+    if m == 0:
+        raise ValueError("Cannot reduce into an empty buffer")
+
+    # The final pass writes straight into the output, viewed as a single column.
+    output = kind.empty(device, out_shape, src.dtype)
+    output_index = NDBuffer.empty(device, out_shape, "int") if op == "argmax" else None
+
+    value = src.view((m, n), (row_stride, col_stride))
+    index: Optional[NativeNDBuffer] = None
+    count = n
+    while True:
+        blocks = (n + REDUCE_BLOCK_SIZE - 1) // REDUCE_BLOCK_SIZE
+        if blocks == 1:
+            result = output.view((m, 1))
+        else:
+            result = kind.empty(device, (m, blocks), src.dtype)
+
+        # One workgroup per block of each row.
+        groups = m * blocks
+        args = {"src": value, "dst": result, "blocks": blocks}
+
+        if op in ("sum", "mean"):
+            # Sums are only scaled by the final pass, so a mean divides the total.
+            scale: Union[int, float] = 1.0 if type_name in FLOAT_TYPES else 1
+            if op == "mean" and blocks == 1:
+                scale = 1.0 / count
+            dispatch_groups(module.reduce_sum, groups, scale=scale, **args)
+        elif op in ("min", "max"):
+            dispatch_groups(module.require_function(f"reduce_{op}"), groups, **args)
+        else:
+            if output_index is not None and blocks == 1:
+                result_index = output_index.view((m, 1))
+            else:
+                result_index = NDBuffer.empty(device, (m, blocks), "int")
+            if index is None:
+                dispatch_groups(
+                    module.reduce_argmax_first, groups, dst_index=result_index, **args
+                )
+            else:
+                dispatch_groups(
+                    module.reduce_argmax, groups, src_index=index, dst_index=result_index, **args
+                )
+            index = result_index
+        value = result
+        n = blocks
+        if blocks == 1:
+            break
+
+    return output_index if output_index is not None else output
+
+
+class ReducedFunction:
+    """
+    Calls a function and reduces its result on the device, returned by `Function.reduce`.
+    The function must return an NDBuffer or Tensor, which is the case for vectorized calls
+    that return a value.
+    """
+
+    def __init__(self, func: "FunctionNode", op: str, axis: Union[None, int, Sequence[int]]):
+        super().__init__()
+        if op not in REDUCE_OPS:
+            raise ValueError(
+                f"Unsupported reduction '{op}', expected one of {', '.join(REDUCE_OPS)}"
+            )
+        self.func = func
+        self.op = op
+        self.axis = axis
+
+    def __call__(self, *args: Any, **kwargs: Any) -> TBuffer:
+        if "_result" in kwargs:
+            raise ValueError("Reduced calls do not support _result")
+        result = self.func.call(*args, **kwargs)
+        if not isinstance(result, (NativeNDBuffer, NativeTensor)):
+            raise ValueError(
+                f"Reduced calls require the function to return an NDBuffer or Tensor, "
+                f"got {type(result).__name__}"
+            )
+        return reduce(result, self.op, self.axis)
@@ -0,0 +1,142 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from collections import deque
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+import numpy as np
+
+from slangpy.core.native import StridedBufferView
+
+if TYPE_CHECKING:
+    from slangpy.core.callfuture import CallFuture
+    from slangpy.core.function import FunctionNode
+
+
+class _Chunk:
+    def __init__(self, future: "CallFuture", start: int, stop: int):
+        super().__init__()
+        self.future = future
+        self.start = start
+        self.stop = stop
+        #: Callbacks that copy results back into non-contiguous slices of the inputs.
+        self.write_backs: list[Callable[[], None]] = []
+
+
+class StreamedFunction:
+    """
+    Calls a function in chunks along one call dimension, so that inputs held in host memory
+    never need to be resident on the device all at once. Returned by `Function.stream`.
+
+    Every numpy array, NDBuffer or Tensor argument whose size along `axis` matches the
+    streamed extent (the largest size of any such argument along `axis`) is split into
+    chunks of `chunk` elements. Other arguments are passed unchanged to every chunk, so
+    are broadcast as usual. Numpy arrays are uploaded chunk by chunk, while device buffers
+    are split into views without copying.
+
+    Up to `depth` chunks are kept in flight: the next chunk is uploaded and submitted
+    while previous chunks execute on the device, and a chunk's results are only read back
+    once `depth` newer chunks have been submitted. As the oldest chunk is only released
+    after the newest one is uploaded, device memory used for host arguments is bounded by
+    `depth + 1` chunks.
+
+    Results are returned as a numpy array assembled along `axis`, or written to the numpy
+    array passed as `_result`.
+    """
+
+    def __init__(self, func: "FunctionNode", chunk: int, axis: int = 0, depth: int = 2):
+        super().__init__()
+        if chunk <= 0:
+            raise ValueError(f"Chunk size must be positive, got {chunk}")
+        if axis < 0:
+            raise ValueError(f"Streamed axis must be non-negative, got {axis}")
+        if depth < 1:
+            raise ValueError(f"Stream depth must be at least 1, got {depth}")
+        self.func = func
+        self.chunk = chunk
+        self.axis = axis
+        self.depth = depth
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        result = kwargs.pop("_result", None)
+        if result is not None and not isinstance(result, np.ndarray):
+            raise ValueError("Streamed calls only support numpy arrays as _result")
+
+        extent = self._extent(list(args) + list(kwargs.values()))
+        if extent is None:
+            raise ValueError(
+                f"Streamed call requires at least one array argument with dimension {self.axis}"
+            )
+        if result is not None and self._size(result) != extent:
+            raise ValueError(
+                f"_result has size {self._size(result)} along axis {self.axis}, expected {extent}"
+            )
+
+        func = self.func.return_type(np.ndarray)
+        pending: deque[_Chunk] = deque()
+        for start in range(0, extent, self.chunk):
+            stop = min(start + self.chunk, extent)
+            write_backs: list[Callable[[], None]] = []
+            chunk_args = [self._split(x, start, stop, extent, write_backs) for x in args]
+            chunk_kwargs = {
+                k: self._split(v, start, stop, extent, write_backs) for k, v in kwargs.items()
+            }
+            chunk = _Chunk(func.call_async(*chunk_args, **chunk_kwargs), start, stop)
+            chunk.write_backs = write_backs
+            pending.append(chunk)
+            if len(pending) > self.depth:
+                result = self._complete(pending.popleft(), result, extent)
+        while len(pending) > 0:
+            result = self._complete(pending.popleft(), result, extent)
+        return result
+
+    def _size(self, value: Any) -> Optional[int]:
+        if isinstance(value, np.ndarray):
+            return value.shape[self.axis] if value.ndim > self.axis else None
+        if isinstance(value, StridedBufferView):
+            shape = value.shape.as_tuple()
+            return shape[self.axis] if len(shape) > self.axis else None
+        return None
+
+    def _extent(self, values: list[Any]) -> Optional[int]:
+        sizes = [s for s in (self._size(x) for x in values) if s is not None]
+        return max(sizes) if len(sizes) > 0 else None
+
+    def _split(
+        self,
+        value: Any,
+        start: int,
+        stop: int,
+        extent: int,
+        write_backs: list[Callable[[], None]],
+    ) -> Any:
+        if self._size(value) != extent:
+            return value
+
+        if isinstance(value, np.ndarray):
+            index = (slice(None),) * self.axis + (slice(start, stop),)
+            view = value[index]
+            if view.flags.c_contiguous:
+                return view
+            # Arrays must be contiguous to be uploaded, so pass a copy of the slice
+            # and copy it back in case the kernel writes to it.
+            copy = np.ascontiguousarray(view)
+            write_backs.append(lambda: value.__setitem__(index, copy))
+            return copy
+
+        shape = list(value.shape.as_tuple())
+        strides = value.strides.as_tuple()
+        shape[self.axis] = stop - start
+        return value.view(tuple(shape), strides, start * strides[self.axis])
+
+    def _complete(self, chunk: _Chunk, result: Optional[np.ndarray], extent: int):
+        res = chunk.future.result()
+        for write_back in chunk.write_backs:
+            write_back()
+        if res is None:
+            return result
+        if result is None:
+            shape = list(res.shape)
+            shape[self.axis] = extent
+            result = np.empty(shape, dtype=res.dtype)
+        index = (slice(None),) * self.axis + (slice(chunk.start, chunk.stop),)
+        result[index] = res
+        return result
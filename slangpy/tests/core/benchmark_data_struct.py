@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Micro-benchmarks for DataStructConverter and Bitmap.convert.
+
+Measures throughput for each pair of common pixel component types, with and without
+sRGB gamma and byte swapping. Run with:
+
+    python -m slangpy.tests.core.benchmark_data_struct [--pixels N] [--json results.json]
+"""
+import argparse
+import itertools
+import json
+import sys
+from timeit import repeat
+from typing import Any
+
+import numpy as np
+
+from slangpy import Bitmap, DataStruct, DataStructConverter
+
+COMPONENT_TYPES: list[tuple[DataStruct.Type, Any]] = [
+    (DataStruct.Type.uint8, np.uint8),
+    (DataStruct.Type.uint16, np.uint16),
+    (DataStruct.Type.float16, np.float16),
+    (DataStruct.Type.float32, np.float32),
+]
+
+OTHER_BYTE_ORDER = (
+    DataStruct.ByteOrder.big_endian
+    if sys.byteorder == "little"
+    else DataStruct.ByteOrder.little_endian
+)
+
+
+def create_pixel_struct(
+    type: DataStruct.Type,
+    channels: int,
+    srgb: bool,
+    byte_order: DataStruct.ByteOrder = DataStruct.ByteOrder.host,
+) -> DataStruct:
+    res = DataStruct(byte_order=byte_order)
+    for name in ["R", "G", "B", "A"][:channels]:
+        flags = DataStruct.Flags.none
+        if DataStruct.is_integer(type):
+            flags |= DataStruct.Flags.normalized
+        if srgb and name != "A":
+            flags |= DataStruct.Flags.srgb_gamma
+        res.append(name, type, flags)
+    return res
+
+
+def measure(func: Any, size: int, repeats: int) -> dict[str, float]:
+    func()  # Warm up, which also compiles the conversion program.
+    times = repeat(func, number=1, repeat=repeats)
+    best = min(times)
+    return {
+        "best_ms": best * 1e3,
+        "median_ms": float(np.median(times)) * 1e3,
+        "mb_per_s": size / best / 1e6,
+    }
+
+
+def run(pixels: int, repeats: int) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    rng = np.random.default_rng(0)
+
+    def record(name: str, stats: dict[str, float]):
+        results.append({"name": name, **stats})
+        print(
+            f"{name:<48} {stats['best_ms']:9.3f} ms {stats['median_ms']:9.3f} ms "
+            f"{stats['mb_per_s']:9.1f} MB/s"
+        )
+
+    cases = itertools.product(COMPONENT_TYPES, COMPONENT_TYPES, [3, 4], [False, True])
+    for (src_type, src_dtype), (dst_type, _), channels, srgb in cases:
+        src_struct = create_pixel_struct(src_type, channels, srgb)
+        dst_struct = create_pixel_struct(dst_type, channels, False)
+        converter = DataStructConverter(src_struct, dst_struct)
+        if np.issubdtype(src_dtype, np.integer):
+            src = rng.integers(0, np.iinfo(src_dtype).max, size=pixels * channels)
+        else:
+            src = rng.random(size=pixels * channels)
+        data = src.astype(src_dtype).tobytes()
+        name = f"{src_type.name}x{channels}{'_srgb' if srgb else ''} -> {dst_type.name}"
+        record(name, measure(lambda: converter.convert(data), len(data), repeats))
+
+    for type, dtype in COMPONENT_TYPES:
+        src_struct = create_pixel_struct(type, 4, False, OTHER_BYTE_ORDER)
+        dst_struct = create_pixel_struct(type, 4, False)
+        converter = DataStructConverter(src_struct, dst_struct)
+        data = np.zeros(pixels * 4, dtype=dtype).tobytes()
+        name = f"{type.name}x4 byte swap"
+        record(name, measure(lambda: converter.convert(data), len(data), repeats))
+
+    width = int(np.sqrt(pixels))
+    image = (rng.random(size=(width, width, 4)) * 255).astype(np.uint8)
+    bitmap = Bitmap(image, Bitmap.PixelFormat.rgba)
+    bitmap.srgb_gamma = True
+    record(
+        "Bitmap rgba8 srgb -> rgba32f linear, flipped",
+        measure(
+            lambda: bitmap.convert(
+                Bitmap.PixelFormat.rgba, Bitmap.ComponentType.float32, False, flip_y=True
+            ),
+            image.nbytes,
+            repeats,
+        ),
+    )
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pixels", type=int, default=1 << 20, help="Pixels per conversion")
+    parser.add_argument("--repeats", type=int, default=10, help="Timed runs per conversion")
+    parser.add_argument("--json", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = run(args.pixels, args.repeats)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"pixels": args.pixels, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
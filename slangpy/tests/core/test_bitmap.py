@@ -135,6 +135,31 @@ def test_bitmap_vflip():
     assert np.all(a == np.flip(img, 0))
 
 
+def test_bitmap_convert_fused():
+    img = create_test_image(50, 100, Bitmap.PixelFormat.rgb, Bitmap.ComponentType.float32)
+    b = Bitmap(img)
+
+    c = b.convert(Bitmap.PixelFormat.rgb, Bitmap.ComponentType.float32, False, flip_y=True)
+    assert np.all(np.array(c, copy=False) == np.flip(img, 0))
+
+    c = b.convert(
+        Bitmap.PixelFormat.rgb, Bitmap.ComponentType.float32, False, scale=2.0, offset=-1.0
+    )
+    assert np.allclose(np.array(c, copy=False), img * 2.0 - 1.0)
+
+    # Greyscale conversion with all options fused into one pass.
+    c = b.convert(
+        Bitmap.PixelFormat.y,
+        Bitmap.ComponentType.float32,
+        False,
+        flip_y=True,
+        scale=0.5,
+        offset=0.25,
+    )
+    y = img[:, :, 0] * 0.2126 + img[:, :, 1] * 0.7152 + img[:, :, 2] * 0.0722
+    assert np.allclose(np.array(c, copy=False).squeeze(), np.flip(y, 0) * 0.5 + 0.25, atol=1e-5)
+
+
 EXR_LAYOUTS = [
     (5, 10, Bitmap.PixelFormat.y, Bitmap.ComponentType.float16),
     (10, 20, Bitmap.PixelFormat.ya, Bitmap.ComponentType.float16),
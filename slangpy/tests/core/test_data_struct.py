@@ -331,5 +331,107 @@ def test_blend_gamma():
     check_conversion(s, "@BB", "@B", (100, 200), (ref,))
 
 
+def test_scale_offset():
+    src = DataStruct()
+    src.append("v", DataStruct.Type.uint8, DataStruct.Flags.normalized)
+
+    target = DataStruct()
+    target.append("v", DataStruct.Type.float32)
+    target.append("a", DataStruct.Type.float32, DataStruct.Flags.default_, default_value=1.0)
+
+    s = DataStructConverter(src, target, scale=2.0, offset=-1.0)
+    assert s.scale == 2.0
+    assert s.offset == -1.0
+
+    check_conversion(s, "@B", "@ff", (51,), (51.0 / 255.0 * 2.0 - 1.0, 1.0))
+
+
+def numpy_dtype(
+    component_type: DataStruct.Type, byte_order: DataStruct.ByteOrder = DataStruct.ByteOrder.host
+) -> np.dtype:
+    dtype = np.dtype(next(t[2] for t in supported_types if t[1] == component_type))
+    if byte_order == DataStruct.ByteOrder.host:
+        return dtype
+    return dtype.newbyteorder("<" if byte_order == DataStruct.ByteOrder.little_endian else ">")
+
+
+def random_components(
+    rng: np.random.Generator, component_type: DataStruct.Type, shape: tuple[int, ...]
+):
+    dtype = numpy_dtype(component_type)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return rng.integers(info.min, info.max, size=shape, dtype=dtype, endpoint=True)
+    return rng.uniform(-1.0, 2.0, size=shape).astype(dtype)
+
+
+@pytest.mark.parametrize(
+    "src_type,dst_type",
+    [
+        (DataStruct.Type.uint8, DataStruct.Type.float32),
+        (DataStruct.Type.uint8, DataStruct.Type.uint16),
+        (DataStruct.Type.uint16, DataStruct.Type.float16),
+        (DataStruct.Type.float16, DataStruct.Type.float32),
+        (DataStruct.Type.float32, DataStruct.Type.uint8),
+    ],
+)
+@pytest.mark.parametrize(
+    "byte_order", [DataStruct.ByteOrder.little_endian, DataStruct.ByteOrder.big_endian]
+)
+@pytest.mark.parametrize("srgb", [False, True])
+def test_convert_large(
+    src_type: DataStruct.Type,
+    dst_type: DataStruct.Type,
+    byte_order: DataStruct.ByteOrder,
+    srgb: bool,
+):
+    flags = DataStruct.Flags.normalized
+    if srgb:
+        flags |= DataStruct.Flags.srgb_gamma
+
+    def make_src(dummy: bool) -> DataStruct:
+        src = DataStruct(byte_order=byte_order)
+        for name in ["R", "G", "B"]:
+            src.append(name, src_type, flags)
+        src.append("A", src_type, DataStruct.Flags.normalized)
+        # A field of another type keeps the struct off the per-component fast path, so it is
+        # converted by the generic program.
+        if dummy:
+            src.append("X", DataStruct.Type.int32)
+        return src
+
+    target = DataStruct(byte_order=byte_order)
+    for name in ["R", "G", "B", "A"]:
+        target.append(name, dst_type, DataStruct.Flags.normalized)
+    target.append("W", dst_type, DataStruct.Flags.default_, default_value=1.0)
+
+    s = DataStructConverter(make_src(False), target, scale=0.5, offset=0.25)
+    ref_s = DataStructConverter(make_src(True), target, scale=0.5, offset=0.25)
+
+    # Large enough to be split across threads.
+    count = 200000
+    src_dtype = numpy_dtype(src_type, byte_order)
+    values = random_components(np.random.default_rng(1), src_type, (count, 4))
+    data = values.astype(src_dtype)
+    dummy_dtype = numpy_dtype(DataStruct.Type.int32, byte_order)
+    padded = np.zeros(count, dtype=[("c", src_dtype, (4,)), ("x", dummy_dtype)])
+    padded["c"] = values
+
+    dst_dtype = numpy_dtype(dst_type, byte_order)
+    res_data = s.convert(data.tobytes())
+    res = np.frombuffer(res_data, dtype=dst_dtype).astype(np.float64)
+    ref = np.frombuffer(ref_s.convert(padded.tobytes()), dtype=dst_dtype).astype(np.float64)
+    if DataStruct.is_integer(dst_type):
+        # Approximations of the sRGB curve in the generic program may round differently.
+        assert np.max(np.abs(res - ref)) <= (1 if srgb else 0)
+    else:
+        rtol = 1e-3 if dst_type == DataStruct.Type.float16 else 1e-5
+        assert np.allclose(res, ref, rtol=rtol, atol=1e-6)
+
+    # Converting in small pieces gives identical results.
+    pieces = [s.convert(data[i : i + 1000].tobytes()) for i in range(0, count, 1000)]
+    assert b"".join(pieces) == res_data
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
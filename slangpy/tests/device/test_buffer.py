@@ -212,5 +212,53 @@ def test_upload_buffer_overflow_fail(device_type: spy.DeviceType):
         device.submit_command_buffer(encoder.finish())
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_batched_transfers(device_type: spy.DeviceType):
+    device = helpers.get_device(device_type)
+
+    buffers = [
+        device.create_buffer(size=4 * 256, usage=spy.BufferUsage.unordered_access)
+        for _ in range(32)
+    ]
+    datas = [np.random.randint(0, 0xFFFFFFFF, size=256, dtype=np.uint32) for _ in buffers]
+
+    # Uploads and reads are recorded, and only submitted once flushed.
+    for buffer, data in zip(buffers, datas):
+        buffer.copy_from_numpy(data)
+    futures = [buffer.to_numpy_async() for buffer in buffers]
+    assert not any(future.done() for future in futures)
+    assert device.flush_transfers() > 0
+    assert device.flush_transfers() == 0
+    for future, data in zip(futures, datas):
+        future.wait()
+        assert future.done()
+        assert np.all(future.result().view(np.uint32) == data)
+
+    # Waiting on a future submits pending transfers.
+    buffers[0].copy_from_numpy(datas[1])
+    assert np.all(buffers[0].to_numpy_async().result().view(np.uint32) == datas[1])
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_to_numpy_async_staging(device_type: spy.DeviceType):
+    device = helpers.get_device(device_type)
+
+    # Reads larger than the staging ring use a dedicated staging buffer.
+    data = np.random.randint(0, 0xFFFFFFFF, size=(32 << 20) // 4, dtype=np.uint32)
+    large = device.create_buffer(usage=spy.BufferUsage.unordered_access, data=data)
+    assert np.all(large.to_numpy_async().result().view(np.uint32) == data)
+
+    # Ring space is reused once futures are released, in any order.
+    data = np.random.randint(0, 0xFFFFFFFF, size=(4 << 20) // 4, dtype=np.uint32)
+    buffer = device.create_buffer(usage=spy.BufferUsage.unordered_access, data=data)
+    futures = []
+    for i in range(16):
+        futures.append(buffer.to_numpy_async())
+        if i % 3 == 0:
+            futures.pop(0)
+    for future in reversed(futures):
+        assert np.all(future.result().view(np.uint32) == data)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -361,5 +361,67 @@ def test_shader_cursor(device_type: spy.DeviceType, use_numpy: bool):
         assert named_result == named_reference
 
 
+NESTED_UNIFORMS_SOURCE = """
+struct Inner {
+    float scale;
+    int2 offset;
+};
+
+struct Params {
+    uint count;
+    Inner inner;
+    float weights[2];
+};
+
+ConstantBuffer<Params> params;
+RWStructuredBuffer<float> result;
+
+[shader("compute")]
+[numthreads(1, 1, 1)]
+void compute_main(uint3 tid: SV_DispatchThreadID)
+{
+    result[0] = float(params.count);
+    result[1] = params.inner.scale;
+    result[2] = float(params.inner.offset.x);
+    result[3] = float(params.inner.offset.y);
+    result[4] = params.weights[0];
+    result[5] = params.weights[1];
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_write_nested_dict(device_type: spy.DeviceType):
+    device = helpers.get_device(type=device_type)
+    module = device.load_module_from_source("test_write_nested_dict", NESTED_UNIFORMS_SOURCE)
+    program = device.link_program([module], [module.entry_point("compute_main")])
+    kernel = device.create_compute_kernel(program)
+    result = device.create_buffer(
+        element_count=6, struct_size=4, usage=spy.BufferUsage.unordered_access
+    )
+
+    # Dispatch several times so later writes reuse the compiled writer for each struct.
+    for i in range(3):
+        params = {
+            "count": i,
+            "inner": {"scale": 0.5 * i, "offset": spy.int2(i, -i)},
+            "weights": [1.0 + i, 2.0 + i],
+        }
+        kernel.dispatch(thread_count=[1, 1, 1], vars={"params": params, "result": result})
+        assert np.array_equal(
+            result.to_numpy().view(np.float32), [i, 0.5 * i, i, -i, 1.0 + i, 2.0 + i]
+        )
+
+    # Fields missing from a dict are skipped.
+    kernel.dispatch(thread_count=[1, 1, 1], vars={"params": {"inner": {}}, "result": result})
+
+    # Errors name the field that failed to write.
+    with pytest.raises(Exception, match="params.inner.scale"):
+        kernel.dispatch(
+            thread_count=[1, 1, 1],
+            vars={"params": {"inner": {"scale": "invalid"}}, "result": result},
+        )
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vvvs"])
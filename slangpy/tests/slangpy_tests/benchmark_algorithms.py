@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Benchmarks slangpy.algorithms against the equivalent numpy operations.
+
+Runs on the CPU device by default, so results are comparable on machines without a GPU. Run with:
+
+    python -m slangpy.tests.slangpy_tests.benchmark_algorithms [--device cpu] [--count N]
+"""
+import argparse
+import json
+from timeit import repeat
+from typing import Any, Callable
+
+import numpy as np
+
+import slangpy as spy
+from slangpy import algorithms
+
+
+def measure(func: Callable[[], Any], device: spy.Device, repeats: int) -> float:
+    def run():
+        func()
+        device.wait_for_idle()
+
+    run()  # Warm up, which also compiles the kernels.
+    return min(repeat(run, number=1, repeat=repeats)) * 1e3
+
+
+def sort_by_key(keys: np.ndarray, values: np.ndarray):
+    order = np.argsort(keys, kind="stable")
+    return keys[order], values[order]
+
+
+def run(device: spy.Device, count: int, repeats: int) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    rng = np.random.default_rng(0)
+
+    values = rng.integers(0, 100, size=count).astype(np.int32)
+    keys = rng.integers(0, np.iinfo(np.int32).max, size=count).astype(np.uint32)
+    mask = (rng.random(size=count) > 0.5).astype(np.int32)
+
+    values_buffer = spy.NDBuffer.empty(device, (count,), "int")
+    values_buffer.copy_from_numpy(values)
+    keys_buffer = spy.NDBuffer.empty(device, (count,), "uint")
+    keys_buffer.copy_from_numpy(keys)
+    mask_buffer = spy.NDBuffer.empty(device, (count,), "int")
+    mask_buffer.copy_from_numpy(mask)
+
+    cases: list[tuple[str, Callable[[], Any], Callable[[], Any]]] = [
+        ("scan", lambda: algorithms.scan(values_buffer), lambda: np.cumsum(values)),
+        (
+            "compact",
+            lambda: algorithms.compact(values_buffer, mask_buffer),
+            lambda: values[mask != 0],
+        ),
+        ("radix_sort", lambda: algorithms.radix_sort(keys_buffer), lambda: np.sort(keys)),
+        (
+            "radix_sort (key/value)",
+            lambda: algorithms.radix_sort(keys_buffer, values_buffer),
+            lambda: sort_by_key(keys, values),
+        ),
+        ("unique", lambda: algorithms.unique(values_buffer), lambda: np.unique(values)),
+    ]
+    for name, func, reference in cases:
+        slangpy_ms = measure(func, device, repeats)
+        numpy_ms = min(repeat(reference, number=1, repeat=repeats)) * 1e3
+        results.append({"name": name, "slangpy_ms": slangpy_ms, "numpy_ms": numpy_ms})
+        print(f"{name:<24} slangpy {slangpy_ms:9.3f} ms   numpy {numpy_ms:9.3f} ms")
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--device", type=str, default="cpu", help="Device type to run on")
+    parser.add_argument("--count", type=int, default=1 << 20, help="Elements per buffer")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per operation")
+    parser.add_argument("--json", type=str, help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    device = spy.create_device(getattr(spy.DeviceType, args.device))
+    results = run(device, args.count, args.repeats)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"device": args.device, "count": args.count, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import pytest
+import numpy as np
+
+from slangpy import DeviceType, algorithms
+from slangpy.types import NDBuffer, Tensor
+from . import helpers
+
+
+def create_buffer(device_type: DeviceType, data: np.ndarray, dtype: str) -> NDBuffer:
+    device = helpers.get_device(device_type)
+    buffer = NDBuffer.empty(device, data.shape, dtype)
+    buffer.copy_from_numpy(data)
+    return buffer
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("count", [1, 255, 256, 1000, 2048, 2049, 100000])
+def test_scan(device_type: DeviceType, count: int):
+    np.random.seed(0)
+    data = np.random.randint(0, 100, size=count).astype(np.int32)
+    buffer = create_buffer(device_type, data, "int")
+
+    inclusive = np.cumsum(data).astype(np.int32)
+    exclusive = inclusive - data
+    assert np.array_equal(algorithms.scan(buffer).to_numpy(), exclusive)
+    assert np.array_equal(algorithms.scan(buffer, exclusive=False).to_numpy(), inclusive)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_scan_tensor(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    np.random.seed(0)
+    data = np.random.rand(4, 300).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    res = algorithms.scan(tensor, exclusive=False)
+    assert isinstance(res, Tensor)
+    assert np.allclose(res.to_numpy(), np.cumsum(data), rtol=1e-4)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_compact(device_type: DeviceType):
+    np.random.seed(0)
+    data = np.random.rand(5000).astype(np.float32)
+    mask_data = (np.random.rand(5000) > 0.7).astype(np.int32)
+    buffer = create_buffer(device_type, data, "float")
+    mask = create_buffer(device_type, mask_data, "int")
+
+    res = algorithms.compact(buffer, mask)
+    assert np.array_equal(res.to_numpy(), data[mask_data != 0])
+
+    mask.copy_from_numpy(np.zeros_like(mask_data))
+    res = algorithms.compact(buffer, mask)
+    assert res.shape.as_tuple() == (0,)
+    assert res.to_numpy().size == 0
+
+    with pytest.raises(ValueError, match="elements"):
+        algorithms.compact(buffer, create_buffer(device_type, mask_data[:10], "int"))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("dtype", ["uint", "int", "float"])
+def test_radix_sort(device_type: DeviceType, dtype: str):
+    np.random.seed(0)
+    np_dtype = {"uint": np.uint32, "int": np.int32, "float": np.float32}[dtype]
+    if dtype == "float":
+        keys_data = ((np.random.rand(20000) - 0.5) * 1000).astype(np_dtype)
+    else:
+        info = np.iinfo(np_dtype)
+        keys_data = np.random.randint(info.min, info.max, size=20000, dtype=np_dtype)
+    keys = create_buffer(device_type, keys_data, dtype)
+
+    res = algorithms.radix_sort(keys)
+    assert not isinstance(res, tuple)
+    assert np.array_equal(res.to_numpy(), np.sort(keys_data))
+
+    # Values follow their keys, and the sort is stable.
+    keys_data = np.random.randint(0, 50, size=20000).astype(np_dtype)
+    keys.copy_from_numpy(keys_data)
+    values = create_buffer(device_type, np.arange(20000, dtype=np.int32), "int")
+    res = algorithms.radix_sort(keys, values)
+    assert isinstance(res, tuple)
+    order = np.argsort(keys_data, kind="stable")
+    assert np.array_equal(res[0].to_numpy(), keys_data[order])
+    assert np.array_equal(res[1].to_numpy(), order)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_unique(device_type: DeviceType):
+    np.random.seed(0)
+    data = np.random.randint(-100, 100, size=3000).astype(np.int32)
+    buffer = create_buffer(device_type, data, "int")
+
+    assert np.array_equal(algorithms.unique(buffer).to_numpy(), np.unique(data))
+
+    with pytest.raises(ValueError, match="element types"):
+        algorithms.unique(create_buffer(device_type, data.astype(np.int64), "int64_t"))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_empty(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    keys = NDBuffer.empty(device, (1,), "int").view((0,))
+    values = NDBuffer.empty(device, (1,), "float").view((0,))
+
+    assert algorithms.scan(keys).to_numpy().size == 0
+    assert algorithms.compact(values, keys).to_numpy().size == 0
+    assert algorithms.unique(keys).to_numpy().size == 0
+    sorted_keys = algorithms.radix_sort(keys)
+    assert not isinstance(sorted_keys, tuple)
+    assert sorted_keys.to_numpy().size == 0
+    res = algorithms.radix_sort(keys, values)
+    assert isinstance(res, tuple)
+    assert res[0].to_numpy().size == 0
+    assert res[1].to_numpy().size == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
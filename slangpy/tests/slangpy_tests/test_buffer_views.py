@@ -3,7 +3,7 @@ import pytest
 
 from slangpy import Struct
 from slangpy.core.native import Shape
-from slangpy import DeviceType, BufferUsage
+from slangpy import DeviceType, BufferUsage, Bitmap
 from . import helpers
 from slangpy.types import NDBuffer, Tensor
 
@@ -12,6 +12,7 @@ from typing import Any, Optional, Union, Type, cast
 import numpy as np
 import math
 import sys
+from pathlib import Path
 
 try:
     import torch
@@ -114,6 +115,11 @@ def test_to_numpy(
     assert ndarray.dtype == np_dtype
     assert (ndarray == numpy_ref).all()
 
+    ndarray = buffer.to_numpy_async().result()
+    assert ndarray.shape == unravelled_shape
+    assert ndarray.dtype == np_dtype
+    assert (ndarray == numpy_ref).all()
+
 
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
 @pytest.mark.parametrize("buffer_type", [Tensor, NDBuffer])
@@ -303,6 +309,63 @@ def test_partial_numpy_copy(
     assert (buffer_to_np == numpy_ref).all()
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("buffer_type", [Tensor, NDBuffer])
+def test_file_copy(
+    device_type: DeviceType, buffer_type: Union[Type[Tensor], Type[NDBuffer]], tmp_path: Path
+):
+
+    device = helpers.get_device(device_type)
+    shape = (5, 4)
+
+    numpy_ref = np.random.default_rng().random(shape + (3,), np.float32)
+    raw_path = tmp_path / "data.bin"
+    raw_path.write_bytes(b"header" + numpy_ref.tobytes())
+
+    buffer = buffer_type.zeros(device, dtype="float3", shape=shape)
+    buffer.copy_from_file(raw_path, len(b"header"))
+    assert (buffer.to_numpy() == numpy_ref).all()
+
+    npy_path = tmp_path / "data.npy"
+    buffer.to_npy(npy_path)
+    assert (np.load(npy_path) == numpy_ref).all()
+
+    # Non-contiguous views are copied to numpy before saving.
+    buffer.view((4, 5), (1, 4)).to_npy(npy_path)
+    assert (np.load(npy_path) == buffer.view((4, 5), (1, 4)).to_numpy()).all()
+
+    with pytest.raises(Exception, match=r"too small to fill the buffer"):
+        buffer.copy_from_file(raw_path, len(b"header") + 4)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("buffer_type", [Tensor, NDBuffer])
+def test_load_from_images(
+    device_type: DeviceType, buffer_type: Union[Type[Tensor], Type[NDBuffer]], tmp_path: Path
+):
+
+    device = helpers.get_device(device_type)
+
+    rng = np.random.default_rng()
+    images = [rng.random((8, 16, 3), np.float32) for _ in range(5)]
+    paths = []
+    for i, image in enumerate(images):
+        paths.append(tmp_path / f"image{i}.exr")
+        Bitmap(image).write(paths[-1])
+
+    buffer = buffer_type.load_from_images(device, paths, flip_y=True, scale=2.0, offset=1.0)
+    assert buffer.shape == Shape(5, 8, 16)
+    expected = np.stack([np.flipud(image) * 2.0 + 1.0 for image in images])
+    assert np.allclose(buffer.to_numpy(), expected)
+
+    buffer = buffer_type.load_from_images(device, paths, grayscale=True)
+    assert np.allclose(buffer.to_numpy(), np.stack([image[:, :, 0] for image in images]))
+
+    Bitmap(rng.random((4, 4, 3), np.float32)).write(paths[-1])
+    with pytest.raises(Exception, match=r"Image dimensions do not match"):
+        buffer_type.load_from_images(device, paths)
+
+
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
 @pytest.mark.parametrize("buffer_type", [Tensor, NDBuffer])
 def test_numpy_copy_errors(
@@ -1,11 +1,15 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
 from . import helpers
 from slangpy import DeviceType
 from slangpy.types.buffer import NDBuffer
+from slangpy.core.calldata import get_kernel_cache, set_kernel_cache_path
+from slangpy.core.lrucache import LRUCache
 
 BASE_MODULE = r"""
 import "slangpy";
@@ -57,5 +61,151 @@ def test_share_kernel_with_same_mapping(device_type: DeviceType):
     assert float_float_cd.kernel == mapped_float_float_cd.kernel
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_persistent_kernel_cache(device_type: DeviceType, tmp_path: Path):
+    set_kernel_cache_path(tmp_path)
+    try:
+        cache = get_kernel_cache()
+        assert cache is not None
+
+        # First module compiles the kernel and writes it to the cache.
+        m = load_test_module(device_type)
+        assert m.foo(1.0, 2.0) == 3.0
+        assert cache.size > 0
+        assert len(list(tmp_path.glob("*/*.slang-module"))) == 1
+
+        # A fresh module has an empty in-memory cache, so has to load from disk.
+        loads: list[bool] = []
+        stores: list[str] = []
+        load, store = cache.load, cache.store
+
+        def counting_load(session: Any, key: str):
+            module = load(session, key)
+            loads.append(module is not None)
+            return module
+
+        def counting_store(key: str, module: Any):
+            stores.append(key)
+            store(key, module)
+
+        cache.load = counting_load  # type: ignore
+        cache.store = counting_store  # type: ignore
+        m2 = load_test_module(device_type)
+        assert len(m2.kernel_cache) == 0
+        assert m2.foo(3.0, 4.0) == 7.0
+        assert loads == [True]
+        assert stores == []
+        assert len(list(tmp_path.glob("*/*.slang-module"))) == 1
+
+        # Clearing removes all entries.
+        cache.clear()
+        assert cache.size == 0
+        assert len(list(tmp_path.glob("*/*.slang-module"))) == 0
+    finally:
+        set_kernel_cache_path(None)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_persistent_kernel_manifest(device_type: DeviceType, tmp_path: Path):
+    set_kernel_cache_path(tmp_path)
+    try:
+        device = helpers.get_device(device_type)
+
+        # First module generates the kernels, and records a manifest for each signature.
+        m = load_test_module(device_type)
+        assert m.foo(1.0, 2.0) == 3.0
+        a = NDBuffer(device, program_layout=m.layout, dtype=float, shape=(16,))
+        a.copy_from_numpy(np.arange(16, dtype=np.float32))
+        res = m.foo(a, 1.0)
+        assert np.allclose(res.to_numpy().view(np.float32), np.arange(16) + 1.0)
+        assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+        # A fresh module restores bindings from the manifest without generating code.
+        m2 = load_test_module(device_type)
+        func = m2.foo.as_func()
+        cd = func.debug_build_call_data(a, 1.0)
+        assert cd.call_dimensionality == 1
+        assert len(m2.kernel_cache) == 1
+        res = m2.foo(a, 1.0)
+        assert np.allclose(res.to_numpy().view(np.float32), np.arange(16) + 1.0)
+        assert m2.foo(3.0, 4.0) == 7.0
+        assert len(list(tmp_path.glob("*/*.json"))) == 2
+    finally:
+        set_kernel_cache_path(None)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_precompile_async(device_type: DeviceType):
+    m = load_test_module(device_type)
+    func = m.foo.as_func()
+
+    # Precompiling the same signature twice shares a single compile.
+    f0 = func.precompile_async(1.0, 2.0)
+    f1 = func.precompile_async(3.0, 4.0)
+    cd = f0.result()
+    assert f1.result() == cd
+    assert len(m.pending_call_data) == 0
+
+    # Calls with a matching signature use the precompiled call data.
+    assert func.debug_build_call_data(1.0, 2.0) == cd
+    assert func(5.0, 6.0) == 11.0
+
+    # Precompiling an already compiled signature doesn't count as a cache lookup.
+    stats = (m.call_data_cache.hits, m.call_data_cache.misses)
+    assert func.precompile_async(7.0, 8.0).result() == cd
+    assert (m.call_data_cache.hits, m.call_data_cache.misses) == stats
+
+    # Warmup compiles multiple signatures in the background.
+    futures = m.warmup([("foo", (1, 2), {}), (func, (1.0,), {"b": 2})])
+    cds = [x.result() for x in futures]
+    assert cds[0] != cds[1]
+    assert func.debug_build_call_data(1, 2) == cds[0]
+    assert m.foo(1, 2) == 3
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_cache_capacity_and_stats(device_type: DeviceType):
+    m = load_test_module(device_type)
+    m.set_cache_capacity(call_data=2, kernels=2)
+    func = m.foo.as_func()
+
+    assert func(1.0, 2.0) == 3.0
+    assert func(3.0, 4.0) == 7.0
+    stats = m.cache_stats()
+    assert stats["call_data"]["entries"] == 1
+    assert stats["call_data"]["hits"] == 1
+    assert stats["call_data"]["misses"] == 1
+    assert stats["build"]["foo"]["count"] == 1
+    assert stats["build"]["foo"]["seconds"] > 0
+
+    # Three distinct signatures overflow a capacity of 2, evicting the least recently used.
+    assert func(1, 2) == 3
+    assert func(1, 2.0) == 3
+    stats = m.cache_stats()
+    assert stats["call_data"]["entries"] == 2
+    assert stats["call_data"]["evictions"] == 1
+    assert stats["kernels"]["entries"] <= 2
+    assert stats["build"]["foo"]["count"] == 3
+
+    # Evicted signature is rebuilt on next call.
+    assert func(1.0, 2.0) == 3.0
+    assert m.cache_stats()["build"]["foo"]["count"] == 4
+
+
+def test_lru_cache():
+    cache: LRUCache[str, int] = LRUCache(2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert "b" not in cache
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+    cache.capacity = 1
+    assert list(cache) == ["c"]
+    assert cache.evictions == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
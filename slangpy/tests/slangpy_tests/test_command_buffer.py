@@ -1,10 +1,13 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import asyncio
+
 import numpy as np
 import pytest
 
 from . import helpers
-from slangpy import Module
-from slangpy import DeviceType, float3
+from slangpy import CallFuture, CallGraph, Module
+from slangpy import BufferUsage, DeviceType, float3
+from slangpy.types.valueref import floatRef
 from slangpy.experimental.diffbuffer import NDDifferentiableBuffer
 
 
@@ -50,5 +53,147 @@ def test_command_buffer(device_type: DeviceType):
     assert np.allclose(b_grad, np.ones_like(b_data))
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_batch(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    add_vectors = m.add_vectors.as_func()
+
+    # Scalar calls return a value per call.
+    args = [(float3(i, i, i), float3(1, 2, 3)) for i in range(16)]
+    results = add_vectors.call_batch(args)
+    assert len(results) == len(args)
+    for i, res in enumerate(results):
+        assert res == float3(i + 1, i + 2, i + 3)
+
+    # Batches can mix signatures and keyword arguments.
+    a = NDDifferentiableBuffer(m.device, float3, 10)
+    a_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(a, a_data.flatten(), 3)
+    results = add_vectors.call_batch(
+        [(a,), (float3(1, 1, 1),)], [{"b": float3(1, 2, 3)}, {"b": float3(2, 2, 2)}]
+    )
+    res_data = helpers.read_ndbuffer_from_numpy(results[0]).reshape(-1, 3)
+    assert np.allclose(res_data, a_data + np.array([1, 2, 3]))
+    assert results[1] == float3(3, 3, 3)
+
+    with pytest.raises(ValueError):
+        add_vectors.call_batch([(a,)], [])
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_async(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    add_vectors = m.add_vectors.as_func()
+
+    a = NDDifferentiableBuffer(m.device, float3, 10)
+    a_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(a, a_data.flatten(), 3)
+
+    future = add_vectors.call_async(a, float3(1, 2, 3))
+    assert isinstance(future, CallFuture)
+    res = future.result()
+    assert future.done()
+    assert future.fence.current_value >= future.fence_value
+    res_data = helpers.read_ndbuffer_from_numpy(res).reshape(-1, 3)
+    assert np.allclose(res_data, a_data + np.array([1, 2, 3]))
+
+    # Results are only read back once.
+    assert future.result() is res
+
+    # Futures can be awaited, allowing other work to overlap with the device.
+    async def run():
+        futures = [add_vectors.call_async(float3(i, i, i), float3(1, 2, 3)) for i in range(4)]
+        return [await f for f in futures]
+
+    results = asyncio.run(run())
+    for i, res in enumerate(results):
+        assert res == float3(i + 1, i + 2, i + 3)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_graph(device_type: DeviceType):
+    m = load_test_module(device_type)
+    assert m is not None
+
+    add_vectors = m.add_vectors.as_func()
+    polynomial = m.polynomial.as_func()
+
+    a = NDDifferentiableBuffer(m.device, float3, 10)
+    a_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(a, a_data.flatten(), 3)
+
+    graph = CallGraph()
+    assert graph.append(add_vectors, a, float3(1, 2, 3)) == 0
+    assert graph.append(polynomial, float3(1, 2, 3), float3(1, 1, 1)) == 1
+    assert len(graph) == 2
+
+    # Replaying returns the result of each call.
+    results = graph.replay()
+    assert results is not None
+    res_data = helpers.read_ndbuffer_from_numpy(results[0]).reshape(-1, 3)
+    assert np.allclose(res_data, a_data + np.array([1, 2, 3]))
+    assert results[1] == float3(3, 6, 11)
+
+    # Buffers are bound by reference, so replays see updated contents.
+    a_data = np.random.rand(10, 3).astype(np.float32)
+    helpers.write_ndbuffer_from_numpy(a, a_data.flatten(), 3)
+    results = graph.replay()
+    assert results is not None
+    res_data = helpers.read_ndbuffer_from_numpy(results[0]).reshape(-1, 3)
+    assert np.allclose(res_data, a_data + np.array([1, 2, 3]))
+
+    # Host values are baked in, and changed by rebinding individual calls.
+    graph.rebind(1, float3(2, 2, 2), float3(0, 0, 0))
+    results = graph.replay()
+    assert results is not None
+    assert results[1] == float3(5, 5, 5)
+
+    # Replay can also be appended to a command encoder.
+    command_encoder = m.device.create_command_encoder()
+    assert graph.replay(command_encoder) is None
+    m.device.submit_command_buffer(command_encoder.finish())
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_graph_replay_readback(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    m = helpers.create_module(
+        device,
+        """
+import "slangpy";
+void accumulate_first(StructuredBuffer<float> src, inout float total) { total += src[0]; }
+float first(StructuredBuffer<float> src) { return src[0]; }
+""",
+    )
+
+    src = device.create_buffer(
+        element_count=1,
+        struct_size=4,
+        usage=BufferUsage.shader_resource,
+        data=np.array([1.0], dtype=np.float32),
+    )
+    total = floatRef(10.0)
+
+    graph = CallGraph()
+    graph.append(m.accumulate_first, src, total)
+    graph.append(m.first, src)
+
+    results = graph.replay()
+    assert results is not None
+    assert total.value == 11.0
+    assert results[1] == 1.0
+
+    # Each replay reads back new results, and re-uploads the recorded inout value.
+    src.copy_from_numpy(np.array([5.0], dtype=np.float32))
+    results = graph.replay()
+    assert results is not None
+    assert total.value == 15.0
+    assert results[1] == 5.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+from pathlib import Path
+
+import pytest
+
+import slangpy as spy
+from slangpy import DeviceType
+from . import helpers
+
+
+def write_module(path: Path, func_name: str, value: int):
+    path.write_text(
+        f"""
+import "slangpy";
+
+int {func_name}(int x) {{
+    return x + {value};
+}}
+"""
+    )
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reload_only_affected_modules(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type, use_cache=False)
+
+    path_a = tmp_path / "hot_reload_a.slang"
+    path_b = tmp_path / "hot_reload_b.slang"
+    write_module(path_a, "add_a", 1)
+    write_module(path_b, "add_b", 10)
+    module_a = spy.Module(device.load_module(str(path_a)))
+    module_b = spy.Module(device.load_module(str(path_b)))
+    assert module_a.add_a(1) == 2
+    assert module_b.add_b(1) == 11
+
+    assert module_a.depends_on([path_a])
+    assert not module_a.depends_on([path_b])
+
+    events: list[spy.ShaderHotReloadEvent] = []
+    device.register_shader_hot_reload_callback(lambda e: events.append(e))
+
+    # Only the module that depends on the changed file drops its kernels.
+    kernel_a = list(module_a.kernel_cache)
+    write_module(path_b, "add_b", 20)
+    device.reload_programs([path_b])
+    assert len(events) == 1
+    assert events[0].changed_files == [path_b]
+    assert list(module_a.kernel_cache) == kernel_a
+    assert len(module_b.kernel_cache) == 0
+    assert module_a.add_a(1) == 2
+    assert module_b.add_b(1) == 21
+
+    # Files nothing depends on don't trigger a reload.
+    device.reload_programs([tmp_path / "unrelated.slang"])
+    assert len(events) == 1
+
+    # A full reload drops everything.
+    device.reload_all_programs()
+    assert len(events) == 2
+    assert events[1].changed_files == []
+    assert len(module_a.kernel_cache) == 0
+    assert module_a.add_a(1) == 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
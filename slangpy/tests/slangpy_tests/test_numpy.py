@@ -18,6 +18,11 @@ float3 add_float3s(float3 a, float3 b) {
     return a + b;
 }
 
+void write_pair(float value, out float even, out float odd) {
+    even = value;
+    odd = value + 1;
+}
+
 
 matrix<float, R, C> matFunc<int R, int C>(){
     return matrix<float, R, C>(1);
@@ -155,6 +160,108 @@ def test_cache(device_type: DeviceType):
     assert np.allclose(res, res_expected)
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_numpy_transient_buffers_reused(device_type: DeviceType):
+
+    module = load_test_module(device_type)
+    pool = spy.core.native.TransientBufferPool.get(module.device)
+    pool.clear()
+
+    a = np.random.rand(64).astype(np.float32)
+    b = np.random.rand(64).astype(np.float32)
+    out = np.zeros_like(a)
+
+    for _ in range(4):
+        res = module.add_floats(a, b, _result=out)
+        assert res is out
+        assert np.allclose(out, a + b)
+
+    # Arguments of identical size should be served from the pool after the first call.
+    assert pool.reuse_count > 0
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_pass_strided_numpy_floats(device_type: DeviceType):
+
+    module = load_test_module(device_type)
+
+    a_full = np.random.rand(8, 16).astype(np.float32)
+    b_full = np.random.rand(16, 8).astype(np.float32)
+
+    # Sliced and transposed arrays are passed with their own strides.
+    a = a_full[:, ::2]
+    b = b_full.T[:, 1::2]
+    res_full = np.zeros((8, 16), dtype=np.float32)
+    res = res_full[:, 1::2]
+    module.add_floats(a, b, _result=res)
+    assert np.allclose(res, a + b)
+
+    # Elements between the written ones are preserved.
+    assert np.all(res_full[:, ::2] == 0)
+
+    # Interleaved writable views of the same array only write back their own elements.
+    full = np.zeros(16, dtype=np.float32)
+    value = np.arange(8, dtype=np.float32)
+    module.write_pair(value, full[::2], full[1::2])
+    assert np.allclose(full[::2], value)
+    assert np.allclose(full[1::2], value + 1)
+
+    # Negative strides fall back to a contiguous copy.
+    res_reversed = np.zeros((8, 8), dtype=np.float32)[::-1]
+    module.add_floats(a[::-1], b, _result=res_reversed)
+    assert np.allclose(res_reversed, a[::-1] + b)
+
+    # Sparse views, such as a column of a wide matrix, are copied contiguously rather than
+    # uploaded with their gaps, and still only write back their own elements.
+    a_wide = np.random.rand(8, 1024).astype(np.float32)
+    b_col = np.random.rand(8).astype(np.float32)
+    res_wide = np.zeros((8, 1024), dtype=np.float32)
+    module.add_floats(a_wide[:, 0], b_col, _result=res_wide[:, 3])
+    assert np.allclose(res_wide[:, 3], a_wide[:, 0] + b_col)
+    assert np.count_nonzero(res_wide) == np.count_nonzero(res_wide[:, 3])
+
+    # Tensors created from strided arrays keep the array's layout.
+    tensor = spy.Tensor.from_numpy(module.device, a)
+    assert tensor.strides.as_tuple() == (16, 2)
+    res = module.add_floats(tensor, b, _result="numpy")
+    assert np.allclose(res, a + b)
+    tensor = spy.Tensor.from_numpy(module.device, a_wide[:, 0])
+    assert tensor.strides.as_tuple() == (1,)
+    assert np.allclose(tensor.to_numpy(), a_wide[:, 0])
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_stream_numpy_floats(device_type: DeviceType):
+
+    module = load_test_module(device_type)
+
+    a = np.random.rand(1000).astype(np.float32)
+    b = np.random.rand(1000).astype(np.float32)
+
+    # Chunk size doesn't divide the extent, so the last chunk is partial.
+    res = module.add_floats.stream(chunk=128)(a, b)
+    assert res.shape == a.shape
+    assert np.allclose(res, a + b)
+
+    # Non-array arguments are broadcast to every chunk, and results can be
+    # written to a provided array.
+    out = np.zeros_like(a)
+    res = module.add_floats.stream(chunk=300, depth=1)(a, 1.0, _result=out)
+    assert res is out
+    assert np.allclose(out, a + 1.0)
+
+    # Streaming along an inner axis splits arrays into non-contiguous slices.
+    a2 = np.random.rand(4, 100).astype(np.float32)
+    b2 = np.random.rand(4, 100).astype(np.float32)
+    res = module.add_floats.stream(chunk=32, axis=1)(a2, b2)
+    assert np.allclose(res, a2 + b2)
+
+    # Device buffers are split into views.
+    buffer = spy.Tensor.from_numpy(module.device, a)
+    res = module.add_floats.stream(chunk=256)(buffer, b)
+    assert np.allclose(res, a + b)
+
+
 # test that we handle the matrix alignment correctly when reading the matrix from the output buffer
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
 def test_return_numpy_matrix(device_type: DeviceType):
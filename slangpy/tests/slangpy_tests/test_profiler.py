@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import json
+from pathlib import Path
+
+import pytest
+
+from . import helpers
+from slangpy import CallProfiler, DeviceType
+
+PROFILER_MODULE = r"""
+import "slangpy";
+float add(float a, float b) {
+    return a+b;
+}
+"""
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_call_profiler(device_type: DeviceType, tmp_path: Path):
+    device = helpers.get_device(device_type)
+    m = helpers.create_module(device, PROFILER_MODULE)
+
+    profiler = m.enable_profiling(gpu_timing=True)
+    assert isinstance(profiler, CallProfiler)
+    assert m.profiler is profiler
+
+    for i in range(4):
+        assert m.add(float(i), 1.0) == i + 1.0
+
+    phases = {event.phase for event in profiler.events()}
+    for phase in ["signature", "lookup", "build", "prepare", "write", "dispatch", "readback"]:
+        assert phase in phases
+    for phase in ["bind", "codegen", "compile"]:
+        assert phase in phases
+    for event in profiler.events():
+        assert event.end >= event.start
+
+    # Kernel is only built once.
+    summary = profiler.summary()
+    assert summary["build"]["count"] == 1
+    assert summary["dispatch"]["count"] == 4
+
+    trace_path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(trace_path)
+    with open(trace_path) as f:
+        trace = json.load(f)
+    assert len([x for x in trace["traceEvents"] if x["ph"] == "X"]) == profiler.size
+
+    # Ring buffer drops oldest events once full.
+    profiler.capacity = 4
+    assert profiler.size == 4
+    assert profiler.dropped > 0
+
+    m.disable_profiling()
+    profiler.clear()
+    m.add(1.0, 2.0)
+    assert profiler.size == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
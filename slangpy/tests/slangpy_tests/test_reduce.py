@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import pytest
+import numpy as np
+
+from slangpy import DeviceType
+from slangpy.core.reduce import reduce
+from slangpy.types import NDBuffer, Tensor
+from . import helpers
+
+MODULE = """
+import "slangpy";
+
+float square(float x) {
+    return x * x;
+}
+"""
+
+SHAPES_AND_AXES = [
+    ((1000,), None),
+    ((70000,), None),
+    ((8, 300), 1),
+    ((8, 300), 0),
+    ((4, 5, 600), (0, 2)),
+    ((4, 5, 6), -1),
+]
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("shape,axis", SHAPES_AND_AXES)
+def test_reduce_tensor(device_type: DeviceType, shape: tuple[int, ...], axis: object):
+    device = helpers.get_device(device_type)
+    np.random.seed(0)
+    data = np.random.rand(*shape).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    expected_shape = np.sum(data, axis=axis, keepdims=False).shape or (1,)
+    for op in ["sum", "min", "max", "mean"]:
+        res = getattr(tensor, op)(axis)
+        assert isinstance(res, Tensor)
+        expected = np.reshape(getattr(np, op)(data, axis=axis), expected_shape)
+        assert res.to_numpy().shape == expected_shape
+        assert np.allclose(res.to_numpy(), expected, rtol=1e-4)
+
+    res = tensor.argmax(axis)
+    assert isinstance(res, NDBuffer)
+    if axis is None or isinstance(axis, int):
+        expected = np.reshape(np.argmax(data, axis=axis), expected_shape)
+        assert np.array_equal(res.to_numpy(), expected)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_ndbuffer_ints(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    np.random.seed(0)
+    data = np.random.randint(-1000, 1000, size=(3, 2000)).astype(np.int32)
+    buffer = NDBuffer.empty(device, data.shape, "int")
+    buffer.copy_from_numpy(data)
+
+    assert np.array_equal(buffer.sum(1).to_numpy(), data.sum(axis=1))
+    assert np.array_equal(buffer.min().to_numpy(), [data.min()])
+    assert np.array_equal(buffer.max(0).to_numpy(), data.max(axis=0))
+    assert np.array_equal(buffer.argmax(1).to_numpy(), data.argmax(axis=1))
+
+    # Ties resolve to the first occurrence, as in numpy.
+    buffer.copy_from_numpy(np.ones_like(data))
+    assert np.array_equal(buffer.argmax(1).to_numpy(), [0, 0, 0])
+
+    with pytest.raises(ValueError, match="floating point"):
+        buffer.mean()
+    with pytest.raises(ValueError, match="out of range"):
+        buffer.sum(2)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_reduce_strided_view(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    np.random.seed(0)
+    data = np.random.rand(6, 500).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    # A transposed view can't be collapsed without a copy.
+    transposed = tensor.view((500, 6), (1, 500))
+    assert np.allclose(reduce(transposed, "sum", 0).to_numpy(), data.sum(axis=1), rtol=1e-4)
+    assert np.allclose(reduce(transposed, "max", 1).to_numpy(), data.max(axis=0))
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_function_reduce(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    module = helpers.create_module(device, MODULE)
+    np.random.seed(0)
+    data = np.random.rand(4, 1000).astype(np.float32)
+    tensor = Tensor.from_numpy(device, data)
+
+    res = module.square.return_type(Tensor).reduce("sum", axis=1)(tensor)
+    assert np.allclose(res.to_numpy(), (data * data).sum(axis=1), rtol=1e-4)
+
+    res = module.square.reduce("max")(tensor)
+    assert np.allclose(res.to_numpy(), [(data * data).max()])
+
+    with pytest.raises(ValueError, match="Unsupported reduction"):
+        module.square.reduce("median")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v", "-s"])
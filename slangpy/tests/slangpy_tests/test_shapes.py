@@ -578,5 +578,35 @@ def test_copyatindex_undefined_output_size(device_type: DeviceType):
         )
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_nested_dict_call_shape(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    function = helpers.create_function_from_module(
+        device,
+        "add_pair",
+        r"""
+struct Pair { float a; float b; };
+float add_pair(Pair p, float c) { return p.a + p.b + c; }
+""",
+    )
+
+    def call_shape(p: Any, c: Any):
+        call_data = function.debug_build_call_data(p, c=c)
+        call_data.call(NativeCallRuntimeOptions(), p, c=c)
+        return list_or_none(call_data.last_call_shape)
+
+    # Leaves nested in dicts and keyword arguments are broadcast together.
+    a = make_float_buffer(device_type, (8,))
+    assert call_shape({"a": a, "b": 1.0}, 2.0) == [8]
+    assert call_shape({"a": 1.0, "b": 2.0}, make_float_buffer(device_type, (8,))) == [8]
+
+    # The same call data recalculates the shape for new values.
+    assert call_shape({"a": a, "b": make_float_buffer(device_type, (8,))}, 2.0) == [8]
+    assert call_shape({"a": make_float_buffer(device_type, (16,)), "b": 1.0}, 2.0) == [16]
+
+    with pytest.raises(ValueError, match=r"Shape mismatch"):
+        call_shape({"a": a, "b": make_float_buffer(device_type, (16,))}, 2.0)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -1,12 +1,17 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+import gc
+import weakref
 from time import time
+from typing import Any
 
+import numpy as np
 import pytest
 
 import slangpy.core.function as kff
 
 from slangpy import Module
-from slangpy import DeviceType, float3
+from slangpy import DeviceType, Tensor, float3
+from slangpy.core.native import NativeObject, SignatureBuilder
 from . import helpers
 from slangpy.types.buffer import NDBuffer
 
@@ -72,5 +77,55 @@ def test_kernel_reuse(device_type: DeviceType):
     print(f"Time taken cached: {1000.0*(end-start)/count}ms")
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_signature_tokens(device_type: DeviceType):
+    device = helpers.get_device(device_type)
+    cache = load_module(device_type).call_data_cache
+
+    def signature(*args: Any, **kwargs: Any) -> str:
+        builder = SignatureBuilder()
+        cache.get_args_signature(builder, *args, **kwargs)
+        return builder.str
+
+    # Objects with the same fixed signature produce the same token.
+    a = NDBuffer(device, float3, 4)
+    b = NDBuffer(device, float3, 8)
+    c = NDBuffer(device, float3, shape=(2, 2))
+    assert a.slangpy_signature_token == b.slangpy_signature_token
+    assert a.slangpy_signature_token != c.slangpy_signature_token
+    assert signature(a, x=b) == signature(b, x=a)
+    assert signature(a, x=b) != signature(a, x=c)
+    assert signature(a) != signature(Tensor.empty(device, (4,), float3))
+
+    # Tokens follow the signature when it is changed.
+    obj = NativeObject()
+    obj.slangpy_signature = "foo"
+    token = obj.slangpy_signature_token
+    obj.slangpy_signature = "bar"
+    assert obj.slangpy_signature_token != token
+    obj.slangpy_signature = "foo"
+    assert obj.slangpy_signature_token == token
+
+    # Signatures provided from Python are kept in full.
+    assert signature(np.zeros(4, dtype=np.float32)) == signature(np.ones(8, dtype=np.float32))
+    assert signature(np.zeros(4, dtype=np.float32)) != signature(np.zeros(4, dtype=np.int32))
+    assert signature({"a": a, "_type": "float3"}) != signature({"a": a, "_type": "float4"})
+
+    class Custom:
+        slangpy_signature = "custom_signature"
+
+    assert "custom_signature" in signature(Custom())
+
+    # The cache doesn't keep the types of values alive.
+    class Temporary:
+        pass
+
+    signature(Temporary())
+    temporary_type = weakref.ref(Temporary)
+    del Temporary
+    gc.collect()
+    assert temporary_type() is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
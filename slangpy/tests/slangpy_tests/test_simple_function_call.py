@@ -9,7 +9,7 @@ from . import helpers
 from slangpy import Device, DeviceType
 from slangpy.types import NDBuffer
 from slangpy.types.diffpair import diffPair, floatDiffPair
-from slangpy.types.valueref import intRef
+from slangpy.types.valueref import ValueRef, floatRef, intRef
 
 
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
@@ -159,6 +159,36 @@ void add_numbers(inout int a) {
     assert out_res.value == 15
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_multiple_outparams(device_type: DeviceType):
+
+    device = helpers.get_device(device_type)
+    function = helpers.create_function_from_module(
+        device,
+        "split",
+        r"""
+void split(inout int a, out float b, out float3 c, out int d) {
+    b = a * 0.5;
+    c = float3(1, 2, 3) * a;
+    d = -a;
+    a += 1;
+}
+""",
+    )
+
+    # All writable refs of a call share a single readback buffer, so check
+    # each one is read back from its own slot.
+    a = intRef(4)
+    b = floatRef()
+    c = ValueRef(float3())
+    d = intRef()
+    function(a, b, c, d)
+    assert a.value == 5
+    assert b.value == 2.0
+    assert c.value == float3(4, 8, 12)
+    assert d.value == -4
+
+
 @pytest.mark.skip("Awaiting diff-pair follow-up")
 @pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
 def test_scalar_outparam_with_diffpair(device_type: DeviceType):
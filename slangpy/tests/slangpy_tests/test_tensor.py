@@ -1,10 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 import pytest
 from slangpy import DeviceType, Device
+from slangpy.core.native import Shape
 from slangpy.types import Tensor
 from . import helpers
 import numpy as np
 from typing import Any
+from pathlib import Path
 import os
 
 
@@ -77,5 +79,28 @@ def test_generic_call(device_type: DeviceType):
     compare_tensors(y.to_numpy(), np_result)
 
 
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+@pytest.mark.parametrize("mmap", [True, False])
+def test_tensor_npy(device_type: DeviceType, mmap: bool, tmp_path: Path):
+    device = helpers.get_device(device_type)
+
+    np_data = np.random.randn(16, 8).astype(np.float32)
+    path = tmp_path / "data.npy"
+    np.save(path, np_data)
+
+    tensor = Tensor.from_npy(device, path, mmap=mmap)
+    assert tensor.shape == Shape(16, 8)
+    compare_tensors(tensor.to_numpy(), np_data)
+
+    # Fortran ordered arrays keep their layout.
+    np.save(path, np.asfortranarray(np_data))
+    tensor = Tensor.from_npy(device, path, mmap=mmap)
+    compare_tensors(tensor.to_numpy(), np_data)
+
+    out_path = tmp_path / "out.npy"
+    Tensor.from_numpy(device, np_data).to_npy(out_path)
+    compare_tensors(np.load(out_path), np_data)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
@@ -2,8 +2,9 @@
 
 import pytest
 import slangpy as spy
-from slangpy import TextureLoader, Bitmap, Format, DataStruct, FormatSupport
+from slangpy import TextureLoader, TextureStreamer, Bitmap, Format, DataStruct, FormatSupport
 import sys
+import time
 import numpy as np
 import numpy.typing as npt
 import enum
@@ -291,5 +292,79 @@ def test_load_texture_array(device_type: spy.DeviceType):
     loader = TextureLoader(device)
 
 
+def wait_for_loads(streamer: TextureStreamer, timeout: float = 10.0):
+    deadline = time.monotonic() + timeout
+    while streamer.pending_count > 0:
+        if time.monotonic() > deadline:
+            pytest.fail(f"Texture loads did not complete within {timeout} seconds")
+        time.sleep(0.001)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_stream_texture(device_type: spy.DeviceType):
+    device = helpers.get_device(type=device_type)
+
+    image = np.random.rand(128, 256, 4).astype(np.float32)
+    streamer = TextureStreamer(device, {"mip_tail_size": 16, "upload_budget": 1})
+    streamed = streamer.load_texture(Bitmap(image))
+    assert streamed.texture is None
+
+    wait_for_loads(streamer)
+    streamer.update()
+    assert streamed.is_loaded
+    assert streamed.error == ""
+    assert streamed.width == 256
+    assert streamed.height == 128
+    assert streamed.mip_count == 9
+
+    # Only the mip tail is uploaded first, then one level per update.
+    assert streamed.resident_mip == 4
+    assert streamed.texture.width == 16
+    assert streamed.texture.mip_count == 5
+    for mip in [3, 2, 1, 0]:
+        streamer.update()
+        assert streamed.resident_mip == mip
+    assert streamed.is_fully_resident
+    assert streamer.memory_usage == streamed.resident_size
+
+    texture = streamed.texture
+    assert texture.mip_count == 9
+    assert np.allclose(texture.to_numpy(0, 0), image, atol=1e-6)
+    ref_mip = image.reshape(64, 2, 128, 2, 4).mean(axis=(1, 3))
+    assert np.allclose(texture.to_numpy(0, 1), ref_mip, atol=1e-5)
+
+
+@pytest.mark.parametrize("device_type", helpers.DEFAULT_DEVICE_TYPES)
+def test_stream_texture_budget(device_type: spy.DeviceType):
+    device = helpers.get_device(type=device_type)
+
+    image = (np.random.rand(256, 256, 4) * 255).astype(np.uint8)
+    streamer = TextureStreamer(device, {"mip_tail_size": 32})
+    a = streamer.load_texture(Bitmap(image))
+    streamer.flush()
+    full_size = a.resident_size
+    assert a.is_fully_resident
+
+    # Budget only fits one texture at full resolution, so the least recently used loses mips.
+    streamer.memory_budget = full_size * 3 // 2
+    b = streamer.load_texture(Bitmap(image))
+    streamer.flush()
+    assert b.is_fully_resident
+    assert not a.is_fully_resident
+    assert streamer.memory_usage <= streamer.memory_budget
+
+    a.touch()
+    streamer.update()
+    assert a.is_fully_resident
+    assert not b.is_fully_resident
+    assert streamer.memory_usage <= streamer.memory_budget
+
+    # Dropped textures no longer count towards the budget.
+    del a
+    streamer.update()
+    assert b.is_fully_resident
+    assert streamer.memory_usage == full_size
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-vvs", "-k", "test_load_texture_from_bitmap_file"])
@@ -1,9 +1,9 @@
 # SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 import math
 from os import PathLike
-from typing import TYPE_CHECKING, Any, Optional, Union, cast
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union, cast
 
-from slangpy.core.native import Shape, NativeNDBuffer, NativeNDBufferDesc
+from slangpy.core.native import Shape, NativeNDBuffer, NativeNDBufferDesc, StridedBufferView
 from slangpy.core.shapes import TShapeOrTuple
 from slangpy.core.struct import Struct
 
@@ -17,10 +17,12 @@ from slangpy import (
     CommandEncoder,
     Bitmap,
     DataStruct,
+    NumpyFuture,
 )
 from slangpy.bindings.marshall import Marshall
 from slangpy.bindings.typeregistry import get_or_create_type
 from slangpy.reflection import ScalarType, SlangProgramLayout, SlangType
+from slangpy.reflection.reflectiontypes import SCALAR_TYPE_TO_NUMPY_TYPE
 
 import numpy as np
 
@@ -139,8 +141,11 @@ def load_buffer_data_from_image(
     else:
         srgb_gamma = bitmap.srgb_gamma
 
-    # Perform conversion to the desired pixel format.
-    bitmap = bitmap.convert(pix_fmt, DataStruct.Type.float32, srgb_gamma)
+    # Perform conversion to the desired pixel format, flipping and applying scale and
+    # offset as part of the same pass.
+    bitmap = bitmap.convert(
+        pix_fmt, DataStruct.Type.float32, srgb_gamma, flip_y=flip_y, scale=scale, offset=offset
+    )
 
     # Convert bitmap to numpy array.
     data: np.ndarray[Any, Any] = np.asarray(bitmap, copy=False)
@@ -156,15 +161,81 @@ def load_buffer_data_from_image(
     if data.dtype != np.float32:
         raise ValueError(f"Bitmap data must be float32, got {data.dtype}")
 
-    # Flip if requested
-    if flip_y:
-        data = np.flipud(data)
+    return data
 
-    # Apply scale and offset if requested.
-    if scale != 1.0 or offset != 0.0:
-        data = data * scale + offset
 
-    return data
+def load_image_batch_layout(
+    paths: Sequence[Union[str, PathLike[str]]], greyscale: bool = False
+) -> tuple[Bitmap, tuple[int, int, int], str]:
+    """
+    Helper to decide the layout of a buffer holding a batch of images. Loads the first image,
+    returning it along with the [N, H, W] shape and element type of the buffer.
+    """
+    if len(paths) == 0:
+        raise ValueError("At least one image path must be provided")
+    first = Bitmap(paths[0])
+    channel_count = 1 if greyscale else first.channel_count
+    if channel_count < 1 or channel_count > 4:
+        raise ValueError(f"Unsupported number of channels: {channel_count}")
+    dtype = "float" if channel_count == 1 else f"float{channel_count}"
+    return first, (len(paths), first.height, first.width), dtype
+
+
+def read_npy_header(
+    path: Union[str, PathLike[str]],
+) -> tuple[np.dtype[Any], tuple[int, ...], bool, int]:
+    """
+    Helper to read the header of a .npy file without loading its data. Returns the dtype, shape
+    and whether the array is stored in fortran order, along with the file offset of the data.
+    """
+    with open(path, "rb") as f:
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        else:
+            raise ValueError(f"Unsupported .npy file version {version}")
+        return dtype, shape, fortran_order, f.tell()
+
+
+def save_buffer_to_npy(buffer: StridedBufferView, path: Union[str, PathLike[str]]):
+    """
+    Helper to save a buffer view to a .npy file, with the same dtype and shape as returned by
+    to_numpy. Contiguous views of scalar, vector, matrix or array elements are written in chunks
+    straight from the device, other views are copied to a numpy array first.
+    """
+    dtype = cast(SlangType, buffer.dtype)
+    innermost = dtype
+    while innermost.element_type is not None and innermost.element_type is not innermost:
+        innermost = innermost.element_type
+
+    np_dtype = None
+    if isinstance(innermost, ScalarType):
+        np_type = SCALAR_TYPE_TO_NUMPY_TYPE.get(innermost.slang_scalar_type)
+        if np_type is not None:
+            np_dtype = np.dtype(np_type)
+    element_shape = dtype.shape.as_tuple()
+
+    # Elements with padding (or types whose size differs from numpy's, such as bool) can't be
+    # written as raw data.
+    if (
+        np_dtype is None
+        or np_dtype.itemsize * math.prod(element_shape) != dtype.buffer_layout.stride
+        or not buffer.is_contiguous()
+    ):
+        with open(path, "wb") as f:
+            np.save(f, buffer.to_numpy())
+        return
+
+    header = {
+        "descr": np.lib.format.dtype_to_descr(np_dtype),
+        "fortran_order": False,
+        "shape": buffer.shape.as_tuple() + element_shape,
+    }
+    with open(path, "wb") as f:
+        np.lib.format.write_array_header_2_0(f, header)
+    buffer.append_to_file(path)
 
 
 class NDBuffer(NativeNDBuffer):
@@ -260,6 +331,15 @@ class NDBuffer(NativeNDBuffer):
         """
         return cast(np.ndarray[Any, Any], super().to_numpy())
 
+    def to_numpy_async(self) -> NumpyFuture:
+        """
+        Starts copying buffer data into a numpy array without waiting for the device, returning
+        a future whose result() is the array returned by to_numpy. Copies are batched with other
+        pending transfers and staged in a persistent ring buffer on the device. They are submitted
+        when the result is waited for, or earlier with device.flush_transfers().
+        """
+        return super().to_numpy_async()
+
     def to_torch(self) -> "torch.Tensor":
         """
         Returns a view of the buffer data as a torch tensor with the same shape and strides.
@@ -267,6 +347,60 @@ class NDBuffer(NativeNDBuffer):
         """
         return cast("torch.Tensor", super().to_torch())
 
+    def to_npy(self, path: Union[str, PathLike[str]]):
+        """
+        Saves buffer data to a .npy file, with the same dtype and shape as returned by to_numpy.
+        Contiguous buffers are read back from the device in chunks and written straight to the
+        file, without creating a numpy array holding the whole buffer.
+        """
+        save_buffer_to_npy(self, path)
+
+    def sum(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer holding the sum over the dimensions in `axis`, or all dimensions if
+        None. The reduction runs on the device, see `slangpy.core.reduce.reduce`.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(NDBuffer, reduce(self, "sum", axis))
+
+    def min(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer holding the minimum over the dimensions in `axis`, or all dimensions
+        if None.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(NDBuffer, reduce(self, "min", axis))
+
+    def max(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer holding the maximum over the dimensions in `axis`, or all dimensions
+        if None.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(NDBuffer, reduce(self, "max", axis))
+
+    def mean(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer holding the mean over the dimensions in `axis`, or all dimensions if
+        None. Requires a floating point element type.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(NDBuffer, reduce(self, "mean", axis))
+
+    def argmax(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer of ints holding the index of the first maximum over the dimensions
+        in `axis`, or all dimensions if None. Indices are into the reduced dimensions flattened
+        in row-major order.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "argmax", axis))
+
     def clear(self, command_buffer: Optional[CommandEncoder] = None):
         """
         Fill the ndbuffer with zeros. If no command buffer is provided, a new one is created and
@@ -330,6 +464,47 @@ class NDBuffer(NativeNDBuffer):
             other.device, other.shape, other.dtype, other.usage, other.memory_type
         )
 
+    @staticmethod
+    def load_from_images(
+        device: Device,
+        paths: Sequence[Union[str, PathLike[str]]],
+        flip_y: bool = False,
+        linearize: bool = False,
+        scale: float = 1.0,
+        offset: float = 0.0,
+        grayscale: bool = False,
+    ) -> "NDBuffer":
+        """
+        Helper to load a batch of images with the same dimensions into a single floating point
+        buffer of shape [N, H, W]. Images are decoded and converted in parallel into one staging
+        allocation, which is uploaded with a single copy.
+        """
+        first, shape, dtype = load_image_batch_layout(paths, grayscale)
+        buffer = NDBuffer.empty(device, shape, dtype)
+        buffer.copy_from_images([first, *paths[1:]], flip_y, linearize, scale, offset)
+        return buffer
+
+    @staticmethod
+    def from_file(
+        device: Device,
+        path: Union[str, PathLike[str]],
+        shape: TShapeOrTuple,
+        dtype: Any,
+        offset: int = 0,
+        usage: BufferUsage = BufferUsage.shader_resource | BufferUsage.unordered_access,
+        memory_type: MemoryType = MemoryType.device_local,
+        program_layout: Optional[SlangProgramLayout] = None,
+    ) -> "NDBuffer":
+        """
+        Creates an NDBuffer with the requested shape and element type, filled with raw data read
+        from a file starting at byte `offset`. The file is memory mapped and uploaded in chunks,
+        so it is never fully loaded into host memory.
+        """
+        buffer = NDBuffer.empty(device, shape, dtype, usage, memory_type, program_layout)
+        if buffer.element_count > 0:
+            buffer.copy_from_file(path, offset)
+        return buffer
+
     @staticmethod
     def load_from_image(
         device: Device,
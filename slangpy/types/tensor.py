@@ -10,6 +10,7 @@ from slangpy import (
     CommandBuffer,
     Bitmap,
     DataStruct,
+    NumpyFuture,
     MemoryType,
 )
 from slangpy.reflection import SlangType, ScalarType, SlangProgramLayout
@@ -21,17 +22,21 @@ from slangpy.types.buffer import (
     resolve_element_type,
     resolve_program_layout,
     load_buffer_data_from_image,
+    load_image_batch_layout,
+    read_npy_header,
+    save_buffer_to_npy,
 )
 from slangpy.core.native import Shape, NativeTensor, NativeTensorDesc
 
 from warnings import warn
 
-from typing import Optional, Any, Union, cast, TYPE_CHECKING
+from typing import Optional, Any, Sequence, Union, cast, TYPE_CHECKING
 import numpy as np
 import math
 
 if TYPE_CHECKING:
     import torch
+    from slangpy.types.buffer import NDBuffer
 
 ST = TypeReflection.ScalarType
 _numpy_to_sgl = {
@@ -150,6 +155,15 @@ class Tensor(NativeTensor):
         """
         return cast(np.ndarray[Any, Any], super().to_numpy())
 
+    def to_numpy_async(self) -> NumpyFuture:
+        """
+        Starts copying tensor data into a numpy array without waiting for the device, returning
+        a future whose result() is the array returned by to_numpy. Copies are batched with other
+        pending transfers and staged in a persistent ring buffer on the device. They are submitted
+        when the result is waited for, or earlier with device.flush_transfers().
+        """
+        return super().to_numpy_async()
+
     def to_torch(self) -> "torch.Tensor":
         """
         Returns a view of the buffer data as a torch tensor with the same shape and strides.
@@ -157,6 +171,60 @@ class Tensor(NativeTensor):
         """
         return cast("torch.Tensor", super().to_torch())
 
+    def to_npy(self, path: Union[str, PathLike[str]]):
+        """
+        Saves tensor data to a .npy file, with the same dtype and shape as returned by to_numpy.
+        Contiguous tensors are read back from the device in chunks and written straight to the
+        file, without creating a numpy array holding the whole tensor.
+        """
+        save_buffer_to_npy(self, path)
+
+    def sum(self, axis: Union[None, int, Sequence[int]] = None) -> "Tensor":
+        """
+        Returns a new tensor holding the sum over the dimensions in `axis`, or all dimensions if
+        None. The reduction runs on the device, see `slangpy.core.reduce.reduce`.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "sum", axis))
+
+    def min(self, axis: Union[None, int, Sequence[int]] = None) -> "Tensor":
+        """
+        Returns a new tensor holding the minimum over the dimensions in `axis`, or all dimensions
+        if None.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "min", axis))
+
+    def max(self, axis: Union[None, int, Sequence[int]] = None) -> "Tensor":
+        """
+        Returns a new tensor holding the maximum over the dimensions in `axis`, or all dimensions
+        if None.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "max", axis))
+
+    def mean(self, axis: Union[None, int, Sequence[int]] = None) -> "Tensor":
+        """
+        Returns a new tensor holding the mean over the dimensions in `axis`, or all dimensions if
+        None. Requires a floating point element type.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast(Tensor, reduce(self, "mean", axis))
+
+    def argmax(self, axis: Union[None, int, Sequence[int]] = None) -> "NDBuffer":
+        """
+        Returns a new NDBuffer of ints holding the index of the first maximum over the dimensions
+        in `axis`, or all dimensions if None. Indices are into the reduced dimensions flattened
+        in row-major order.
+        """
+        from slangpy.core.reduce import reduce
+
+        return cast("NDBuffer", reduce(self, "argmax", axis))
+
     def with_grads(
         self,
         grad_in: Optional[Tensor] = None,
@@ -199,26 +267,62 @@ class Tensor(NativeTensor):
     def from_numpy(device: Device, ndarray: np.ndarray[Any, Any]) -> Tensor:
         """
         Creates a new tensor with the same contents, shape and strides as the given numpy array.
+        The memory spanned by the array is uploaded as-is, so non-contiguous arrays are not
+        repacked. Arrays with negative or unaligned strides, or whose memory is mostly gaps, are
+        copied to a contiguous array first.
         """
 
         dtype = _numpy_to_slang(ndarray.dtype, device)
         if dtype is None:
             raise ValueError(f"Unsupported numpy dtype {ndarray.dtype}")
-        if (ndarray.nbytes % ndarray.itemsize) != 0:
-            raise ValueError(f"Unsupported numpy array")
-        for stride in ndarray.strides:
-            if (stride % ndarray.itemsize) != 0:
-                raise ValueError(f"Unsupported numpy array")
+        if any(stride < 0 or (stride % ndarray.itemsize) != 0 for stride in ndarray.strides):
+            ndarray = np.ascontiguousarray(ndarray)
 
-        N = ndarray.nbytes // ndarray.itemsize
-        flattened = np.lib.stride_tricks.as_strided(ndarray, (N,), (ndarray.itemsize,))
         strides = tuple(stride // ndarray.itemsize for stride in ndarray.strides)
+        N = 0
+        if ndarray.size > 0:
+            N = 1 + sum((dim - 1) * stride for dim, stride in zip(ndarray.shape, strides))
+        if N > 2 * ndarray.size:
+            # Uploading the gaps costs more than repacking, e.g. for a column of a large matrix.
+            ndarray = np.ascontiguousarray(ndarray)
+            strides = tuple(stride // ndarray.itemsize for stride in ndarray.strides)
+            N = ndarray.size
+        flattened = np.lib.stride_tricks.as_strided(ndarray, (N,), (ndarray.itemsize,))
 
         usage = BufferUsage.shader_resource | BufferUsage.unordered_access
-        buffer = device.create_buffer(ndarray.nbytes, usage=usage, data=flattened)
+        buffer = device.create_buffer(N * ndarray.itemsize, usage=usage, data=flattened)
 
         return Tensor(buffer, dtype, tuple(ndarray.shape), strides)
 
+    @staticmethod
+    def from_npy(device: Device, path: Union[str, PathLike[str]], mmap: bool = True) -> Tensor:
+        """
+        Creates a new tensor with the contents, shape and dtype of the array stored in a .npy file.
+        If `mmap` is True, the file is memory mapped and uploaded in chunks straight to the device,
+        so the array is never fully loaded into host memory. Fortran ordered arrays keep their
+        layout through the tensor strides.
+        """
+
+        np_dtype, shape, fortran_order, data_offset = read_npy_header(path)
+        if not mmap or not np_dtype.isnative:
+            ndarray = np.load(path).astype(np_dtype.newbyteorder("="), copy=False)
+            return Tensor.from_numpy(device, ndarray)
+
+        dtype = _numpy_to_slang(np_dtype, device)
+        if dtype is None:
+            raise ValueError(f"Unsupported numpy dtype {np_dtype}")
+
+        N = math.prod(shape)
+        usage = BufferUsage.shader_resource | BufferUsage.unordered_access
+        buffer = device.create_buffer(max(N, 1) * np_dtype.itemsize, usage=usage)
+        if N > 0:
+            Tensor(buffer, dtype, (N,)).copy_from_file(path, data_offset)
+
+        strides = None
+        if fortran_order:
+            strides = Shape(shape[::-1]).calc_contiguous_strides().as_tuple()[::-1]
+        return Tensor(buffer, dtype, shape, strides)
+
     @staticmethod
     def empty(
         device: Device,
@@ -309,3 +413,23 @@ class Tensor(NativeTensor):
         tensor = Tensor.empty(device, data.shape[:2], dtype)
         tensor.copy_from_numpy(data)
         return tensor
+
+    @staticmethod
+    def load_from_images(
+        device: Device,
+        paths: Sequence[Union[str, PathLike[str]]],
+        flip_y: bool = False,
+        linearize: bool = False,
+        scale: float = 1.0,
+        offset: float = 0.0,
+        grayscale: bool = False,
+    ) -> Tensor:
+        """
+        Helper to load a batch of images with the same dimensions into a single floating point
+        tensor of shape [N, H, W]. Images are decoded and converted in parallel into one staging
+        allocation, which is uploaded with a single copy.
+        """
+        first, shape, dtype = load_image_batch_layout(paths, grayscale)
+        tensor = Tensor.empty(device, shape, dtype)
+        tensor.copy_from_images([first, *paths[1:]], flip_y, linearize, scale, offset)
+        return tensor
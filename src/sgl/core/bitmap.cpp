@@ -413,7 +413,14 @@ std::vector<std::pair<std::string, ref<Bitmap>>> Bitmap::split() const
     return result;
 }
 
-ref<Bitmap> Bitmap::convert(PixelFormat pixel_format, ComponentType component_type, bool srgb_gamma) const
+ref<Bitmap> Bitmap::convert(
+    PixelFormat pixel_format,
+    ComponentType component_type,
+    bool srgb_gamma,
+    bool flip_y,
+    float scale,
+    float offset
+) const
 {
     uint32_t channel_count = 0;
     std::vector<std::string> channel_names;
@@ -424,11 +431,11 @@ ref<Bitmap> Bitmap::convert(PixelFormat pixel_format, ComponentType component_ty
     ref<Bitmap> result
         = make_ref<Bitmap>(pixel_format, component_type, m_width, m_height, channel_count, channel_names);
     result->set_srgb_gamma(srgb_gamma);
-    convert(result);
+    convert(result, flip_y, scale, offset);
     return result;
 }
 
-void Bitmap::convert(Bitmap* target) const
+void Bitmap::convert(Bitmap* target, bool flip_y, float scale, float offset) const
 {
     if (width() != target->width() || height() != target->height())
         SGL_THROW(
@@ -484,8 +491,16 @@ void Bitmap::convert(Bitmap* target) const
         SGL_THROW("Unable to convert bitmap: cannot determine how to derive field \"{}\" in target image!", field.name);
     }
 
-    ref<DataStructConverter> converter = make_ref<DataStructConverter>(src_struct, dst_struct);
-    converter->convert(data(), target->data(), pixel_count());
+    ref<DataStructConverter> converter = make_ref<DataStructConverter>(src_struct, dst_struct, scale, offset);
+    ptrdiff_t src_pitch = ptrdiff_t(m_width * bytes_per_pixel());
+    ptrdiff_t dst_pitch = ptrdiff_t(target->width() * target->bytes_per_pixel());
+    uint8_t* dst_data = target->uint8_data();
+    if (flip_y && m_height > 0) {
+        // Write rows bottom up.
+        dst_data += (m_height - 1) * dst_pitch;
+        dst_pitch = -dst_pitch;
+    }
+    converter->convert_2d(data(), src_pitch, dst_data, dst_pitch, m_width, m_height);
 }
 
 bool Bitmap::operator==(const Bitmap& other) const
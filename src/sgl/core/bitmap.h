@@ -238,9 +238,32 @@ public:
      */
     std::vector<std::pair<std::string, ref<Bitmap>>> split() const;
 
-    ref<Bitmap> convert(PixelFormat pixel_format, ComponentType component_type, bool srgb_gamma) const;
+    /**
+     * \brief Convert the bitmap to a different pixel format and component type.
+     *
+     * Flipping and the linear transform are fused into the conversion, so no intermediate
+     * bitmaps are created. The transform is applied to normalized values in the target's
+     * encoding (after sRGB gamma), i.e. ``value * scale + offset``.
+     *
+     * \param pixel_format Target pixel format.
+     * \param component_type Target component type.
+     * \param srgb_gamma Whether the target uses sRGB gamma encoding.
+     * \param flip_y Flip the image vertically.
+     * \param scale Scale applied to converted values.
+     * \param offset Offset added to converted values after scaling.
+     */
+    ref<Bitmap> convert(
+        PixelFormat pixel_format,
+        ComponentType component_type,
+        bool srgb_gamma,
+        bool flip_y = false,
+        float scale = 1.f,
+        float offset = 0.f
+    ) const;
 
-    void convert(Bitmap* target) const;
+    /// Convert the bitmap into an existing \c target bitmap of the same dimensions.
+    /// See \ref convert for a description of the remaining parameters.
+    void convert(Bitmap* target, bool flip_y = false, float scale = 1.f, float offset = 0.f) const;
 
     /// Equality operator.
     bool operator==(const Bitmap& other) const;
@@ -51,6 +51,7 @@ derivative works thereof, in binary and source code form.
 #include "sgl/core/maths.h"
 #include "sgl/core/string.h"
 #include "sgl/core/hash.h"
+#include "sgl/core/thread.h"
 
 #include "sgl/math/float16.h"
 #include "sgl/math/colorspace.h"
@@ -66,11 +67,15 @@ derivative works thereof, in binary and source code form.
 #endif
 #endif
 
+#include <algorithm>
+#include <array>
+#include <cstring>
 #include <limits>
 #include <unordered_map>
 #include <map>
 #include <memory>
 #include <mutex>
+#include <optional>
 #include <utility>
 
 #define SGL_LOG_JIT_ASSEMBLY 0
@@ -510,10 +515,23 @@ struct VM {
     }
 };
 
+/// Linear transform applied to destination values (\c value * scale + offset).
+struct Transform {
+    double scale{1.0};
+    double offset{0.0};
+
+    bool is_identity() const { return scale == 1.0 && offset == 0.0; }
+
+    bool operator==(const Transform& other) const { return scale == other.scale && offset == other.offset; }
+};
+
+/// Register used to hold the transform offset, above any registers used for blending.
+static constexpr uint8_t TRANSFORM_REG = 7;
+
 /// Generate conversion program for converting from \c src_struct to \c dst_struct.
 /// This generates code for the virtual machine.
 /// If using a JIT compiler, this code can be compiled to native code.
-std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& dst_struct)
+std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
 {
     const bool src_swap = src_struct.byte_order() != DataStruct::host_byte_order();
     const bool dst_swap = dst_struct.byte_order() != DataStruct::host_byte_order();
@@ -521,6 +539,18 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
     std::vector<Op> code;
     std::map<std::string, uint8_t> src_regs;
 
+    // Apply the transform to the value in register 0. This is done in the destination's
+    // encoding (i.e. after applying gamma), but before de-normalizing integers.
+    auto transform_value = [&]()
+    {
+        if (transform.scale != 1.0)
+            code.push_back({.type = Op::Type::multiply, .reg = 0, .multiply = {transform.scale}});
+        if (transform.offset != 0.0) {
+            code.push_back({.type = Op::Type::load_imm, .reg = TRANSFORM_REG, .load_imm = {transform.offset}});
+            code.push_back({.type = Op::Type::multiply_add, .reg = 0, .multiply_add = {TRANSFORM_REG, 1.0}});
+        }
+    };
+
     for (const auto& dst_field : dst_struct) {
 
         if (!dst_field.blend.empty()) {
@@ -538,6 +568,7 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
                 } else {
                     // Load linear value from source.
                     src_reg = static_cast<uint8_t>(src_regs.size() + 1);
+                    SGL_CHECK(src_reg < TRANSFORM_REG, "Too many fields blended into field \"{}\".", dst_field.name);
                     src_regs.emplace(name, src_reg);
 
                     // Load value from source struct.
@@ -573,6 +604,8 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
             if (is_set(dst_field.flags, DataStruct::Flags::srgb_gamma))
                 code.push_back({.type = Op::Type::linear_to_srgb, .reg = 0});
 
+            transform_value();
+
             // De-normalize destination value.
             if (DataStruct::is_integer(dst_field.type) && is_set(dst_field.flags, DataStruct::Flags::normalized))
                 code.push_back({.type = Op::Type::multiply, .reg = 0, .multiply = {dst_range.second}});
@@ -600,7 +633,8 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
 
             // Convert value if types don't match.
             DataStruct::Flags flag_mask = DataStruct::Flags::normalized | DataStruct::Flags::srgb_gamma;
-            if (src_field.type != dst_field.type || (src_field.flags & flag_mask) != (dst_field.flags & flag_mask)) {
+            if (src_field.type != dst_field.type || (src_field.flags & flag_mask) != (dst_field.flags & flag_mask)
+                || !transform.is_identity()) {
                 const auto src_range = DataStruct::type_range(src_field.type);
                 const auto dst_range = DataStruct::type_range(dst_field.type);
 
@@ -619,6 +653,8 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
                 if (is_set(dst_field.flags, DataStruct::Flags::srgb_gamma))
                     code.push_back({.type = Op::Type::linear_to_srgb, .reg = 0});
 
+                transform_value();
+
                 // De-normalize destination value.
                 if (DataStruct::is_integer(dst_field.type) && is_set(dst_field.flags, DataStruct::Flags::normalized))
                     code.push_back({.type = Op::Type::multiply, .reg = 0, .multiply = {dst_range.second}});
@@ -637,8 +673,10 @@ std::vector<Op> generate_code(const DataStruct& src_struct, const DataStruct& ds
                 {.type = Op::Type::save_mem, .reg = 0, .save_mem = {dst_field.offset, dst_field.type, dst_swap}}
             );
         } else if (is_set(dst_field.flags, DataStruct::Flags::default_)) {
-            // Set default value.
+            // Set default value. Integer defaults are raw values, so are only transformed for floats.
             code.push_back({.type = Op::Type::load_imm, .reg = 0, .load_imm = {dst_field.default_value}});
+            if (DataStruct::is_float(dst_field.type))
+                transform_value();
             code.push_back({.type = Op::Type::cast, .reg = 0, .cast = {DataStruct::Type::float64, dst_field.type}});
             code.push_back(
                 {.type = Op::Type::save_mem, .reg = 0, .save_mem = {dst_field.offset, dst_field.type, dst_swap}}
@@ -677,16 +715,267 @@ struct VMProgram : public Program {
         }
     }
 
-    static std::unique_ptr<Program> compile(const DataStruct& src_struct, const DataStruct& dst_struct)
+    static std::unique_ptr<Program>
+    compile(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
     {
         auto program = std::make_unique<VMProgram>();
-        program->code = generate_code(src_struct, dst_struct);
+        program->code = generate_code(src_struct, dst_struct, transform);
         program->src_size = src_struct.size();
         program->dst_size = dst_struct.size();
         return program;
     }
 };
 
+/// Conversion program for structs whose fields all share one component type (e.g. RGB(A) pixels), where each
+/// destination field is either copied from a single source field or set to its default value.
+/// Instead of converting one struct at a time, structs are processed in blocks, and each step of converting a
+/// component is a simple loop over the block, which the compiler can vectorize. Sources with 8-bit components
+/// are converted through a lookup table holding the result for each of the 256 possible values, which makes
+/// sRGB gamma conversions cheap. Other sources requiring gamma conversion are left to the generic programs.
+struct ComponentProgram : public Program {
+    static constexpr size_t BLOCK_SIZE = 256;
+
+    using LoadFunc = void (*)(const uint8_t* src, size_t stride, double* values, size_t count);
+    using StoreFunc = void (*)(const double* values, uint8_t* dst, size_t stride, size_t count);
+
+    struct Component {
+        size_t src_offset;
+        size_t dst_offset;
+        /// Load function, or nullptr if setting the default value.
+        LoadFunc load;
+        StoreFunc store;
+        /// Default value (if not loading).
+        double default_value;
+        /// Converted values for 8-bit sources (if not empty), before rounding.
+        std::vector<double> lut;
+        /// Apply the conversion steps below (if not using a lookup table).
+        bool convert;
+        double normalize;
+        double scale;
+        double offset;
+        double denormalize;
+        bool round;
+        std::pair<double, double> range;
+    };
+
+    std::vector<Component> components;
+    size_t src_size;
+    size_t dst_size;
+
+    void execute(const void* src, void* dst, size_t count) const override
+    {
+        const uint8_t* src_data = static_cast<const uint8_t*>(src);
+        uint8_t* dst_data = static_cast<uint8_t*>(dst);
+        std::array<double, BLOCK_SIZE> values;
+
+        for (size_t begin = 0; begin < count; begin += BLOCK_SIZE) {
+            size_t n = std::min(BLOCK_SIZE, count - begin);
+            const uint8_t* src_block = src_data + begin * src_size;
+            uint8_t* dst_block = dst_data + begin * dst_size;
+            for (const Component& c : components) {
+                if (!c.load) {
+                    std::fill_n(values.data(), n, c.default_value);
+                    c.store(values.data(), dst_block + c.dst_offset, dst_size, n);
+                    continue;
+                }
+                if (!c.lut.empty()) {
+                    const uint8_t* src_values = src_block + c.src_offset;
+                    for (size_t i = 0; i < n; ++i)
+                        values[i] = c.lut[src_values[i * src_size]];
+                } else {
+                    c.load(src_block + c.src_offset, src_size, values.data(), n);
+                    if (c.convert) {
+                        if (c.normalize != 1.0) {
+                            for (size_t i = 0; i < n; ++i)
+                                values[i] *= c.normalize;
+                        }
+                        if (c.scale != 1.0) {
+                            for (size_t i = 0; i < n; ++i)
+                                values[i] *= c.scale;
+                        }
+                        if (c.offset != 0.0) {
+                            for (size_t i = 0; i < n; ++i)
+                                values[i] += c.offset;
+                        }
+                        if (c.denormalize != 1.0) {
+                            for (size_t i = 0; i < n; ++i)
+                                values[i] *= c.denormalize;
+                        }
+                    }
+                }
+                if (c.round) {
+                    for (size_t i = 0; i < n; ++i)
+                        values[i] = std::clamp(std::rint(values[i]), c.range.first, c.range.second);
+                }
+                c.store(values.data(), dst_block + c.dst_offset, dst_size, n);
+            }
+        }
+    }
+
+    template<typename T, DataStruct::Type type, bool swap>
+    static void load_values(const uint8_t* src, size_t stride, double* values, size_t count)
+    {
+        for (size_t i = 0; i < count; ++i) {
+            T v;
+            std::memcpy(&v, src + i * stride, sizeof(T));
+            if constexpr (swap)
+                v = stdx::byteswap(v);
+            if constexpr (type == DataStruct::Type::float16)
+                values[i] = math::float16_to_float32(v);
+            else if constexpr (type == DataStruct::Type::float32)
+                values[i] = stdx::bit_cast<float>(v);
+            else
+                values[i] = static_cast<double>(v);
+        }
+    }
+
+    template<typename T, DataStruct::Type type, bool swap>
+    static void store_values(const double* values, uint8_t* dst, size_t stride, size_t count)
+    {
+        for (size_t i = 0; i < count; ++i) {
+            T v;
+            if constexpr (type == DataStruct::Type::float16)
+                v = math::float32_to_float16(static_cast<float>(values[i]));
+            else if constexpr (type == DataStruct::Type::float32)
+                v = stdx::bit_cast<uint32_t>(static_cast<float>(values[i]));
+            else
+                v = static_cast<T>(static_cast<uint64_t>(values[i]));
+            if constexpr (swap)
+                v = stdx::byteswap(v);
+            std::memcpy(dst + i * stride, &v, sizeof(T));
+        }
+    }
+
+    template<bool swap>
+    static LoadFunc get_load_func(DataStruct::Type type)
+    {
+        switch (type) {
+        case DataStruct::Type::uint8:
+            return &load_values<uint8_t, DataStruct::Type::uint8, false>;
+        case DataStruct::Type::uint16:
+            return &load_values<uint16_t, DataStruct::Type::uint16, swap>;
+        case DataStruct::Type::float16:
+            return &load_values<uint16_t, DataStruct::Type::float16, swap>;
+        case DataStruct::Type::float32:
+            return &load_values<uint32_t, DataStruct::Type::float32, swap>;
+        default:
+            return nullptr;
+        }
+    }
+
+    template<bool swap>
+    static StoreFunc get_store_func(DataStruct::Type type)
+    {
+        switch (type) {
+        case DataStruct::Type::uint8:
+            return &store_values<uint8_t, DataStruct::Type::uint8, false>;
+        case DataStruct::Type::uint16:
+            return &store_values<uint16_t, DataStruct::Type::uint16, swap>;
+        case DataStruct::Type::float16:
+            return &store_values<uint16_t, DataStruct::Type::float16, swap>;
+        case DataStruct::Type::float32:
+            return &store_values<uint32_t, DataStruct::Type::float32, swap>;
+        default:
+            return nullptr;
+        }
+    }
+
+    /// Returns the shared type of all fields, or nothing if the struct is empty or has mixed types.
+    static std::optional<DataStruct::Type> component_type(const DataStruct& struct_)
+    {
+        std::optional<DataStruct::Type> type;
+        for (const auto& field : struct_) {
+            if (type && *type != field.type)
+                return {};
+            type = field.type;
+        }
+        return type;
+    }
+
+    /// Compile a program, or return nullptr if the structs are not supported.
+    /// Follows the same sequence of operations as \c generate_code, so results match the generic programs.
+    static std::unique_ptr<Program>
+    compile(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
+    {
+        std::optional<DataStruct::Type> src_type = component_type(src_struct);
+        std::optional<DataStruct::Type> dst_type = component_type(dst_struct);
+        if (!src_type || !dst_type)
+            return nullptr;
+
+        const bool src_swap = src_struct.byte_order() != DataStruct::host_byte_order();
+        const bool dst_swap = dst_struct.byte_order() != DataStruct::host_byte_order();
+        LoadFunc load = src_swap ? get_load_func<true>(*src_type) : get_load_func<false>(*src_type);
+        StoreFunc store = dst_swap ? get_store_func<true>(*dst_type) : get_store_func<false>(*dst_type);
+        if (!load || !store)
+            return nullptr;
+
+        const auto src_range = DataStruct::type_range(*src_type);
+        const auto dst_range = DataStruct::type_range(*dst_type);
+        const DataStruct::Flags flag_mask = DataStruct::Flags::normalized | DataStruct::Flags::srgb_gamma;
+
+        auto program = std::make_unique<ComponentProgram>();
+        program->src_size = src_struct.size();
+        program->dst_size = dst_struct.size();
+
+        for (const auto& dst_field : dst_struct) {
+            if (!dst_field.blend.empty())
+                return nullptr;
+
+            Component c{};
+            c.dst_offset = dst_field.offset;
+            c.store = store;
+
+            if (src_struct.has_field(dst_field.name)) {
+                const auto& src_field = src_struct.field(dst_field.name);
+                const bool src_srgb = is_set(src_field.flags, DataStruct::Flags::srgb_gamma);
+                const bool dst_srgb = is_set(dst_field.flags, DataStruct::Flags::srgb_gamma);
+
+                c.src_offset = src_field.offset;
+                c.load = load;
+                c.convert = src_field.type != dst_field.type
+                    || (src_field.flags & flag_mask) != (dst_field.flags & flag_mask) || !transform.is_identity();
+                c.normalize = DataStruct::is_integer(src_field.type)
+                        && is_set(src_field.flags, DataStruct::Flags::normalized)
+                    ? 1.0 / src_range.second
+                    : 1.0;
+                c.scale = transform.scale;
+                c.offset = transform.offset;
+                c.denormalize = DataStruct::is_integer(dst_field.type)
+                        && is_set(dst_field.flags, DataStruct::Flags::normalized)
+                    ? dst_range.second
+                    : 1.0;
+                c.round = c.convert && DataStruct::is_integer(dst_field.type);
+                c.range = dst_range;
+
+                // Gamma conversions are only supported through lookup tables.
+                if (c.convert && src_field.type == DataStruct::Type::uint8) {
+                    c.lut.resize(256);
+                    for (size_t i = 0; i < 256; ++i) {
+                        double value = static_cast<double>(i) * c.normalize;
+                        if (src_srgb)
+                            value = math::srgb_to_linear(value);
+                        if (dst_srgb)
+                            value = math::linear_to_srgb(value);
+                        c.lut[i] = (value * c.scale + c.offset) * c.denormalize;
+                    }
+                } else if (c.convert && (src_srgb || dst_srgb)) {
+                    return nullptr;
+                }
+            } else if (is_set(dst_field.flags, DataStruct::Flags::default_)) {
+                c.default_value = dst_field.default_value;
+                if (DataStruct::is_float(dst_field.type))
+                    c.default_value = c.default_value * transform.scale + transform.offset;
+            } else {
+                return nullptr;
+            }
+
+            program->components.push_back(std::move(c));
+        }
+
+        return program;
+    }
+};
+
 #if SGL_HAS_ASMJIT
 
 /// Conversion program running just-in-time compiled X86 code.
@@ -697,7 +986,8 @@ struct X86Program : public Program {
 
     void execute(const void* src, void* dst, size_t count) const override { func(src, dst, count); }
 
-    static std::unique_ptr<Program> compile(const DataStruct& src_struct, const DataStruct& dst_struct)
+    static std::unique_ptr<Program>
+    compile(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
     {
         asmjit::CodeHolder code;
         code.init(runtime().environment(), runtime().cpuFeatures());
@@ -711,7 +1001,7 @@ struct X86Program : public Program {
         asmjit::x86::Compiler c(&code);
 
         Builder builder(c);
-        builder.build(src_struct, dst_struct);
+        builder.build(src_struct, dst_struct, transform);
 
         asmjit::Error err = c.finalize();
         if (err != asmjit::kErrorOk) {
@@ -911,9 +1201,9 @@ private:
             }
         }
 
-        void build(const DataStruct& src_struct, const DataStruct& dst_struct)
+        void build(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
         {
-            std::vector<Op> ops = generate_code(src_struct, dst_struct);
+            std::vector<Op> ops = generate_code(src_struct, dst_struct, transform);
 
             auto comment = [this](std::string text)
             {
@@ -1418,7 +1708,8 @@ struct ARMProgram : public Program {
 
     void execute(const void* src, void* dst, size_t count) const override { func(src, dst, count); }
 
-    static std::unique_ptr<Program> compile(const DataStruct& src_struct, const DataStruct& dst_struct)
+    static std::unique_ptr<Program>
+    compile(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
     {
         // TODO: check cpu features, but for some reason these are all false
         bool supported = true;
@@ -1448,7 +1739,7 @@ struct ARMProgram : public Program {
         asmjit::a64::Compiler c(&code);
 
         Builder builder(c);
-        builder.build(src_struct, dst_struct);
+        builder.build(src_struct, dst_struct, transform);
 
         asmjit::Error err = c.finalize();
         if (err != asmjit::kErrorOk) {
@@ -1498,9 +1789,9 @@ private:
         /// Load a constant value.
         asmjit::a64::Mem const_(double value) { return c.newDoubleConst(asmjit::ConstPoolScope::kGlobal, value); }
 
-        void build(const DataStruct& src_struct, const DataStruct& dst_struct)
+        void build(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
         {
-            std::vector<Op> ops = generate_code(src_struct, dst_struct);
+            std::vector<Op> ops = generate_code(src_struct, dst_struct, transform);
 
             auto comment = [this](std::string text)
             {
@@ -1971,15 +2262,15 @@ private:
 
 class ProgramCache {
 public:
-    const Program* get_program(const DataStruct& src_struct, const DataStruct& dst_struct)
+    const Program* get_program(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
     {
         std::lock_guard<std::mutex> lock(m_mutex);
 
-        auto key = std::make_pair(src_struct, dst_struct);
+        ProgramKey key{src_struct, dst_struct, transform};
         auto it = m_programs.find(key);
         if (it != m_programs.end())
             return it->second.get();
-        auto [it2, inserted] = m_programs.emplace(key, compile_program(src_struct, dst_struct));
+        auto [it2, inserted] = m_programs.emplace(key, compile_program(src_struct, dst_struct, transform));
         return it2->second.get();
     }
 
@@ -1990,50 +2281,115 @@ public:
     }
 
 private:
-    std::unique_ptr<Program> compile_program(const DataStruct& src_struct, const DataStruct& dst_struct)
+    struct ProgramKey {
+        DataStruct src_struct;
+        DataStruct dst_struct;
+        Transform transform;
+
+        bool operator==(const ProgramKey& other) const
+        {
+            return src_struct == other.src_struct && dst_struct == other.dst_struct && transform == other.transform;
+        }
+
+        friend size_t hash(const ProgramKey& key)
+        {
+            return sgl::hash(key.src_struct, key.dst_struct, key.transform.scale, key.transform.offset);
+        }
+    };
+
+    std::unique_ptr<Program>
+    compile_program(const DataStruct& src_struct, const DataStruct& dst_struct, const Transform& transform)
     {
-        std::unique_ptr<Program> program;
+        std::unique_ptr<Program> program = ComponentProgram::compile(src_struct, dst_struct, transform);
+        if (program)
+            return program;
 
 #if SGL_HAS_ASMJIT
 #if SGL_X86_64
-        program = X86Program::compile(src_struct, dst_struct);
+        program = X86Program::compile(src_struct, dst_struct, transform);
 #elif SGL_ARM64
-        program = ARMProgram::compile(src_struct, dst_struct);
+        program = ARMProgram::compile(src_struct, dst_struct, transform);
 #endif
 #endif // SGL_HAS_ASMJIT
         if (!program)
-            program = VMProgram::compile(src_struct, dst_struct);
+            program = VMProgram::compile(src_struct, dst_struct, transform);
 
         return program;
     }
 
     std::mutex m_mutex;
-    std::unordered_map<
-        std::pair<DataStruct, DataStruct>,
-        std::unique_ptr<Program>,
-        hasher<std::pair<DataStruct, DataStruct>>,
-        comparator<std::pair<DataStruct, DataStruct>>>
-        m_programs;
+    std::unordered_map<ProgramKey, std::unique_ptr<Program>, hasher<ProgramKey>, comparator<ProgramKey>> m_programs;
 };
 
 
-DataStructConverter::DataStructConverter(const DataStruct* src, const DataStruct* dst)
+/// Minimum number of structs converted by each task when converting large inputs in parallel.
+static constexpr size_t PARALLEL_GRAIN_SIZE = 16384;
+
+DataStructConverter::DataStructConverter(const DataStruct* src, const DataStruct* dst, double scale, double offset)
     : m_src(new DataStruct(*src))
     , m_dst(new DataStruct(*dst))
+    , m_scale(scale)
+    , m_offset(offset)
 {
 }
 
 void DataStructConverter::convert(const void* src, void* dst, size_t count) const
 {
+    convert_2d(src, 0, dst, 0, count, 1);
+}
+
+void DataStructConverter::convert_2d(
+    const void* src,
+    ptrdiff_t src_pitch,
+    void* dst,
+    ptrdiff_t dst_pitch,
+    size_t width,
+    size_t height
+) const
+{
+    const uint8_t* src_data = static_cast<const uint8_t*>(src);
+    uint8_t* dst_data = static_cast<uint8_t*>(dst);
+    Transform transform{m_scale, m_offset};
+
     // Direct copy if source and destination struct are the same.
-    if (*m_src == *m_dst) {
-        std::memcpy(dst, src, m_src->size() * count);
+    if (*m_src == *m_dst && transform.is_identity()) {
+        for (size_t y = 0; y < height; ++y)
+            std::memcpy(dst_data + y * dst_pitch, src_data + y * src_pitch, m_src->size() * width);
         return;
     }
 
-    const Program* program = ProgramCache::get().get_program(*m_src, *m_dst);
+    const Program* program = ProgramCache::get().get_program(*m_src, *m_dst, transform);
     SGL_CHECK(program, "Failed to compile conversion program.");
-    program->execute(src, dst, count);
+
+    // Small inputs are converted on the calling thread.
+    if (width * height < 2 * PARALLEL_GRAIN_SIZE) {
+        for (size_t y = 0; y < height; ++y)
+            program->execute(src_data + y * src_pitch, dst_data + y * dst_pitch, width);
+        return;
+    }
+
+    // Split large inputs into blocks of rows, or blocks of structs within a single row.
+    if (height > 1) {
+        size_t grain_size = std::max<size_t>(1, PARALLEL_GRAIN_SIZE / std::max<size_t>(width, 1));
+        thread::parallel_for(
+            height,
+            grain_size,
+            [&](size_t begin, size_t end)
+            {
+                for (size_t y = begin; y < end; ++y)
+                    program->execute(src_data + y * src_pitch, dst_data + y * dst_pitch, width);
+            }
+        );
+    } else {
+        const size_t src_size = m_src->size();
+        const size_t dst_size = m_dst->size();
+        thread::parallel_for(
+            width,
+            PARALLEL_GRAIN_SIZE,
+            [&](size_t begin, size_t end)
+            { program->execute(src_data + begin * src_size, dst_data + begin * dst_size, end - begin); }
+        );
+    }
 }
 
 std::string DataStructConverter::to_string() const
@@ -2041,10 +2397,14 @@ std::string DataStructConverter::to_string() const
     return fmt::format(
         "DataStructConverter(\n"
         "  src = {},\n"
-        "  dst = {}\n"
+        "  dst = {},\n"
+        "  scale = {},\n"
+        "  offset = {}\n"
         ")",
         string::indent(m_src->to_string()),
-        string::indent(m_dst->to_string())
+        string::indent(m_dst->to_string()),
+        m_scale,
+        m_offset
     );
 }
 
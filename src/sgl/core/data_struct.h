@@ -336,7 +336,13 @@ public:
     /// Constructor.
     /// \param src Source struct definition.
     /// \param dst Destination struct definition.
-    DataStructConverter(const DataStruct* src, const DataStruct* dst);
+    /// \param scale Scale applied to destination values.
+    /// \param offset Offset added to destination values after scaling.
+    ///
+    /// The scale and offset are applied in the destination's encoding (after sRGB gamma
+    /// but before de-normalizing integer values), so that a normalized value of 1.0 maps
+    /// to \c scale + \c offset.
+    DataStructConverter(const DataStruct* src, const DataStruct* dst, double scale = 1.0, double offset = 0.0);
 
     /// The source struct definition.
     const DataStruct* src() const { return m_src; }
@@ -344,17 +350,42 @@ public:
     /// The destination struct definition.
     const DataStruct* dst() const { return m_dst; }
 
+    /// Scale applied to destination values.
+    double scale() const { return m_scale; }
+
+    /// Offset added to destination values after scaling.
+    double offset() const { return m_offset; }
+
     /// Convert data from source struct to destination struct.
     /// \param src Source data.
     /// \param dst Destination data.
     /// \param count Number of structs to convert.
     void convert(const void* src, void* dst, size_t count) const;
 
+    /// Convert rows of data from source struct to destination struct.
+    /// Pitches may be negative, e.g. to flip an image vertically.
+    /// \param src Source data (first row).
+    /// \param src_pitch Distance in bytes between rows in the source data.
+    /// \param dst Destination data (first row).
+    /// \param dst_pitch Distance in bytes between rows in the destination data.
+    /// \param width Number of structs to convert per row.
+    /// \param height Number of rows to convert.
+    void convert_2d(
+        const void* src,
+        ptrdiff_t src_pitch,
+        void* dst,
+        ptrdiff_t dst_pitch,
+        size_t width,
+        size_t height
+    ) const;
+
     std::string to_string() const override;
 
 private:
     ref<const DataStruct> m_src;
     ref<const DataStruct> m_dst;
+    double m_scale;
+    double m_offset;
 };
 
 } // namespace sgl
@@ -4,6 +4,12 @@
 
 #include "sgl/core/error.h"
 
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <exception>
+#include <mutex>
+
 namespace sgl::thread {
 
 static std::unique_ptr<BS::thread_pool> s_global_thread_pool;
@@ -30,4 +36,74 @@ BS::thread_pool& global_thread_pool()
     return *s_global_thread_pool;
 }
 
+/// Number of blocks per thread used by \c parallel_for, to balance load between threads.
+static constexpr size_t BLOCKS_PER_THREAD = 4;
+
+struct ParallelForState {
+    const std::function<void(size_t, size_t)>* func;
+    size_t count;
+    size_t block_size;
+    size_t block_count;
+    std::atomic<size_t> next_block{0};
+    std::atomic<size_t> finished_blocks{0};
+    std::mutex mutex;
+    std::condition_variable cv;
+    std::exception_ptr exception;
+};
+
+static void run_blocks(ParallelForState& state)
+{
+    while (true) {
+        size_t block = state.next_block.fetch_add(1);
+        if (block >= state.block_count)
+            return;
+        size_t begin = block * state.block_size;
+        size_t end = std::min(begin + state.block_size, state.count);
+        try {
+            (*state.func)(begin, end);
+        } catch (...) {
+            std::lock_guard<std::mutex> lock(state.mutex);
+            if (!state.exception)
+                state.exception = std::current_exception();
+        }
+        if (state.finished_blocks.fetch_add(1) + 1 == state.block_count) {
+            std::lock_guard<std::mutex> lock(state.mutex);
+            state.cv.notify_all();
+        }
+    }
+}
+
+void parallel_for(size_t count, size_t grain_size, const std::function<void(size_t, size_t)>& func)
+{
+    if (count == 0)
+        return;
+
+    BS::thread_pool& pool = global_thread_pool();
+    size_t thread_count = pool.get_thread_count();
+    grain_size = std::max<size_t>(grain_size, 1);
+    size_t block_count = std::min((count + grain_size - 1) / grain_size, (thread_count + 1) * BLOCKS_PER_THREAD);
+    if (block_count <= 1 || thread_count == 0) {
+        func(0, count);
+        return;
+    }
+
+    // Shared with helper tasks, which may only start running after all blocks are finished.
+    auto state = std::make_shared<ParallelForState>();
+    state->func = &func;
+    state->count = count;
+    state->block_size = (count + block_count - 1) / block_count;
+    state->block_count = (count + state->block_size - 1) / state->block_size;
+
+    size_t helper_count = std::min(thread_count, state->block_count - 1);
+    for (size_t i = 0; i < helper_count; ++i)
+        pool.push_task([state]() { run_blocks(*state); });
+
+    run_blocks(*state);
+
+    std::unique_lock<std::mutex> lock(state->mutex);
+    state->cv.wait(lock, [&]() { return state->finished_blocks.load() == state->block_count; });
+    if (state->exception)
+        std::rethrow_exception(state->exception);
+}
+
 } // namespace sgl::thread
@@ -6,6 +6,7 @@
 
 #include <BS_thread_pool.hpp>
 
+#include <functional>
 #include <type_traits>
 #include <future>
 
@@ -25,4 +26,18 @@ std::future<R> do_async(F&& task, A&&... args)
     return global_thread_pool().submit(std::forward<F>(task), std::forward<A>(args)...);
 }
 
+/**
+ * \brief Run \c func over the range [0, count) split into blocks, using the global thread pool.
+ *
+ * Blocks contain at least \c grain_size items, and \c func is called with the [begin, end) range of each block.
+ * The calling thread processes blocks as well and only waits for blocks already started by other threads,
+ * so this is safe to call from within tasks running on the thread pool. The first exception thrown by \c func
+ * is rethrown on the calling thread once all blocks have finished.
+ *
+ * \param count Number of items.
+ * \param grain_size Minimum number of items per block.
+ * \param func Function called for each block.
+ */
+SGL_API void parallel_for(size_t count, size_t grain_size, const std::function<void(size_t, size_t)>& func);
+
 } // namespace sgl::thread
@@ -54,14 +54,7 @@ BufferElementCursor BufferElementCursor::find_field(std::string_view name) const
         if (field_index < 0)
             break;
 
-        ref<const VariableLayoutReflection> field_layout = m_type_layout->get_field_by_index(field_index);
-        BufferElementCursor field_cursor;
-
-        field_cursor.m_buffer = m_buffer;
-        field_cursor.m_type_layout = field_layout->type_layout();
-        field_cursor.m_offset = m_offset + field_layout->offset();
-
-        return field_cursor;
+        return find_field_by_index(uint32_t(field_index));
     }
 
     default:
@@ -71,6 +64,24 @@ BufferElementCursor BufferElementCursor::find_field(std::string_view name) const
     return {};
 }
 
+BufferElementCursor BufferElementCursor::find_field_by_index(uint32_t index) const
+{
+    if (!is_valid())
+        return *this;
+
+    if (m_type_layout->kind() != TypeReflection::Kind::struct_)
+        return {};
+
+    ref<const VariableLayoutReflection> field_layout = m_type_layout->get_field_by_index(index);
+    BufferElementCursor field_cursor;
+
+    field_cursor.m_buffer = m_buffer;
+    field_cursor.m_type_layout = field_layout->type_layout();
+    field_cursor.m_offset = m_offset + field_layout->offset();
+
+    return field_cursor;
+}
+
 BufferElementCursor BufferElementCursor::find_element(uint32_t index) const
 {
     if (!is_valid())
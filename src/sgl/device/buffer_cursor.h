@@ -40,6 +40,10 @@ public:
     BufferElementCursor find_field(std::string_view name) const;
     BufferElementCursor find_element(uint32_t index) const;
 
+    /// Find a struct field by its index in the type layout, avoiding the lookup by name.
+    /// The index must be less than the number of fields of the struct.
+    BufferElementCursor find_field_by_index(uint32_t index) const;
+
     bool has_field(std::string_view name) const { return find_field(name).is_valid(); }
     bool has_element(uint32_t index) const { return find_element(index).is_valid(); }
 
@@ -21,6 +21,7 @@
 #include "sgl/device/print.h"
 #include "sgl/device/blit.h"
 #include "sgl/device/hot_reload.h"
+#include "sgl/device/staging.h"
 #include "sgl/device/debug_logger.h"
 
 #include "sgl/core/file_system_watcher.h"
@@ -281,6 +282,10 @@ void Device::close()
     m_blitter.reset();
     m_debug_printer.reset();
 
+    m_transfer_encoder = nullptr;
+    m_transfer_batch.reset();
+    m_readback_ring.reset();
+
     m_global_fence.reset();
 
     m_slang_session.reset();
@@ -406,6 +411,12 @@ void Device::reload_all_programs()
         m_hot_reload->recreate_all_sessions();
 }
 
+void Device::reload_programs(std::span<const std::filesystem::path> changed_files)
+{
+    if (m_hot_reload)
+        m_hot_reload->recreate_sessions(changed_files);
+}
+
 ref<SlangModule> Device::load_module(std::string_view module_name)
 {
     return m_slang_session->load_module(module_name);
@@ -520,6 +531,9 @@ uint64_t Device::submit_command_buffers(
     if (has_signal_fence_values && signal_fence_values.size() != signal_fences.size())
         SGL_THROW("\"signal_fence_values\" size does not match \"signal_fences\" size.");
 
+    // Submit pending transfers first, so they are visible to the submitted work.
+    flush_transfers();
+
     // Update hot reload system if created.
     // TODO(slang-rhi) need to make sure this is not too expensive.
     if (m_hot_reload)
@@ -636,6 +650,7 @@ void Device::wait_for_submit(uint64_t id)
 void Device::wait_for_idle(CommandQueueType queue)
 {
     SGL_CHECK(queue == CommandQueueType::graphics, "Only graphics queue is supported.");
+    flush_transfers();
     m_rhi_graphics_queue->waitOnHost();
 }
 
@@ -670,11 +685,43 @@ void Device::wait()
     wait_for_idle();
 }
 
+uint64_t Device::flush_transfers()
+{
+    std::lock_guard lock(m_transfer_mutex);
+    if (!m_transfer_encoder)
+        return 0;
+
+    // Take the pending batch before submitting, as submitting flushes transfers again.
+    ref<CommandEncoder> command_encoder = m_transfer_encoder;
+    std::shared_ptr<TransferBatch> batch = std::move(m_transfer_batch);
+    m_transfer_encoder = nullptr;
+    m_transfer_size = 0;
+
+    batch->submit_id = submit_command_buffer(command_encoder->finish());
+    return batch->submit_id;
+}
+
+CommandEncoder* Device::get_transfer_encoder()
+{
+    if (!m_transfer_encoder) {
+        m_transfer_encoder = create_command_encoder();
+        m_transfer_batch = std::make_shared<TransferBatch>();
+    }
+    return m_transfer_encoder;
+}
+
+void Device::add_transfer_size(size_t size)
+{
+    m_transfer_size += size;
+    if (m_transfer_size >= TRANSFER_BATCH_SIZE)
+        flush_transfers();
+}
+
 void Device::upload_buffer_data(Buffer* buffer, size_t offset, size_t size, const void* data)
 {
-    auto command_encoder = create_command_encoder();
-    command_encoder->upload_buffer_data(buffer, offset, size, data);
-    submit_command_buffer(command_encoder->finish());
+    std::lock_guard lock(m_transfer_mutex);
+    get_transfer_encoder()->upload_buffer_data(buffer, offset, size, data);
+    add_transfer_size(size);
 }
 
 void Device::read_buffer_data(const Buffer* buffer, void* data, size_t size, size_t offset)
@@ -683,9 +730,51 @@ void Device::read_buffer_data(const Buffer* buffer, void* data, size_t size, siz
     SGL_CHECK(offset + size <= buffer->size(), "Buffer read is out of bounds");
     SGL_CHECK_NOT_NULL(data);
 
+    flush_transfers();
     SLANG_RHI_CALL(m_rhi_device->readBuffer(buffer->rhi_buffer(), offset, size, data));
 }
 
+ref<BufferReadback> Device::read_buffer_data_async(const Buffer* buffer, size_t size, size_t offset)
+{
+    SGL_CHECK_NOT_NULL(buffer);
+    SGL_CHECK(offset + size <= buffer->size(), "Buffer read is out of bounds");
+
+    std::lock_guard lock(m_transfer_mutex);
+
+    if (!m_readback_ring)
+        m_readback_ring = std::make_shared<ReadbackRing>(this, READBACK_RING_SIZE);
+
+    // Stage in the ring if there is space, otherwise fall back to a dedicated buffer.
+    std::shared_ptr<ReadbackRing> ring;
+    ref<Buffer> staging_buffer;
+    size_t staging_offset = 0;
+    if (auto ring_offset = m_readback_ring->allocate(size)) {
+        ring = m_readback_ring;
+        staging_buffer = ref(ring->buffer());
+        staging_offset = *ring_offset;
+    } else {
+        staging_buffer = create_buffer({
+            .size = size,
+            .memory_type = MemoryType::read_back,
+            .usage = BufferUsage::copy_destination,
+            .label = "readback_staging",
+        });
+    }
+
+    get_transfer_encoder()->copy_buffer(staging_buffer, staging_offset, buffer, offset, size);
+    ref<BufferReadback> readback = make_ref<BufferReadback>(
+        ref(this),
+        ref(buffer),
+        size,
+        staging_buffer,
+        staging_offset,
+        std::move(ring),
+        m_transfer_batch
+    );
+    add_transfer_size(size);
+    return readback;
+}
+
 void Device::upload_texture_data(
     Texture* texture,
     SubresourceRange subresource_range,
@@ -694,16 +783,19 @@ void Device::upload_texture_data(
     std::span<SubresourceData> subresource_data
 )
 {
-    ref<CommandEncoder> command_encoder = create_command_encoder();
-    command_encoder->upload_texture_data(texture, subresource_range, offset, extent, subresource_data);
-    submit_command_buffer(command_encoder->finish());
+    std::lock_guard lock(m_transfer_mutex);
+    get_transfer_encoder()->upload_texture_data(texture, subresource_range, offset, extent, subresource_data);
+    size_t size = 0;
+    for (const SubresourceData& data : subresource_data)
+        size += data.size;
+    add_transfer_size(size);
 }
 
 void Device::upload_texture_data(Texture* texture, uint32_t layer, uint32_t mip, SubresourceData subresource_data)
 {
-    ref<CommandEncoder> command_encoder = create_command_encoder();
-    command_encoder->upload_texture_data(texture, layer, mip, subresource_data);
-    submit_command_buffer(command_encoder->finish());
+    std::lock_guard lock(m_transfer_mutex);
+    get_transfer_encoder()->upload_texture_data(texture, layer, mip, subresource_data);
+    add_transfer_size(subresource_data.size);
 }
 
 OwnedSubresourceData Device::read_texture_data(const Texture* texture, uint32_t layer, uint32_t mip)
@@ -712,6 +804,8 @@ OwnedSubresourceData Device::read_texture_data(const Texture* texture, uint32_t
     SGL_CHECK_LT(layer, texture->layer_count());
     SGL_CHECK_LT(mip, texture->mip_count());
 
+    flush_transfers();
+
     // Query layout information.
     rhi::SubresourceLayout rhi_layout;
     SLANG_RHI_CALL(texture->rhi_texture()->getSubresourceLayout(mip, &rhi_layout));
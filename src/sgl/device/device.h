@@ -22,6 +22,8 @@
 
 #include <array>
 #include <filesystem>
+#include <memory>
+#include <mutex>
 #include <optional>
 #include <string>
 #include <vector>
@@ -180,7 +182,11 @@ struct ShaderCacheStats {
 };
 
 /// Event data for hot reload hook.
-struct ShaderHotReloadEvent { };
+struct ShaderHotReloadEvent {
+    /// Absolute paths of the changed files that triggered the reload.
+    /// Empty if everything was reloaded, e.g. by \c Device::reload_all_programs.
+    std::vector<std::filesystem::path> changed_files;
+};
 using ShaderHotReloadCallback = std::function<void(const ShaderHotReloadEvent&)>;
 
 
@@ -238,6 +244,9 @@ public:
      */
     void close();
 
+    /// True if the device has been closed.
+    bool is_closed() const { return m_closed; }
+
     /// Close all open devices.
     static void close_all_devices();
 
@@ -402,6 +411,9 @@ public:
 
     void reload_all_programs();
 
+    /// Reload programs that depend on any of the changed files, leaving other programs untouched.
+    void reload_programs(std::span<const std::filesystem::path> changed_files);
+
     ref<ShaderObject> create_root_shader_object(const ShaderProgram* shader_program);
 
     ref<ShaderObject> create_shader_object(const TypeLayoutReflection* type_layout);
@@ -508,8 +520,27 @@ public:
     /// Wait for all device work to complete.
     void wait();
 
+    /**
+     * \brief Submit all pending transfers.
+     *
+     * Uploads and asynchronous reads are recorded into a shared command encoder and submitted
+     * as one batch, instead of one submission per transfer. Pending transfers are submitted
+     * automatically before any other submission, before reading resources back, when waiting
+     * for the device and once the batch grows beyond \c TRANSFER_BATCH_SIZE bytes.
+     *
+     * \return Submission ID of the batch, or 0 if there were no pending transfers.
+     */
+    uint64_t flush_transfers();
+
+    /// Number of bytes after which pending transfers are submitted automatically.
+    static constexpr size_t TRANSFER_BATCH_SIZE = 64 * 1024 * 1024;
+
+    /// Size of the persistent ring buffer used for asynchronous reads.
+    static constexpr size_t READBACK_RING_SIZE = 16 * 1024 * 1024;
+
     /**
      * Upload host memory to buffer.
+     * \note The upload is recorded with the pending transfers, see \c flush_transfers.
      *
      * \param buffer Buffer to write to.
      * \param offset Offset in the buffer to write to.
@@ -529,8 +560,22 @@ public:
      */
     void read_buffer_data(const Buffer* buffer, void* data, size_t size, size_t offset = 0);
 
+    /**
+     * Read buffer data to host memory without waiting.
+     *
+     * The copy is recorded with the pending transfers, see \c flush_transfers. Data is staged
+     * in a persistent ring buffer, or in a dedicated buffer if the read does not fit the ring.
+     *
+     * \param buffer Buffer to read from.
+     * \param size Size of the data in bytes.
+     * \param offset Offset in the buffer to read from.
+     * \return Readback object that can be waited on to access the data.
+     */
+    ref<BufferReadback> read_buffer_data_async(const Buffer* buffer, size_t size, size_t offset = 0);
+
     /**
      * Upload host memory to texture.
+     * \note The upload is recorded with the pending transfers, see \c flush_transfers.
      *
      * \param texture Texture to write to.
      * \param subresource Subresource index.
@@ -615,10 +660,10 @@ public:
     HotReload* _hot_reload() { return m_hot_reload; }
 
     /// Called by hot reload system after reload occurs, to trigger the hooks.
-    void _on_hot_reload()
+    void _on_hot_reload(const ShaderHotReloadEvent& event)
     {
         for (auto& hook : m_shader_hot_reload_callbacks)
-            hook({});
+            hook(event);
     }
 
 private:
@@ -657,6 +702,16 @@ private:
     ref<cuda::Device> m_cuda_device;
     ref<cuda::ExternalSemaphore> m_cuda_semaphore;
     bool m_wait_global_fence{false};
+
+    /// Pending transfers, see \c flush_transfers.
+    std::recursive_mutex m_transfer_mutex;
+    ref<CommandEncoder> m_transfer_encoder;
+    std::shared_ptr<TransferBatch> m_transfer_batch;
+    size_t m_transfer_size{0};
+    std::shared_ptr<ReadbackRing> m_readback_ring;
+
+    CommandEncoder* get_transfer_encoder();
+    void add_transfer_size(size_t size);
 };
 
 } // namespace sgl
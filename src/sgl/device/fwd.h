@@ -48,6 +48,12 @@ class Sampler;
 struct FenceDesc;
 class Fence;
 
+// staging.h
+
+struct TransferBatch;
+class ReadbackRing;
+class BufferReadback;
+
 // shader.h
 
 struct SlangSessionDesc;
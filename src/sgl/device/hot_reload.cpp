@@ -26,18 +26,25 @@ void HotReload::update()
 
 void HotReload::on_file_system_event(std::span<FileSystemWatchEvent> events)
 {
-    // Simple check to see if any events involved .slang files.
-    auto fn_check = [](const FileSystemWatchEvent& e) { return platform::has_extension(e.path, "slang"); };
-    bool has_slang_files = std::find_if(events.begin(), events.end(), fn_check) != events.end();
-    if (!has_slang_files)
+    // Collect the .slang files involved in the events.
+    std::set<std::filesystem::path> changed_files;
+    for (const FileSystemWatchEvent& e : events) {
+        if (platform::has_extension(e.path, "slang"))
+            changed_files.insert(e.absolute_path.lexically_normal().make_preferred());
+    }
+    if (changed_files.empty())
         return;
 
-    // If slang files detected, recreate all existing sessions
-    if (m_auto_detect_changes)
-        recreate_all_sessions();
+    // If slang files detected, recreate the sessions that depend on them. After a failed
+    // build the recorded dependencies may be out of date, so everything is recreated.
+    if (m_auto_detect_changes) {
+        if (m_last_build_failed)
+            recreate_all_sessions();
+        else
+            recreate_sessions(changed_files);
+    }
 }
 
-
 void HotReload::_register_slang_session(SlangSession* session)
 {
     m_all_slang_sessions.insert(session);
@@ -64,6 +71,30 @@ void HotReload::set_auto_detect_delay(uint32_t delay_ms)
 
 void HotReload::recreate_all_sessions()
 {
+    recreate_sessions(std::set<std::filesystem::path>{});
+}
+
+void HotReload::recreate_sessions(std::span<const std::filesystem::path> changed_files)
+{
+    std::set<std::filesystem::path> files;
+    for (const auto& path : changed_files)
+        files.insert(std::filesystem::absolute(path).lexically_normal().make_preferred());
+    recreate_sessions(files);
+}
+
+void HotReload::recreate_sessions(const std::set<std::filesystem::path>& changed_files)
+{
+    // An empty set of changed files recreates everything.
+    std::vector<SlangSession*> sessions;
+    for (SlangSession* session : m_all_slang_sessions) {
+        if (changed_files.empty() || session->depends_on(changed_files))
+            sessions.push_back(session);
+    }
+    if (!changed_files.empty() && sessions.empty()) {
+        log_debug("Hot reload skipped, no session depends on the changed files");
+        return;
+    }
+
     // Notify reflection system to clear all reflection data
     detail::invalidate_all_reflection_data();
 
@@ -73,8 +104,8 @@ void HotReload::recreate_all_sessions()
     // logged and application carry on as usual.
     try {
         m_last_build_failed = false;
-        for (SlangSession* session : m_all_slang_sessions)
-            session->recreate_session();
+        for (SlangSession* session : sessions)
+            session->recreate_session(changed_files);
     } catch (SlangCompileError& compile_error) {
         log_error("Hot reload failed due to compile error");
         log_error(compile_error.what());
@@ -89,7 +120,9 @@ void HotReload::recreate_all_sessions()
     m_has_reloaded = true;
 
     // Notify device so it can notify hooks.
-    m_device->_on_hot_reload();
+    ShaderHotReloadEvent event;
+    event.changed_files.assign(changed_files.begin(), changed_files.end());
+    m_device->_on_hot_reload(event);
 }
 
 void HotReload::update_watched_paths_for_session(SlangSession* session)
@@ -99,30 +132,12 @@ void HotReload::update_watched_paths_for_session(SlangSession* session)
     SlangInt module_count = slang_session->getLoadedModuleCount();
     for (SlangInt module_index = 0; module_index < module_count; module_index++) {
         slang::IModule* slang_module = slang_session->getLoadedModule(module_index);
-        SlangInt32 dependency_count = slang_module->getDependencyFileCount();
-        for (SlangInt32 dependency_index = 0; dependency_index < dependency_count; dependency_index++) {
-            {
-                // Get the dependency as an FS path, verify it is absolute and turn into directory path.
-                const char* path = slang_module->getDependencyFilePath(dependency_index);
-                if (path) {
-                    std::filesystem::path abs_path = path;
-                    if (!abs_path.is_absolute()) {
-                        // IModule::getDependencyFilePath can return relative file paths for shaders
-                        // that are in the current working directory.
-                        // If the path is not absolute, we also try to resolve it against cwd to turn it into
-                        // absolute path. The returned path can also be a non-file, e.g. for string modules.
-                        if (!std::filesystem::exists(abs_path))
-                            continue;
-                        abs_path = std::filesystem::absolute(abs_path);
-                    }
-                    abs_path = abs_path.parent_path().make_preferred();
-
-                    // If not already monitoring this path, add a watch for it.
-                    if (!m_watched_paths.contains(abs_path)) {
-                        m_file_system_watcher->add_watch({.directory = abs_path});
-                        m_watched_paths.insert(abs_path);
-                    }
-                }
+        for (const auto& path : detail::get_dependency_files(slang_module)) {
+            // If not already monitoring the directory of the dependency, add a watch for it.
+            std::filesystem::path dir_path = path.parent_path();
+            if (!m_watched_paths.contains(dir_path)) {
+                m_file_system_watcher->add_watch({.directory = dir_path});
+                m_watched_paths.insert(dir_path);
             }
         }
     }
@@ -33,6 +33,10 @@ public:
     /// any modules/programs they've loaded/linked.
     void recreate_all_sessions();
 
+    /// Recreate sessions with modules that depend on any of the changed files, only
+    /// relinking programs that depend on them. Other sessions are left untouched.
+    void recreate_sessions(std::span<const std::filesystem::path> changed_files);
+
     /// Updates internal file system monitor for change detection.
     void update();
 
@@ -63,6 +67,7 @@ public:
 private:
     void on_file_system_event(std::span<FileSystemWatchEvent> events);
     void update_watched_paths_for_session(SlangSession* session);
+    void recreate_sessions(const std::set<std::filesystem::path>& changed_files);
 
     Device* m_device;
     bool m_auto_detect_changes{true};
@@ -9,6 +9,7 @@
 
 #include "sgl/math/vector.h"
 
+#include <atomic>
 #include <span>
 
 namespace sgl {
@@ -16,6 +17,7 @@ namespace sgl {
 namespace detail {
 
     static std::map<void*, const BaseReflectionObject*> g_slang_reflection_to_sgl_reflection;
+    static std::atomic<uint64_t> g_reflection_generation{0};
 
     template<typename SGLType, typename SlangType>
     ref<const SGLType> create_reflection_type_from_slang_type(ref<const Object> owner, SlangType* slang_reflection)
@@ -61,6 +63,17 @@ namespace detail {
             const_cast<BaseReflectionObject*>(reflection)->_hot_reload_invalidate();
         }
         g_slang_reflection_to_sgl_reflection.clear();
+        next_reflection_generation();
+    }
+
+    uint64_t reflection_generation()
+    {
+        return g_reflection_generation.load(std::memory_order_acquire);
+    }
+
+    void next_reflection_generation()
+    {
+        g_reflection_generation.fetch_add(1, std::memory_order_acq_rel);
     }
 } // namespace detail
 
@@ -39,6 +39,14 @@ namespace detail {
     SGL_API void on_slang_wrapper_destroyed(void* slang_reflection);
 
     SGL_API void invalidate_all_reflection_data();
+
+    /// Counter that changes whenever reflection data may have been destroyed, i.e. when a
+    /// session, module, entry point or program is destroyed or reflection data is invalidated.
+    /// Caches keyed by slang reflection pointers drop their entries when it changes, as the
+    /// address of destroyed reflection data can be reused.
+    SGL_API uint64_t reflection_generation();
+
+    SGL_API void next_reflection_generation();
 } // namespace detail
 
 
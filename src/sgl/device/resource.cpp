@@ -151,6 +151,8 @@ void Buffer::unmap() const
 void* Buffer::cuda_memory() const
 {
     SGL_CHECK(m_device->supports_cuda_interop(), "Device does not support CUDA interop");
+    // Make pending uploads visible to CUDA.
+    m_device->flush_transfers();
     if (!m_cuda_memory)
         m_cuda_memory = make_ref<cuda::ExternalMemory>(this);
     return m_cuda_memory->mapped_data();
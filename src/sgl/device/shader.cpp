@@ -147,6 +147,33 @@ private:
     std::vector<Entry> m_entries;
 };
 
+namespace detail {
+
+    std::vector<std::filesystem::path> get_dependency_files(slang::IModule* slang_module)
+    {
+        std::vector<std::filesystem::path> result;
+        SlangInt32 dependency_count = slang_module->getDependencyFileCount();
+        for (SlangInt32 dependency_index = 0; dependency_index < dependency_count; dependency_index++) {
+            const char* path = slang_module->getDependencyFilePath(dependency_index);
+            if (!path)
+                continue;
+            std::filesystem::path abs_path = path;
+            if (!abs_path.is_absolute()) {
+                // IModule::getDependencyFilePath can return relative file paths for shaders
+                // that are in the current working directory.
+                // If the path is not absolute, we also try to resolve it against cwd to turn it into
+                // absolute path. The returned path can also be a non-file, e.g. for string modules.
+                if (!std::filesystem::exists(abs_path))
+                    continue;
+                abs_path = std::filesystem::absolute(abs_path);
+            }
+            result.push_back(abs_path.lexically_normal().make_preferred());
+        }
+        return result;
+    }
+
+} // namespace detail
+
 // ----------------------------------------------------------------------------
 // SlangSession
 // ----------------------------------------------------------------------------
@@ -215,20 +242,31 @@ SlangSession::~SlangSession()
     // Unregister with hot load reload system if enabled.
     if (m_device->_hot_reload())
         m_device->_hot_reload()->_unregister_slang_session(this);
+
+    detail::next_reflection_generation();
 }
 
-void SlangSession::recreate_session()
+void SlangSession::recreate_session(const std::set<std::filesystem::path>& changed_files)
 {
     SGL_CHECK_NOT_NULL(m_device);
 
     SlangSessionBuild build;
 
+    // Find programs that need relinking before modules are reloaded, as dependencies are
+    // read from the currently loaded modules. Other programs keep their linked code and
+    // pipelines, which stay valid as they hold on to the session they were linked in.
+    std::vector<ShaderProgram*> programs;
+    for (auto program : m_registered_programs) {
+        if (changed_files.empty() || program->depends_on(changed_files))
+            programs.push_back(program);
+    }
+
     // Build everything first.
     create_session(build);
     for (auto module : m_registered_modules) {
         module->load(build);
     }
-    for (auto program : m_registered_programs) {
+    for (auto program : programs) {
         program->link(build);
     }
 
@@ -237,7 +275,7 @@ void SlangSession::recreate_session()
     for (auto module : m_registered_modules) {
         module->store_built_data(build);
     }
-    for (auto program : m_registered_programs) {
+    for (auto program : programs) {
         program->store_built_data(build);
     }
 
@@ -509,6 +547,31 @@ ref<SlangModule> SlangSession::load_module_from_source(
     return module;
 }
 
+ref<SlangModule> SlangSession::load_module_from_ir(std::string_view module_name, std::span<const uint8_t> ir)
+{
+    // Reject serialized modules whose dependencies have changed since they were written.
+    UnownedSlangBlob ir_blob(ir.data(), ir.size());
+    if (!m_data->slang_session->isBinaryModuleUpToDate(std::string{module_name}.c_str(), &ir_blob))
+        return nullptr;
+
+    SlangModuleDesc desc;
+    desc.module_name = module_name;
+    desc.ir = std::vector<uint8_t>(ir.begin(), ir.end());
+
+    ref<SlangModule> module = make_ref<SlangModule>(ref(this), desc);
+
+    // Setup build info with just this session in and load/store the module.
+    SlangSessionBuild build;
+    build.session = m_data;
+    module->load(build);
+    module->store_built_data(build);
+
+    // Update cache of loaded modules.
+    update_module_cache_and_dependencies();
+
+    return module;
+}
+
 ref<ShaderProgram> SlangSession::link_program(
     std::vector<ref<SlangModule>> modules,
     std::vector<ref<SlangEntryPoint>> entry_points,
@@ -584,6 +647,15 @@ std::string SlangSession::load_source(std::string_view module_name)
     SGL_THROW("Failed to load source for module \"{}\"", module_name);
 }
 
+bool SlangSession::depends_on(const std::set<std::filesystem::path>& files) const
+{
+    for (auto module : m_registered_modules) {
+        if (module->depends_on(files))
+            return true;
+    }
+    return false;
+}
+
 void SlangSession::_register_program(ShaderProgram* program)
 {
     m_registered_programs.insert(program);
@@ -747,6 +819,7 @@ SlangModule::SlangModule(ref<SlangSession> session, const SlangModuleDesc& desc)
 SlangModule::~SlangModule()
 {
     m_session->_unregister_module(this);
+    detail::next_reflection_generation();
 }
 
 void SlangModule::load(SlangSessionBuild& build_data) const
@@ -758,8 +831,25 @@ void SlangModule::load(SlangSessionBuild& build_data) const
     const SlangModuleDesc& desc = m_desc;
     const SlangSessionData* session_data = build_data.session.get();
 
-    // Load module either from resolved name or source depending on whether source specified
-    if (!desc.source.has_value()) {
+    // Load module either from serialized IR, resolved name or source depending on what is specified
+    if (desc.ir.has_value()) {
+        UnownedSlangBlob ir_blob(desc.ir->data(), desc.ir->size());
+        SGL_CATCH_INTERNAL_SLANG_ERROR(
+            slang_module = session_data->slang_session->loadModuleFromIRBlob(
+                std::string{desc.module_name}.c_str(),
+                std::string{desc.module_name}.c_str(),
+                &ir_blob,
+                diagnostics.writeRef()
+            )
+        );
+        if (!slang_module) {
+            std::string msg = append_diagnostics(
+                fmt::format("Failed to load slang module \"{}\" from IR", desc.module_name),
+                diagnostics
+            );
+            throw SlangCompileError(msg);
+        }
+    } else if (!desc.source.has_value()) {
         std::string resolved_name = session_data->resolve_module_name(desc.module_name);
         SGL_CATCH_INTERNAL_SLANG_ERROR(
             slang_module = session_data->slang_session->loadModule(resolved_name.c_str(), diagnostics.writeRef());
@@ -830,6 +920,20 @@ void SlangModule::populate_build_data(SlangSessionBuild& build_data)
         ep->populate_build_data(build_data);
 }
 
+std::vector<std::filesystem::path> SlangModule::dependency_files() const
+{
+    return detail::get_dependency_files(m_data->slang_module);
+}
+
+bool SlangModule::depends_on(const std::set<std::filesystem::path>& files) const
+{
+    for (const auto& path : dependency_files()) {
+        if (files.contains(path))
+            return true;
+    }
+    return false;
+}
+
 std::vector<ref<SlangEntryPoint>> SlangModule::entry_points() const
 {
     std::vector<ref<SlangEntryPoint>> entry_points;
@@ -875,6 +979,14 @@ ref<const DeclReflection> SlangModule::module_decl() const
     return detail::from_slang(ref(this), m_data->slang_module->getModuleReflection());
 }
 
+std::vector<uint8_t> SlangModule::serialize() const
+{
+    Slang::ComPtr<ISlangBlob> blob;
+    SLANG_CALL(m_data->slang_module->serialize(blob.writeRef()));
+    const uint8_t* data = reinterpret_cast<const uint8_t*>(blob->getBufferPointer());
+    return std::vector<uint8_t>(data, data + blob->getBufferSize());
+}
+
 void SlangModule::_register_entry_point(SlangEntryPoint* entry_point) const
 {
     m_registered_entry_points.insert(entry_point);
@@ -910,6 +1022,7 @@ SlangEntryPoint::SlangEntryPoint(ref<SlangModule> module, const SlangEntryPointD
 SlangEntryPoint::~SlangEntryPoint()
 {
     m_module->_unregister_entry_point(this);
+    detail::next_reflection_generation();
 }
 
 void SlangEntryPoint::init(SlangSessionBuild& build_data) const
@@ -1084,6 +1197,7 @@ ShaderProgram::ShaderProgram(ref<Device> device, ref<SlangSession> session, cons
 ShaderProgram::~ShaderProgram()
 {
     m_session->_unregister_program(this);
+    detail::next_reflection_generation();
 }
 
 void ShaderProgram::link(SlangSessionBuild& build_data) const
@@ -1198,6 +1312,7 @@ void ShaderProgram::link(SlangSessionBuild& build_data) const
     auto data = make_ref<ShaderProgramData>();
 
     // Store program info.
+    data->session = build_data.session;
     data->linked_program = linked_program;
     data->rhi_shader_program = rhi_shader_program;
 
@@ -1205,6 +1320,19 @@ void ShaderProgram::link(SlangSessionBuild& build_data) const
     build_data.programs[this] = std::move(data);
 }
 
+bool ShaderProgram::depends_on(const std::set<std::filesystem::path>& files) const
+{
+    for (const auto& module : m_desc.modules) {
+        if (module->depends_on(files))
+            return true;
+    }
+    for (const auto& entry_point : m_desc.entry_points) {
+        if (entry_point->module()->depends_on(files))
+            return true;
+    }
+    return false;
+}
+
 void ShaderProgram::store_built_data(SlangSessionBuild& build_data)
 {
     // Store built program data
@@ -217,6 +217,14 @@ struct SlangModuleData;
 struct SlangEntryPointData;
 struct ShaderProgramData;
 
+namespace detail {
+
+    /// Get the absolute paths of all files a slang module depends on. Dependencies that are
+    /// not files on disk, such as modules loaded from strings, are skipped.
+    SGL_API std::vector<std::filesystem::path> get_dependency_files(slang::IModule* slang_module);
+
+} // namespace detail
+
 /// Intermediate structure used during a build that stores new session, module,
 /// program and entry point information. This is populated during a build, then
 /// applied to all built modules/entrypoints/programs at once on success.
@@ -269,7 +277,12 @@ public:
     ~SlangSession();
 
     /// Fully recreates this session and any loaded modules or linked programs.
-    void recreate_session();
+    /// If \c changed_files is not empty, only programs that depend on one of the
+    /// files are relinked, other programs keep their previously linked code.
+    void recreate_session(const std::set<std::filesystem::path>& changed_files = {});
+
+    /// True if any module loaded in this session depends on one of the files.
+    bool depends_on(const std::set<std::filesystem::path>& files) const;
 
     Device* device() const { return m_device; }
     const SlangSessionDesc& desc() const { return m_desc; }
@@ -284,6 +297,10 @@ public:
         std::optional<std::filesystem::path> path = {}
     );
 
+    /// Load a module from serialized IR (see \c SlangModule::serialize).
+    /// Returns nullptr if the serialized module is out of date with respect to its dependencies.
+    ref<SlangModule> load_module_from_ir(std::string_view module_name, std::span<const uint8_t> ir);
+
     /// Link a program with a set of modules and entry points.
     ref<ShaderProgram> link_program(
         std::vector<ref<SlangModule>> modules,
@@ -350,6 +367,9 @@ struct SlangModuleDesc {
 
     /// If source specified, additional path for compilation.
     std::optional<std::filesystem::path> path;
+
+    /// Optional serialized module IR. If specified, the module is loaded from IR instead of source.
+    std::optional<std::vector<uint8_t>> ir;
 };
 
 struct SlangModuleData : Object {
@@ -384,6 +404,13 @@ public:
 
     /// Module source path. This can be empty if the module was generated from a string.
     const std::filesystem::path& path() const { return m_data->path; }
+
+    /// Absolute paths of all files the module was built from, including imported modules.
+    std::vector<std::filesystem::path> dependency_files() const;
+
+    /// True if the module was built from any of the files.
+    bool depends_on(const std::set<std::filesystem::path>& files) const;
+
     ref<const ProgramLayout> layout() const
     {
         return ProgramLayout::from_slang(ref(this), m_data->slang_module->getLayout());
@@ -402,6 +429,9 @@ public:
     /// Get root decl ref for this module
     ref<const DeclReflection> module_decl() const;
 
+    /// Serialize the module IR, so it can later be reloaded with \c SlangSession::load_module_from_ir.
+    std::vector<uint8_t> serialize() const;
+
     /// Internal slang module.
     slang::IModule* slang_module() const { return m_data->slang_module; }
 
@@ -476,6 +506,8 @@ struct ShaderProgramDesc {
     std::optional<SlangLinkOptions> link_options;
 };
 struct ShaderProgramData : Object {
+    /// Session the program was linked in, kept alive for programs not relinked by a hot reload.
+    ref<SlangSessionData> session;
     Slang::ComPtr<slang::IComponentType> linked_program;
     Slang::ComPtr<rhi::IShaderProgram> rhi_shader_program;
 };
@@ -493,6 +525,9 @@ public:
 
     const ShaderProgramDesc& desc() const { return m_desc; }
 
+    /// True if any module or entry point linked into the program depends on one of the files.
+    bool depends_on(const std::set<std::filesystem::path>& files) const;
+
     ref<const ProgramLayout> layout() const
     {
         return ProgramLayout::from_slang(ref(this), m_data->linked_program->getLayout());
@@ -127,12 +127,67 @@ ShaderCursor ShaderCursor::find_field(std::string_view name) const
         if (field_index < 0)
             break;
 
+        return find_field_by_index(uint32_t(field_index));
+    }
+
+    // In some cases the user might be trying to acess a field by name
+    // from a cursor that references a constant buffer or parameter block,
+    // and in these cases we want the access to Just Work.
+    //
+    case TypeReflection::Kind::constant_buffer:
+    case TypeReflection::Kind::parameter_block: {
+        // We basically need to "dereference" the current cursor
+        // to go from a pointer to a constant buffer to a pointer
+        // to the *contents* of the constant buffer.
+        //
+        ShaderCursor d = dereference();
+        return d.find_field(name);
+    }
+
+    default:
+        break;
+    }
+
+#if 0
+    // If a cursor is pointing at a root shader object (created for a
+    // program), then we will also iterate over the entry point shader
+    // objects attached to it and look for a matching parameter name
+    // on them.
+    //
+    // This is a bit of "do what I mean" logic and could potentially
+    // lead to problems if there could be multiple entry points with
+    // the same parameter name.
+    //
+    // TODO: figure out whether we should support this long-term.
+    //
+    auto entryPointCount = (GfxIndex)m_shader_object->getEntryPointCount();
+    for (GfxIndex e = 0; e < entryPointCount; ++e) {
+        ComPtr<IShaderObject> entryPoint;
+        m_shader_object->getEntryPoint(e, entryPoint.writeRef());
+
+        ShaderCursor entryPointCursor(entryPoint);
+
+        auto result = entryPointCursor.getField(name, nameEnd, outCursor);
+        if (SLANG_SUCCEEDED(result))
+            return result;
+    }
+#endif
+    return {};
+}
+
+ShaderCursor ShaderCursor::find_field_by_index(uint32_t index) const
+{
+    if (!is_valid())
+        return *this;
+
+    switch ((TypeReflection::Kind)m_type_layout->getKind()) {
+    case TypeReflection::Kind::struct_: {
         // Once we know the index of the field being referenced,
         // we create a cursor to point at the field, based on
         // the offset information already in this cursor, plus
         // offsets derived from the field's layout.
         //
-        slang::VariableLayoutReflection* field_layout = m_type_layout->getFieldByIndex(field_index);
+        slang::VariableLayoutReflection* field_layout = m_type_layout->getFieldByIndex(index);
         ShaderCursor field_cursor;
 
         // The field cursor will point into the same parent object.
@@ -149,7 +204,7 @@ ShaderCursor ShaderCursor::find_field(std::string_view name) const
         field_cursor.m_offset.uniform_offset
             = m_offset.uniform_offset + narrow_cast<uint32_t>(field_layout->getOffset());
         field_cursor.m_offset.binding_range_index = m_offset.binding_range_index
-            + narrow_cast<int32_t>(m_type_layout->getFieldBindingRangeOffset(field_index));
+            + narrow_cast<int32_t>(m_type_layout->getFieldBindingRangeOffset(index));
 
         // The index of the field within any binding ranges will be the same
         // as the index computed for the parent structure.
@@ -179,48 +234,14 @@ ShaderCursor ShaderCursor::find_field(std::string_view name) const
         return field_cursor;
     }
 
-    // In some cases the user might be trying to acess a field by name
-    // from a cursor that references a constant buffer or parameter block,
-    // and in these cases we want the access to Just Work.
-    //
+    // Access through constant buffers and parameter blocks works as for find_field.
     case TypeReflection::Kind::constant_buffer:
-    case TypeReflection::Kind::parameter_block: {
-        // We basically need to "dereference" the current cursor
-        // to go from a pointer to a constant buffer to a pointer
-        // to the *contents* of the constant buffer.
-        //
-        ShaderCursor d = dereference();
-        return d.find_field(name);
-    }
+    case TypeReflection::Kind::parameter_block:
+        return dereference().find_field_by_index(index);
 
     default:
         break;
     }
-
-#if 0
-    // If a cursor is pointing at a root shader object (created for a
-    // program), then we will also iterate over the entry point shader
-    // objects attached to it and look for a matching parameter name
-    // on them.
-    //
-    // This is a bit of "do what I mean" logic and could potentially
-    // lead to problems if there could be multiple entry points with
-    // the same parameter name.
-    //
-    // TODO: figure out whether we should support this long-term.
-    //
-    auto entryPointCount = (GfxIndex)m_shader_object->getEntryPointCount();
-    for (GfxIndex e = 0; e < entryPointCount; ++e) {
-        ComPtr<IShaderObject> entryPoint;
-        m_shader_object->getEntryPoint(e, entryPoint.writeRef());
-
-        ShaderCursor entryPointCursor(entryPoint);
-
-        auto result = entryPointCursor.getField(name, nameEnd, outCursor);
-        if (SLANG_SUCCEEDED(result))
-            return result;
-    }
-#endif
     return {};
 }
 
@@ -48,6 +48,10 @@ public:
     ShaderCursor find_field(std::string_view name) const;
     ShaderCursor find_element(uint32_t index) const;
 
+    /// Find a struct field by its index in the type layout, avoiding the lookup by name.
+    /// The index must be less than the number of fields of the struct.
+    ShaderCursor find_field_by_index(uint32_t index) const;
+
     ShaderCursor find_entry_point(uint32_t index) const;
 
     bool has_field(std::string_view name) const { return find_field(name).is_valid(); }
@@ -0,0 +1,178 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#include "staging.h"
+
+#include "sgl/device/device.h"
+#include "sgl/device/resource.h"
+
+#include "sgl/core/error.h"
+#include "sgl/core/maths.h"
+#include "sgl/core/string.h"
+
+#include <algorithm>
+
+namespace sgl {
+
+// ----------------------------------------------------------------------------
+// ReadbackRing
+// ----------------------------------------------------------------------------
+
+ReadbackRing::ReadbackRing(Device* device, size_t capacity)
+    : m_capacity(capacity)
+{
+    SGL_ASSERT(device);
+
+    m_buffer = device->create_buffer({
+        .size = capacity,
+        .memory_type = MemoryType::read_back,
+        .usage = BufferUsage::copy_destination,
+        .label = "readback_ring",
+    });
+    m_mapped_data = m_buffer->map<const uint8_t>();
+}
+
+ReadbackRing::~ReadbackRing()
+{
+    m_buffer->unmap();
+}
+
+size_t ReadbackRing::used() const
+{
+    std::lock_guard lock(m_mutex);
+    if (m_blocks.empty())
+        return 0;
+    size_t tail = m_blocks.front().offset;
+    return m_head > tail ? m_head - tail : m_capacity - tail + m_head;
+}
+
+std::optional<size_t> ReadbackRing::allocate(size_t size)
+{
+    std::lock_guard lock(m_mutex);
+
+    size = align_to(ALIGNMENT, std::max(size, size_t(1)));
+    if (size > m_capacity)
+        return {};
+
+    size_t offset;
+    if (m_blocks.empty()) {
+        offset = 0;
+    } else {
+        // Free space is [head, capacity) + [0, tail) if the head is after the tail,
+        // otherwise [head, tail). Head equal to tail means the ring is full.
+        size_t tail = m_blocks.front().offset;
+        if (m_head > tail) {
+            if (m_head + size <= m_capacity)
+                offset = m_head;
+            else if (size <= tail)
+                offset = 0;
+            else
+                return {};
+        } else if (m_head < tail && m_head + size <= tail) {
+            offset = m_head;
+        } else {
+            return {};
+        }
+    }
+
+    m_blocks.push_back({offset, size, false});
+    m_head = offset + size;
+    if (m_head == m_capacity)
+        m_head = 0;
+    return offset;
+}
+
+void ReadbackRing::free(size_t offset)
+{
+    std::lock_guard lock(m_mutex);
+
+    auto it
+        = std::find_if(m_blocks.begin(), m_blocks.end(), [&](const Block& block) { return block.offset == offset; });
+    SGL_ASSERT(it != m_blocks.end() && !it->freed);
+    it->freed = true;
+    while (!m_blocks.empty() && m_blocks.front().freed)
+        m_blocks.pop_front();
+    if (m_blocks.empty())
+        m_head = 0;
+}
+
+// ----------------------------------------------------------------------------
+// BufferReadback
+// ----------------------------------------------------------------------------
+
+BufferReadback::BufferReadback(
+    ref<Device> device,
+    ref<const Buffer> buffer,
+    size_t size,
+    ref<Buffer> staging_buffer,
+    size_t staging_offset,
+    std::shared_ptr<ReadbackRing> ring,
+    std::shared_ptr<TransferBatch> batch
+)
+    : m_device(std::move(device))
+    , m_buffer(std::move(buffer))
+    , m_size(size)
+    , m_staging_buffer(std::move(staging_buffer))
+    , m_staging_offset(staging_offset)
+    , m_ring(std::move(ring))
+    , m_batch(std::move(batch))
+{
+}
+
+BufferReadback::~BufferReadback()
+{
+    // The staging memory may only be reused once the copy has finished.
+    // Closing the device waits for all submissions.
+    if (!m_device->is_closed() && m_batch->submit_id != 0 && !m_device->is_submit_finished(m_batch->submit_id))
+        m_device->wait_for_submit(m_batch->submit_id);
+
+    if (m_ring)
+        m_ring->free(m_staging_offset);
+    else if (m_data)
+        m_staging_buffer->unmap();
+}
+
+bool BufferReadback::is_ready() const
+{
+    if (m_device->is_closed())
+        return m_batch->submit_id != 0;
+    return m_batch->submit_id != 0 && m_device->is_submit_finished(m_batch->submit_id);
+}
+
+void BufferReadback::wait()
+{
+    SGL_CHECK(m_batch->submit_id != 0 || !m_device->is_closed(), "Device was closed before the read was submitted");
+    if (m_device->is_closed())
+        return;
+    if (m_batch->submit_id == 0)
+        m_device->flush_transfers();
+    SGL_ASSERT(m_batch->submit_id != 0);
+    m_device->wait_for_submit(m_batch->submit_id);
+}
+
+const void* BufferReadback::data()
+{
+    if (!m_data) {
+        wait();
+        if (m_ring)
+            m_data = m_ring->mapped_data() + m_staging_offset;
+        else
+            m_data = m_staging_buffer->map<const uint8_t>() + m_staging_offset;
+    }
+    return m_data;
+}
+
+std::string BufferReadback::to_string() const
+{
+    return fmt::format(
+        "BufferReadback(\n"
+        "  buffer = {},\n"
+        "  size = {},\n"
+        "  ready = {}\n"
+        ")",
+        string::indent(m_buffer->to_string()),
+        m_size,
+        is_ready()
+    );
+}
+
+} // namespace sgl
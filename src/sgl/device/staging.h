@@ -0,0 +1,118 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+#include "sgl/device/fwd.h"
+
+#include "sgl/core/macros.h"
+#include "sgl/core/object.h"
+
+#include <deque>
+#include <memory>
+#include <mutex>
+#include <optional>
+
+namespace sgl {
+
+/// A batch of transfers recorded by the device, see \c Device::flush_transfers.
+struct TransferBatch {
+    /// Submission ID of the batch, or 0 if the batch has not been submitted yet.
+    uint64_t submit_id{0};
+};
+
+/**
+ * \brief Ring allocator over a persistently mapped read back buffer.
+ *
+ * Allocations are handed out in order and can be freed in any order.
+ * Space is reclaimed once all allocations before it have been freed.
+ */
+class SGL_API ReadbackRing {
+public:
+    /// Alignment of allocations in bytes.
+    static constexpr size_t ALIGNMENT = 256;
+
+    ReadbackRing(Device* device, size_t capacity);
+    ~ReadbackRing();
+
+    SGL_NON_COPYABLE_AND_MOVABLE(ReadbackRing);
+
+    Buffer* buffer() const { return m_buffer; }
+    const uint8_t* mapped_data() const { return m_mapped_data; }
+    size_t capacity() const { return m_capacity; }
+
+    /// Number of bytes currently allocated, including padding.
+    size_t used() const;
+
+    /// Allocate \c size bytes, or return an empty optional if the ring is full.
+    std::optional<size_t> allocate(size_t size);
+
+    /// Free the allocation at \c offset.
+    void free(size_t offset);
+
+private:
+    struct Block {
+        size_t offset;
+        size_t size;
+        bool freed;
+    };
+
+    ref<Buffer> m_buffer;
+    const uint8_t* m_mapped_data{nullptr};
+    size_t m_capacity;
+    size_t m_head{0};
+    std::deque<Block> m_blocks;
+    mutable std::mutex m_mutex;
+};
+
+/**
+ * \brief Asynchronous read of buffer data to host memory.
+ *
+ * The copy to host memory is recorded with the device's pending transfers and is submitted
+ * with the next flush. Waiting for the read flushes pending transfers if needed.
+ */
+class SGL_API BufferReadback : public Object {
+    SGL_OBJECT(BufferReadback)
+public:
+    /// Constructor.
+    /// Do not use directly, instead use \c Device::read_buffer_data_async.
+    BufferReadback(
+        ref<Device> device,
+        ref<const Buffer> buffer,
+        size_t size,
+        ref<Buffer> staging_buffer,
+        size_t staging_offset,
+        std::shared_ptr<ReadbackRing> ring,
+        std::shared_ptr<TransferBatch> batch
+    );
+    ~BufferReadback();
+
+    /// Buffer that is read from.
+    const Buffer* buffer() const { return m_buffer; }
+
+    /// Size of the read in bytes.
+    size_t size() const { return m_size; }
+
+    /// True if the read has been submitted and finished executing on the device.
+    bool is_ready() const;
+
+    /// Block until the read has finished, submitting pending transfers if needed.
+    void wait();
+
+    /// Wait for the read to finish and return the data in host memory.
+    /// The data stays valid for the lifetime of this object.
+    const void* data();
+
+    std::string to_string() const override;
+
+private:
+    ref<Device> m_device;
+    ref<const Buffer> m_buffer;
+    size_t m_size;
+    ref<Buffer> m_staging_buffer;
+    size_t m_staging_offset;
+    std::shared_ptr<ReadbackRing> m_ring;
+    std::shared_ptr<TransferBatch> m_batch;
+    const uint8_t* m_data{nullptr};
+};
+
+} // namespace sgl
@@ -2,7 +2,170 @@
 
 #include "slangpy.h"
 #include "sgl/device/device.h"
+#include "sgl/device/resource.h"
+#include "sgl/core/maths.h"
+
+#include <bit>
+#include <cstring>
+#include <numeric>
+#include <unordered_map>
 
 namespace sgl::slangpy {
 
+static std::unordered_map<Device*, ref<TransientBufferPool>> s_transient_pools;
+
+static size_t size_class(size_t size, size_t min_size_class)
+{
+    return std::max(size_t(std::bit_width(size > 1 ? size - 1 : 1)), min_size_class);
+}
+
+TransientBufferPool::TransientBufferPool(Device* device)
+    : m_device(device)
+{
+}
+
+TransientBufferPool::~TransientBufferPool()
+{
+    clear();
+}
+
+TransientBufferPool* TransientBufferPool::get(Device* device)
+{
+    auto it = s_transient_pools.find(device);
+    if (it != s_transient_pools.end())
+        return it->second;
+
+    auto pool = make_ref<TransientBufferPool>(device);
+    s_transient_pools[device] = pool;
+    device->register_device_close_callback([](Device* closed_device) { s_transient_pools.erase(closed_device); });
+    return pool;
+}
+
+ref<Buffer> TransientBufferPool::acquire(size_t size)
+{
+    size_t cls = size_class(size, MIN_SIZE_CLASS);
+    SGL_CHECK(cls < SIZE_CLASS_COUNT, "Transient buffer size {} is too large", size);
+
+    // Reuse a free buffer whose last submission has finished.
+    std::vector<Entry>& bucket = m_free[cls];
+    for (size_t i = 0; i < bucket.size(); ++i) {
+        if (m_device->is_submit_finished(bucket[i].submit_id)) {
+            ref<Buffer> buffer = std::move(bucket[i].buffer);
+            bucket.erase(bucket.begin() + i);
+            m_acquired.push_back(buffer);
+            m_reuse_count++;
+            return buffer;
+        }
+    }
+
+    ref<Buffer> buffer = m_device->create_buffer({
+        .size = size_t(1) << cls,
+        .memory_type = MemoryType::device_local,
+        .usage = BufferUsage::shader_resource | BufferUsage::unordered_access | BufferUsage::copy_source
+            | BufferUsage::copy_destination,
+        .label = "transient",
+    });
+    m_acquired.push_back(buffer);
+    m_pooled_size += buffer->size();
+    m_allocation_count++;
+    return buffer;
+}
+
+void TransientBufferPool::retire(uint64_t submit_id)
+{
+    for (ref<Buffer>& buffer : m_acquired) {
+        size_t cls = size_class(buffer->size(), MIN_SIZE_CLASS);
+        m_free[cls].push_back({std::move(buffer), submit_id});
+    }
+    m_acquired.clear();
+    trim();
+}
+
+void TransientBufferPool::clear()
+{
+    for (auto& bucket : m_free) {
+        for (const Entry& entry : bucket)
+            m_pooled_size -= entry.buffer->size();
+        bucket.clear();
+    }
+}
+
+void TransientBufferPool::set_max_pooled_size(size_t size)
+{
+    m_max_pooled_size = size;
+    trim();
+}
+
+void TransientBufferPool::trim()
+{
+    // Release free buffers, largest first, until within budget. Buffers still in flight
+    // are kept alive by the command buffers that reference them.
+    for (size_t cls = SIZE_CLASS_COUNT; cls-- > 0 && m_pooled_size > m_max_pooled_size;) {
+        std::vector<Entry>& bucket = m_free[cls];
+        while (!bucket.empty() && m_pooled_size > m_max_pooled_size) {
+            m_pooled_size -= bucket.back().buffer->size();
+            bucket.pop_back();
+        }
+    }
+}
+
+ref<Buffer> CallContext::create_transient_buffer(size_t size) const
+{
+    if (m_transient_pool)
+        return m_transient_pool->acquire(size);
+    return m_device->create_buffer({
+        .size = size,
+        .memory_type = MemoryType::device_local,
+        .usage = BufferUsage::shader_resource | BufferUsage::unordered_access,
+    });
+}
+
+ref<BufferView> CallContext::allocate_readback(const void* data, size_t size, size_t element_stride)
+{
+    SGL_CHECK(size > 0, "Readback slot size must be greater than zero");
+    SGL_CHECK(element_stride > 0, "Readback slot element stride must be greater than zero");
+
+    // Structured buffer views must start on a multiple of their element stride.
+    size_t alignment = std::lcm(READBACK_ALIGNMENT, element_stride);
+
+    ReadbackChunk* chunk = m_readback_chunks.empty() ? nullptr : &m_readback_chunks.back();
+    size_t offset = chunk ? align_to(alignment, chunk->used) : 0;
+    if (!chunk || offset + size > chunk->data.size()) {
+        size_t chunk_size = std::max(READBACK_CHUNK_SIZE, size);
+        ref<Buffer> buffer = create_transient_buffer(chunk_size);
+        chunk = &m_readback_chunks.emplace_back();
+        chunk->buffer = std::move(buffer);
+        chunk->data.resize(chunk_size);
+        offset = 0;
+    }
+
+    std::memcpy(chunk->data.data() + offset, data, size);
+    chunk->used = offset + size;
+
+    return chunk->buffer->create_view({.range = {.offset = offset, .size = size}});
+}
+
+void CallContext::flush_readback()
+{
+    for (ReadbackChunk& chunk : m_readback_chunks) {
+        chunk.buffer->set_data(chunk.data.data(), chunk.used);
+        chunk.result.clear();
+    }
+}
+
+std::span<const uint8_t> CallContext::read_readback(const BufferView* view)
+{
+    for (ReadbackChunk& chunk : m_readback_chunks) {
+        if (chunk.buffer.get() != view->buffer())
+            continue;
+        if (chunk.result.empty()) {
+            chunk.result.resize(chunk.used);
+            chunk.buffer->get_data(chunk.result.data(), chunk.used);
+        }
+        const BufferRange& range = view->range();
+        return std::span<const uint8_t>(chunk.result.data() + range.offset, range.size);
+    }
+    SGL_THROW("Buffer view was not allocated from this call's readback buffer");
+}
+
 } // namespace sgl::slangpy
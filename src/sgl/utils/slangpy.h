@@ -10,6 +10,7 @@
 
 #include <vector>
 #include <map>
+#include <span>
 
 namespace sgl::slangpy {
 
@@ -53,6 +54,12 @@ public:
     {
     }
 
+    /// Constructor taking ownership of optional 'tuple'.
+    Shape(std::optional<std::vector<int>>&& shape)
+        : m_shape(std::move(shape))
+    {
+    }
+
     /// Constructor from initializer list
     Shape(std::initializer_list<int> shape)
         : m_shape(shape)
@@ -167,12 +174,79 @@ private:
     std::optional<std::vector<int>> m_shape;
 };
 
+/// Pool of transient device local buffers used to pass data to and from kernels.
+///
+/// Buffers are bucketed into power of two size classes. A buffer acquired from the pool
+/// is in use until retire is called with the id of the submission that uses it, after
+/// which it is reused once that submission has finished executing on the device.
+class SGL_API TransientBufferPool : public Object {
+    SGL_OBJECT(TransientBufferPool)
+public:
+    /// Default maximum number of bytes held in free buffers (256MB).
+    static constexpr size_t DEFAULT_MAX_POOLED_SIZE = 256 * 1024 * 1024;
+
+    TransientBufferPool(Device* device);
+    ~TransientBufferPool();
+
+    /// Get the pool for a device, creating it if necessary. The pool is released
+    /// when the device is closed.
+    static TransientBufferPool* get(Device* device);
+
+    /// Acquire a buffer of at least the given size.
+    ref<Buffer> acquire(size_t size);
+
+    /// Mark all buffers acquired since the last call to retire as used by a given
+    /// submission, returning them to the pool once it has finished executing.
+    void retire(uint64_t submit_id);
+
+    /// Release all free buffers.
+    void clear();
+
+    /// Maximum number of bytes held in free buffers before they are released.
+    size_t max_pooled_size() const { return m_max_pooled_size; }
+    void set_max_pooled_size(size_t size);
+
+    /// Number of bytes currently held by the pool in free or in flight buffers.
+    size_t pooled_size() const { return m_pooled_size; }
+
+    /// Number of buffers allocated by the pool.
+    uint64_t allocation_count() const { return m_allocation_count; }
+
+    /// Number of times a buffer has been reused.
+    uint64_t reuse_count() const { return m_reuse_count; }
+
+private:
+    struct Entry {
+        ref<Buffer> buffer;
+        uint64_t submit_id;
+    };
+
+    static constexpr size_t MIN_SIZE_CLASS = 8;
+    static constexpr size_t SIZE_CLASS_COUNT = 48;
+
+    void trim();
+
+    Device* m_device;
+    std::vector<ref<Buffer>> m_acquired;
+    std::vector<Entry> m_free[SIZE_CLASS_COUNT];
+    size_t m_max_pooled_size{DEFAULT_MAX_POOLED_SIZE};
+    size_t m_pooled_size{0};
+    uint64_t m_allocation_count{0};
+    uint64_t m_reuse_count{0};
+};
+
 class SGL_API CallContext : Object {
 public:
-    CallContext(ref<Device> device, const Shape& call_shape, CallMode call_mode)
+    CallContext(
+        ref<Device> device,
+        const Shape& call_shape,
+        CallMode call_mode,
+        TransientBufferPool* transient_pool = nullptr
+    )
         : m_device(std::move(device))
         , m_call_shape(call_shape)
         , m_call_mode(call_mode)
+        , m_transient_pool(transient_pool)
     {
     }
 
@@ -180,10 +254,50 @@ public:
     const Shape& call_shape() const { return m_call_shape; }
     CallMode call_mode() const { return m_call_mode; }
 
+    /// Pool to allocate buffers that only live for the duration of the call from, or
+    /// null if the call's lifetime is not known (e.g. when appending to a command encoder).
+    TransientBufferPool* transient_pool() const { return m_transient_pool; }
+
+    /// Allocate a buffer that only needs to live for the duration of the call, using
+    /// the transient pool if available.
+    ref<Buffer> create_transient_buffer(size_t size) const;
+
+    /// Allocate a slot in the call's shared readback buffer, initialized with the given data.
+    /// Small values written by the kernel (e.g. ValueRefs) are packed into the same buffer
+    /// so they are uploaded and read back with a single copy each, rather than one per value.
+    /// The returned view is suitable for binding as a structured buffer of the given stride.
+    ref<BufferView> allocate_readback(const void* data, size_t size, size_t element_stride);
+
+    /// Upload the initial contents of all readback slots. Called once all call data is written,
+    /// and again each time a recorded call is replayed, which also discards the results read
+    /// back after the previous dispatch.
+    void flush_readback();
+
+    /// Get the contents of a readback slot after the call has completed. The first call after
+    /// each dispatch reads back the whole shared buffer containing the slot.
+    std::span<const uint8_t> read_readback(const BufferView* view);
+
 private:
+    /// Alignment of readback slots, which satisfies the storage buffer offset
+    /// alignment requirements of all supported APIs.
+    static constexpr size_t READBACK_ALIGNMENT = 256;
+    /// Minimum size of a shared readback buffer.
+    static constexpr size_t READBACK_CHUNK_SIZE = 16 * 1024;
+
+    struct ReadbackChunk {
+        ref<Buffer> buffer;
+        /// Initial contents, uploaded each time the call is dispatched.
+        std::vector<uint8_t> data;
+        /// Contents read back after the last dispatch, or empty if not read back yet.
+        std::vector<uint8_t> result;
+        size_t used{0};
+    };
+
     ref<Device> m_device;
     Shape m_call_shape;
     CallMode m_call_mode;
+    TransientBufferPool* m_transient_pool;
+    std::vector<ReadbackChunk> m_readback_chunks;
 };
 
 } // namespace sgl::slangpy
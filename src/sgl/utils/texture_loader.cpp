@@ -8,13 +8,18 @@
 #include "sgl/device/native_formats.h"
 
 #include "sgl/core/error.h"
+#include "sgl/core/maths.h"
 #include "sgl/core/bitmap.h"
 #include "sgl/core/dds_file.h"
 #include "sgl/core/file_stream.h"
 #include "sgl/core/timer.h"
 #include "sgl/core/thread.h"
 
+#include <algorithm>
+#include <chrono>
+#include <limits>
 #include <map>
+#include <queue>
 
 namespace sgl {
 
@@ -455,4 +460,578 @@ ref<Texture> TextureLoader::load_texture_array(std::span<std::filesystem::path>
     return create_texture_array(m_device, m_blitter, source_images, options);
 }
 
+// ----------------------------------------------------------------------------
+// TextureStreamer
+// ----------------------------------------------------------------------------
+
+/// Source data of a streamed texture, prepared on the thread pool.
+/// Only references objects created while preparing, so it can be released on any thread.
+struct StreamSource {
+    Format format{Format::undefined};
+    TextureType type{TextureType::texture_2d};
+    uint32_t width{0};
+    uint32_t height{0};
+    uint32_t depth{1};
+    uint32_t array_length{1};
+    uint32_t layer_count{1};
+    uint32_t mip_count{0};
+    /// Coarsest mip level that is streamed in separately. Coarser levels form the mip tail.
+    uint32_t tail_mip{0};
+    /// Subresource data, indexed by layer * mip_count + mip.
+    std::vector<SubresourceData> subresources;
+    ref<DDSFile> dds_file;
+    std::vector<ref<Bitmap>> bitmaps;
+    std::string error;
+
+    uint32_t mip_width(uint32_t mip) const { return std::max(1u, width >> mip); }
+    uint32_t mip_height(uint32_t mip) const { return std::max(1u, height >> mip); }
+    uint32_t mip_depth(uint32_t mip) const { return std::max(1u, depth >> mip); }
+
+    /// Size in bytes of a mip level (including all layers).
+    size_t mip_size(uint32_t mip) const
+    {
+        const FormatInfo& info = get_format_info(format);
+        return size_t(div_round_up(mip_width(mip), info.block_width))
+            * div_round_up(mip_height(mip), info.block_height) * info.bytes_per_block * mip_depth(mip) * layer_count;
+    }
+
+    /// Size in bytes of mip levels [mip, mip_count).
+    size_t range_size(uint32_t mip) const
+    {
+        size_t size = 0;
+        for (; mip < mip_count; ++mip)
+            size += mip_size(mip);
+        return size;
+    }
+
+    /// Check if a texture can start at the given mip level.
+    /// Only 2D textures are split, and block compressed textures need to start at a multiple of the block size.
+    bool is_valid_base(uint32_t mip) const
+    {
+        if (mip == 0)
+            return true;
+        if (type != TextureType::texture_2d)
+            return false;
+        const FormatInfo& info = get_format_info(format);
+        return mip_width(mip) % info.block_width == 0 && mip_height(mip) % info.block_height == 0;
+    }
+};
+
+/// Downsample a float32 bitmap by a factor of two using a box filter.
+static ref<Bitmap> downsample_bitmap(const Bitmap* src)
+{
+    SGL_ASSERT(src->component_type() == Bitmap::ComponentType::float32);
+
+    uint32_t src_width = src->width();
+    uint32_t src_height = src->height();
+    uint32_t width = std::max(1u, src_width / 2);
+    uint32_t height = std::max(1u, src_height / 2);
+    uint32_t channel_count = src->channel_count();
+    ref<Bitmap> dst = make_ref<Bitmap>(src->pixel_format(), Bitmap::ComponentType::float32, width, height);
+
+    const float* src_data = reinterpret_cast<const float*>(src->data());
+    float* dst_data = reinterpret_cast<float*>(dst->data());
+    for (uint32_t y = 0; y < height; ++y) {
+        const float* row0 = src_data + size_t(std::min(2 * y, src_height - 1)) * src_width * channel_count;
+        const float* row1 = src_data + size_t(std::min(2 * y + 1, src_height - 1)) * src_width * channel_count;
+        for (uint32_t x = 0; x < width; ++x) {
+            size_t x0 = size_t(std::min(2 * x, src_width - 1)) * channel_count;
+            size_t x1 = size_t(std::min(2 * x + 1, src_width - 1)) * channel_count;
+            for (uint32_t c = 0; c < channel_count; ++c)
+                *dst_data++ = 0.25f * (row0[x0 + c] + row0[x1 + c] + row1[x0 + c] + row1[x1 + c]);
+        }
+    }
+    return dst;
+}
+
+static void prepare_bitmap_source(StreamSource& source, const Bitmap* bitmap, const TextureStreamer::Options& options)
+{
+    TextureLoader::Options load_options;
+    load_options.load_as_normalized = options.load_as_normalized;
+    load_options.load_as_srgb = options.load_as_srgb;
+    load_options.extend_alpha = options.extend_alpha;
+    auto [format, convert_to_rgba] = determine_texture_format(bitmap, load_options);
+
+    const Bitmap* base = bitmap;
+    if (convert_to_rgba) {
+        source.bitmaps.push_back(
+            bitmap->convert(Bitmap::PixelFormat::rgba, bitmap->component_type(), bitmap->srgb_gamma())
+        );
+        base = source.bitmaps.back();
+    }
+
+    source.format = format;
+    source.width = base->width();
+    source.height = base->height();
+    source.mip_count = 1;
+    if (options.generate_mips) {
+        while ((std::max(source.width, source.height) >> source.mip_count) > 0)
+            source.mip_count++;
+    }
+
+    // Generate mip levels by filtering linear values, then convert back to the source format.
+    std::vector<const Bitmap*> levels{base};
+    if (source.mip_count > 1) {
+        ref<Bitmap> linear = base->convert(base->pixel_format(), Bitmap::ComponentType::float32, false);
+        for (uint32_t mip = 1; mip < source.mip_count; ++mip) {
+            linear = downsample_bitmap(linear);
+            source.bitmaps.push_back(
+                linear->convert(base->pixel_format(), base->component_type(), base->srgb_gamma())
+            );
+            levels.push_back(source.bitmaps.back());
+        }
+    }
+
+    for (const Bitmap* level : levels) {
+        source.subresources.push_back({
+            .data = level->data(),
+            .size = level->buffer_size(),
+            .row_pitch = level->width() * level->bytes_per_pixel(),
+        });
+    }
+}
+
+static void prepare_dds_source(StreamSource& source, ref<DDSFile> dds_file)
+{
+    const auto& [texture_type, layer_count]
+        = get_texture_type_and_layer_count(dds_file->type(), dds_file->array_size());
+    source.format = get_format(DXGI_FORMAT(dds_file->dxgi_format()));
+    source.type = texture_type;
+    source.width = dds_file->width();
+    source.height = dds_file->height();
+    source.depth = dds_file->depth();
+    source.array_length = dds_file->array_size();
+    source.layer_count = layer_count;
+    source.mip_count = dds_file->mip_count();
+
+    for (uint32_t layer_index = 0; layer_index < layer_count; ++layer_index) {
+        for (uint32_t mip_index = 0; mip_index < dds_file->mip_count(); ++mip_index) {
+            uint32_t row_pitch;
+            uint32_t slice_pitch;
+            dds_file->get_subresource_pitch(mip_index, &row_pitch, &slice_pitch);
+            source.subresources.push_back({
+                .data = dds_file->get_subresource_data(mip_index, layer_index),
+                .size = size_t(slice_pitch) * source.mip_depth(mip_index),
+                .row_pitch = row_pitch,
+                .slice_pitch = slice_pitch,
+            });
+        }
+    }
+    source.dds_file = std::move(dds_file);
+}
+
+/// Prepare the source of a streamed texture from either a bitmap or a file.
+/// Runs on the thread pool. Errors are reported through \c StreamSource::error.
+static std::shared_ptr<StreamSource> prepare_source(
+    const Bitmap* bitmap,
+    const std::filesystem::path& path,
+    const TextureStreamer::Options& options
+)
+{
+    auto source = std::make_shared<StreamSource>();
+    try {
+        if (bitmap) {
+            prepare_bitmap_source(*source, bitmap, options);
+        } else {
+            SourceImage source_image = load_source_image(path);
+            if (source_image.dds_file) {
+                prepare_dds_source(*source, source_image.dds_file);
+            } else if (source_image.bitmap) {
+                source->bitmaps.push_back(source_image.bitmap);
+                prepare_bitmap_source(*source, source_image.bitmap, options);
+            } else {
+                SGL_THROW("Unsupported image file \"{}\"", path);
+            }
+        }
+
+        // The mip tail contains all levels up to the tail size, starting at a valid base level.
+        source->tail_mip = source->mip_count - 1;
+        while (source->tail_mip > 0
+               && std::max(source->mip_width(source->tail_mip - 1), source->mip_height(source->tail_mip - 1))
+                   <= options.mip_tail_size)
+            source->tail_mip--;
+        while (!source->is_valid_base(source->tail_mip))
+            source->tail_mip--;
+    } catch (const std::exception& e) {
+        source->error = e.what();
+    }
+    return source;
+}
+
+struct StreamedTexture::State {
+    /// Source data, set once loading has finished.
+    std::shared_ptr<StreamSource> source;
+    /// Source bitmap, kept alive as level 0 may reference its data.
+    ref<const Bitmap> bitmap;
+    /// Texture holding mip levels [resident_mip, mip_count).
+    ref<Texture> texture;
+    uint32_t resident_mip{0};
+    Timer::TimePoint last_used{Timer::now()};
+
+    bool is_streaming() const { return source && source->error.empty(); }
+
+    size_t resident_size() const { return is_streaming() ? source->range_size(resident_mip) : 0; }
+
+    /// Next finer base level to stream in.
+    uint32_t finer_base() const
+    {
+        if (resident_mip == source->mip_count)
+            return source->tail_mip;
+        uint32_t mip = resident_mip - 1;
+        while (!source->is_valid_base(mip))
+            mip--;
+        return mip;
+    }
+
+    /// Next coarser base level to evict to.
+    uint32_t coarser_base() const
+    {
+        uint32_t mip = resident_mip + 1;
+        while (mip < source->tail_mip && !source->is_valid_base(mip))
+            mip++;
+        return mip;
+    }
+
+    /// Replace the texture with one holding mip levels [base, mip_count).
+    /// Levels that are already resident are copied from the current texture, others are uploaded from the source.
+    void set_resident_mip(Device* device, CommandEncoder* command_encoder, uint32_t base, TextureUsage usage)
+    {
+        ref<Texture> new_texture = device->create_texture({
+            .type = source->type,
+            .format = source->format,
+            .width = source->mip_width(base),
+            .height = source->mip_height(base),
+            .depth = source->mip_depth(base),
+            .array_length = source->array_length,
+            .mip_count = source->mip_count - base,
+            .usage = usage | TextureUsage::copy_source | TextureUsage::copy_destination,
+        });
+        for (uint32_t layer = 0; layer < source->layer_count; ++layer) {
+            for (uint32_t mip = base; mip < source->mip_count; ++mip) {
+                if (texture && mip >= resident_mip) {
+                    command_encoder->copy_texture(
+                        new_texture,
+                        layer,
+                        mip - base,
+                        uint3(0),
+                        texture,
+                        layer,
+                        mip - resident_mip,
+                        uint3(0)
+                    );
+                } else {
+                    command_encoder->upload_texture_data(
+                        new_texture,
+                        layer,
+                        mip - base,
+                        source->subresources[layer * source->mip_count + mip]
+                    );
+                }
+            }
+        }
+        texture = std::move(new_texture);
+        resident_mip = base;
+    }
+};
+
+StreamedTexture::StreamedTexture(std::shared_ptr<State> state)
+    : m_state(std::move(state))
+{
+}
+
+StreamedTexture::~StreamedTexture() = default;
+
+ref<Texture> StreamedTexture::texture()
+{
+    touch();
+    return m_state->texture;
+}
+
+void StreamedTexture::touch()
+{
+    m_state->last_used = Timer::now();
+}
+
+bool StreamedTexture::is_loaded() const
+{
+    return m_state->source != nullptr;
+}
+
+std::string StreamedTexture::error() const
+{
+    return m_state->source ? m_state->source->error : std::string{};
+}
+
+uint32_t StreamedTexture::width() const
+{
+    return m_state->source ? m_state->source->width : 0;
+}
+
+uint32_t StreamedTexture::height() const
+{
+    return m_state->source ? m_state->source->height : 0;
+}
+
+uint32_t StreamedTexture::mip_count() const
+{
+    return m_state->source ? m_state->source->mip_count : 0;
+}
+
+Format StreamedTexture::format() const
+{
+    return m_state->source ? m_state->source->format : Format::undefined;
+}
+
+uint32_t StreamedTexture::resident_mip() const
+{
+    return m_state->resident_mip;
+}
+
+bool StreamedTexture::is_fully_resident() const
+{
+    return m_state->is_streaming() && m_state->resident_mip == 0;
+}
+
+size_t StreamedTexture::resident_size() const
+{
+    return m_state->resident_size();
+}
+
+std::string StreamedTexture::to_string() const
+{
+    return fmt::format(
+        "StreamedTexture(\n"
+        "  loaded = {},\n"
+        "  width = {},\n"
+        "  height = {},\n"
+        "  mip_count = {},\n"
+        "  format = {},\n"
+        "  resident_mip = {}\n"
+        ")",
+        is_loaded(),
+        width(),
+        height(),
+        mip_count(),
+        format(),
+        resident_mip()
+    );
+}
+
+struct TextureStreamer::Task {
+    std::shared_ptr<StreamedTexture::State> state;
+    std::future<std::shared_ptr<StreamSource>> future;
+};
+
+TextureStreamer::Options::Options() { }
+
+TextureStreamer::TextureStreamer(ref<Device> device, std::optional<Options> options)
+    : m_device(std::move(device))
+    , m_options(options.value_or(Options{}))
+{
+}
+
+TextureStreamer::~TextureStreamer()
+{
+    // Tasks reference source bitmaps held by the texture states.
+    for (Task& task : m_tasks)
+        task.future.wait();
+}
+
+ref<StreamedTexture> TextureStreamer::load_texture(ref<const Bitmap> bitmap)
+{
+    SGL_CHECK_NOT_NULL(bitmap);
+    auto state = std::make_shared<StreamedTexture::State>();
+    state->bitmap = std::move(bitmap);
+    m_tasks.push_back({
+        .state = state,
+        .future = thread::do_async(prepare_source, state->bitmap.get(), std::filesystem::path{}, m_options),
+    });
+    m_states.push_back(state);
+    return make_ref<StreamedTexture>(std::move(state));
+}
+
+ref<StreamedTexture> TextureStreamer::load_texture(const std::filesystem::path& path)
+{
+    auto state = std::make_shared<StreamedTexture::State>();
+    m_tasks.push_back({
+        .state = state,
+        .future = thread::do_async(prepare_source, nullptr, path, m_options),
+    });
+    m_states.push_back(state);
+    return make_ref<StreamedTexture>(std::move(state));
+}
+
+void TextureStreamer::collect()
+{
+    for (auto it = m_tasks.begin(); it != m_tasks.end();) {
+        if (it->future.wait_for(std::chrono::seconds(0)) == std::future_status::ready) {
+            it->state->source = it->future.get();
+            it->state->resident_mip = it->state->source->mip_count;
+            if (!it->state->source->error.empty())
+                log_warn("Failed to stream texture: {}", it->state->source->error);
+            it = m_tasks.erase(it);
+        } else {
+            ++it;
+        }
+    }
+    std::erase_if(m_states, [](const auto& state) { return state.expired(); });
+}
+
+void TextureStreamer::update()
+{
+    using State = StreamedTexture::State;
+
+    collect();
+
+    std::vector<std::shared_ptr<State>> states;
+    size_t usage = 0;
+    for (const auto& weak_state : m_states) {
+        if (auto state = weak_state.lock(); state && state->is_streaming()) {
+            usage += state->resident_size();
+            states.push_back(std::move(state));
+        }
+    }
+
+    // Textures that can be streamed in further, smallest upload first.
+    // Ties are broken in favor of the most recently used texture.
+    struct Candidate {
+        size_t size;
+        Timer::TimePoint last_used;
+        State* state;
+    };
+    auto compare = [](const Candidate& a, const Candidate& b)
+    { return a.size != b.size ? a.size > b.size : a.last_used < b.last_used; };
+    std::priority_queue<Candidate, std::vector<Candidate>, decltype(compare)> candidates(compare);
+    auto push_candidate = [&](State* state)
+    {
+        if (state->resident_mip > 0) {
+            size_t size = state->source->range_size(state->finer_base()) - state->resident_size();
+            candidates.push({size, state->last_used, state});
+        }
+    };
+    for (const auto& state : states)
+        push_candidate(state.get());
+
+    // Textures that can have mip levels evicted, least recently used first.
+    std::vector<State*> victims;
+    for (const auto& state : states)
+        if (state->resident_mip < state->source->tail_mip)
+            victims.push_back(state.get());
+    std::sort(victims.begin(), victims.end(), [](State* a, State* b) { return a->last_used < b->last_used; });
+    size_t victim_index = 0;
+
+    ref<CommandEncoder> command_encoder;
+    std::vector<ref<Texture>> retired_textures;
+    auto get_command_encoder = [&]()
+    {
+        if (!command_encoder)
+            command_encoder = m_device->create_command_encoder();
+        return command_encoder.get();
+    };
+    auto set_resident_mip = [&](State* state, uint32_t base)
+    {
+        if (state->texture)
+            retired_textures.push_back(state->texture);
+        state->set_resident_mip(m_device, get_command_encoder(), base, m_options.usage);
+    };
+
+    // Evict one step of mip levels from a texture used before the given time.
+    auto evict = [&](Timer::TimePoint used_before) -> bool
+    {
+        while (victim_index < victims.size()) {
+            State* victim = victims[victim_index];
+            if (victim->last_used >= used_before)
+                return false;
+            if (victim->resident_mip >= victim->source->tail_mip) {
+                victim_index++;
+                continue;
+            }
+            size_t size = victim->resident_size();
+            set_resident_mip(victim, victim->coarser_base());
+            usage -= size - victim->resident_size();
+            return true;
+        }
+        return false;
+    };
+
+    const size_t memory_budget = m_options.memory_budget;
+    const size_t upload_budget = m_options.upload_budget;
+
+    // Shrink to the budget, e.g. after it was lowered.
+    if (memory_budget > 0) {
+        while (usage > memory_budget && evict(std::numeric_limits<Timer::TimePoint>::max())) { }
+    }
+
+    size_t uploaded = 0;
+    while (!candidates.empty()) {
+        State* state = candidates.top().state;
+        candidates.pop();
+
+        uint32_t base = state->finer_base();
+        size_t size = state->source->range_size(base) - state->resident_size();
+        if (upload_budget > 0 && uploaded > 0 && uploaded + size > upload_budget)
+            break;
+
+        // Make room by evicting mip levels of less recently used textures.
+        if (memory_budget > 0) {
+            while (usage + size > memory_budget && evict(state->last_used)) { }
+            if (usage + size > memory_budget)
+                continue;
+        }
+
+        set_resident_mip(state, base);
+        usage += size;
+        uploaded += size;
+        push_candidate(state);
+    }
+
+    if (command_encoder)
+        m_device->submit_command_buffer(command_encoder->finish());
+}
+
+void TextureStreamer::flush()
+{
+    for (Task& task : m_tasks)
+        task.future.wait();
+
+    size_t upload_budget = m_options.upload_budget;
+    m_options.upload_budget = 0;
+    update();
+    m_options.upload_budget = upload_budget;
+}
+
+size_t TextureStreamer::pending_count() const
+{
+    return std::count_if(
+        m_tasks.begin(),
+        m_tasks.end(),
+        [](const Task& task) { return task.future.wait_for(std::chrono::seconds(0)) != std::future_status::ready; }
+    );
+}
+
+size_t TextureStreamer::memory_usage() const
+{
+    size_t usage = 0;
+    for (const auto& weak_state : m_states)
+        if (auto state = weak_state.lock())
+            usage += state->resident_size();
+    return usage;
+}
+
+std::string TextureStreamer::to_string() const
+{
+    return fmt::format(
+        "TextureStreamer(\n"
+        "  texture_count = {},\n"
+        "  pending_count = {},\n"
+        "  memory_usage = {},\n"
+        "  memory_budget = {}\n"
+        ")",
+        m_states.size(),
+        pending_count(),
+        memory_usage(),
+        m_options.memory_budget
+    );
+}
+
 } // namespace sgl
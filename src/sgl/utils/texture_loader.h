@@ -9,6 +9,8 @@
 #include "sgl/core/object.h"
 
 #include <filesystem>
+#include <memory>
+#include <vector>
 
 namespace sgl {
 
@@ -103,4 +105,162 @@ private:
     ref<Blitter> m_blitter;
 };
 
+/**
+ * \brief Texture whose mip levels are streamed in by a \c TextureStreamer.
+ *
+ * The underlying texture is replaced whenever mip levels are added or evicted,
+ * so \c texture should be queried every time the texture is bound instead of being cached.
+ */
+class SGL_API StreamedTexture : public sgl::Object {
+    SGL_OBJECT(StreamedTexture)
+public:
+    struct State;
+
+    StreamedTexture(std::shared_ptr<State> state);
+    ~StreamedTexture();
+
+    /**
+     * \brief Texture holding the resident mip levels.
+     *
+     * Mip level 0 of the returned texture corresponds to mip level \c resident_mip of the full texture.
+     * Also marks the texture as used, which keeps its mip levels from being evicted in favor of
+     * textures that were used less recently.
+     *
+     * \return Current texture, or nullptr if no mip levels are resident yet.
+     */
+    ref<Texture> texture();
+
+    /// Mark the texture as used without accessing it.
+    void touch();
+
+    /// True once the source image has finished loading (successfully or not).
+    bool is_loaded() const;
+
+    /// Error message if the source image failed to load, empty otherwise.
+    std::string error() const;
+
+    /// Width of mip level 0 (0 until loaded).
+    uint32_t width() const;
+
+    /// Height of mip level 0 (0 until loaded).
+    uint32_t height() const;
+
+    /// Total number of mip levels (0 until loaded).
+    uint32_t mip_count() const;
+
+    /// Texture format (\c Format::undefined until loaded).
+    Format format() const;
+
+    /// Index of the finest resident mip level, or \c mip_count if no mip levels are resident.
+    uint32_t resident_mip() const;
+
+    /// True if all mip levels are resident.
+    bool is_fully_resident() const;
+
+    /// Size in bytes of the resident mip levels.
+    size_t resident_size() const;
+
+    std::string to_string() const override;
+
+private:
+    std::shared_ptr<State> m_state;
+};
+
+/**
+ * \brief Utility class for streaming textures in the background.
+ *
+ * Loading a texture returns a \c StreamedTexture immediately, while the source image is decoded,
+ * converted and mip mapped on the global thread pool. Mip levels are then uploaded by \c update,
+ * which should be called regularly (e.g. once per frame) from the thread using the textures.
+ * The smallest mip levels (the mip tail) are uploaded first, and finer levels are added one at a
+ * time, always choosing the smallest pending level of any texture, so all textures become usable
+ * at low resolution before any texture reaches full resolution.
+ *
+ * If a memory budget is set, fine mip levels of the least recently used textures are evicted to
+ * make room for finer levels of more recently used textures. Evicted levels are streamed in again
+ * once the texture is used. Source data is kept in host memory for this purpose.
+ *
+ * Sources that cannot be split into mip levels (e.g. cube maps or 3D textures from DDS files)
+ * are uploaded in one step.
+ */
+class SGL_API TextureStreamer : public sgl::Object {
+    SGL_OBJECT(TextureStreamer)
+public:
+    struct SGL_API Options {
+        /// Load 8/16-bit integer data as normalized resource format.
+        bool load_as_normalized{true};
+        /// Use \c Format::rgba8_unorm_srgb format if bitmap is 8-bit RGBA with sRGB gamma.
+        bool load_as_srgb{true};
+        /// Extend RGB to RGBA if RGB texture format is not available.
+        bool extend_alpha{true};
+        /// Generate mip levels for bitmaps on the host.
+        bool generate_mips{true};
+        /// Resource usage flags for the textures.
+        TextureUsage usage{TextureUsage::shader_resource};
+        /// Mip levels up to this size (in texels along the largest dimension) are uploaded together.
+        uint32_t mip_tail_size{64};
+        /// Maximum size in bytes of all resident mip levels (0 for no limit).
+        size_t memory_budget{0};
+        /// Maximum number of bytes uploaded per call to \c update (0 for no limit).
+        /// At least one mip level is uploaded per call if any are pending.
+        size_t upload_budget{0};
+
+        Options();
+    };
+
+    TextureStreamer(ref<Device> device, std::optional<Options> options = {});
+    ~TextureStreamer();
+
+    /// Streaming options.
+    const Options& options() const { return m_options; }
+
+    /// Set the memory budget in bytes (0 for no limit). Applied during the next \c update.
+    void set_memory_budget(size_t memory_budget) { m_options.memory_budget = memory_budget; }
+
+    /**
+     * \brief Stream a texture from a bitmap.
+     *
+     * \param bitmap Bitmap to load. Kept alive by the streamed texture.
+     * \return New streamed texture.
+     */
+    ref<StreamedTexture> load_texture(ref<const Bitmap> bitmap);
+
+    /**
+     * \brief Stream a texture from an image or DDS file.
+     *
+     * \param path Image file path.
+     * \return New streamed texture.
+     */
+    ref<StreamedTexture> load_texture(const std::filesystem::path& path);
+
+    /**
+     * \brief Upload pending mip levels and evict mip levels to stay within the memory budget.
+     *
+     * Uploads are recorded into a single command buffer, which is submitted without waiting.
+     */
+    void update();
+
+    /// Wait for all source images to load, then upload as many mip levels as the memory budget allows.
+    void flush();
+
+    /// Number of textures whose source image is still loading.
+    size_t pending_count() const;
+
+    /// Size in bytes of all resident mip levels.
+    size_t memory_usage() const;
+
+    std::string to_string() const override;
+
+private:
+    struct Task;
+
+    /// Collect finished loads and drop textures that are no longer referenced.
+    void collect();
+
+    ref<Device> m_device;
+    Options m_options;
+    std::vector<std::weak_ptr<StreamedTexture::State>> m_states;
+    std::vector<Task> m_tasks;
+};
+
 } // namespace sgl
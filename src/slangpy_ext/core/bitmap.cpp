@@ -123,17 +123,26 @@ SGL_PY_EXPORT(core_bitmap)
             [](Bitmap& self,
                std::optional<Bitmap::PixelFormat> pixel_format,
                std::optional<Bitmap::ComponentType> component_type,
-               std::optional<bool> srgb_gamma) -> ref<Bitmap>
+               std::optional<bool> srgb_gamma,
+               bool flip_y,
+               float scale,
+               float offset) -> ref<Bitmap>
             {
                 return self.convert(
                     pixel_format.value_or(self.pixel_format()),
                     component_type.value_or(self.component_type()),
-                    srgb_gamma.value_or(self.srgb_gamma())
+                    srgb_gamma.value_or(self.srgb_gamma()),
+                    flip_y,
+                    scale,
+                    offset
                 );
             },
             "pixel_format"_a.none() = nb::none(),
             "component_type"_a.none() = nb::none(),
             "srgb_gamma"_a.none() = nb::none(),
+            "flip_y"_a = false,
+            "scale"_a = 1.f,
+            "offset"_a = 0.f,
             D(Bitmap, convert)
         )
         .def(
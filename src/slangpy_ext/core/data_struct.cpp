@@ -93,14 +93,18 @@ SGL_PY_EXPORT(core_data_struct)
     nb::class_<DataStructConverter, Object>(m, "DataStructConverter", D(DataStructConverter))
         .def(
             "__init__",
-            [](DataStructConverter* self, const DataStruct* src, const DataStruct* dst)
-            { new (self) DataStructConverter(ref<const DataStruct>(src), ref<const DataStruct>(dst)); },
+            [](DataStructConverter* self, const DataStruct* src, const DataStruct* dst, double scale, double offset)
+            { new (self) DataStructConverter(ref<const DataStruct>(src), ref<const DataStruct>(dst), scale, offset); },
             "src"_a,
             "dst"_a,
+            "scale"_a = 1.0,
+            "offset"_a = 0.0,
             D(DataStructConverter, DataStructConverter)
         )
         .def_prop_ro("src", &DataStructConverter::src, D(DataStructConverter, src))
         .def_prop_ro("dst", &DataStructConverter::dst, D(DataStructConverter, dst))
+        .def_prop_ro("scale", &DataStructConverter::scale, D_NA(DataStructConverter, scale))
+        .def_prop_ro("offset", &DataStructConverter::offset, D_NA(DataStructConverter, offset))
         .def(
             "convert",
             [](DataStructConverter* self, nb::bytes input) -> nb::bytes
@@ -3,6 +3,7 @@
 #pragma once
 
 #include <optional>
+#include <unordered_map>
 
 #include "nanobind.h"
 
@@ -263,6 +264,10 @@ private:
         = [](CursorType& self, nb::object nbval) { _write_matrix<c_type>(self, nbval); };
 
 /// Table of converters based on slang scalar type and shape.
+///
+/// Dicts written to structs are handled by a compiled writer per struct type layout, which
+/// caches the field indices, names as Python strings and writers for scalar, vector and matrix
+/// fields. Writing a dict is then a loop over the fields, without looking fields up by name.
 template<typename CursorType>
 class WriteConverterTable {
 public:
@@ -332,6 +337,8 @@ public:
         matrix_case(float4x4, float32);
     }
 
+    SGL_NON_COPYABLE_AND_MOVABLE(WriteConverterTable);
+
     /// Virtual for writing none-basic value types.
     virtual bool write_value(CursorType& self, nb::object nbval)
     {
@@ -345,22 +352,156 @@ public:
     /// and arrays, expects a dict, sequence type or numpy array.
     void write(CursorType& self, nb::object nbval)
     {
+        // Compiled writers are keyed by layout address, which can be reused once the layout's
+        // program is destroyed, so they are dropped whenever reflection data may have been
+        // destroyed. This only happens outside of nested writes, which hold on to entries.
+        if (m_write_depth == 0) {
+            uint64_t generation = detail::reflection_generation();
+            if (generation != m_compiled_generation) {
+                clear_compiled_structs();
+                m_compiled_generation = generation;
+            }
+        }
+
         m_stack.clear();
+        m_write_depth++;
         try {
             write_internal(self, nbval);
         } catch (const std::exception& err) {
+            m_write_depth--;
             SGL_THROW("{}: {}", build_error(), err.what());
         }
+        m_write_depth--;
     }
 
 private:
-    std::function<void(CursorType&, nb::object)> m_write_scalar[(int)TypeReflection::ScalarType::COUNT];
-    std::function<void(CursorType&, nb::object)> m_write_vector[(int)TypeReflection::ScalarType::COUNT][5];
-    std::function<void(CursorType&, nb::object)> m_write_matrix[(int)TypeReflection::ScalarType::COUNT][5][5];
+    using WriteFunc = std::function<void(CursorType&, nb::object)>;
+
+    /// Struct field with everything needed to write it precomputed.
+    struct CompiledField {
+        /// Index of the field in the struct type layout.
+        uint32_t index;
+        /// Field name, also as a Python string for dict lookups.
+        const char* name;
+        PyObject* py_name;
+        /// Type layout of the field if it is a struct, otherwise null.
+        slang::TypeLayoutReflection* struct_layout;
+        /// Writer for scalar, vector and matrix fields, otherwise null.
+        const WriteFunc* write;
+    };
+
+    struct CompiledStruct {
+        std::vector<CompiledField> fields;
+    };
+
+    WriteFunc m_write_scalar[(int)TypeReflection::ScalarType::COUNT];
+    WriteFunc m_write_vector[(int)TypeReflection::ScalarType::COUNT][5];
+    WriteFunc m_write_matrix[(int)TypeReflection::ScalarType::COUNT][5][5];
     std::vector<const char*> m_stack;
 
+    /// Compiled writers by struct type layout. Only accessed with the GIL held.
+    /// Names are only released when entries are dropped, as tables are static and outlive
+    /// the interpreter.
+    std::unordered_map<slang::TypeLayoutReflection*, CompiledStruct> m_compiled_structs;
+    /// Reflection generation the compiled writers were created in.
+    uint64_t m_compiled_generation{0};
+    /// Number of writes in progress, as writing Python objects can re-enter the table.
+    uint32_t m_write_depth{0};
+
+    void clear_compiled_structs()
+    {
+        for (const auto& [_, compiled] : m_compiled_structs)
+            for (const CompiledField& field : compiled.fields)
+                Py_DECREF(field.py_name);
+        m_compiled_structs.clear();
+    }
+
     std::string build_error() { return fmt::format("{}", fmt::join(m_stack, ".")); }
 
+    /// Writer for a scalar, vector or matrix type layout, or null for other kinds.
+    const WriteFunc* get_leaf_writer(slang::TypeLayoutReflection* type_layout) const
+    {
+        auto type = type_layout->getType();
+        if (!type)
+            return nullptr;
+        int scalar_type = (int)type->getScalarType();
+        switch ((TypeReflection::Kind)type_layout->getKind()) {
+        case TypeReflection::Kind::scalar:
+            return &m_write_scalar[scalar_type];
+        case TypeReflection::Kind::vector:
+            if (type->getColumnCount() >= 5)
+                return nullptr;
+            return &m_write_vector[scalar_type][type->getColumnCount()];
+        case TypeReflection::Kind::matrix:
+            if (type->getRowCount() >= 5 || type->getColumnCount() >= 5)
+                return nullptr;
+            return &m_write_matrix[scalar_type][type->getRowCount()][type->getColumnCount()];
+        default:
+            return nullptr;
+        }
+    }
+
+    /// Get the compiled writer for a struct type layout, compiling it on first use.
+    const CompiledStruct& compile_struct(slang::TypeLayoutReflection* type_layout)
+    {
+        auto it = m_compiled_structs.find(type_layout);
+        if (it != m_compiled_structs.end())
+            return it->second;
+
+        uint32_t field_count = type_layout->getFieldCount();
+        CompiledStruct compiled;
+        compiled.fields.reserve(field_count);
+        for (uint32_t i = 0; i < field_count; i++) {
+            slang::VariableLayoutReflection* field_layout = type_layout->getFieldByIndex(i);
+            slang::TypeLayoutReflection* field_type_layout = field_layout->getTypeLayout();
+            bool is_struct = (TypeReflection::Kind)field_type_layout->getKind() == TypeReflection::Kind::struct_;
+            PyObject* py_name = PyUnicode_InternFromString(field_layout->getName());
+            if (!py_name)
+                throw nb::python_error();
+            compiled.fields.push_back({
+                .index = i,
+                .name = field_layout->getName(),
+                .py_name = py_name,
+                .struct_layout = is_struct ? field_type_layout : nullptr,
+                .write = get_leaf_writer(field_type_layout),
+            });
+        }
+        return m_compiled_structs.emplace(type_layout, std::move(compiled)).first->second;
+    }
+
+    /// True for values a scalar, vector or matrix writer can be called with directly, as they
+    /// can't be descriptor handles or have a 'uniforms' method.
+    static bool is_plain_value(PyObject* value)
+    {
+        return PyFloat_CheckExact(value) || PyLong_CheckExact(value) || PyBool_Check(value)
+            || PyList_CheckExact(value) || PyTuple_CheckExact(value);
+    }
+
+    /// Write the entries of a dict to the fields of a struct with the given type layout.
+    /// Fields missing from the dict are left unchanged.
+    void write_dict(CursorType& self, slang::TypeLayoutReflection* type_layout, nb::handle dict)
+    {
+        const CompiledStruct& compiled = compile_struct(type_layout);
+        for (const CompiledField& field : compiled.fields) {
+            PyObject* item = PyDict_GetItemWithError(dict.ptr(), field.py_name);
+            if (!item) {
+                if (PyErr_Occurred())
+                    throw nb::python_error();
+                continue;
+            }
+            nb::object value = nb::borrow(item);
+            CursorType child = self.find_field_by_index(field.index);
+            m_stack.push_back(field.name);
+            if (field.write && is_plain_value(item))
+                (*field.write)(child, value);
+            else if (field.struct_layout && PyDict_CheckExact(item) && child.is_valid())
+                write_dict(child, field.struct_layout, value);
+            else
+                write_internal(child, value);
+            m_stack.pop_back();
+        }
+    }
+
     void write_internal(CursorType& self, nb::object nbval)
     {
         if (!self.is_valid())
@@ -417,17 +558,16 @@ private:
 
             // Expect a dict for a slang struct.
             if (nb::isinstance<nb::dict>(nbval)) {
-                auto dict = nb::cast<nb::dict>(nbval);
-                for (uint32_t i = 0; i < type_layout->getFieldCount(); i++) {
-                    auto field = type_layout->getFieldByIndex(i);
-                    const char* name = field->getName();
-                    auto child = self[name];
-                    if (dict.contains(name)) {
-                        m_stack.push_back(name);
-                        write_internal(child, dict[name]);
-                        m_stack.pop_back();
+                // Write fields of constant buffers and parameter blocks through a single
+                // dereferenced cursor, instead of dereferencing for every field.
+                if constexpr (requires { self.dereference(); }) {
+                    if (kind != TypeReflection::Kind::struct_) {
+                        CursorType target = self.dereference();
+                        write_dict(target, target.slang_type_layout(), nbval);
+                        return;
                     }
                 }
+                write_dict(self, type_layout, nbval);
                 return;
             } else {
                 SGL_THROW("Expected dict");
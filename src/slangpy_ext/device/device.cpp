@@ -222,7 +222,8 @@ SGL_PY_EXPORT(device_device)
         .def_ro("hit_count", &ShaderCacheStats::hit_count, D(ShaderCacheStats, hit_count))
         .def_ro("miss_count", &ShaderCacheStats::miss_count, D(ShaderCacheStats, miss_count));
 
-    nb::class_<ShaderHotReloadEvent>(m, "ShaderHotReloadEvent", D(ShaderHotReloadEvent));
+    nb::class_<ShaderHotReloadEvent>(m, "ShaderHotReloadEvent", D(ShaderHotReloadEvent))
+        .def_ro("changed_files", &ShaderHotReloadEvent::changed_files, D_NA(ShaderHotReloadEvent, changed_files));
 
     nb::class_<Device, Object> device(m, "Device", nb::is_weak_referenceable(), D(Device));
     device.def(
@@ -613,6 +614,12 @@ SGL_PY_EXPORT(device_device)
         D(Device, create_slang_session)
     );
     device.def("reload_all_programs", &Device::reload_all_programs, D(Device, reload_all_programs));
+    device.def(
+        "reload_programs",
+        [](Device* self, std::vector<std::filesystem::path> changed_files) { self->reload_programs(changed_files); },
+        "changed_files"_a,
+        D_NA(Device, reload_programs)
+    );
     device.def("load_module", &Device::load_module, "module_name"_a, D(Device, load_module));
     device.def(
         "load_module_from_source",
@@ -628,6 +635,7 @@ SGL_PY_EXPORT(device_device)
         "modules"_a,
         "entry_points"_a,
         "link_options"_a.none() = nb::none(),
+        nb::call_guard<nb::gil_scoped_release>(),
         D(Device, link_program)
     );
     device.def(
@@ -740,13 +748,21 @@ SGL_PY_EXPORT(device_device)
         [](Device* self, ref<ShaderProgram> program)
         { return self->create_compute_kernel({.program = std::move(program)}); },
         "program"_a,
+        nb::call_guard<nb::gil_scoped_release>(),
+        D(Device, create_compute_kernel)
+    );
+    device.def(
+        "create_compute_kernel",
+        &Device::create_compute_kernel,
+        "desc"_a,
+        nb::call_guard<nb::gil_scoped_release>(),
         D(Device, create_compute_kernel)
     );
-    device.def("create_compute_kernel", &Device::create_compute_kernel, "desc"_a, D(Device, create_compute_kernel));
 
     device.def("flush_print", &Device::flush_print, D(Device, flush_print));
     device.def("flush_print_to_string", &Device::flush_print_to_string, D(Device, flush_print_to_string));
     device.def("wait", &Device::wait, D(Device, wait));
+    device.def("flush_transfers", &Device::flush_transfers, D_NA(Device, flush_transfers));
     device.def(
         "register_shader_hot_reload_callback",
         &Device::register_shader_hot_reload_callback,
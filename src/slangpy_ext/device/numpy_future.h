@@ -0,0 +1,52 @@
+// SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+
+#pragma once
+
+#include <cstring>
+#include <functional>
+
+#include "nanobind.h"
+
+#include "sgl/device/staging.h"
+
+namespace sgl {
+
+/// Pending read of device data into a numpy array, as returned by \c to_numpy_async.
+class NumpyFuture : public Object {
+    SGL_OBJECT(NumpyFuture)
+public:
+    /// Creates the numpy array from data that has been read back to host memory.
+    using Converter = std::function<nb::ndarray<nb::numpy>(void* data, nb::handle owner)>;
+
+    NumpyFuture(ref<BufferReadback> readback, Converter converter)
+        : m_readback(std::move(readback))
+        , m_converter(std::move(converter))
+    {
+    }
+
+    /// True if the data has been read back.
+    bool done() const { return m_readback->is_ready(); }
+
+    /// Block until the data has been read back.
+    void wait() { m_readback->wait(); }
+
+    /// Wait for the data and return it as a new numpy array.
+    nb::ndarray<nb::numpy> result()
+    {
+        size_t size = m_readback->size();
+        void* data = new uint8_t[size];
+        {
+            // Waiting for and copying the data doesn't touch Python objects.
+            nb::gil_scoped_release guard;
+            std::memcpy(data, m_readback->data(), size);
+        }
+        nb::capsule owner(data, [](void* p) noexcept { delete[] reinterpret_cast<uint8_t*>(p); });
+        return m_converter(data, owner);
+    }
+
+private:
+    ref<BufferReadback> m_readback;
+    Converter m_converter;
+};
+
+} // namespace sgl
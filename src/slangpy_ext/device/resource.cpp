@@ -9,6 +9,8 @@
 
 #include "sgl/core/bitmap.h"
 
+#include "device/numpy_future.h"
+
 namespace sgl {
 
 SGL_DICT_TO_DESC_BEGIN(BufferDesc)
@@ -88,17 +90,10 @@ inline std::optional<nb::dlpack::dtype> resource_format_to_dtype(Format format)
     }
 }
 
-static const char* __doc_sgl_buffer_to_numpy = R"doc()doc";
-
-nb::ndarray<nb::numpy> buffer_to_numpy(Buffer* self)
+/// Wrap data read back from the whole buffer in a numpy array, typed by the buffer format.
+static nb::ndarray<nb::numpy> buffer_data_to_numpy(const Buffer* self, void* data, nb::handle owner)
 {
     size_t data_size = self->size();
-    void* data = new uint8_t[data_size];
-
-    self->get_data(data, data_size);
-
-    nb::capsule owner(data, [](void* p) noexcept { delete[] reinterpret_cast<uint8_t*>(p); });
-
     if (auto dtype = resource_format_to_dtype(self->format())) {
         const FormatInfo& format_info = get_format_info(self->format());
         size_t channel_count = format_info.channel_count;
@@ -116,6 +111,29 @@ nb::ndarray<nb::numpy> buffer_to_numpy(Buffer* self)
     }
 }
 
+static const char* __doc_sgl_buffer_to_numpy = R"doc()doc";
+
+nb::ndarray<nb::numpy> buffer_to_numpy(Buffer* self)
+{
+    size_t data_size = self->size();
+    void* data = new uint8_t[data_size];
+
+    self->get_data(data, data_size);
+
+    nb::capsule owner(data, [](void* p) noexcept { delete[] reinterpret_cast<uint8_t*>(p); });
+
+    return buffer_data_to_numpy(self, data, owner);
+}
+
+ref<NumpyFuture> buffer_to_numpy_async(Buffer* self)
+{
+    ref<BufferReadback> readback = self->device()->read_buffer_data_async(self, self->size());
+    return make_ref<NumpyFuture>(
+        std::move(readback),
+        [buffer = ref(self)](void* data, nb::handle owner) { return buffer_data_to_numpy(buffer, data, owner); }
+    );
+}
+
 static const char* __doc_sgl_buffer_from_numpy = R"doc()doc";
 
 void buffer_copy_from_numpy(Buffer* self, nb::ndarray<nb::numpy> data)
@@ -384,6 +402,11 @@ SGL_PY_EXPORT(device_resource)
         .def_rw("label", &BufferDesc::label, D(BufferDesc, label));
     nb::implicitly_convertible<nb::dict, BufferDesc>();
 
+    nb::class_<NumpyFuture, Object>(m, "NumpyFuture", D_NA(NumpyFuture))
+        .def("done", &NumpyFuture::done, D_NA(NumpyFuture, done))
+        .def("wait", &NumpyFuture::wait, nb::call_guard<nb::gil_scoped_release>(), D_NA(NumpyFuture, wait))
+        .def("result", &NumpyFuture::result, D_NA(NumpyFuture, result));
+
     nb::class_<Buffer, Resource>(m, "Buffer", D(Buffer))
         .def_prop_ro("desc", &Buffer::desc, D(Buffer, desc))
         .def_prop_ro("size", &Buffer::size, D(Buffer, size))
@@ -391,6 +414,7 @@ SGL_PY_EXPORT(device_resource)
         .def_prop_ro("device_address", &Buffer::device_address, D(Buffer, device_address))
         .def_prop_ro("shared_handle", &Buffer::shared_handle, D(Buffer, shared_handle))
         .def("to_numpy", &buffer_to_numpy, D(buffer_to_numpy))
+        .def("to_numpy_async", &buffer_to_numpy_async, D_NA(Buffer, to_numpy_async))
         .def("copy_from_numpy", &buffer_copy_from_numpy, "data"_a, D(buffer_from_numpy))
         .def(
             "to_torch",
@@ -180,7 +180,7 @@ SGL_PY_EXPORT(device_shader)
     using sgl::SlangSession;
     using sgl::SlangEntryPoint;
 
-    nb::class_<SlangSession, Object>(m, "SlangSession", D(SlangSession))
+    nb::class_<SlangSession, Object>(m, "SlangSession", nb::is_weak_referenceable(), D(SlangSession))
         .def_prop_ro("device", &SlangSession::device, D(SlangSession, device))
         .def_prop_ro("desc", &SlangSession::desc, D(SlangSession, desc))
         .def("load_module", &SlangSession::load_module, "module_name"_a, D(SlangSession, load_module))
@@ -192,12 +192,26 @@ SGL_PY_EXPORT(device_shader)
             "path"_a.none() = nb::none(),
             D(SlangSession, load_module_from_source)
         )
+        .def(
+            "load_module_from_ir",
+            [](SlangSession* self, std::string_view module_name, nb::bytes ir)
+            {
+                return self->load_module_from_ir(
+                    module_name,
+                    std::span<const uint8_t>(reinterpret_cast<const uint8_t*>(ir.c_str()), ir.size())
+                );
+            },
+            "module_name"_a,
+            "ir"_a,
+            D(SlangSession, load_module_from_ir)
+        )
         .def(
             "link_program",
             &SlangSession::link_program,
             "modules"_a,
             "entry_points"_a,
             "link_options"_a.none() = nb::none(),
+            nb::call_guard<nb::gil_scoped_release>(),
             D(SlangSession, link_program)
         )
         .def(
@@ -215,9 +229,19 @@ SGL_PY_EXPORT(device_shader)
         .def_prop_ro("session", &SlangModule::session, D(SlangModule, session))
         .def_prop_ro("name", &SlangModule::name, D(SlangModule, name))
         .def_prop_ro("path", &SlangModule::path, D(SlangModule, path))
+        .def_prop_ro("dependency_files", &SlangModule::dependency_files, D_NA(SlangModule, dependency_files))
         .def_prop_ro("layout", &SlangModule::layout, D(SlangModule, layout))
         .def_prop_ro("entry_points", &SlangModule::entry_points, D(SlangModule, entry_points))
         .def_prop_ro("module_decl", &SlangModule::module_decl, D(SlangModule, module_decl))
+        .def(
+            "serialize",
+            [](SlangModule* self)
+            {
+                std::vector<uint8_t> ir = self->serialize();
+                return nb::bytes(ir.data(), ir.size());
+            },
+            D(SlangModule, serialize)
+        )
         .def(
             "entry_point",
             &SlangModule::entry_point,
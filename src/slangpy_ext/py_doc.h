@@ -6251,6 +6251,10 @@ static const char *__doc_sgl_SlangModule_register_entry_point = R"doc()doc";
 
 static const char *__doc_sgl_SlangModule_session = R"doc(The session from which this module was built.)doc";
 
+static const char *__doc_sgl_SlangModule_serialize =
+R"doc(Serialize the module IR, so it can later be reloaded with
+``SlangSession::load_module_from_ir``.)doc";
+
 static const char *__doc_sgl_SlangModule_slang_module = R"doc(Internal slang module.)doc";
 
 static const char *__doc_sgl_SlangModule_store_built_data =
@@ -6343,6 +6347,11 @@ static const char *__doc_sgl_SlangSession_link_program = R"doc(Link a program wi
 
 static const char *__doc_sgl_SlangSession_load_module = R"doc(Load a module by name.)doc";
 
+static const char *__doc_sgl_SlangSession_load_module_from_ir =
+R"doc(Load a module from serialized IR (see ``SlangModule::serialize``).
+Returns nullptr if the serialized module is out of date with respect to
+its dependencies.)doc";
+
 static const char *__doc_sgl_SlangSession_load_module_from_source = R"doc(Load a module from string source code.)doc";
 
 static const char *__doc_sgl_SlangSession_load_program =
@@ -1,15 +1,19 @@
 // SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
 #include <sstream>
+#include <thread>
 
 #include "nanobind.h"
 
 #include "sgl/core/macros.h"
 #include "sgl/core/logger.h"
+#include "sgl/core/short_vector.h"
 #include "sgl/utils/slangpy.h"
 #include "sgl/device/device.h"
 #include "sgl/device/kernel.h"
 #include "sgl/device/command.h"
+#include "sgl/device/resource.h"
+#include "sgl/device/query.h"
 
 #include "utils/slangpy.h"
 #include "utils/slangpyvalue.h"
@@ -26,6 +30,54 @@ buffer_to_torch(Buffer* self, DataType type, std::vector<size_t> shape, std::vec
 
 namespace sgl::slangpy {
 
+void NativeCallProfiler::set_capacity(size_t capacity)
+{
+    m_capacity = capacity;
+    while (m_events.size() > m_capacity) {
+        m_events.pop_front();
+        m_dropped++;
+    }
+}
+
+void NativeCallProfiler::record(
+    std::string name,
+    std::string phase,
+    Timer::TimePoint start,
+    Timer::TimePoint end,
+    bool gpu
+)
+{
+    if (m_capacity == 0)
+        return;
+    if (m_events.size() == m_capacity) {
+        m_events.pop_front();
+        m_dropped++;
+    }
+    m_events.push_back({
+        .name = std::move(name),
+        .phase = std::move(phase),
+        .start = start,
+        .end = end,
+        .thread_id = std::hash<std::thread::id>{}(std::this_thread::get_id()),
+        .gpu = gpu,
+    });
+}
+
+void NativeCallProfiler::clear()
+{
+    m_events.clear();
+    m_dropped = 0;
+}
+
+QueryPool* NativeCallProfiler::timestamp_query_pool(Device* device)
+{
+    if (!m_gpu_timing || !device->has_feature(Feature::timestamp_query))
+        return nullptr;
+    if (!m_query_pool || m_query_pool->device() != device)
+        m_query_pool = device->create_query_pool({.type = QueryType::timestamp, .count = 2});
+    return m_query_pool;
+}
+
 void SignatureBuilder::add(const std::string& value)
 {
     add_bytes((const uint8_t*)value.data(), (int)value.length());
@@ -35,6 +87,17 @@ void SignatureBuilder::add(const char* value)
     add_bytes((const uint8_t*)value, (int)strlen(value));
 }
 
+void SignatureBuilder::add_token(uint64_t token)
+{
+    static const char digits[] = "0123456789abcdef";
+    uint8_t hex[16];
+    for (int i = 15; i >= 0; --i) {
+        hex[i] = digits[token & 0xf];
+        token >>= 4;
+    }
+    add_bytes(hex, sizeof(hex));
+}
+
 nb::bytes SignatureBuilder::bytes() const
 {
     return nb::bytes(m_buffer, m_size);
@@ -250,6 +313,72 @@ nb::object NativeBoundVariableRuntime::read_output(CallContext* context, nb::obj
     }
 }
 
+void NativeBoundCallRuntime::add_shape_slots(
+    NativeBoundVariableRuntime* variable,
+    int arg_index,
+    nb::object kwarg_name,
+    std::vector<nb::object>& path,
+    int call_dimensionality
+)
+{
+    if (variable->m_children) {
+        // Flatten children, recording the key used to read each child value.
+        for (const auto& [name, child_ref] : *variable->m_children) {
+            if (child_ref) {
+                path.push_back(nb::steal(PyUnicode_InternFromString(name.c_str())));
+                add_shape_slots(child_ref.get(), arg_index, kwarg_name, path, call_dimensionality);
+                path.pop_back();
+            }
+        }
+        return;
+    }
+
+    ShapeSlot slot{
+        .variable = variable,
+        .source = ShapeSlot::Source::value,
+        .arg_index = arg_index,
+        .kwarg_name = kwarg_name,
+        .path = path,
+    };
+    if (!variable->m_transform.valid()) {
+        slot.source = ShapeSlot::Source::invalid;
+        m_shape_slots.push_back(std::move(slot));
+        return;
+    }
+
+    // Types with a concrete shape or that match the call shape have the same shape every call.
+    // Types that match the call shape set every dimension to 1 so they are broadcast.
+    const std::vector<int>& tf = variable->m_transform.as_vector();
+    NativeMarshall* python_type = variable->m_python_type.get();
+    if (python_type->get_concrete_shape().valid()) {
+        slot.source = ShapeSlot::Source::concrete;
+        slot.shape = python_type->get_concrete_shape();
+    } else if (python_type->get_match_call_shape()) {
+        slot.source = ShapeSlot::Source::call;
+        slot.shape = Shape(std::vector<int>(tf.size(), 1));
+    }
+
+    // Call indices outside the call shape are sub-element indices, so are ignored.
+    for (size_t i = 0; i < tf.size(); ++i) {
+        if (tf[i] < call_dimensionality)
+            slot.dims.emplace_back(static_cast<int>(i), tf[i]);
+    }
+    m_shape_slots.push_back(std::move(slot));
+}
+
+void NativeBoundCallRuntime::compile_shape_slots(int call_dimensionality)
+{
+    m_shape_slots.clear();
+    std::vector<nb::object> path;
+    for (size_t idx = 0; idx < m_args.size(); ++idx)
+        add_shape_slots(m_args[idx].get(), static_cast<int>(idx), nb::none(), path, call_dimensionality);
+    for (const auto& [name, arg] : m_kwargs) {
+        nb::object kwarg_name = nb::steal(PyUnicode_InternFromString(name.c_str()));
+        add_shape_slots(arg.get(), -1, kwarg_name, path, call_dimensionality);
+    }
+    m_shape_slots_dimensionality = call_dimensionality;
+}
+
 Shape NativeBoundCallRuntime::calculate_call_shape(
     int call_dimensionality,
     nb::list args,
@@ -257,24 +386,90 @@ Shape NativeBoundCallRuntime::calculate_call_shape(
     NativeCallData* error_context
 )
 {
+    if (m_shape_slots_dimensionality != call_dimensionality)
+        compile_shape_slots(call_dimensionality);
+
     // Setup initial call shape of correct dimensionality, with all dimensions set to 1.
-    std::vector<int> call_shape(call_dimensionality, 1);
+    short_vector<int, 8> call_shape(call_dimensionality, 1);
+
+    size_t arg_count = args.size();
+    for (const ShapeSlot& slot : m_shape_slots) {
+        // Find the argument the leaf belongs to, skipping arguments that weren't passed.
+        nb::object value;
+        if (slot.arg_index >= 0) {
+            if (static_cast<size_t>(slot.arg_index) >= arg_count)
+                continue;
+            value = args[slot.arg_index];
+        } else {
+            PyObject* item = PyDict_GetItemWithError(kwargs.ptr(), slot.kwarg_name.ptr());
+            if (!item) {
+                if (PyErr_Occurred())
+                    throw nb::python_error();
+                continue;
+            }
+            value = nb::borrow(item);
+        }
 
-    // Populate call shape for each positional argument.
-    for (size_t idx = 0; idx < args.size(); ++idx) {
-        m_args[idx]->populate_call_shape(call_shape, args[idx], error_context);
-    }
+        // Walk down to the value of the leaf.
+        for (const nb::object& key : slot.path)
+            value = value[key];
+        if (value.is_none())
+            continue;
 
-    // Populate call shape for each keyword argument.
-    for (auto [key, value] : kwargs) {
-        auto it = m_kwargs.find(nb::str(key).c_str());
-        if (it != m_kwargs.end()) {
-            it->second->populate_call_shape(call_shape, nb::cast<nb::object>(value), error_context);
+        NativeBoundVariableRuntime* variable = slot.variable;
+        switch (slot.source) {
+        case ShapeSlot::Source::invalid:
+            throw NativeBoundVariableException(
+                fmt::format(
+                    "Transform shape is not set for {}. This is an internal error.",
+                    variable->m_variable_name
+                ),
+                ref(variable),
+                ref(error_context)
+            );
+        case ShapeSlot::Source::call:
+            variable->m_shape = slot.shape;
+            continue;
+        case ShapeSlot::Source::concrete:
+            variable->m_shape = slot.shape;
+            break;
+        case ShapeSlot::Source::value:
+            variable->m_shape = variable->m_python_type->get_shape(value);
+            break;
+        }
+
+        // Apply this shape to the overall call shape.
+        //- if it's the same, we're fine
+        //- if current call shape == 1, shape_dim != 1, call is expanded
+        //- if current call shape != 1, shape_dim == 1, shape is broadcast
+        //- if current call shape != 1, shape_dim != 1, it's a mismatch
+        const std::vector<int>& shape = variable->m_shape.as_vector();
+        for (const auto& [shape_idx, call_idx] : slot.dims) {
+            int shape_dim = shape[shape_idx];
+            int& cs = call_shape[call_idx];
+            if (cs != shape_dim) {
+                if (cs != 1 && shape_dim != 1) {
+                    throw NativeBoundVariableException(
+                        fmt::format(
+                            "Shape mismatch for {} between value ({}) and call ({})\nThis is typically caused when "
+                            "attempting to combine containers with the same dimensionality but different sizes.",
+                            variable->m_variable_name,
+                            shape_dim,
+                            cs
+                        ),
+                        ref(variable),
+                        ref(error_context)
+                    );
+                }
+                if (shape_dim != 1) {
+                    cs = shape_dim;
+                }
+            }
         }
     }
 
     // Return finalized shape.
-    return Shape(call_shape);
+    return Shape(std::optional<std::vector<int>>(std::in_place, call_shape.begin(), call_shape.end()));
 }
 
 void NativeBoundCallRuntime::write_shader_cursor_pre_dispatch(
@@ -354,6 +549,138 @@ nb::object NativeCallData::exec(
     nb::args args,
     nb::kwargs kwargs
 )
+{
+    // If command_buffer is not null, just append and return early.
+    if (command_encoder != nullptr) {
+        dispatch(opts, command_encoder, args, kwargs, false);
+        return nanobind::none();
+    }
+
+    // Otherwise the submission is owned by this call, so transient buffers can be pooled.
+    TransientBufferPool* transient_pool = TransientBufferPool::get(m_device);
+    ref<CommandEncoder> temp_command_encoder = m_device->create_command_encoder();
+
+    // Optionally bracket the dispatch with timestamps to measure device execution time.
+    NativeCallProfiler* profiler = opts->get_profiler();
+    QueryPool* query_pool = profiler ? profiler->timestamp_query_pool(m_device) : nullptr;
+    if (query_pool) {
+        query_pool->reset();
+        temp_command_encoder->write_timestamp(query_pool, 0);
+    }
+
+    PendingCall pending = dispatch(opts, temp_command_encoder, args, kwargs, true, transient_pool);
+
+    if (query_pool)
+        temp_command_encoder->write_timestamp(query_pool, 1);
+
+    Timer::TimePoint submit_start = profiler ? Timer::now() : 0;
+    uint64_t submit_id = m_device->submit_command_buffer(temp_command_encoder->finish());
+    transient_pool->retire(submit_id);
+    if (profiler)
+        profiler->record(m_debug_name, "submit", submit_start, Timer::now());
+
+    Timer::TimePoint readback_start = profiler ? Timer::now() : 0;
+    nb::object result = complete(pending);
+    if (profiler)
+        profiler->record(m_debug_name, "readback", readback_start, Timer::now());
+
+    if (query_pool) {
+        m_device->wait_for_submit(submit_id);
+        std::vector<double> timestamps = query_pool->get_timestamp_results(0, 2);
+        auto duration = Timer::TimePoint((timestamps[1] - timestamps[0]) * 1e9);
+        profiler->record(m_debug_name, "execute", submit_start, submit_start + duration, true);
+    }
+
+    return result;
+}
+
+ref<NativeCallFuture> NativeCallData::call_async(ref<NativeCallRuntimeOptions> opts, nb::args args, nb::kwargs kwargs)
+{
+    if (!m_fence)
+        m_fence = m_device->create_fence({});
+
+    // Results are read back at an arbitrary later point, by which time pooled buffers may
+    // have been handed out again, so asynchronous calls allocate their own transient buffers.
+    ref<CommandEncoder> command_encoder = m_device->create_command_encoder();
+    PendingCall pending = dispatch(opts, command_encoder, args, kwargs, true);
+
+    uint64_t fence_value = m_fence->update_signaled_value();
+    ref<CommandBuffer> command_buffer = command_encoder->finish();
+    CommandBuffer* command_buffers[] = {command_buffer.get()};
+    Fence* signal_fences[] = {m_fence};
+    uint64_t signal_fence_values[] = {fence_value};
+    m_device->submit_command_buffers(command_buffers, {}, {}, signal_fences, signal_fence_values);
+
+    return make_ref<NativeCallFuture>(ref(this), std::move(pending), m_fence, fence_value);
+}
+
+NativeCallData::PendingCall NativeCallData::dispatch(
+    ref<NativeCallRuntimeOptions> opts,
+    CommandEncoder* command_encoder,
+    nb::args args,
+    nb::kwargs kwargs,
+    bool allocate_result,
+    TransientBufferPool* transient_pool
+)
+{
+    NativeCallProfiler* profiler = opts->get_profiler();
+
+    Timer::TimePoint prepare_start = profiler ? Timer::now() : 0;
+    PendingCall pending = prepare(args, kwargs, allocate_result, transient_pool);
+    uint3 thread_count = calculate_thread_count(pending.context->call_shape());
+    if (profiler)
+        profiler->record(m_debug_name, "prepare", prepare_start, Timer::now());
+
+    if (is_log_enabled(LogLevel::debug)) {
+        log_debug("Dispatching {}", m_debug_name);
+        log_debug("  Call type: {}", transient_pool ? "call" : "append");
+        log_debug("  Call shape: {}", pending.context->call_shape().to_string());
+        log_debug("  Call mode: {}", m_call_mode);
+        log_debug("  Threads: {}", thread_count.x);
+    }
+
+    // Dispatch the kernel.
+    Timer::TimePoint dispatch_start = profiler ? Timer::now() : 0;
+    m_kernel->dispatch(
+        thread_count,
+        [&](ShaderCursor cursor)
+        {
+            Timer::TimePoint write_start = profiler ? Timer::now() : 0;
+            write_call_data(opts, pending, cursor);
+            if (profiler)
+                profiler->record(m_debug_name, "write", write_start, Timer::now());
+        },
+        command_encoder
+    );
+    if (profiler)
+        profiler->record(m_debug_name, "dispatch", dispatch_start, Timer::now());
+
+    return pending;
+}
+
+ref<NativeCallGraphNode>
+NativeCallData::record(ref<NativeCallRuntimeOptions> opts, nb::args args, nb::kwargs kwargs)
+{
+    auto node = make_ref<NativeCallGraphNode>();
+    node->call_data = ref(this);
+    node->pending = prepare(args, kwargs, true);
+    node->thread_count = calculate_thread_count(node->pending.context->call_shape());
+
+    // Write call data to a persistent root object, which is bound every time the node is replayed.
+    node->root_object = m_device->create_root_shader_object(m_kernel->program());
+    write_call_data(opts, node->pending, ShaderCursor(node->root_object));
+
+    if (is_log_enabled(LogLevel::debug)) {
+        log_debug("Recorded {}", m_debug_name);
+        log_debug("  Call shape: {}", node->pending.context->call_shape().to_string());
+        log_debug("  Threads: {}", node->thread_count.x);
+    }
+
+    return node;
+}
+
+NativeCallData::PendingCall
+NativeCallData::prepare(nb::args args, nb::kwargs kwargs, bool allocate_result, TransientBufferPool* transient_pool)
 {
     // Unpack args and kwargs.
     nb::list unpacked_args = unpack_args(args);
@@ -364,10 +691,10 @@ nb::object NativeCallData::exec(
     m_last_call_shape = call_shape;
 
     // Setup context.
-    auto context = make_ref<CallContext>(m_device, call_shape, m_call_mode);
+    auto context = make_ref<CallContext>(m_device, call_shape, m_call_mode, transient_pool);
 
     // Allocate return value if needed.
-    if (!command_encoder && m_call_mode == CallMode::prim) {
+    if (allocate_result && m_call_mode == CallMode::prim) {
         ref<NativeBoundVariableRuntime> rv_node = m_runtime->find_kwarg("_result");
         if (rv_node && (!kwargs.contains("_result") || kwargs["_result"].is_none())) {
             nb::object output = rv_node->get_python_type()->create_output(context, rv_node.get());
@@ -377,70 +704,87 @@ nb::object NativeCallData::exec(
         }
     }
 
+    return PendingCall{
+        .context = std::move(context),
+        .args = args,
+        .kwargs = kwargs,
+        .unpacked_args = std::move(unpacked_args),
+        .unpacked_kwargs = std::move(unpacked_kwargs),
+        .read_back = nb::list(),
+    };
+}
+
+uint3 NativeCallData::calculate_thread_count(const Shape& call_shape) const
+{
+    int total_threads = 1;
+    for (int dim : call_shape.as_vector())
+        total_threads *= dim;
+    return uint3(total_threads, 1, 1);
+}
+
+void NativeCallData::write_call_data(
+    ref<NativeCallRuntimeOptions> opts,
+    PendingCall& pending,
+    ShaderCursor cursor
+)
+{
     // Calculate total threads and strides.
     int total_threads = 1;
     std::vector<int> strides;
-    const std::vector<int>& cs = call_shape.as_vector();
+    const std::vector<int>& cs = pending.context->call_shape().as_vector();
     for (auto it = cs.rbegin(); it != cs.rend(); ++it) {
         strides.push_back(total_threads);
         total_threads *= *it;
     }
     std::reverse(strides.begin(), strides.end());
 
-    nb::list read_back;
+    auto call_data_cursor = cursor.find_field("call_data");
 
-    // Dispatch the kernel.
-    auto bind_vars = [&](ShaderCursor cursor)
-    {
-        auto call_data_cursor = cursor.find_field("call_data");
-
-        // Dereference the cursor if it is a reference.
-        // We do this here to avoid doing it automatically for every
-        // child. Shouldn't need to do recursively as its only
-        // relevant for parameter blocks and constant buffers.
-        if (call_data_cursor.is_reference())
-            call_data_cursor = call_data_cursor.dereference();
-
-        if (!strides.empty()) {
-            call_data_cursor["_call_stride"]._set_array_unsafe(&strides[0], strides.size() * 4, strides.size());
-            call_data_cursor["_call_dim"]._set_array_unsafe(&cs[0], cs.size() * 4, cs.size());
-        }
-        call_data_cursor["_thread_count"] = uint3(total_threads, 1, 1);
+    // Dereference the cursor if it is a reference.
+    // We do this here to avoid doing it automatically for every
+    // child. Shouldn't need to do recursively as its only
+    // relevant for parameter blocks and constant buffers.
+    if (call_data_cursor.is_reference())
+        call_data_cursor = call_data_cursor.dereference();
 
-        m_runtime
-            ->write_shader_cursor_pre_dispatch(context, call_data_cursor, unpacked_args, unpacked_kwargs, read_back);
+    if (!strides.empty()) {
+        call_data_cursor["_call_stride"]._set_array_unsafe(&strides[0], strides.size() * 4, strides.size());
+        call_data_cursor["_call_dim"]._set_array_unsafe(&cs[0], cs.size() * 4, cs.size());
+    }
+    call_data_cursor["_thread_count"] = uint3(total_threads, 1, 1);
+
+    m_runtime->write_shader_cursor_pre_dispatch(
+        pending.context,
+        call_data_cursor,
+        pending.unpacked_args,
+        pending.unpacked_kwargs,
+        pending.read_back
+    );
 
-        nb::list uniforms = opts->get_uniforms();
-        if (uniforms) {
-            for (auto u : uniforms) {
-                if (nb::isinstance<nb::dict>(u)) {
-                    write_shader_cursor(cursor, nb::cast<nb::dict>(u));
-                } else {
-                    write_shader_cursor(cursor, nb::cast<nb::dict>(u(this)));
-                }
+    nb::list uniforms = opts->get_uniforms();
+    if (uniforms) {
+        for (auto u : uniforms) {
+            if (nb::isinstance<nb::dict>(u)) {
+                write_shader_cursor(cursor, nb::cast<nb::dict>(u));
+            } else {
+                write_shader_cursor(cursor, nb::cast<nb::dict>(u(this)));
             }
         }
-    };
-
-    if (is_log_enabled(LogLevel::debug)) {
-        log_debug("Dispatching {}", m_debug_name);
-        log_debug("  Call type: {}", command_encoder ? "append" : "call");
-        log_debug("  Call shape: {}", call_shape.to_string());
-        log_debug("  Call mode: {}", m_call_mode);
-        log_debug("  Strides: [{}]", fmt::join(strides, ", "));
-        log_debug("  Threads: {}", total_threads);
     }
 
-    m_kernel->dispatch(uint3(total_threads, 1, 1), bind_vars, command_encoder);
+    // Upload values packed into the shared readback buffer in one go.
+    pending.context->flush_readback();
+}
 
-    // If command_buffer is not null, return early.
-    if (command_encoder != nullptr) {
-        return nanobind::none();
-    }
+nb::object NativeCallData::complete(PendingCall& pending)
+{
+    const ref<CallContext>& context = pending.context;
+    nb::list& unpacked_args = pending.unpacked_args;
+    nb::dict& unpacked_kwargs = pending.unpacked_kwargs;
 
     // Read call data post dispatch.
     // m_runtime->read_call_data_post_dispatch(context, call_data, unpacked_args, unpacked_kwargs);
-    for (auto val : read_back) {
+    for (auto val : pending.read_back) {
         auto t = nb::cast<nb::tuple>(val);
         auto bvr = nb::cast<ref<NativeBoundVariableRuntime>>(t[0]);
         auto rb_val = t[1];
@@ -449,10 +793,10 @@ nb::object NativeCallData::exec(
     }
 
     // Pack updated 'this' values back.
-    for (size_t i = 0; i < args.size(); ++i) {
-        pack_arg(args[i], unpacked_args[i]);
+    for (size_t i = 0; i < pending.args.size(); ++i) {
+        pack_arg(pending.args[i], unpacked_args[i]);
     }
-    for (auto [k, v] : kwargs) {
+    for (auto [k, v] : pending.kwargs) {
         pack_arg(nb::cast<nb::object>(v), unpacked_kwargs[k]);
     }
 
@@ -466,71 +810,147 @@ nb::object NativeCallData::exec(
     return nb::none();
 }
 
+bool NativeCallFuture::done() const
+{
+    return m_completed || m_fence->current_value() >= m_fence_value;
+}
+
+void NativeCallFuture::wait() const
+{
+    if (!m_completed)
+        m_fence->wait(m_fence_value);
+}
+
+nb::object NativeCallFuture::result()
+{
+    if (!m_completed) {
+        {
+            nb::gil_scoped_release release;
+            wait();
+        }
+        m_result = m_call_data->complete(m_pending);
+        m_completed = true;
+    }
+    return m_result;
+}
+
+void NativeCallGraph::set_node(size_t index, ref<NativeCallGraphNode> node)
+{
+    if (index >= m_nodes.size())
+        throw nb::index_error("Call graph node index out of range");
+    m_nodes[index] = std::move(node);
+}
+
+ref<NativeCallGraphNode> NativeCallGraph::get_node(size_t index) const
+{
+    if (index >= m_nodes.size())
+        throw nb::index_error("Call graph node index out of range");
+    return m_nodes[index];
+}
+
+nb::object NativeCallGraph::replay(CommandEncoder* command_encoder)
+{
+    if (m_nodes.empty())
+        return command_encoder ? nb::none() : nb::object(nb::list());
+
+    ref<CommandEncoder> temp_command_encoder;
+    if (command_encoder == nullptr) {
+        temp_command_encoder = m_nodes[0]->call_data->get_device()->create_command_encoder();
+        command_encoder = temp_command_encoder;
+    }
+
+    // Bind the pre-written root objects, skipping all argument processing. Values packed into
+    // shared readback buffers (e.g. ValueRefs) are re-uploaded, as the last dispatch may have
+    // overwritten them.
+    for (const auto& node : m_nodes) {
+        node->pending.context->flush_readback();
+        auto pass_encoder = command_encoder->begin_compute_pass();
+        pass_encoder->bind_pipeline(node->call_data->get_kernel()->pipeline(), node->root_object);
+        pass_encoder->dispatch(node->thread_count);
+        pass_encoder->end();
+    }
+
+    // If command_buffer is not null, return early.
+    if (!temp_command_encoder)
+        return nb::none();
+
+    m_nodes[0]->call_data->get_device()->submit_command_buffer(temp_command_encoder->finish());
+
+    nb::list results;
+    for (const auto& node : m_nodes)
+        results.append(node->call_data->complete(node->pending));
+    return results;
+}
+
 NativeCallDataCache::NativeCallDataCache()
 {
     m_cache.reserve(1024);
 
     m_type_signature_table[typeid(Texture)] = [](const ref<SignatureBuilder>& builder, nb::handle o)
     {
-        auto tex = nb::cast<Texture*>(o);
-
-        // Note: Using snprintf here as fmt library is quite
-        // a bit slower for this use case. (over 4x).
-        char temp[256];
-        std::snprintf(
-            temp,
-            sizeof(temp),
-            "[%d,%d,%d,%d]",
-            (int)tex->desc().type,
-            (int)tex->desc().usage,
-            (int)tex->desc().format,
-            (int)tex->desc().array_length
-        );
-        builder->add(temp);
+        const TextureDesc& desc = nb::cast<Texture*>(o)->desc();
+
+        // Type and format are small enums, so pack exactly into a token with the usage flags.
+        builder->add_token((uint64_t(desc.type) << 56) | (uint64_t(desc.format) << 32) | uint64_t(desc.usage));
+        builder->add_token(desc.array_length);
 
         return true;
     };
 
     m_type_signature_table[typeid(Buffer)] = [](const ref<SignatureBuilder>& builder, nb::handle o)
     {
-        auto buffer = nb::cast<Buffer*>(o);
-
-        // Note: Using snprintf here as fmt library is quite
-        // a bit slower for this use case. (over 4x).
-        char temp[256];
-        std::snprintf(temp, sizeof(temp), "[%d]", (int)buffer->desc().usage);
-        builder->add(temp);
-
+        builder->add_token(uint64_t(nb::cast<Buffer*>(o)->desc().usage));
         return true;
     };
 }
 
+const NativeCallDataCache::TypeSignatureInfo& NativeCallDataCache::get_type_signature_info(nb::handle type)
+{
+    auto it = m_type_signature_info.find(type.ptr());
+    if (it != m_type_signature_info.end())
+        return it->second;
+
+    TypeSignatureInfo info;
+    PyObject* key = type.ptr();
+    info.type = nb::weakref(type, nb::cpp_function([this, key](nb::handle) { m_type_signature_info.erase(key); }));
+    info.is_bound_type = nb::type_check(type);
+    info.build_signature = nullptr;
+    if (info.is_bound_type) {
+        const auto& type_info = nb::type_info(type);
+        info.name_token = signature_token(type_info.name());
+        auto table_it = m_type_signature_table.find(type_info);
+        if (table_it != m_type_signature_table.end())
+            info.build_signature = &table_it->second;
+    } else {
+        info.name_token = signature_token(nb::str(nb::getattr(type, "__name__")).c_str());
+    }
+
+    // Attributes can only be set on instances that have a __dict__.
+    bool has_instance_dict = ((PyTypeObject*)type.ptr())->tp_dictoffset != 0;
+    info.has_get_this = has_instance_dict || nb::hasattr(type, "get_this");
+    info.has_slangpy_signature = has_instance_dict || nb::hasattr(type, "slangpy_signature");
+
+    return m_type_signature_info.emplace(key, std::move(info)).first->second;
+}
+
 void NativeCallDataCache::get_value_signature(const ref<SignatureBuilder> builder, nb::handle o)
 {
-    // Get python type.
-    auto type = o.type();
+    const TypeSignatureInfo& type_info = get_type_signature_info(o.type());
 
     // Check if this is a bound native type, in which case we can hopefully do fast things!
-    bool is_bound_type = nb::type_check(type);
-    if (is_bound_type) {
-
-        // Get C++ type info, and attempt to cast to a slangpy native object
-        const auto& type_info = nb::type_info(type);
+    if (type_info.is_bound_type) {
 
         // If we have a native object, can directly request the signature.
         const NativeObject* native_object;
         if (nb::try_cast<const NativeObject*>(o, native_object)) {
-            *builder << type_info.name() << "\n";
+            builder->add_token(type_info.name_token);
             native_object->read_signature(builder);
             return;
         }
 
         // Attempt to use type signature table to lookup type
-        auto it = m_type_signature_table.find(type_info);
-        if (it != m_type_signature_table.end()) {
-            if (it->second(builder, o)) {
-                return;
-            }
+        if (type_info.build_signature && (*type_info.build_signature)(builder, o)) {
+            return;
         }
     }
 
@@ -571,23 +991,27 @@ void NativeCallDataCache::get_value_signature(const ref<SignatureBuilder> builde
     }
 
     // Add type name.
-    auto type_name = nb::str(nb::getattr(o.type(), "__name__"));
-    *builder << type_name.c_str() << "\n";
+    builder->add_token(type_info.name_token);
 
     // Handle objects with get_this method.
-    auto get_this = nb::getattr(o, "get_this", nb::none());
-    if (!get_this.is_none()) {
-        auto this_ = get_this();
-        get_value_signature(builder, this_);
-        return;
+    if (type_info.has_get_this) {
+        nb::object get_this = nb::getattr(o, "get_this", nb::handle());
+        if (get_this.is_valid() && !get_this.is_none()) {
+            auto this_ = get_this();
+            get_value_signature(builder, this_);
+            return;
+        }
     }
 
     // If x has signature attribute, use it.
-    if (nb::hasattr(o, "slangpy_signature")) {
-
-        auto slangpy_sig = nb::getattr(o, "slangpy_signature");
-        *builder << nb::str(slangpy_sig).c_str() << "\n";
-        return;
+    if (type_info.has_slangpy_signature) {
+        nb::object slangpy_sig = nb::getattr(o, "slangpy_signature", nb::handle());
+        if (slangpy_sig.is_valid()) {
+            // Signatures provided from Python can be anything, so are kept in full rather than
+            // reduced to a token that could collide.
+            *builder << nb::str(slangpy_sig).c_str() << "\n";
+            return;
+        }
     }
 
     // If x is a dictionary get signature of its children.
@@ -709,12 +1133,17 @@ void pack_arg(nanobind::object arg, nanobind::object unpacked_arg)
     }
 }
 
+/// Cache used by get_value_signature. Created on first use and destroyed at exit, while the
+/// interpreter is still alive, as it holds weak references to Python types.
+static std::unique_ptr<NativeCallDataCache> s_value_signature_cache;
+
 // Helper to get signature of a single value.
 std::string get_value_signature(nb::handle o)
 {
-    static NativeCallDataCache cache;
+    if (!s_value_signature_cache)
+        s_value_signature_cache = std::make_unique<NativeCallDataCache>();
     auto builder = make_ref<SignatureBuilder>();
-    cache.get_value_signature(builder, o);
+    s_value_signature_cache->get_value_signature(builder, o);
     return builder->str();
 }
 
@@ -756,6 +1185,7 @@ SGL_PY_EXPORT(utils_slangpy)
         D_NA(slangpy, pack_arg)
     );
     slangpy.def("get_value_signature", &get_value_signature, "o"_a, D_NA(slangpy, get_value_signature));
+    nb::module_::import_("atexit").attr("register")(nb::cpp_function([]() { s_value_signature_cache.reset(); }));
 
     nb::register_exception_translator(
         [](const std::exception_ptr& p, void* /* unused */)
@@ -775,6 +1205,7 @@ SGL_PY_EXPORT(utils_slangpy)
     nb::class_<SignatureBuilder, Object>(slangpy, "SignatureBuilder") //
         .def(nb::init<>(), D_NA(SignatureBuilder, SignatureBuilder))
         .def("add", nb::overload_cast<const std::string&>(&SignatureBuilder::add), "value"_a, D_NA(NativeObject, add))
+        .def("add_token", &SignatureBuilder::add_token, "token"_a, D_NA(SignatureBuilder, add_token))
         .def_prop_ro("str", &SignatureBuilder::str, D_NA(SignatureBuilder, str))
         .def_prop_ro(
             "bytes",
@@ -790,6 +1221,11 @@ SGL_PY_EXPORT(utils_slangpy)
             D_NA(NativeObject, NativeObject)
         )
         .def_prop_rw("slangpy_signature", &NativeObject::slangpy_signature, &NativeObject::set_slangpy_signature)
+        .def_prop_ro(
+            "slangpy_signature_token",
+            &NativeObject::slangpy_signature_token,
+            D_NA(NativeObject, slangpy_signature_token)
+        )
         .def("read_signature", &NativeObject::read_signature, "builder"_a, D_NA(NativeObject, read_signature));
 
     nb::class_<NativeSlangType, PyNativeSlangType, Object>(slangpy, "NativeSlangType") //
@@ -976,6 +1412,49 @@ SGL_PY_EXPORT(utils_slangpy)
             D_NA(NativeBoundCallRuntime, write_raw_dispatch_data)
         );
 
+    nb::class_<NativeCallProfiler::Event>(slangpy, "CallProfileEvent") //
+        .def_ro("name", &NativeCallProfiler::Event::name, D_NA(CallProfileEvent, name))
+        .def_ro("phase", &NativeCallProfiler::Event::phase, D_NA(CallProfileEvent, phase))
+        .def_ro("start", &NativeCallProfiler::Event::start, D_NA(CallProfileEvent, start))
+        .def_ro("end", &NativeCallProfiler::Event::end, D_NA(CallProfileEvent, end))
+        .def_ro("thread_id", &NativeCallProfiler::Event::thread_id, D_NA(CallProfileEvent, thread_id))
+        .def_ro("gpu", &NativeCallProfiler::Event::gpu, D_NA(CallProfileEvent, gpu));
+
+    nb::class_<NativeCallProfiler, Object>(slangpy, "NativeCallProfiler") //
+        .def(
+            nb::init<size_t>(),
+            "capacity"_a = NativeCallProfiler::DEFAULT_CAPACITY,
+            D_NA(NativeCallProfiler, NativeCallProfiler)
+        )
+        .def_static("now", &Timer::now, D_NA(NativeCallProfiler, now))
+        .def_prop_rw(
+            "capacity",
+            &NativeCallProfiler::capacity,
+            &NativeCallProfiler::set_capacity,
+            D_NA(NativeCallProfiler, capacity)
+        )
+        .def_prop_ro("size", &NativeCallProfiler::size, D_NA(NativeCallProfiler, size))
+        .def_prop_ro("dropped", &NativeCallProfiler::dropped, D_NA(NativeCallProfiler, dropped))
+        .def_prop_rw(
+            "gpu_timing",
+            &NativeCallProfiler::gpu_timing,
+            &NativeCallProfiler::set_gpu_timing,
+            D_NA(NativeCallProfiler, gpu_timing)
+        )
+        .def(
+            "record",
+            &NativeCallProfiler::record,
+            "name"_a,
+            "phase"_a,
+            "start"_a,
+            "end"_a,
+            "gpu"_a = false,
+            D_NA(NativeCallProfiler, record)
+        )
+        .def("events", &NativeCallProfiler::events, D_NA(NativeCallProfiler, events))
+        .def("clear", &NativeCallProfiler::clear, D_NA(NativeCallProfiler, clear));
+    slangpy.attr("NativeCallProfiler").attr("DEFAULT_CAPACITY") = NativeCallProfiler::DEFAULT_CAPACITY;
+
     nb::class_<NativeCallRuntimeOptions, Object>(slangpy, "NativeCallRuntimeOptions") //
         .def(nb::init<>(), D_NA(NativeCallRuntimeOptions, NativeCallRuntimeOptions))
         .def_prop_rw(
@@ -983,6 +1462,19 @@ SGL_PY_EXPORT(utils_slangpy)
             &NativeCallRuntimeOptions::get_uniforms,
             &NativeCallRuntimeOptions::set_uniforms,
             D_NA(NativeCallRuntimeOptions, uniforms)
+        )
+        .def_prop_rw(
+            "this",
+            &NativeCallRuntimeOptions::get_this,
+            &NativeCallRuntimeOptions::set_this,
+            D_NA(NativeCallRuntimeOptions, this)
+        )
+        .def_prop_rw(
+            "profiler",
+            &NativeCallRuntimeOptions::get_profiler,
+            &NativeCallRuntimeOptions::set_profiler,
+            nb::arg().none(),
+            D_NA(NativeCallRuntimeOptions, profiler)
         );
 
     // clang-format off
@@ -1042,6 +1534,14 @@ SGL_PY_EXPORT(utils_slangpy)
             nb::arg("kwargs"),
             D_NA(NativeCallData, append_to)
         )
+        .def(
+            "call_async",
+            &NativeCallData::call_async,
+            nb::arg("opts"),
+            nb::arg("args"),
+            nb::arg("kwargs"),
+            D_NA(NativeCallData, call_async)
+        )
         .def("log", &NativeCallData::log, "level"_a, "msg"_a, "frequency"_a = LogFrequency::always, D(Logger, log))
         .DEF_LOG_METHOD(log_debug)
         .DEF_LOG_METHOD(log_info)
@@ -1051,6 +1551,44 @@ SGL_PY_EXPORT(utils_slangpy)
 
 #undef DEF_LOG_METHOD
 
+    nb::class_<NativeCallFuture, Object>(slangpy, "NativeCallFuture") //
+        .def_prop_ro("fence", &NativeCallFuture::fence, D_NA(NativeCallFuture, fence))
+        .def_prop_ro("fence_value", &NativeCallFuture::fence_value, D_NA(NativeCallFuture, fence_value))
+        .def("done", &NativeCallFuture::done, D_NA(NativeCallFuture, done))
+        .def(
+            "wait",
+            &NativeCallFuture::wait,
+            nb::call_guard<nb::gil_scoped_release>(),
+            D_NA(NativeCallFuture, wait)
+        )
+        .def("result", &NativeCallFuture::result, D_NA(NativeCallFuture, result));
+
+    nb::class_<NativeCallGraphNode, Object>(slangpy, "NativeCallGraphNode") //
+        .def_prop_ro(
+            "call_data",
+            [](NativeCallGraphNode& self) { return self.call_data; },
+            D_NA(NativeCallGraphNode, call_data)
+        )
+        .def_prop_ro(
+            "call_shape",
+            [](NativeCallGraphNode& self) { return self.pending.context->call_shape(); },
+            D_NA(NativeCallGraphNode, call_shape)
+        );
+
+    nb::class_<NativeCallGraph, Object>(slangpy, "NativeCallGraph") //
+        .def(nb::init<>(), D_NA(NativeCallGraph, NativeCallGraph))
+        .def("add_node", &NativeCallGraph::add_node, "node"_a, D_NA(NativeCallGraph, add_node))
+        .def("set_node", &NativeCallGraph::set_node, "index"_a, "node"_a, D_NA(NativeCallGraph, set_node))
+        .def("get_node", &NativeCallGraph::get_node, "index"_a, D_NA(NativeCallGraph, get_node))
+        .def("clear", &NativeCallGraph::clear, D_NA(NativeCallGraph, clear))
+        .def("__len__", &NativeCallGraph::size, D_NA(NativeCallGraph, size))
+        .def(
+            "replay",
+            &NativeCallGraph::replay,
+            "command_encoder"_a.none() = nullptr,
+            D_NA(NativeCallGraph, replay)
+        );
+
     nb::class_<NativeCallDataCache, PyNativeCallDataCache, Object>(slangpy, "NativeCallDataCache")
         .def(
             "__init__",
@@ -1078,6 +1616,12 @@ SGL_PY_EXPORT(utils_slangpy)
             "signature"_a,
             D_NA(NativeCallDataCache, find_call_data)
         )
+        .def(
+            "peek_call_data",
+            &NativeCallDataCache::peek_call_data,
+            "signature"_a,
+            D_NA(NativeCallDataCache, peek_call_data)
+        )
         .def(
             "add_call_data",
             &NativeCallDataCache::add_call_data,
@@ -1085,6 +1629,25 @@ SGL_PY_EXPORT(utils_slangpy)
             "call_data"_a,
             D_NA(NativeCallDataCache, add_call_data)
         )
+        .def_prop_rw(
+            "capacity",
+            &NativeCallDataCache::capacity,
+            &NativeCallDataCache::set_capacity,
+            D_NA(NativeCallDataCache, capacity)
+        )
+        .def_prop_rw(
+            "profiler",
+            &NativeCallDataCache::profiler,
+            &NativeCallDataCache::set_profiler,
+            nb::arg().none(),
+            D_NA(NativeCallDataCache, profiler)
+        )
+        .def_prop_ro("size", &NativeCallDataCache::size, D_NA(NativeCallDataCache, size))
+        .def_prop_ro("hits", &NativeCallDataCache::hits, D_NA(NativeCallDataCache, hits))
+        .def_prop_ro("misses", &NativeCallDataCache::misses, D_NA(NativeCallDataCache, misses))
+        .def_prop_ro("evictions", &NativeCallDataCache::evictions, D_NA(NativeCallDataCache, evictions))
+        .def("clear", &NativeCallDataCache::clear, D_NA(NativeCallDataCache, clear))
+        .def("reset_stats", &NativeCallDataCache::reset_stats, D_NA(NativeCallDataCache, reset_stats))
         .def(
             "lookup_value_signature",
             &NativeCallDataCache::lookup_value_signature,
@@ -1177,14 +1740,56 @@ SGL_PY_EXPORT(utils_slangpy)
             D_NA(Shape, operator==)
         );
 
+    nb::class_<TransientBufferPool, Object>(slangpy, "TransientBufferPool") //
+        .def_static("get", &TransientBufferPool::get, "device"_a, D_NA(TransientBufferPool, get))
+        .def("clear", &TransientBufferPool::clear, D_NA(TransientBufferPool, clear))
+        .def_prop_rw(
+            "max_pooled_size",
+            &TransientBufferPool::max_pooled_size,
+            &TransientBufferPool::set_max_pooled_size,
+            D_NA(TransientBufferPool, max_pooled_size)
+        )
+        .def_prop_ro("pooled_size", &TransientBufferPool::pooled_size, D_NA(TransientBufferPool, pooled_size))
+        .def_prop_ro(
+            "allocation_count",
+            &TransientBufferPool::allocation_count,
+            D_NA(TransientBufferPool, allocation_count)
+        )
+        .def_prop_ro("reuse_count", &TransientBufferPool::reuse_count, D_NA(TransientBufferPool, reuse_count));
+
     nb::class_<CallContext, Object>(slangpy, "CallContext") //
         .def(
-            nb::init<ref<Device>, const Shape&, CallMode>(),
+            nb::init<ref<Device>, const Shape&, CallMode, TransientBufferPool*>(),
             nb::arg("device"),
             nb::arg("call_shape"),
             nb::arg("call_mode"),
+            nb::arg("transient_pool").none() = nullptr,
             D_NA(CallContext, CallContext)
         )
+        .def(
+            "create_transient_buffer",
+            &CallContext::create_transient_buffer,
+            "size"_a,
+            D_NA(CallContext, create_transient_buffer)
+        )
+        .def(
+            "allocate_readback",
+            [](CallContext& self, nb::bytes data, size_t element_stride)
+            { return self.allocate_readback(data.c_str(), data.size(), element_stride); },
+            "data"_a,
+            "element_stride"_a,
+            D_NA(CallContext, allocate_readback)
+        )
+        .def(
+            "read_readback",
+            [](CallContext& self, const BufferView* view)
+            {
+                std::span<const uint8_t> data = self.read_readback(view);
+                return nb::bytes(reinterpret_cast<const char*>(data.data()), data.size());
+            },
+            "view"_a,
+            D_NA(CallContext, read_readback)
+        )
         .def_prop_ro(
             "device",
             [](const CallContext& self) -> Device* { return self.device(); },
@@ -3,6 +3,8 @@
 #pragma once
 
 #include <vector>
+#include <deque>
+#include <list>
 #include <map>
 #include <typeindex>
 #include <unordered_map>
@@ -12,8 +14,11 @@
 #include "sgl/core/macros.h"
 #include "sgl/core/fwd.h"
 #include "sgl/core/object.h"
+#include "sgl/core/timer.h"
 #include "sgl/device/fwd.h"
 #include "sgl/device/shader_cursor.h"
+#include "sgl/device/shader_object.h"
+#include "sgl/device/fence.h"
 #include "sgl/utils/slangpy.h"
 
 namespace sgl::slangpy {
@@ -48,6 +53,24 @@ private:
     ref<NativeCallData> m_context;
 };
 
+/// Stable 64 bit token for a signature string (FNV-1a hash). Tokens are the same in every
+/// process, so signatures built from them can also be used as persistent cache keys.
+///
+/// Tokens are not checked against the strings they were made from, so two strings with the
+/// same token would share call data. They are only used for type names and signatures that
+/// slangpy generates for its own native objects, a small set for which a 64 bit collision is
+/// vanishingly unlikely (around n^2 / 2^65 for n distinct strings). Signatures provided from
+/// Python, by slangpy_signature attributes or lookup_value_signature, are kept in full.
+inline uint64_t signature_token(std::string_view str)
+{
+    uint64_t hash = 0xcbf29ce484222325ull;
+    for (char c : str) {
+        hash ^= uint8_t(c);
+        hash *= 0x100000001b3ull;
+    }
+    return hash;
+}
+
 /// Used during calculation of slangpy signature
 class SignatureBuilder : public Object {
 public:
@@ -66,6 +89,9 @@ public:
     void add(const std::string& value);
     void add(const char* value);
 
+    /// Add a fixed size token, written as 16 hex digits so the signature remains a valid string.
+    void add_token(uint64_t token);
+
     template<typename T>
     SignatureBuilder& operator<<(const T& value)
     {
@@ -79,6 +105,9 @@ public:
 
     std::string dbg_as_string() const { return std::string((const char*)m_buffer, m_size); }
 
+    /// Reset the builder so it can be reused for a new signature.
+    void clear() { m_size = 0; }
+
 private:
     uint8_t m_initial_buffer[1024];
     uint8_t* m_buffer;
@@ -105,17 +134,26 @@ private:
 /// to slangpy without entering python code. A user can set a fixed
 /// signature on a NativeObject on construction, or override the
 /// read_signature function to generate a signature dynamically.
+/// A fixed signature is reduced to a token when set, so reading it
+/// doesn't copy the signature string.
 class NativeObject : public Object {
 public:
     NativeObject() = default;
 
     std::string_view slangpy_signature() const { return m_signature; }
-    void set_slangpy_signature(std::string_view signature) { m_signature = signature; }
+    void set_slangpy_signature(std::string_view signature)
+    {
+        m_signature = signature;
+        m_signature_token = signature_token(signature);
+    }
+
+    uint64_t slangpy_signature_token() const { return m_signature_token; }
 
-    virtual void read_signature(SignatureBuilder* builder) const { builder->add(m_signature); }
+    virtual void read_signature(SignatureBuilder* builder) const { builder->add_token(m_signature_token); }
 
 private:
     std::string m_signature;
+    uint64_t m_signature_token{signature_token("")};
 };
 
 /// Nanobind trampoline class for NativeObject
@@ -483,6 +521,8 @@ public:
     void write_raw_dispatch_data(nb::dict call_data, nb::object value);
 
 private:
+    friend class NativeBoundCallRuntime;
+
     std::pair<AccessType, AccessType> m_access{AccessType::none, AccessType::none};
     Shape m_transform;
     ref<NativeMarshall> m_python_type;
@@ -503,13 +543,21 @@ public:
     const std::vector<ref<NativeBoundVariableRuntime>>& get_args() const { return m_args; }
 
     /// Set positional arguments.
-    void set_args(const std::vector<ref<NativeBoundVariableRuntime>>& args) { m_args = args; }
+    void set_args(const std::vector<ref<NativeBoundVariableRuntime>>& args)
+    {
+        m_args = args;
+        m_shape_slots_dimensionality = -1;
+    }
 
     /// Get keyword arguments.
     const std::map<std::string, ref<NativeBoundVariableRuntime>>& get_kwargs() const { return m_kwargs; }
 
     /// Set keyword arguments.
-    void set_kwargs(const std::map<std::string, ref<NativeBoundVariableRuntime>>& kwargs) { m_kwargs = kwargs; }
+    void set_kwargs(const std::map<std::string, ref<NativeBoundVariableRuntime>>& kwargs)
+    {
+        m_kwargs = kwargs;
+        m_shape_slots_dimensionality = -1;
+    }
 
     /// Find a keyword argument by name.
     ref<NativeBoundVariableRuntime> find_kwarg(const char* name) const
@@ -521,7 +569,9 @@ public:
         return it->second;
     }
 
-    /// Calculate the overall call shape by combining the shapes of all arguments.
+    /// Calculate the overall call shape by combining the shapes of all arguments. The binding
+    /// tree is flattened into a list of leaf slots on first use, so each call is a single pass
+    /// over the leaves. Setting args or kwargs flattens the tree again.
     Shape calculate_call_shape(int call_dimensionality, nb::list args, nb::dict kwargs, NativeCallData* error_context);
 
     void write_shader_cursor_pre_dispatch(
@@ -540,8 +590,109 @@ public:
     void write_raw_dispatch_data(nb::dict call_data, nb::dict kwargs);
 
 private:
+    /// Leaf of the binding tree with its broadcast rules precomputed.
+    struct ShapeSlot {
+        /// Where the shape of the leaf's value comes from.
+        enum class Source {
+            /// Read from the value on every call.
+            value,
+            /// Fixed by the concrete shape of the marshal.
+            concrete,
+            /// Matches the call shape, so never changes it.
+            call,
+            /// Transform is not set, which is an error if a value is passed.
+            invalid,
+        };
+
+        NativeBoundVariableRuntime* variable;
+        Source source;
+
+        /// Index of the positional argument the leaf belongs to, or -1 for keyword arguments.
+        int arg_index;
+
+        /// Name of the keyword argument the leaf belongs to.
+        nb::object kwarg_name;
+
+        /// Keys leading from the argument value to the leaf value.
+        std::vector<nb::object> path;
+
+        /// Shape of the leaf if it isn't read from the value.
+        Shape shape;
+
+        /// Pairs of (value dimension, call dimension), excluding sub-element dimensions.
+        std::vector<std::pair<int, int>> dims;
+    };
+
+    void compile_shape_slots(int call_dimensionality);
+    void add_shape_slots(
+        NativeBoundVariableRuntime* variable,
+        int arg_index,
+        nb::object kwarg_name,
+        std::vector<nb::object>& path,
+        int call_dimensionality
+    );
+
     std::vector<ref<NativeBoundVariableRuntime>> m_args;
     std::map<std::string, ref<NativeBoundVariableRuntime>> m_kwargs;
+    std::vector<ShapeSlot> m_shape_slots;
+    int m_shape_slots_dimensionality{-1};
+};
+
+/// Ring buffer of timed events recorded while making calls, used to find where time is spent
+/// within a call. CPU times are in nanoseconds on the Timer clock. Device execution times are
+/// measured with timestamp queries, and recorded as starting when the call was submitted.
+class NativeCallProfiler : public Object {
+public:
+    struct Event {
+        std::string name;
+        std::string phase;
+        Timer::TimePoint start;
+        Timer::TimePoint end;
+        uint64_t thread_id;
+        bool gpu;
+    };
+
+    /// Default maximum number of events retained.
+    static constexpr size_t DEFAULT_CAPACITY = 16384;
+
+    NativeCallProfiler(size_t capacity = DEFAULT_CAPACITY)
+        : m_capacity(capacity)
+    {
+    }
+
+    /// Maximum number of events retained. Once full, the oldest events are dropped.
+    size_t capacity() const { return m_capacity; }
+    void set_capacity(size_t capacity);
+
+    /// Number of events currently held.
+    size_t size() const { return m_events.size(); }
+
+    /// Number of events dropped since the last clear due to exceeding capacity.
+    uint64_t dropped() const { return m_dropped; }
+
+    /// Whether device execution of calls is timed with timestamp queries.
+    bool gpu_timing() const { return m_gpu_timing; }
+    void set_gpu_timing(bool gpu_timing) { m_gpu_timing = gpu_timing; }
+
+    /// Record an event.
+    void record(std::string name, std::string phase, Timer::TimePoint start, Timer::TimePoint end, bool gpu = false);
+
+    /// Get all events, oldest first.
+    std::vector<Event> events() const { return {m_events.begin(), m_events.end()}; }
+
+    /// Remove all events.
+    void clear();
+
+    /// Get the query pool used to time device execution, or null if gpu timing is disabled
+    /// or not supported by the device.
+    QueryPool* timestamp_query_pool(Device* device);
+
+private:
+    std::deque<Event> m_events;
+    size_t m_capacity;
+    uint64_t m_dropped{0};
+    bool m_gpu_timing{false};
+    ref<QueryPool> m_query_pool;
 };
 
 class NativeCallRuntimeOptions : Object {
@@ -558,9 +709,16 @@ public:
     /// Set this
     void set_this(const nb::object& this_) { m_this = this_; }
 
+    /// Get the profiler to record call timings to, if any.
+    NativeCallProfiler* get_profiler() const { return m_profiler; }
+
+    /// Set the profiler to record call timings to.
+    void set_profiler(NativeCallProfiler* profiler) { m_profiler = profiler; }
+
 private:
     nb::list m_uniforms;
     nb::object m_this{nb::none()};
+    ref<NativeCallProfiler> m_profiler;
 };
 
 /// Defines the common logging functions for a given log level.
@@ -578,6 +736,9 @@ private:
         log(level, fmt::format(fmt, std::forward<Args>(args)...), LogFrequency::always);                               \
     }
 
+class NativeCallGraphNode;
+class NativeCallFuture;
+
 /// Contains the compute kernel for a call, the corresponding bindings and any additional
 /// options provided by the user.
 class NativeCallData : Object {
@@ -636,6 +797,39 @@ public:
     nb::object
     append_to(ref<NativeCallRuntimeOptions> opts, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
 
+    /// Call the compute kernel with the provided arguments and keyword arguments, without waiting for
+    /// it to finish. The returned future tracks completion with a fence, and reads back results on request.
+    ref<NativeCallFuture> call_async(ref<NativeCallRuntimeOptions> opts, nb::args args, nb::kwargs kwargs);
+
+    /// State of a call that has been recorded to a command encoder but not yet completed.
+    struct PendingCall {
+        ref<CallContext> context;
+        nb::args args;
+        nb::kwargs kwargs;
+        nb::list unpacked_args;
+        nb::dict unpacked_kwargs;
+        nb::list read_back;
+    };
+
+    /// Record the compute kernel to a command encoder, optionally allocating the return value. The
+    /// returned pending call must be completed by calling complete once the encoder has been submitted.
+    /// If a transient pool is provided, the caller must retire it with the id of the submission.
+    PendingCall dispatch(
+        ref<NativeCallRuntimeOptions> opts,
+        CommandEncoder* command_encoder,
+        nb::args args,
+        nb::kwargs kwargs,
+        bool allocate_result,
+        TransientBufferPool* transient_pool = nullptr
+    );
+
+    /// Complete a dispatched call, reading back call data and returning the result (if any).
+    nb::object complete(PendingCall& pending);
+
+    /// Record the call to a node that can be replayed repeatedly as part of a call graph. Arguments
+    /// are written once to a persistent shader object, and the return value is allocated once.
+    ref<NativeCallGraphNode> record(ref<NativeCallRuntimeOptions> opts, nb::args args, nb::kwargs kwargs);
+
     /// Log a message, using either the provided logger or the default logger.
     void log(LogLevel level, const std::string_view msg, LogFrequency frequency = LogFrequency::always)
     {
@@ -673,12 +867,102 @@ private:
     Shape m_last_call_shape;
     std::string m_debug_name;
     ref<Logger> m_logger;
+    ref<Fence> m_fence;
 
     nb::object
     exec(ref<NativeCallRuntimeOptions> opts, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
+
+    PendingCall
+    prepare(nb::args args, nb::kwargs kwargs, bool allocate_result, TransientBufferPool* transient_pool = nullptr);
+
+    uint3 calculate_thread_count(const Shape& call_shape) const;
+
+    void write_call_data(ref<NativeCallRuntimeOptions> opts, PendingCall& pending, ShaderCursor cursor);
 };
 #undef SGL_LOG_FUNC_FAMILY
 
+/// A call recorded by NativeCallData::record, with its arguments pre-written to a root shader object.
+class NativeCallGraphNode : public Object {
+public:
+    ref<NativeCallData> call_data;
+    ref<ShaderObject> root_object;
+    uint3 thread_count;
+    NativeCallData::PendingCall pending;
+};
+
+/// A call that has been submitted by NativeCallData::call_async, but whose results have not been read back.
+class NativeCallFuture : public Object {
+public:
+    NativeCallFuture(
+        ref<NativeCallData> call_data,
+        NativeCallData::PendingCall pending,
+        ref<Fence> fence,
+        uint64_t fence_value
+    )
+        : m_call_data(std::move(call_data))
+        , m_pending(std::move(pending))
+        , m_fence(std::move(fence))
+        , m_fence_value(fence_value)
+    {
+    }
+
+    /// Fence that is signaled when the call has finished executing.
+    Fence* fence() const { return m_fence; }
+
+    /// Value the fence is signaled with when the call has finished executing.
+    uint64_t fence_value() const { return m_fence_value; }
+
+    /// Check if the call has finished executing on the device.
+    bool done() const;
+
+    /// Block until the call has finished executing on the device.
+    void wait() const;
+
+    /// Wait for the call to finish, then read back and return its result. Results are
+    /// only read back once, and subsequent calls return the same result.
+    nb::object result();
+
+private:
+    ref<NativeCallData> m_call_data;
+    NativeCallData::PendingCall m_pending;
+    ref<Fence> m_fence;
+    uint64_t m_fence_value;
+    bool m_completed{false};
+    nb::object m_result;
+};
+
+/// Sequence of recorded calls that can be dispatched repeatedly without re-resolving call data
+/// or re-writing arguments.
+class NativeCallGraph : public Object {
+public:
+    /// Number of nodes in the graph.
+    size_t size() const { return m_nodes.size(); }
+
+    /// Append a node to the graph, returning its index.
+    size_t add_node(ref<NativeCallGraphNode> node)
+    {
+        m_nodes.push_back(std::move(node));
+        return m_nodes.size() - 1;
+    }
+
+    /// Replace the node at a given index.
+    void set_node(size_t index, ref<NativeCallGraphNode> node);
+
+    /// Get the node at a given index.
+    ref<NativeCallGraphNode> get_node(size_t index) const;
+
+    /// Remove all nodes from the graph.
+    void clear() { m_nodes.clear(); }
+
+    /// Dispatch all nodes. If a command encoder is provided, the dispatches are appended to it and
+    /// None is returned. Otherwise they are submitted immediately, and the result of each node is
+    /// returned in a list.
+    nb::object replay(CommandEncoder* command_encoder);
+
+private:
+    std::vector<ref<NativeCallGraphNode>> m_nodes;
+};
+
 typedef std::function<bool(const ref<SignatureBuilder>& builder, nb::handle)> BuildSignatureFunc;
 
 /// Native side of system for caching call data info for given function signatures.
@@ -690,20 +974,86 @@ public:
 
     void get_args_signature(const ref<SignatureBuilder> builder, nb::args args, nb::kwargs kwargs);
 
+    /// Find call data for a given signature, marking it as most recently used.
     ref<NativeCallData> find_call_data(const std::string& signature)
     {
         auto it = m_cache.find(signature);
         if (it != m_cache.end()) {
-            return it->second;
+            m_lru.splice(m_lru.begin(), m_lru, it->second.lru_it);
+            m_hits++;
+            return it->second.call_data;
         }
+        m_misses++;
         return nullptr;
     }
 
+    /// Find call data for a given signature without counting the lookup or
+    /// marking the entry as used.
+    ref<NativeCallData> peek_call_data(const std::string& signature) const
+    {
+        auto it = m_cache.find(signature);
+        return it != m_cache.end() ? it->second.call_data : nullptr;
+    }
+
+    /// Add call data for a given signature, evicting the least recently used
+    /// entries if the cache is over capacity.
     void add_call_data(const std::string& signature, const ref<NativeCallData>& call_data)
     {
-        m_cache[signature] = call_data;
+        auto it = m_cache.find(signature);
+        if (it != m_cache.end()) {
+            it->second.call_data = call_data;
+            m_lru.splice(m_lru.begin(), m_lru, it->second.lru_it);
+            return;
+        }
+        auto new_it = m_cache.emplace(signature, Entry{call_data, {}}).first;
+        m_lru.push_front(&new_it->first);
+        new_it->second.lru_it = m_lru.begin();
+        evict();
+    }
+
+    /// Get the maximum number of entries, or 0 if unbounded.
+    size_t capacity() const { return m_capacity; }
+
+    /// Set the maximum number of entries, or 0 if unbounded.
+    void set_capacity(size_t capacity)
+    {
+        m_capacity = capacity;
+        evict();
+    }
+
+    /// Number of entries in the cache.
+    size_t size() const { return m_cache.size(); }
+
+    /// Number of lookups that found an entry.
+    uint64_t hits() const { return m_hits; }
+
+    /// Number of lookups that failed to find an entry.
+    uint64_t misses() const { return m_misses; }
+
+    /// Number of entries evicted due to exceeding capacity.
+    uint64_t evictions() const { return m_evictions; }
+
+    /// Remove all entries from the cache.
+    void clear()
+    {
+        m_cache.clear();
+        m_lru.clear();
+    }
+
+    /// Reset hit/miss/eviction counters.
+    void reset_stats()
+    {
+        m_hits = 0;
+        m_misses = 0;
+        m_evictions = 0;
     }
 
+    /// Get the profiler that calls made through this cache record timings to, if any.
+    NativeCallProfiler* profiler() const { return m_profiler; }
+
+    /// Set the profiler that calls made through this cache record timings to.
+    void set_profiler(NativeCallProfiler* profiler) { m_profiler = profiler; }
+
     virtual std::optional<std::string> lookup_value_signature(nb::handle o)
     {
         SGL_UNUSED(o);
@@ -711,8 +1061,54 @@ public:
     }
 
 private:
-    std::unordered_map<std::string, ref<NativeCallData>> m_cache;
+    struct Entry {
+        ref<NativeCallData> call_data;
+        std::list<const std::string*>::iterator lru_it;
+    };
+
+    /// Per Python type information used when building value signatures.
+    struct TypeSignatureInfo {
+        /// Weak reference to the type, whose callback removes the entry when the type is
+        /// destroyed, before its address can be reused by another type.
+        nb::weakref type;
+        /// Token for the type name.
+        uint64_t name_token;
+        /// True if the type is a nanobind bound type.
+        bool is_bound_type;
+        /// Signature function from the type signature table, if any.
+        const BuildSignatureFunc* build_signature;
+        /// False if neither the type nor its instances can provide get_this.
+        bool has_get_this;
+        /// False if neither the type nor its instances can provide slangpy_signature.
+        bool has_slangpy_signature;
+    };
+
+    const TypeSignatureInfo& get_type_signature_info(nb::handle type);
+
+    void evict()
+    {
+        if (m_capacity == 0)
+            return;
+        while (m_cache.size() > m_capacity) {
+            auto victim = m_cache.find(*m_lru.back());
+            m_lru.pop_back();
+            m_cache.erase(victim);
+            m_evictions++;
+        }
+    }
+
+    std::unordered_map<std::string, Entry> m_cache;
+    /// Keys of m_cache, most recently used first. Pointers remain valid as
+    /// unordered_map never moves its elements.
+    std::list<const std::string*> m_lru;
+    size_t m_capacity{0};
+    uint64_t m_hits{0};
+    uint64_t m_misses{0};
+    uint64_t m_evictions{0};
+    ref<NativeCallProfiler> m_profiler;
     std::unordered_map<std::type_index, BuildSignatureFunc> m_type_signature_table;
+    /// Per type information by type. Entries don't keep types alive.
+    std::unordered_map<PyObject*, TypeSignatureInfo> m_type_signature_info;
 };
 
 class PyNativeCallDataCache : public NativeCallDataCache {
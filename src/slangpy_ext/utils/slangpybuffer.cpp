@@ -1,6 +1,8 @@
 // SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+#include <cstring>
 #include <initializer_list>
+#include <limits>
 #include "nanobind.h"
 
 #include "sgl/device/device.h"
@@ -114,7 +116,8 @@ nb::object NativeNDBufferMarshall::create_output(CallContext* context, NativeBou
     return nb::cast(buffer);
 }
 
-ref<NativeNDBuffer> NativeNDBufferMarshall::create_buffer(Device* device, const Shape& shape) const
+ref<NativeNDBuffer>
+NativeNDBufferMarshall::create_buffer(Device* device, const Shape& shape, CallContext* transient_context) const
 {
     NativeNDBufferDesc desc;
     desc.dtype = m_slang_element_type;
@@ -124,7 +127,12 @@ ref<NativeNDBuffer> NativeNDBufferMarshall::create_buffer(Device* device, const
     desc.strides = desc.shape.calc_contiguous_strides();
     desc.usage = BufferUsage::shader_resource | BufferUsage::unordered_access;
     desc.memory_type = MemoryType::device_local;
-    return make_ref<NativeNDBuffer>(device, desc);
+
+    // Buffers that only live for the duration of a call are allocated from its transient pool.
+    ref<Buffer> storage;
+    if (transient_context && transient_context->transient_pool())
+        storage = transient_context->transient_pool()->acquire(shape.element_count() * m_element_layout->stride());
+    return make_ref<NativeNDBuffer>(device, desc, storage);
 }
 
 nb::object NativeNDBufferMarshall::create_dispatchdata(nb::object data) const
@@ -149,6 +157,27 @@ NativeNDBufferMarshall::read_output(CallContext* context, NativeBoundVariableRun
     return data;
 }
 
+/// Get the strides of a numpy array in elements, and the number of elements its memory spans
+/// from the first to the last element. Returns false if the array can't be described by a
+/// buffer layout (negative strides, or no elements), or if its memory is mostly gaps, such as a
+/// column of a large matrix, which are cheaper to repack than to upload and read back.
+static bool get_numpy_layout(const nb::ndarray<nb::numpy>& ndarray, std::vector<int>& strides, size_t& span)
+{
+    span = 1;
+    for (size_t i = 0; i < ndarray.ndim(); i++) {
+        int64_t stride = ndarray.stride(i);
+        if (stride < 0 || ndarray.shape(i) == 0)
+            return false;
+        span += (ndarray.shape(i) - 1) * size_t(stride);
+    }
+    if (span > 2 * ndarray.size() || span > size_t(std::numeric_limits<int>::max()))
+        return false;
+    strides.resize(ndarray.ndim());
+    for (size_t i = 0; i < ndarray.ndim(); i++)
+        strides[i] = int(ndarray.stride(i));
+    return true;
+}
+
 Shape NativeNumpyMarshall::get_shape(nb::object data) const
 {
     auto ndarray = nb::cast<nb::ndarray<nb::numpy>>(data);
@@ -190,13 +219,38 @@ void NativeNumpyMarshall::write_shader_cursor_pre_dispatch(
     }
 
     Shape shape(shape_vec);
+    AccessType access = binding->get_access().first;
+
+    // The array's strides are passed through the buffer layout, so its memory is copied to a
+    // transient buffer as-is, including any gaps, rather than repacked. Arrays whose layout
+    // can't be described that way, or that are mostly gaps, fall back to a contiguous copy.
+    std::vector<int> strides_vec;
+    size_t span;
+    ref<NativeNDBuffer> buffer;
+    if (get_numpy_layout(ndarray, strides_vec, span)) {
+        SGL_CHECK(
+            ndarray.itemsize() == element_stride(),
+            "numpy array item size does not match the element size ({} != {})",
+            ndarray.itemsize(),
+            element_stride()
+        );
+        buffer = create_buffer(context->device(), Shape({int(span)}), context);
+        buffer = buffer->view(shape, Shape(strides_vec), 0);
+
+        // Arrays that are only written by the kernel don't need uploading. Only their own
+        // elements are written back, so any gaps are left untouched.
+        if (access != AccessType::write)
+            buffer->storage()->set_data(ndarray.data(), span * ndarray.itemsize());
+    } else {
+        auto contiguous = nb::module_::import_("numpy").attr("ascontiguousarray")(value);
+        buffer = create_buffer(context->device(), shape, context);
+        buffer_copy_from_numpy(buffer->storage().get(), nb::cast<nb::ndarray<nb::numpy>>(contiguous));
+    }
 
-    SGL_UNUSED(binding);
-    auto buffer = create_buffer(context->device(), shape);
-    buffer_copy_from_numpy(buffer->storage().get(), ndarray);
-
+    // Only read the array back if the kernel writes to it.
     auto buffer_obj = nb::cast(buffer);
-    store_readback(binding, read_back, value, buffer_obj);
+    if (access == AccessType::write || access == AccessType::readwrite)
+        store_readback(binding, read_back, value, buffer_obj);
 
     NativeNDBufferMarshall::write_shader_cursor_pre_dispatch(context, binding, cursor, buffer_obj, read_back);
 }
@@ -214,16 +268,48 @@ void NativeNumpyMarshall::read_calldata(
     auto ndarray = nb::cast<nb::ndarray<nb::numpy>>(data);
     auto buffer = nb::cast<NativeNDBuffer*>(result);
 
-    size_t numpy_data_size = ndarray.nbytes();
-    size_t buffer_data_size = buffer->storage()->size();
+    // Buffers that share the array's layout are read back into its memory. Packed arrays are
+    // read directly. Arrays with gaps are read into a temporary, from which only the array's
+    // own elements are scattered, as the gaps may belong to other views of the same memory.
+    std::vector<int> strides_vec;
+    size_t span;
+    if (get_numpy_layout(ndarray, strides_vec, span) && buffer->strides().as_vector() == strides_vec) {
+        size_t itemsize = ndarray.itemsize();
+        size_t element_count = ndarray.size();
+        if (span == element_count) {
+            buffer->storage()->get_data(ndarray.data(), span * itemsize);
+            return;
+        }
+
+        std::vector<uint8_t> temp(span * itemsize);
+        buffer->storage()->get_data(temp.data(), temp.size());
+        uint8_t* dst = reinterpret_cast<uint8_t*>(ndarray.data());
+        std::vector<size_t> index(ndarray.ndim(), 0);
+        for (size_t n = 0; n < element_count; n++) {
+            size_t offset = 0;
+            for (size_t i = 0; i < index.size(); i++)
+                offset += index[i] * strides_vec[i];
+            std::memcpy(dst + offset * itemsize, temp.data() + offset * itemsize, itemsize);
+            for (size_t i = index.size(); i-- > 0;) {
+                if (++index[i] < ndarray.shape(i))
+                    break;
+                index[i] = 0;
+            }
+        }
+        return;
+    }
+
+    // Otherwise the buffer holds a contiguous copy, which is read back then assigned to the array.
+    size_t buffer_data_size = buffer->shape().element_count() * buffer->element_stride();
     SGL_CHECK(
-        numpy_data_size == buffer_data_size,
+        ndarray.nbytes() == buffer_data_size,
         "numpy array size does not match the buffer ({} > {})",
-        numpy_data_size,
+        ndarray.nbytes(),
         buffer_data_size
     );
-
-    buffer->storage()->get_data(ndarray.data(), buffer_data_size);
+    auto contiguous = nb::module_::import_("numpy").attr("empty_like")(data, "order"_a = "C");
+    buffer->storage()->get_data(nb::cast<nb::ndarray<nb::numpy>>(contiguous).data(), buffer_data_size);
+    data[nb::ellipsis()] = contiguous;
 }
 
 nb::object NativeNumpyMarshall::create_output(CallContext* context, NativeBoundVariableRuntime* binding) const
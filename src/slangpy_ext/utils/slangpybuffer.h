@@ -82,7 +82,10 @@ public:
     nb::object read_output(CallContext* context, NativeBoundVariableRuntime* binding, nb::object data) const override;
 
 protected:
-    ref<NativeNDBuffer> create_buffer(Device* device, const Shape& shape) const;
+    /// Create a buffer to hold data of the given shape. If a call context is provided, the
+    /// buffer is transient and its storage is taken from the context's transient pool.
+    ref<NativeNDBuffer>
+    create_buffer(Device* device, const Shape& shape, CallContext* transient_context = nullptr) const;
 
 private:
     int m_dims;
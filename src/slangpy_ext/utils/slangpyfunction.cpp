@@ -13,6 +13,44 @@ namespace sgl {
 
 namespace sgl::slangpy {
 
+ref<NativeCallData> NativeFunctionNode::find_or_build_call_data(
+    NativeCallDataCache* cache,
+    nb::args args,
+    nb::kwargs kwargs,
+    SignatureBuilder* builder
+)
+{
+    NativeCallProfiler* profiler = cache->profiler();
+    Timer::TimePoint signature_start = profiler ? Timer::now() : 0;
+
+    ref<SignatureBuilder> temp_builder;
+    if (!builder) {
+        temp_builder = make_ref<SignatureBuilder>();
+        builder = temp_builder;
+    }
+    builder->clear();
+    read_signature(builder);
+    cache->get_args_signature(builder, args, kwargs);
+    std::string sig = builder->str();
+
+    Timer::TimePoint lookup_start = profiler ? Timer::now() : 0;
+    ref<NativeCallData> call_data = cache->find_call_data(sig);
+    Timer::TimePoint lookup_end = profiler ? Timer::now() : 0;
+
+    if (!call_data) {
+        call_data = generate_call_data(args, kwargs);
+        cache->add_call_data(sig, call_data);
+        if (profiler)
+            profiler->record(call_data->get_debug_name(), "build", lookup_end, Timer::now());
+    }
+
+    if (profiler) {
+        profiler->record(call_data->get_debug_name(), "signature", signature_start, lookup_start);
+        profiler->record(call_data->get_debug_name(), "lookup", lookup_start, lookup_end);
+    }
+    return call_data;
+}
+
 ref<NativeCallData> NativeFunctionNode::build_call_data(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
 {
     auto options = make_ref<NativeCallRuntimeOptions>();
@@ -23,43 +61,22 @@ ref<NativeCallData> NativeFunctionNode::build_call_data(NativeCallDataCache* cac
         args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
 
-    auto builder = make_ref<SignatureBuilder>();
-    read_signature(builder);
-    cache->get_args_signature(builder, args, kwargs);
-
-    std::string sig = builder->str();
-    ref<NativeCallData> result = cache->find_call_data(sig);
-    if (!result) {
-        result = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, result);
-    }
-    return result;
+    return find_or_build_call_data(cache, args, kwargs);
 }
 
 nb::object NativeFunctionNode::call(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
 {
     auto options = make_ref<NativeCallRuntimeOptions>();
     gather_runtime_options(options);
+    options->set_profiler(cache->profiler());
 
     nb::tuple full_args;
     if (!options->get_this().is_none()) {
         args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
 
-    auto builder = make_ref<SignatureBuilder>();
-    read_signature(builder);
-    cache->get_args_signature(builder, args, kwargs);
-
-    std::string sig = builder->str();
-    ref<NativeCallData> call_data = cache->find_call_data(sig);
-
-    if (call_data) {
-        return call_data->call(options, args, kwargs);
-    } else {
-        ref<NativeCallData> new_call_data = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, new_call_data);
-        return new_call_data->call(options, args, kwargs);
-    }
+    ref<NativeCallData> call_data = find_or_build_call_data(cache, args, kwargs);
+    return call_data->call(options, args, kwargs);
 }
 
 void NativeFunctionNode::append_to(
@@ -71,27 +88,94 @@ void NativeFunctionNode::append_to(
 {
     auto options = make_ref<NativeCallRuntimeOptions>();
     gather_runtime_options(options);
+    options->set_profiler(cache->profiler());
 
     nb::tuple full_args;
     if (!options->get_this().is_none()) {
         args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
     }
 
+    ref<NativeCallData> call_data = find_or_build_call_data(cache, args, kwargs);
+    call_data->append_to(options, command_encoder, args, kwargs);
+}
+
+ref<NativeCallFuture> NativeFunctionNode::call_async(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+{
+    auto options = make_ref<NativeCallRuntimeOptions>();
+    gather_runtime_options(options);
+    options->set_profiler(cache->profiler());
+
+    if (!options->get_this().is_none()) {
+        args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
+    }
+
+    ref<NativeCallData> call_data = find_or_build_call_data(cache, args, kwargs);
+    return call_data->call_async(options, args, kwargs);
+}
+
+ref<NativeCallGraphNode> NativeFunctionNode::record(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs)
+{
+    auto options = make_ref<NativeCallRuntimeOptions>();
+    gather_runtime_options(options);
+    options->set_profiler(cache->profiler());
+
+    if (!options->get_this().is_none()) {
+        args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
+    }
+
+    ref<NativeCallData> call_data = find_or_build_call_data(cache, args, kwargs);
+    return call_data->record(options, args, kwargs);
+}
+
+nb::list NativeFunctionNode::call_batch(NativeCallDataCache* cache, nb::list calls)
+{
+    auto options = make_ref<NativeCallRuntimeOptions>();
+    gather_runtime_options(options);
+    options->set_profiler(cache->profiler());
+
+    ref<Device> device;
+    ref<CommandEncoder> command_encoder;
+    TransientBufferPool* transient_pool = nullptr;
+    std::vector<std::pair<ref<NativeCallData>, NativeCallData::PendingCall>> pending;
+    pending.reserve(calls.size());
+
+    // Record all calls to a single command encoder, reusing one signature builder.
     auto builder = make_ref<SignatureBuilder>();
-    read_signature(builder);
-    cache->get_args_signature(builder, args, kwargs);
+    for (auto call : calls) {
+        auto call_tuple = nb::cast<nb::tuple>(call);
+        if (call_tuple.size() != 2)
+            throw nb::value_error("Each batched call must be a tuple of (args, kwargs).");
+        nb::args args = nb::cast<nb::args>(call_tuple[0]);
+        nb::kwargs kwargs = nb::cast<nb::kwargs>(call_tuple[1]);
 
+        if (!options->get_this().is_none()) {
+            args = nb::cast<nb::args>(nb::make_tuple(options->get_this()) + args);
+        }
 
-    std::string sig = builder->str();
-    NativeCallData* call_data = cache->find_call_data(sig);
-
-    if (call_data) {
-        call_data->append_to(options, command_encoder, args, kwargs);
-    } else {
-        ref<NativeCallData> new_call_data = generate_call_data(args, kwargs);
-        cache->add_call_data(sig, new_call_data);
-        new_call_data->append_to(options, command_encoder, args, kwargs);
+        ref<NativeCallData> call_data = find_or_build_call_data(cache, args, kwargs, builder);
+
+        if (!command_encoder) {
+            device = call_data->get_device();
+            command_encoder = device->create_command_encoder();
+            transient_pool = TransientBufferPool::get(device);
+        }
+        pending.emplace_back(
+            call_data,
+            call_data->dispatch(options, command_encoder, args, kwargs, true, transient_pool)
+        );
+    }
+
+    // Submit all dispatches at once.
+    if (command_encoder) {
+        uint64_t submit_id = device->submit_command_buffer(command_encoder->finish());
+        transient_pool->retire(submit_id);
     }
+
+    // Read back results once the dispatches have been submitted.
+    nb::list results;
+    for (auto& [cd, pending_call] : pending)
+        results.append(cd->complete(pending_call));
+    return results;
 }
 
 } // namespace sgl::slangpy
@@ -139,6 +223,29 @@ SGL_PY_EXPORT(utils_slangpy_function)
             "kwargs"_a,
             D_NA(NativeFunctionNode, append_to)
         )
+        .def(
+            "_native_call_batch",
+            &NativeFunctionNode::call_batch,
+            "cache"_a,
+            "calls"_a,
+            D_NA(NativeFunctionNode, call_batch)
+        )
+        .def(
+            "_native_call_async",
+            &NativeFunctionNode::call_async,
+            "cache"_a,
+            "args"_a,
+            "kwargs"_a,
+            D_NA(NativeFunctionNode, call_async)
+        )
+        .def(
+            "_native_record",
+            &NativeFunctionNode::record,
+            "cache"_a,
+            "args"_a,
+            "kwargs"_a,
+            D_NA(NativeFunctionNode, record)
+        )
         .def(
             "generate_call_data",
             &NativeFunctionNode::generate_call_data,
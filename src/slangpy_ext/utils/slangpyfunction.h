@@ -96,6 +96,16 @@ public:
 
     void append_to(NativeCallDataCache* cache, CommandEncoder* command_encoder, nb::args args, nb::kwargs kwargs);
 
+    /// Call the function once for each (args, kwargs) tuple in a list, recording all dispatches
+    /// to a single command encoder that is submitted once. Returns a list of results.
+    nb::list call_batch(NativeCallDataCache* cache, nb::list calls);
+
+    /// Call the function without waiting for it to finish, returning a future for the result.
+    ref<NativeCallFuture> call_async(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
+
+    /// Record a call to a node that can be replayed as part of a call graph.
+    ref<NativeCallGraphNode> record(NativeCallDataCache* cache, nb::args args, nb::kwargs kwargs);
+
     virtual ref<NativeCallData> generate_call_data(nb::args args, nb::kwargs kwargs)
     {
         SGL_UNUSED(args);
@@ -104,6 +114,15 @@ public:
     }
 
 private:
+    /// Build the signature of a call, and find its call data in the cache, generating and
+    /// adding it on a miss. A builder can be passed in to be reused across calls.
+    ref<NativeCallData> find_or_build_call_data(
+        NativeCallDataCache* cache,
+        nb::args args,
+        nb::kwargs kwargs,
+        SignatureBuilder* builder = nullptr
+    );
+
     ref<NativeFunctionNode> m_parent;
     FunctionNodeType m_type;
     nb::object m_data;
@@ -1,8 +1,15 @@
 // SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
 
+#include <algorithm>
+#include <cstring>
+#include <future>
 #include <initializer_list>
 #include "nanobind.h"
 
+#include "sgl/core/file_stream.h"
+#include "sgl/core/memory_mapped_file.h"
+#include "sgl/core/thread.h"
+
 #include "sgl/device/device.h"
 #include "sgl/device/command.h"
 #include "sgl/device/buffer_cursor.h"
@@ -11,6 +18,10 @@
 
 namespace sgl::slangpy {
 
+/// Size of the chunks that file data is transferred to and from the device in, which bounds
+/// the size of the staging memory needed.
+static constexpr size_t FILE_CHUNK_SIZE = 64 * 1024 * 1024;
+
 inline std::optional<nb::dlpack::dtype> scalartype_to_dtype(TypeReflection::ScalarType scalar_type)
 {
     switch (scalar_type) {
@@ -371,6 +382,18 @@ nb::ndarray<nb::numpy> StridedBufferView::to_numpy() const
     return to_ndarray<nb::numpy>(data, owner, desc());
 }
 
+ref<NumpyFuture> StridedBufferView::to_numpy_async() const
+{
+    size_t dtype_size = desc().element_layout->stride();
+    size_t byte_offset = desc().offset * dtype_size;
+    size_t data_size = m_storage->size() - byte_offset;
+    ref<BufferReadback> readback = device()->read_buffer_data_async(m_storage, data_size, byte_offset);
+    return make_ref<NumpyFuture>(
+        std::move(readback),
+        [desc = desc()](void* data, nb::handle owner) { return to_ndarray<nb::numpy>(data, owner, desc); }
+    );
+}
+
 nb::ndarray<nb::pytorch> StridedBufferView::to_torch() const
 {
     // Map cuda memory and pass to nanobind ndarray
@@ -402,6 +425,196 @@ void StridedBufferView::copy_from_numpy(nb::ndarray<nb::numpy> data)
     m_storage->set_data(data.data(), data_size, byte_offset);
 }
 
+void StridedBufferView::copy_from_file(const std::filesystem::path& path, size_t file_offset)
+{
+    SGL_CHECK(is_contiguous(), "Destination buffer view must be contiguous");
+
+    MemoryMappedFile file(path, MemoryMappedFile::WHOLE_FILE, MemoryMappedFile::AccessHint::sequential);
+    SGL_CHECK(file.is_open(), "Failed to open file \"{}\"", path);
+
+    size_t dtype_size = desc().element_layout->stride();
+    size_t byte_offset = desc().offset * dtype_size;
+    size_t data_size = element_count() * dtype_size;
+    SGL_CHECK(
+        file_offset + data_size <= file.size(),
+        "File \"{}\" is too small to fill the buffer ({} > {})",
+        path,
+        file_offset + data_size,
+        file.size()
+    );
+
+    // Pages are only read from disk as each chunk is copied, so the file is never fully
+    // resident in memory. The GIL is only released while reading the file, as device
+    // submission is not thread safe against other Python threads using the device.
+    const uint8_t* data = reinterpret_cast<const uint8_t*>(file.data()) + file_offset;
+    std::vector<uint8_t> chunk(std::min(FILE_CHUNK_SIZE, data_size));
+    for (size_t offset = 0; offset < data_size; offset += FILE_CHUNK_SIZE) {
+        size_t size = std::min(FILE_CHUNK_SIZE, data_size - offset);
+        {
+            nb::gil_scoped_release release;
+            std::memcpy(chunk.data(), data + offset, size);
+        }
+        m_storage->set_data(chunk.data(), size, byte_offset + offset);
+    }
+}
+
+void StridedBufferView::append_to_file(const std::filesystem::path& path) const
+{
+    SGL_CHECK(is_contiguous(), "Source buffer view must be contiguous");
+
+    FileStream file(path, FileStream::Mode::read_write);
+    file.seek(file.size());
+
+    size_t dtype_size = desc().element_layout->stride();
+    size_t byte_offset = desc().offset * dtype_size;
+    size_t data_size = element_count() * dtype_size;
+
+    // The GIL is only released while writing the file, as device submission is not thread
+    // safe against other Python threads using the device.
+    std::vector<uint8_t> chunk(std::min(FILE_CHUNK_SIZE, data_size));
+    for (size_t offset = 0; offset < data_size; offset += FILE_CHUNK_SIZE) {
+        size_t size = std::min(FILE_CHUNK_SIZE, data_size - offset);
+        m_storage->get_data(chunk.data(), size, byte_offset + offset);
+        nb::gil_scoped_release release;
+        file.write(chunk.data(), size);
+    }
+}
+
+/// Convert an image to float pixels and write it to (write-combined) staging memory, applying
+/// the optional flip and scale/offset while copying so the staging memory is only written once.
+static void write_staging_image(
+    const Bitmap* image,
+    uint8_t* dst,
+    Bitmap::PixelFormat pixel_format,
+    uint32_t width,
+    uint32_t height,
+    bool flip_y,
+    bool linearize,
+    float scale,
+    float offset
+)
+{
+    SGL_CHECK(
+        image->width() == width && image->height() == height,
+        "Image dimensions do not match the buffer ({}x{} != {}x{})",
+        image->width(),
+        image->height(),
+        width,
+        height
+    );
+
+    // Convert straight into the staging memory, with flip and transform fused into the conversion.
+    ref<Bitmap> target = make_ref<Bitmap>(pixel_format, Bitmap::ComponentType::float32, width, height, 0, {}, dst);
+    target->set_srgb_gamma(linearize ? false : image->srgb_gamma());
+    image->convert(target, flip_y, scale, offset);
+}
+
+void StridedBufferView::copy_from_images(
+    const std::vector<std::variant<ref<Bitmap>, std::filesystem::path>>& images,
+    bool flip_y,
+    bool linearize,
+    float scale,
+    float offset
+)
+{
+    SGL_CHECK(is_contiguous(), "Destination buffer view must be contiguous");
+    SGL_CHECK(dims() == 3, "Destination buffer view must have shape [N, H, W], got {}", shape().to_string());
+
+    const std::vector<int>& shape_vec = shape().as_vector();
+    SGL_CHECK(
+        size_t(shape_vec[0]) == images.size(),
+        "Number of images does not match the buffer ({} != {})",
+        images.size(),
+        shape_vec[0]
+    );
+
+    static const Bitmap::PixelFormat pixel_formats[] = {
+        Bitmap::PixelFormat::r,
+        Bitmap::PixelFormat::rg,
+        Bitmap::PixelFormat::rgb,
+        Bitmap::PixelFormat::rgba,
+    };
+    size_t dtype_size = element_stride();
+    size_t channel_count = dtype_size / sizeof(float);
+    SGL_CHECK(
+        dtype_size % sizeof(float) == 0 && channel_count >= 1 && channel_count <= 4,
+        "Destination buffer elements must be 1 to 4 floats"
+    );
+    Bitmap::PixelFormat pixel_format = pixel_formats[channel_count - 1];
+
+    uint32_t height = narrow_cast<uint32_t>(shape_vec[1]);
+    uint32_t width = narrow_cast<uint32_t>(shape_vec[2]);
+    size_t image_size = size_t(width) * height * dtype_size;
+    size_t data_size = image_size * images.size();
+    if (data_size == 0)
+        return;
+
+    // Take raw pointers to the bitmaps that are already loaded, as their reference counts
+    // can't be touched from worker threads without the GIL.
+    std::vector<const Bitmap*> bitmaps(images.size());
+    for (size_t i = 0; i < images.size(); ++i) {
+        if (auto bitmap = std::get_if<ref<Bitmap>>(&images[i]))
+            bitmaps[i] = bitmap->get();
+    }
+
+    // Images are decoded and converted on the thread pool straight into slices of one
+    // host visible staging buffer, which is then copied to the device in a single command.
+    ref<Buffer> staging = device()->create_buffer({
+        .size = data_size,
+        .memory_type = MemoryType::upload,
+        .usage = BufferUsage::copy_source,
+    });
+    uint8_t* data = staging->map<uint8_t>();
+
+    std::exception_ptr error;
+    {
+        nb::gil_scoped_release release;
+        std::vector<std::future<void>> futures;
+        futures.reserve(images.size());
+        for (size_t i = 0; i < images.size(); ++i) {
+            futures.push_back(thread::do_async(
+                [&, i]()
+                {
+                    ref<Bitmap> loaded;
+                    const Bitmap* image = bitmaps[i];
+                    if (!image) {
+                        loaded = make_ref<Bitmap>(std::get<std::filesystem::path>(images[i]));
+                        image = loaded.get();
+                    }
+                    write_staging_image(
+                        image,
+                        data + i * image_size,
+                        pixel_format,
+                        width,
+                        height,
+                        flip_y,
+                        linearize,
+                        scale,
+                        offset
+                    );
+                }
+            ));
+        }
+        // Wait for every task before reporting errors, as they all write to the staging buffer.
+        for (auto& future : futures) {
+            try {
+                future.get();
+            } catch (...) {
+                if (!error)
+                    error = std::current_exception();
+            }
+        }
+    }
+
+    staging->unmap();
+    if (error)
+        std::rethrow_exception(error);
+
+    ref<CommandEncoder> encoder = device()->create_command_encoder();
+    encoder->copy_buffer(m_storage, desc().offset * dtype_size, staging, 0, data_size);
+    device()->submit_command_buffer(encoder->finish());
+}
+
 } // namespace sgl::slangpy
 
 SGL_PY_EXPORT(utils_slangpy_strided_buffer_view)
@@ -436,7 +649,26 @@ SGL_PY_EXPORT(utils_slangpy_strided_buffer_view)
         .def("cursor", &StridedBufferView::cursor, "start"_a.none() = std::nullopt, "count"_a.none() = std::nullopt)
         .def("uniforms", &StridedBufferView::uniforms)
         .def("to_numpy", &StridedBufferView::to_numpy, D_NA(StridedBufferView, to_numpy))
+        .def("to_numpy_async", &StridedBufferView::to_numpy_async, D_NA(StridedBufferView, to_numpy_async))
         .def("to_torch", &StridedBufferView::to_torch, D_NA(StridedBufferView, to_torch))
         .def("copy_from_numpy", &StridedBufferView::copy_from_numpy, "data"_a, D_NA(StridedBufferView, copy_from_numpy))
+        .def(
+            "copy_from_file",
+            &StridedBufferView::copy_from_file,
+            "path"_a,
+            "file_offset"_a = 0,
+            D_NA(StridedBufferView, copy_from_file)
+        )
+        .def("append_to_file", &StridedBufferView::append_to_file, "path"_a, D_NA(StridedBufferView, append_to_file))
+        .def(
+            "copy_from_images",
+            &StridedBufferView::copy_from_images,
+            "images"_a,
+            "flip_y"_a = false,
+            "linearize"_a = false,
+            "scale"_a = 1.f,
+            "offset"_a = 0.f,
+            D_NA(StridedBufferView, copy_from_images)
+        )
         .def("is_contiguous", &StridedBufferView::is_contiguous, D_NA(&StridedBufferView, is_contiguous));
 }
@@ -2,6 +2,8 @@
 
 #pragma once
 
+#include <filesystem>
+#include <variant>
 #include <vector>
 #include <map>
 
@@ -10,10 +12,12 @@
 #include "sgl/core/macros.h"
 #include "sgl/core/fwd.h"
 #include "sgl/core/object.h"
+#include "sgl/core/bitmap.h"
 
 #include "sgl/device/fwd.h"
 #include "sgl/device/resource.h"
 
+#include "device/numpy_future.h"
 #include "utils/slangpy.h"
 
 namespace sgl::slangpy {
@@ -60,10 +64,25 @@ public:
 
     /// Copy to CPU memory as a numpy array of correct stride/shape
     nb::ndarray<nb::numpy> to_numpy() const;
+    /// Start copying to CPU memory, returning a future for the numpy array
+    ref<NumpyFuture> to_numpy_async() const;
     /// Map GPU memory to torch tensor of correct stride/shape
     nb::ndarray<nb::pytorch> to_torch() const;
     /// Copy from CPU memory (as a numpy array) into GPU buffer
     void copy_from_numpy(nb::ndarray<nb::numpy> data);
+    /// Copy raw data from a file into GPU buffer, mapping the file and uploading it in chunks
+    void copy_from_file(const std::filesystem::path& path, size_t file_offset = 0);
+    /// Append raw data from GPU buffer to the end of a file, reading it back in chunks
+    void append_to_file(const std::filesystem::path& path) const;
+    /// Decode and convert a batch of images in parallel into a [N, H, W] buffer of float
+    /// elements with 1 to 4 channels, uploading them with a single copy
+    void copy_from_images(
+        const std::vector<std::variant<ref<Bitmap>, std::filesystem::path>>& images,
+        bool flip_y = false,
+        bool linearize = false,
+        float scale = 1.f,
+        float offset = 0.f
+    );
 
 protected:
     // In-place versions of view changing methods.
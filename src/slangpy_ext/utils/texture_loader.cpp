@@ -18,6 +18,18 @@ SGL_DICT_TO_DESC_FIELD(allocate_mips, bool)
 SGL_DICT_TO_DESC_FIELD(generate_mips, bool)
 SGL_DICT_TO_DESC_FIELD(usage, TextureUsage)
 SGL_DICT_TO_DESC_END()
+
+using TextureStreamerOptions = TextureStreamer::Options;
+SGL_DICT_TO_DESC_BEGIN(TextureStreamerOptions)
+SGL_DICT_TO_DESC_FIELD(load_as_normalized, bool)
+SGL_DICT_TO_DESC_FIELD(load_as_srgb, bool)
+SGL_DICT_TO_DESC_FIELD(extend_alpha, bool)
+SGL_DICT_TO_DESC_FIELD(generate_mips, bool)
+SGL_DICT_TO_DESC_FIELD(usage, TextureUsage)
+SGL_DICT_TO_DESC_FIELD(mip_tail_size, uint32_t)
+SGL_DICT_TO_DESC_FIELD(memory_budget, size_t)
+SGL_DICT_TO_DESC_FIELD(upload_budget, size_t)
+SGL_DICT_TO_DESC_END()
 } // namespace sgl
 
 SGL_PY_EXPORT(utils_texture_loader)
@@ -100,4 +112,88 @@ SGL_PY_EXPORT(utils_texture_loader)
             "options"_a.none() = nb::none(),
             D(TextureLoader, load_texture_array, 2)
         );
+
+    nb::class_<StreamedTexture, Object>(m, "StreamedTexture", D_NA(StreamedTexture))
+        .def_prop_ro("texture", &StreamedTexture::texture, D_NA(StreamedTexture, texture))
+        .def("touch", &StreamedTexture::touch, D_NA(StreamedTexture, touch))
+        .def_prop_ro("is_loaded", &StreamedTexture::is_loaded, D_NA(StreamedTexture, is_loaded))
+        .def_prop_ro("error", &StreamedTexture::error, D_NA(StreamedTexture, error))
+        .def_prop_ro("width", &StreamedTexture::width, D_NA(StreamedTexture, width))
+        .def_prop_ro("height", &StreamedTexture::height, D_NA(StreamedTexture, height))
+        .def_prop_ro("mip_count", &StreamedTexture::mip_count, D_NA(StreamedTexture, mip_count))
+        .def_prop_ro("format", &StreamedTexture::format, D_NA(StreamedTexture, format))
+        .def_prop_ro("resident_mip", &StreamedTexture::resident_mip, D_NA(StreamedTexture, resident_mip))
+        .def_prop_ro("is_fully_resident", &StreamedTexture::is_fully_resident, D_NA(StreamedTexture, is_fully_resident))
+        .def_prop_ro("resident_size", &StreamedTexture::resident_size, D_NA(StreamedTexture, resident_size));
+
+    nb::class_<TextureStreamer, Object> texture_streamer(m, "TextureStreamer", D_NA(TextureStreamer));
+
+    nb::class_<TextureStreamer::Options>(texture_streamer, "Options", D_NA(TextureStreamer, Options))
+        .def(nb::init<>(), D_NA(TextureStreamer, Options))
+        .def(
+            "__init__",
+            [](TextureStreamer::Options* self, nb::dict dict)
+            { new (self) TextureStreamer::Options(dict_to_TextureStreamerOptions(dict)); }
+        )
+        .def_rw(
+            "load_as_normalized",
+            &TextureStreamer::Options::load_as_normalized,
+            D_NA(TextureStreamer, Options, load_as_normalized)
+        )
+        .def_rw("load_as_srgb", &TextureStreamer::Options::load_as_srgb, D_NA(TextureStreamer, Options, load_as_srgb))
+        .def_rw("extend_alpha", &TextureStreamer::Options::extend_alpha, D_NA(TextureStreamer, Options, extend_alpha))
+        .def_rw(
+            "generate_mips",
+            &TextureStreamer::Options::generate_mips,
+            D_NA(TextureStreamer, Options, generate_mips)
+        )
+        .def_rw("usage", &TextureStreamer::Options::usage, D_NA(TextureStreamer, Options, usage))
+        .def_rw(
+            "mip_tail_size",
+            &TextureStreamer::Options::mip_tail_size,
+            D_NA(TextureStreamer, Options, mip_tail_size)
+        )
+        .def_rw(
+            "memory_budget",
+            &TextureStreamer::Options::memory_budget,
+            D_NA(TextureStreamer, Options, memory_budget)
+        )
+        .def_rw(
+            "upload_budget",
+            &TextureStreamer::Options::upload_budget,
+            D_NA(TextureStreamer, Options, upload_budget)
+        );
+
+    nb::implicitly_convertible<nb::dict, TextureStreamer::Options>();
+
+    texture_streamer //
+        .def(
+            nb::init<ref<Device>, std::optional<TextureStreamer::Options>>(),
+            "device"_a,
+            "options"_a.none() = nb::none(),
+            D_NA(TextureStreamer, TextureStreamer)
+        )
+        .def_prop_ro("options", &TextureStreamer::options, D_NA(TextureStreamer, options))
+        .def_prop_rw(
+            "memory_budget",
+            [](const TextureStreamer* self) { return self->options().memory_budget; },
+            &TextureStreamer::set_memory_budget,
+            D_NA(TextureStreamer, set_memory_budget)
+        )
+        .def(
+            "load_texture",
+            [](TextureStreamer* self, const Bitmap* bitmap) { return self->load_texture(ref<const Bitmap>(bitmap)); },
+            "bitmap"_a,
+            D_NA(TextureStreamer, load_texture)
+        )
+        .def(
+            "load_texture",
+            nb::overload_cast<const std::filesystem::path&>(&TextureStreamer::load_texture),
+            "path"_a,
+            D_NA(TextureStreamer, load_texture, 2)
+        )
+        .def("update", &TextureStreamer::update, D_NA(TextureStreamer, update))
+        .def("flush", &TextureStreamer::flush, D_NA(TextureStreamer, flush))
+        .def_prop_ro("pending_count", &TextureStreamer::pending_count, D_NA(TextureStreamer, pending_count))
+        .def_prop_ro("memory_usage", &TextureStreamer::memory_usage, D_NA(TextureStreamer, memory_usage));
 }
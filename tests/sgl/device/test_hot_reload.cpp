@@ -427,6 +427,41 @@ TEST_CASE_GPU("load module separately from program")
 }
 
 
+TEST_CASE_GPU("recreate sessions only relinks dependent programs")
+{
+    // Disable auto detection
+    ctx.device->_hot_reload()->set_auto_detect_changes(false);
+
+    // Write and load 2 independent programs.
+    auto path_a = testing::get_case_temp_directory() / "partialprog_a.slang";
+    auto path_b = testing::get_case_temp_directory() / "partialprog_b.slang";
+    write_shader({.path = path_a, .set_to = "1"});
+    write_shader({.path = path_b, .set_to = "2"});
+    ref<ShaderProgram> program_a = ctx.device->load_program(path_a.string(), {"compute_main"});
+    ref<ShaderProgram> program_b = ctx.device->load_program(path_b.string(), {"compute_main"});
+    ref<ComputeKernel> kernel_a = ctx.device->create_compute_kernel({.program = program_a});
+    ref<ComputeKernel> kernel_b = ctx.device->create_compute_kernel({.program = program_b});
+    run_and_verify(ctx, kernel_a, 1);
+    run_and_verify(ctx, kernel_b, 2);
+    CHECK(program_a->depends_on({std::filesystem::absolute(path_a)}));
+    CHECK(!program_a->depends_on({std::filesystem::absolute(path_b)}));
+
+    // Re-write both shaders, but only report program b as changed, so program a keeps its old code.
+    write_shader({.path = path_a, .set_to = "3"});
+    write_shader({.path = path_b, .set_to = "4"});
+    std::vector<std::filesystem::path> changed_files{path_b};
+    ctx.device->_hot_reload()->recreate_sessions(changed_files);
+    CHECK(!ctx.device->_hot_reload()->last_build_failed());
+    run_and_verify(ctx, kernel_a, 1);
+    run_and_verify(ctx, kernel_b, 4);
+
+    // A full recreate relinks program a as well.
+    ctx.device->_hot_reload()->recreate_all_sessions();
+    CHECK(!ctx.device->_hot_reload()->last_build_failed());
+    run_and_verify(ctx, kernel_a, 3);
+    run_and_verify(ctx, kernel_b, 4);
+}
+
 TEST_CASE_GPU("change program and auto detect changes")
 {
     // Enable auto detection and wipe any existing monitors to ensure test is from a 'clean slate'.
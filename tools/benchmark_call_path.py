@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: Apache-2.0 WITH LLVM-exception
+"""
+Micro-benchmarks of the per-call overhead of the SlangPy call path.
+
+Each benchmark is run for a number of rounds, each made of enough iterations to take at least
+`--min-time` seconds. Statistics (min, max, mean, stddev, median and percentiles) are computed
+over the per-iteration time of each round, in the style of pytest-benchmark. Runs on the CPU
+device by default, so results are comparable on machines without a GPU. Run with:
+
+    python tools/benchmark_call_path.py [--device cpu] [--json out.json]
+
+Results can be compared against an earlier run, failing if any median regressed by more than
+`--threshold`:
+
+    python tools/benchmark_call_path.py --compare baseline.json
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+from dataclasses import dataclass
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+import slangpy as spy
+from slangpy.core.native import SignatureBuilder
+
+MODULE = r"""
+import "slangpy";
+
+float add(float a, float b) {
+    return a + b;
+}
+
+void accumulate(float a, inout float total) {
+    total += a;
+}
+
+void write_index(uint3 thread_id, RWStructuredBuffer<float> res) {
+    res[thread_id.x] = thread_id.x;
+}
+
+struct AddKernelData {
+    StructuredBuffer<float> a;
+    StructuredBuffer<float> b;
+    RWStructuredBuffer<float> res;
+    int count;
+}
+ParameterBlock<AddKernelData> add_kernel_data;
+
+[shader("compute")]
+[numthreads(32, 1, 1)]
+void add_kernel(uint3 thread_id: SV_DispatchThreadID) {
+    if (thread_id.x < add_kernel_data.count) {
+        uint i = thread_id.x;
+        add_kernel_data.res[i] = add_kernel_data.a[i] + add_kernel_data.b[i];
+    }
+}
+"""
+
+#: Percentiles reported for every benchmark.
+PERCENTILES = (50, 90, 99)
+
+
+@dataclass
+class Benchmark:
+    #: Group the benchmark belongs to, e.g. "call" or "signature".
+    group: str
+    #: Name of the benchmark within its group.
+    name: str
+    #: Function to time.
+    func: Callable[[], Any]
+    #: Called after every round, outside of the timed region.
+    after_round: Optional[Callable[[], Any]] = None
+
+    @property
+    def full_name(self) -> str:
+        return f"{self.group}/{self.name}"
+
+
+def percentile(sorted_times: list[float], p: float) -> float:
+    """
+    Linearly interpolated percentile of sorted times, matching numpy's default method.
+    """
+    if len(sorted_times) == 1:
+        return sorted_times[0]
+    pos = (len(sorted_times) - 1) * p / 100.0
+    lo = math.floor(pos)
+    hi = min(lo + 1, len(sorted_times) - 1)
+    return sorted_times[lo] + (sorted_times[hi] - sorted_times[lo]) * (pos - lo)
+
+
+def compute_stats(times: list[float]) -> dict[str, float]:
+    """
+    Statistics, in seconds, of a list of per-iteration times.
+    """
+    sorted_times = sorted(times)
+    mean = sum(sorted_times) / len(sorted_times)
+    variance = sum((t - mean) ** 2 for t in sorted_times) / max(len(sorted_times) - 1, 1)
+    stats = {
+        "min": sorted_times[0],
+        "max": sorted_times[-1],
+        "mean": mean,
+        "stddev": math.sqrt(variance),
+        "median": percentile(sorted_times, 50),
+        "iqr": percentile(sorted_times, 75) - percentile(sorted_times, 25),
+        "ops": 1.0 / mean if mean > 0 else 0.0,
+    }
+    for p in PERCENTILES:
+        stats[f"p{p}"] = percentile(sorted_times, p)
+    return stats
+
+
+def measure(
+    benchmark: Benchmark, device: spy.Device, rounds: int, min_time: float
+) -> dict[str, Any]:
+    def run_round(iterations: int) -> float:
+        start = perf_counter()
+        for _ in range(iterations):
+            benchmark.func()
+        elapsed = perf_counter() - start
+        if benchmark.after_round is not None:
+            benchmark.after_round()
+        device.wait_for_idle()
+        return elapsed
+
+    # Warm up, which also compiles kernels, then pick enough iterations per round
+    # to make timer resolution negligible.
+    run_round(1)
+    single = run_round(1)
+    iterations = max(1, math.ceil(min_time / single)) if single > 0 else 1000
+
+    times = [run_round(iterations) / iterations for _ in range(rounds)]
+    return {
+        "group": benchmark.group,
+        "name": benchmark.name,
+        "rounds": rounds,
+        "iterations": iterations,
+        "stats": compute_stats(times),
+    }
+
+
+def create_benchmarks(device: spy.Device, count: int) -> list[Benchmark]:
+    module = spy.Module.load_from_source(device, "benchmark_call_path", MODULE)
+    cache = module.call_data_cache
+
+    rng = np.random.default_rng(0)
+    a_data = rng.random(count, dtype=np.float32)
+    b_data = rng.random(count, dtype=np.float32)
+
+    a = spy.NDBuffer.empty(device, (count,), "float")
+    a.copy_from_numpy(a_data)
+    b = spy.NDBuffer.empty(device, (count,), "float")
+    b.copy_from_numpy(b_data)
+    res = spy.NDBuffer.empty(device, (count,), "float")
+
+    a_tensor = spy.Tensor.from_numpy(device, a_data)
+    b_tensor = spy.Tensor.from_numpy(device, b_data)
+    res_tensor = spy.Tensor.empty_like(a_tensor)
+
+    total = spy.floatRef(0.0)
+
+    kernel_program = device.link_program(
+        [module.device_module], [module.device_module.entry_point("add_kernel")]
+    )
+    kernel = device.create_compute_kernel(kernel_program)
+    kernel_vars = {
+        "add_kernel_data": {"a": a.storage, "b": b.storage, "res": res.storage, "count": count}
+    }
+
+    encoder = [device.create_command_encoder()]
+
+    def submit_appended():
+        device.submit_command_buffer(encoder[0].finish())
+        encoder[0] = device.create_command_encoder()
+
+    def signature(*args: Any, **kwargs: Any):
+        cache.get_args_signature(SignatureBuilder(), *args, **kwargs)
+
+    return [
+        Benchmark("signature", "scalars", lambda: signature(1.0, 2.0)),
+        Benchmark("signature", "ndbuffer", lambda: signature(a, b, _result=res)),
+        Benchmark("signature", "tensor", lambda: signature(a_tensor, b_tensor, _result=res_tensor)),
+        Benchmark("signature", "numpy", lambda: signature(a_data, b_data)),
+        # Generates new call data every iteration, bypassing the call data cache. The kernel
+        # itself is only compiled once, then found in the module's kernel cache by hash.
+        Benchmark(
+            "build",
+            "call_data",
+            lambda: module.add.generate_call_data((a, b), {"_result": res}),
+        ),
+        Benchmark("call", "scalars", lambda: module.add(1.0, 2.0)),
+        Benchmark("call", "ndbuffer", lambda: module.add(a, b, _result=res)),
+        Benchmark("call", "tensor", lambda: module.add(a_tensor, b_tensor, _result=res_tensor)),
+        Benchmark("call", "numpy", lambda: module.add(a_data, b_data)),
+        Benchmark("call", "valueref", lambda: module.accumulate(1.0, total)),
+        Benchmark(
+            "append_to",
+            "ndbuffer",
+            lambda: module.add.append_to(encoder[0], a, b, _result=res),
+            after_round=submit_appended,
+        ),
+        Benchmark(
+            "dispatch",
+            "function",
+            lambda: module.write_index.dispatch(spy.uint3(count, 1, 1), res=res.storage),
+        ),
+        Benchmark(
+            "dispatch", "kernel", lambda: kernel.dispatch(spy.uint3(count, 1, 1), vars=kernel_vars)
+        ),
+        Benchmark("readback", "to_numpy", lambda: res.to_numpy()),
+        Benchmark("readback", "to_numpy_async", lambda: res.to_numpy_async().result()),
+    ]
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float
+) -> list[str]:
+    """
+    Print the change in median time of each benchmark against a baseline, returning the names
+    of benchmarks that are slower by more than `threshold` (a fraction of the baseline).
+    """
+    baseline_medians = {f"{r['group']}/{r['name']}": r["stats"]["median"] for r in baseline}
+    regressions: list[str] = []
+    for r in results:
+        name = f"{r['group']}/{r['name']}"
+        old = baseline_medians.get(name)
+        if old is None or old <= 0:
+            continue
+        change = r["stats"]["median"] / old - 1.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        new = r["stats"]["median"]
+        print(f"{name:<28} {old * 1e6:10.2f} us -> {new * 1e6:10.2f} us  {change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--device", type=str, default="cpu", help="Device type to run on")
+    parser.add_argument("--count", type=int, default=32, help="Elements per buffer")
+    parser.add_argument("--rounds", type=int, default=100, help="Timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=1e-3, help="Minimum seconds per round")
+    parser.add_argument("--filter", type=str, help="Only run benchmarks containing this string")
+    parser.add_argument("--json", type=str, help="Write results to a JSON file")
+    parser.add_argument("--compare", type=str, help="JSON file of a previous run to compare to")
+    parser.add_argument(
+        "--threshold", type=float, default=0.1, help="Median slowdown counted as a regression"
+    )
+    args = parser.parse_args()
+
+    device = spy.create_device(getattr(spy.DeviceType, args.device))
+    benchmarks = create_benchmarks(device, args.count)
+    if args.filter:
+        benchmarks = [b for b in benchmarks if args.filter in b.full_name]
+
+    results: list[dict[str, Any]] = []
+    print(f"{'name':<28} {'median':>10} {'p90':>10} {'p99':>10} {'mean':>10} {'stddev':>10}")
+    for benchmark in benchmarks:
+        result = measure(benchmark, device, args.rounds, args.min_time)
+        results.append(result)
+        s = result["stats"]
+        print(
+            f"{benchmark.full_name:<28} "
+            + " ".join(f"{s[k] * 1e6:7.2f} us" for k in ("median", "p90", "p99", "mean", "stddev"))
+        )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "machine_info": {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "slangpy": spy.SGL_VERSION,
+                        "device": device.info.adapter_name,
+                    },
+                    "device_type": args.device,
+                    "benchmarks": results,
+                },
+                f,
+                indent=2,
+            )
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["benchmarks"]
+        print()
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()